@@ -10,10 +10,12 @@ personality, memory integration, and system awareness.
 import asyncio
 import logging
 import os
+import re
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -23,8 +25,21 @@ sys.path.insert(0, str(project_root))
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_ASSISTANT_PREFIX = "ASSISTANT:"
+
+# Explicit status/help requests: a bare "help"/"status" message, or a
+# "/help"/"/status" command with optional arguments. Only these turns are
+# answered deterministically so their replies can be cached.
+_STATUS_HELP_INTENT = re.compile(
+    r"^\s*(?:/(?:help|status)\b.*|(?:help|status)\s*[?!.]*\s*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+
 try:
-    from Aetherra.core.ai.multi_llm_manager import MultiLLMManager
+    try:
+        from Aetherra.core.ai.multi_llm_manager import MultiLLMManager
+    except ImportError:
+        from Aetherra.core.multi_llm_manager import MultiLLMManager
 
     LLM_AVAILABLE = True
 except ImportError as e:
@@ -32,6 +47,16 @@ except ImportError as e:
     MultiLLMManager = None
     LLM_AVAILABLE = False
 
+# Import LLM response cache
+try:
+    from Aetherra.core.llm_response_cache import LLMResponseCache
+
+    RESPONSE_CACHE_AVAILABLE = True
+except ImportError as e:
+    logger.warning(f"⚠️ LLM response cache not available: {e}")
+    RESPONSE_CACHE_AVAILABLE = False
+    LLMResponseCache = None
+
 # Import the enhanced prompt engine
 try:
     from Aetherra.core.prompt_engine import build_dynamic_prompt
@@ -202,7 +227,15 @@ class LyrixaConversationManager:
     - Multiple LLM backend support
     """
 
-    def __init__(self, workspace_path: str, aether_runtime=None, gui_interface=None):
+    def __init__(
+        self,
+        workspace_path: str,
+        aether_runtime=None,
+        gui_interface=None,
+        llm_manager=None,
+        response_cache=None,
+        cache_sampled_responses: bool = False,
+    ):
         self.workspace_path = workspace_path
         self.aether_runtime = aether_runtime
         self.gui_interface = gui_interface  # Reference to GUI for code injection
@@ -211,10 +244,37 @@ class LyrixaConversationManager:
         self.model_failures = {}
         self.max_retries_per_model = 3
 
+        # Generation parameters (part of the response cache key). Status and
+        # help questions are answered deterministically, see
+        # _generation_params_for.
+        self.generation_params = {"temperature": 0.7, "max_tokens": 1000}
+        self.deterministic_params = {**self.generation_params, "temperature": 0}
+
+        # 💾 Response cache: identical questions in an identical context reuse
+        # the previous answer until the TTL expires. Deterministic turns are
+        # always cached; answers sampled at the temperature above only when
+        # cache_sampled_responses is set.
+        if response_cache is not None:
+            self.response_cache = response_cache
+        elif RESPONSE_CACHE_AVAILABLE and LLMResponseCache:
+            try:
+                self.response_cache = LLMResponseCache(
+                    db_path=os.path.join(workspace_path, "llm_response_cache.db")
+                    if workspace_path
+                    else None,
+                    ttl_seconds=600,
+                    cache_sampled_responses=cache_sampled_responses,
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ LLM response cache initialization failed: {e}")
+                self.response_cache = None
+        else:
+            self.response_cache = None
+
         # Initialize LLM manager if available
-        if LLM_AVAILABLE and MultiLLMManager is not None:
+        if llm_manager is not None or (LLM_AVAILABLE and MultiLLMManager is not None):
             try:
-                self.llm_manager = MultiLLMManager()
+                self.llm_manager = llm_manager or MultiLLMManager()
 
                 # Updated model preferences with Ollama as primary
                 self.preferred_models = [
@@ -887,6 +947,43 @@ class LyrixaConversationManager:
 
         return "\n".join(prompt_parts)
 
+    async def _build_generation_prompt(self, user_input: str):
+        """Build (system prompt, messages, flattened prompt) for a turn"""
+        # 🧠 Use enhanced dynamic prompt engine if available
+        if PROMPT_ENGINE_AVAILABLE and build_dynamic_prompt:
+            try:
+                system_prompt = build_dynamic_prompt(user_id="default_user")
+                logger.info("🎭 Using enhanced dynamic prompt with contextual personality")
+            except Exception as e:
+                logger.warning(f"⚠️ Dynamic prompt engine failed, using fallback: {e}")
+                # Fallback to traditional method
+                messages = await self.get_conversation_messages(user_input)
+                system_prompt = messages[0]["content"]
+        else:
+            # Fallback to traditional method
+            messages = await self.get_conversation_messages(user_input)
+            system_prompt = messages[0]["content"]
+
+        # Create messages with enhanced prompt
+        enhanced_messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_input},
+        ]
+
+        # Add conversation history for context
+        conversation_messages = []
+        for msg in self.conversation_history[-6:]:  # Last 6 messages for context
+            conversation_messages.append({"role": msg["role"], "content": msg["content"]})
+
+        # Combine: system prompt + history + current input
+        final_messages = (
+            [enhanced_messages[0]] + conversation_messages + [enhanced_messages[1]]
+        )
+
+        prompt = self.format_messages_as_prompt(final_messages)
+
+        return system_prompt, final_messages, prompt
+
     async def generate_response(self, user_input: str) -> str:
         """Generate an LLM-powered response with enhanced dynamic prompts and robust fallback mechanism"""
         try:
@@ -907,51 +1004,17 @@ class LyrixaConversationManager:
                 logger.info(f"🎯 Plugin editor intent handled: {user_input[:50]}...")
                 return plugin_response
 
-            # 🧠 Use enhanced dynamic prompt engine if available
-            if PROMPT_ENGINE_AVAILABLE and build_dynamic_prompt:
-                try:
-                    system_prompt = build_dynamic_prompt(user_id="default_user")
-                    logger.info(
-                        "🎭 Using enhanced dynamic prompt with contextual personality"
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"⚠️ Dynamic prompt engine failed, using fallback: {e}"
-                    )
-                    # Fallback to traditional method
-                    messages = await self.get_conversation_messages(user_input)
-                    system_prompt = messages[0]["content"]
-            else:
-                # Fallback to traditional method
-                messages = await self.get_conversation_messages(user_input)
-                system_prompt = messages[0]["content"]
-
-            # Create messages with enhanced prompt
-            enhanced_messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_input},
-            ]
-
-            # Add conversation history for context
-            conversation_messages = []
-            for msg in self.conversation_history[-6:]:  # Last 6 messages for context
-                conversation_messages.append(
-                    {"role": msg["role"], "content": msg["content"]}
-                )
-
-            # Combine: system prompt + history + current input
-            final_messages = (
-                [enhanced_messages[0]] + conversation_messages + [enhanced_messages[1]]
+            system_prompt, final_messages, prompt = await self._build_generation_prompt(
+                user_input
             )
-
-            prompt = self.format_messages_as_prompt(final_messages)
+            params = self._generation_params_for(user_input)
 
             logger.info(
                 f"💬 Generating enhanced LLM response for: {user_input[:100]}..."
             )
 
             # Try each model in order until one succeeds
-            for model in self.preferred_models:
+            for model in self._generation_order():
                 # Skip models that have failed too many times
                 if self.model_failures.get(model, 0) >= self.max_retries_per_model:
                     continue
@@ -969,15 +1032,25 @@ class LyrixaConversationManager:
                         self._record_model_failure(model)
                         continue
 
-                    # Generate response
-                    response = await self.llm_manager.generate_response(
-                        prompt=prompt, temperature=0.7, max_tokens=1000
+                    # Reuse a cached answer for the same context, or generate
+                    cache_key = self._response_cache_key(
+                        model, system_prompt, final_messages[1:], params
                     )
+                    cached = self.response_cache.get(cache_key) if cache_key else None
+                    if cached is not None:
+                        logger.info(f"💾 Response cache hit for {model}")
+                        response = cached.response
+                    else:
+                        started = time.perf_counter()
+                        response = await self.llm_manager.generate_response(
+                            prompt=prompt, **params
+                        )
+                        latency_ms = (time.perf_counter() - started) * 1000
 
-                    # Clean up the response
-                    response = response.strip()
-                    if response.startswith("ASSISTANT:"):
-                        response = response[10:].strip()
+                        # Clean up the response
+                        response = response.strip()
+                        if response.startswith("ASSISTANT:"):
+                            response = response[10:].strip()
 
                     # Check if response is valid
                     if not response or len(response.strip()) < 10:
@@ -985,6 +1058,15 @@ class LyrixaConversationManager:
                         self._record_model_failure(model)
                         continue
 
+                    if cache_key and cached is None:
+                        self.response_cache.put(
+                            cache_key,
+                            response,
+                            model,
+                            latency_ms=latency_ms,
+                            cost_usd=self._estimate_cost(model, prompt, response),
+                        )
+
                     # Success! Add to conversation history
                     self.add_to_conversation_history("user", user_input)
                     self.add_to_conversation_history("assistant", response)
@@ -1067,6 +1149,116 @@ class LyrixaConversationManager:
             logger.error(f"❌ Critical error in generate_response: {e}")
             return await self._generate_smart_fallback_response(user_input)
 
+    async def stream_response(self, user_input: str) -> AsyncIterator[str]:
+        """
+        Stream an LLM response as text chunks
+
+        Follows generate_response: fallbacks and cached answers arrive as a
+        single chunk, and a completed turn is added to history, memory and the
+        response cache. A model that fails before sending anything is skipped
+        for the next one; a failure after text was sent is raised. Closing the
+        iterator (e.g. the client disconnected) cancels the provider request
+        and records nothing.
+        """
+        self.conversation_count += 1
+
+        if not self.llm_enabled or not self.llm_manager:
+            yield await self._generate_smart_fallback_response(user_input)
+            return
+
+        (
+            plugin_intent_detected,
+            plugin_response,
+        ) = await self._handle_plugin_editor_intent(user_input)
+        if plugin_intent_detected:
+            yield plugin_response
+            return
+
+        system_prompt, final_messages, prompt = await self._build_generation_prompt(
+            user_input
+        )
+        params = self._generation_params_for(user_input)
+
+        for model in self._generation_order():
+            if self.model_failures.get(model, 0) >= self.max_retries_per_model:
+                continue
+            if model not in self.llm_manager.list_available_models():
+                continue
+            if not self.llm_manager.set_model(model):
+                self._record_model_failure(model)
+                continue
+
+            cache_key = self._response_cache_key(
+                model, system_prompt, final_messages[1:], params
+            )
+            cached = self.response_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                logger.info(f"💾 Response cache hit for {model}")
+                response = cached.response
+                yield response
+            else:
+                chunks: List[str] = []
+                # Start of the stream, held back until it can be told apart
+                # from a (possibly split) "ASSISTANT:" prefix
+                head = ""
+                prefix_checked = False
+                started = time.perf_counter()
+                stream = self.llm_manager.stream_response(prompt=prompt, **params)
+                try:
+                    async for chunk in stream:
+                        if not chunks:
+                            head = (head + chunk).lstrip()
+                            if not prefix_checked:
+                                if len(head) < len(
+                                    _ASSISTANT_PREFIX
+                                ) and _ASSISTANT_PREFIX.startswith(head):
+                                    continue
+                                if head.startswith(_ASSISTANT_PREFIX):
+                                    head = head[len(_ASSISTANT_PREFIX) :].lstrip()
+                                prefix_checked = True
+                            if not head:
+                                continue
+                            chunk, head = head, ""
+                        chunks.append(chunk)
+                        yield chunk
+                    if head:
+                        # Stream ended inside what looked like the prefix
+                        chunks.append(head)
+                        yield head
+                except Exception as e:
+                    self._record_model_failure(model)
+                    if chunks:
+                        raise
+                    logger.warning(f"⚠️ Model {model} failed to stream: {e}")
+                    continue
+                finally:
+                    await stream.aclose()
+
+                response = "".join(chunks).strip()
+                if not response:
+                    logger.warning(f"⚠️ Empty streamed response from {model}")
+                    self._record_model_failure(model)
+                    continue
+
+                if cache_key:
+                    self.response_cache.put(
+                        cache_key,
+                        response,
+                        model,
+                        latency_ms=(time.perf_counter() - started) * 1000,
+                        cost_usd=self._estimate_cost(model, prompt, response),
+                    )
+
+            self.add_to_conversation_history("user", user_input)
+            self.add_to_conversation_history("assistant", response)
+            self.current_model = model
+            await self._store_conversation_in_memory(user_input, response)
+            self.handle_llm_response(response, user_input)
+            return
+
+        logger.error("❌ All models failed, using smart fallback response")
+        yield await self._generate_smart_fallback_response(user_input)
+
     def _generate_fallback_response(self, user_input: str) -> str:
         """Generate an intelligent fallback response when LLM fails"""
         message_lower = user_input.lower()
@@ -1924,8 +2116,51 @@ I'm genuinely curious about your challenge and excited to collaborate on finding
             "available_models": list(self.llm_manager.list_available_models().keys())
             if self.llm_manager
             else [],
+            "response_cache": self.response_cache.get_stats()
+            if self.response_cache
+            else {"enabled": False},
         }
 
+    def _generation_order(self) -> List[str]:
+        """Preferred models, plus the selected model if it is not among them"""
+        models = list(self.preferred_models)
+        if self.current_model not in models and self.current_model not in (
+            "fallback",
+            "intelligent_fallback",
+        ):
+            models.append(self.current_model)
+        return models
+
+    def _generation_params_for(self, user_input: str) -> Dict[str, Any]:
+        """Deterministic parameters for status and help turns, sampled otherwise"""
+        if _STATUS_HELP_INTENT.match(user_input):
+            return self.deterministic_params
+        return self.generation_params
+
+    def _response_cache_key(
+        self,
+        model: str,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        params: Dict[str, Any],
+    ) -> Optional[str]:
+        """Cache key for a turn, or None when the call should not be cached"""
+        if not self.response_cache:
+            return None
+        if not self.response_cache.is_cacheable(params):
+            self.response_cache.record_uncacheable()
+            return None
+        conversation = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+        return self.response_cache.make_key(
+            conversation, model, params, context=system_prompt
+        )
+
+    def _estimate_cost(self, model: str, prompt: str, response: str) -> float:
+        """Rough USD cost of a completion (~4 characters per token)"""
+        config = self.llm_manager.model_configs.get(model) if self.llm_manager else None
+        rate = getattr(config, "cost_per_1k_tokens", 0.0) or 0.0
+        return (len(prompt) + len(response)) / 4 / 1000 * rate
+
     async def _try_ollama_fallback(self, prompt: str) -> str:
         """Try to use Ollama as a local fallback"""
         try:
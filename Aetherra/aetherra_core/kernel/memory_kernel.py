@@ -15,11 +15,13 @@ Core Components:
 
 import asyncio
 import json
+import logging
 import uuid
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Deque, Dict, List, Optional, Set
 
 from ..memory.fractal_mesh.analogs import CrossContextAnalogies
 from ..memory.fractal_mesh.base import (
@@ -38,6 +40,8 @@ from .narrator import MemoryNarrative, MemoryNarrator
 from .pulse import DriftAlert, MemoryHealth, MemoryPulseMonitor
 from .reflector import MemoryReflector, ReflectionInsight
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class MemorySystemConfig:
@@ -61,6 +65,15 @@ class MemorySystemConfig:
     fragment_retention_days: int = 365
     low_confidence_cleanup_threshold: float = 0.2
 
+    # Startup loading: lazy mode keeps only lightweight indexes resident and
+    # hydrates fragments, clusters and chains on demand through an LRU cache
+    lazy_loading: bool = False
+    hydration_cache_size: int = 10000
+
+    # remember() pipeline: when deferred, concept clustering and timeline
+    # placement run in a background stage after the memory is committed
+    defer_enrichment: bool = False
+
     # Integration settings
     enable_cross_system_validation: bool = True
     narrative_generation_threshold: int = 5  # Min fragments for narrative
@@ -96,9 +109,21 @@ class LyrixaMemoryEngine:
 
         # Initialize core components
         self.core_memory = LyrixaMemorySystem(self.config.core_db_path)
-        self.fractal_mesh = FractalMeshCore(self.config.fractal_db_path)
-        self.concept_manager = ConceptClusterManager(self.config.concepts_db_path)
-        self.timeline_manager = EpisodicTimeline(self.config.timeline_db_path)
+        self.fractal_mesh = FractalMeshCore(
+            self.config.fractal_db_path,
+            lazy=self.config.lazy_loading,
+            cache_size=self.config.hydration_cache_size,
+        )
+        self.concept_manager = ConceptClusterManager(
+            self.config.concepts_db_path,
+            lazy=self.config.lazy_loading,
+            cache_size=self.config.hydration_cache_size,
+        )
+        self.timeline_manager = EpisodicTimeline(
+            self.config.timeline_db_path,
+            lazy=self.config.lazy_loading,
+            cache_size=self.config.hydration_cache_size,
+        )
         self.analog_finder = CrossContextAnalogies()
         self.narrator = MemoryNarrator()
         self.pulse_monitor = MemoryPulseMonitor(self.config.pulse_db_path)
@@ -116,8 +141,14 @@ class LyrixaMemoryEngine:
             "fragments_created": 0,
             "narratives_generated": 0,
             "insights_discovered": 0,
+            "deferred_enrichments": 0,
+            "failed_enrichments": 0,
         }
 
+        # Background enrichment stage (used when config.defer_enrichment)
+        self._pending_enrichment: Deque[MemoryFragment] = deque()
+        self._enrichment_task: Optional[asyncio.Task] = None
+
     async def remember(
         self,
         content: Any,
@@ -129,57 +160,29 @@ class LyrixaMemoryEngine:
     ) -> MemoryOperationResult:
         """
         Store a new memory with integrated processing across all systems
+
+        Staged pipeline: build the fragment, enrich it in memory (concept
+        clusters, associative links, timeline placement), then commit it
+        once to the core store and the fractal mesh. With
+        ``config.defer_enrichment`` the enrichment stage runs in the
+        background after the commit instead.
         """
         self.operation_stats["total_operations"] += 1
 
         try:
-            # Create unique fragment ID
-            fragment_id = str(uuid.uuid4())
-            current_time = datetime.now()
-
-            # Store in core memory system (vector embeddings)
-            core_result = await self.core_memory.store_memory(
-                content={"text": str(content), "category": category},
-                context={"category": category, "narrative_role": narrative_role},
-                tags=tags or [],
-                importance=confidence * 0.8,  # Convert confidence to importance
-                memory_type=category,
-            )
-
-            # Create fractal mesh fragment
-            fragment = MemoryFragment(
-                fragment_id=fragment_id,
-                content={"text": str(content), "category": category},
-                fragment_type=fragment_type,
-                temporal_tags={
-                    "hour": current_time.hour,
-                    "day_of_week": current_time.weekday(),
-                    "timestamp": current_time.isoformat(),
-                },
-                symbolic_tags=set(tags or []),
-                associative_links=[],  # Will be populated by concept analysis
-                confidence_score=confidence,
-                access_pattern={"created": current_time.isoformat(), "access_count": 0},
-                narrative_role=narrative_role,
-                created_at=current_time,
-                last_evolved=current_time,
+            # Stage 1: build
+            fragment = self._build_fragment(
+                content, tags, category, fragment_type, confidence, narrative_role
             )
 
-            # Store in fractal mesh
-            self.fractal_mesh.store_fragment(fragment)
-
-            # Process through concept clustering
-            affected_clusters = self.concept_manager.process_new_fragment(fragment)
+            # Stage 2: enrich in memory, before anything is persisted
+            deferred = self.config.defer_enrichment
+            affected_clusters: List[str] = []
+            if not deferred:
+                affected_clusters = self._enrich_fragment(fragment)
 
-            # Process through episodic timeline
-            affected_chains = self.timeline_manager.process_new_fragment(fragment)
-
-            # Update fragment with associative links from clustering
-            if affected_clusters:
-                fragment.associative_links.extend(
-                    affected_clusters[:5]
-                )  # Limit associations
-                self.fractal_mesh.store_fragment(fragment)  # Update with associations
+            # Stage 3: single commit to both stores
+            await self._commit_fragment(fragment, tags, category, narrative_role)
 
             self.operation_stats["successful_operations"] += 1
             self.operation_stats["fragments_created"] += 1
@@ -199,11 +202,18 @@ class LyrixaMemoryEngine:
             if background_tasks:
                 await asyncio.gather(*background_tasks, return_exceptions=True)
 
+            if deferred:
+                # Stage 4 (deferred): enrichment runs once the caller yields
+                self._schedule_enrichment(fragment)
+                message = "Memory stored successfully; concept processing deferred"
+            else:
+                message = f"Memory stored successfully with {len(affected_clusters)} concept associations"
+
             return MemoryOperationResult(
                 success=True,
                 operation_type="remember",
-                fragment_id=fragment_id,
-                message=f"Memory stored successfully with {len(affected_clusters)} concept associations",
+                fragment_id=fragment.fragment_id,
+                message=message,
             )
 
         except Exception as e:
@@ -213,6 +223,99 @@ class LyrixaMemoryEngine:
                 message=f"Failed to store memory: {str(e)}",
             )
 
+    def _build_fragment(
+        self,
+        content: Any,
+        tags: Optional[List[str]],
+        category: str,
+        fragment_type: MemoryFragmentType,
+        confidence: float,
+        narrative_role: Optional[str],
+    ) -> MemoryFragment:
+        """remember() stage 1: create the fractal mesh fragment"""
+        current_time = datetime.now()
+        return MemoryFragment(
+            fragment_id=str(uuid.uuid4()),
+            content={"text": str(content), "category": category},
+            fragment_type=fragment_type,
+            temporal_tags={
+                "hour": current_time.hour,
+                "day_of_week": current_time.weekday(),
+                "timestamp": current_time.isoformat(),
+            },
+            symbolic_tags=set(tags or []),
+            associative_links=[],  # Populated by concept analysis
+            confidence_score=confidence,
+            access_pattern={"created": current_time.isoformat(), "access_count": 0},
+            narrative_role=narrative_role,
+            created_at=current_time,
+            last_evolved=current_time,
+        )
+
+    def _enrich_fragment(self, fragment: MemoryFragment) -> List[str]:
+        """remember() stage 2: concept clustering, links and timeline placement"""
+        affected_clusters = self.concept_manager.process_new_fragment(fragment)
+        self.timeline_manager.process_new_fragment(fragment)
+
+        if affected_clusters:
+            # Limit associations
+            fragment.associative_links.extend(affected_clusters[:5])
+        return affected_clusters
+
+    async def _commit_fragment(
+        self,
+        fragment: MemoryFragment,
+        tags: Optional[List[str]],
+        category: str,
+        narrative_role: Optional[str],
+    ):
+        """remember() stage 3: persist once to the core store and the fractal mesh"""
+        await self.core_memory.store_memory(
+            content=fragment.content,
+            context={"category": category, "narrative_role": narrative_role},
+            tags=tags or [],
+            importance=fragment.confidence_score * 0.8,  # Confidence -> importance
+            memory_type=category,
+        )
+        self.fractal_mesh.store_fragment(fragment)
+
+    def _schedule_enrichment(self, fragment: MemoryFragment):
+        """Queue a committed fragment for the background enrichment stage"""
+        self._pending_enrichment.append(fragment)
+        self.operation_stats["deferred_enrichments"] += 1
+        if self._enrichment_task is None or self._enrichment_task.done():
+            self._enrichment_task = asyncio.create_task(self._enrichment_worker())
+
+    async def _enrichment_worker(self):
+        while self._pending_enrichment:
+            self._enrich_pending_fragment(self._pending_enrichment.popleft())
+            await asyncio.sleep(0)  # Yield between fragments
+
+    def _enrich_pending_fragment(self, fragment: MemoryFragment):
+        try:
+            if self._enrich_fragment(fragment):
+                # Links arrived after the commit: re-queue the mesh write
+                self.fractal_mesh.store_fragment(fragment)
+        except Exception as e:
+            self.operation_stats["failed_enrichments"] += 1
+            logger.warning(
+                f"Deferred enrichment failed for {fragment.fragment_id}: {e}"
+            )
+
+    async def drain_enrichment(self):
+        """Wait until every deferred enrichment has been processed"""
+        self.run_pending_enrichment()
+        if self._enrichment_task is not None and not self._enrichment_task.done():
+            await self._enrichment_task
+
+    def run_pending_enrichment(self) -> int:
+        """Process the deferred enrichment backlog inline; returns fragments done"""
+        processed = 0
+        while self._pending_enrichment:
+            self._enrich_pending_fragment(self._pending_enrichment.popleft())
+            processed += 1
+        return processed
+
     async def recall(
         self,
         query: str,
@@ -587,6 +690,20 @@ class LyrixaMemoryEngine:
         if time_since_last > timedelta(hours=2):  # Check health every 2 hours
             await self.check_memory_health()
 
+    def flush(self):
+        """Commit all write-behind queues of the fractal mesh stack"""
+        self.run_pending_enrichment()
+        self.fractal_mesh.flush()
+        self.concept_manager.flush()
+        self.timeline_manager.flush()
+
+    def close(self):
+        """Flush pending writes and release fractal mesh database connections"""
+        self.run_pending_enrichment()
+        self.fractal_mesh.close()
+        self.concept_manager.close()
+        self.timeline_manager.close()
+
     def get_system_status(self) -> Dict[str, Any]:
         """Get overall system status and metrics"""
 
@@ -606,6 +723,11 @@ class LyrixaMemoryEngine:
                 "narrative_generation": self.last_narrative_generation.isoformat(),
             },
             "performance": self.operation_stats,
+            "storage": {
+                "fractal_mesh": self.fractal_mesh.get_storage_metrics(),
+                "concept_clusters": self.concept_manager.get_storage_metrics(),
+                "episodic_timeline": self.timeline_manager.get_storage_metrics(),
+            },
             "configuration": {
                 "auto_narrative": self.config.auto_narrative_generation,
                 "auto_pulse": self.config.auto_pulse_monitoring,
@@ -9,6 +9,7 @@ Enables narrative continuity, pattern recognition, and self-reflective memory ex
 from .analogs.pattern_matcher import CrossContextAnalogies
 from .base import FractalMeshCore
 from .concepts.concept_clusters import ConceptClusterManager
+from .connection_manager import MeshConnectionManager
 from .timelines.episodic_timeline import EpisodicTimeline
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "ConceptClusterManager",
     "EpisodicTimeline",
     "CrossContextAnalogies",
+    "MeshConnectionManager",
 ]
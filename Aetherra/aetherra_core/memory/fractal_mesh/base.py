@@ -6,14 +6,17 @@ The central orchestration engine for multi-dimensional memory operations.
 Coordinates between episodic, symbolic, and associative memory layers.
 """
 
+import bisect
 import json
-import sqlite3
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, MutableMapping, Optional, Set, Tuple
+
+from .connection_manager import acquire_connection_manager, release_connection_manager
+from .lazy_store import LazyRecordStore
 
 
 class MemoryFragmentType(Enum):
@@ -101,9 +104,22 @@ class FractalMeshCore:
     - Associative networks (creative connections)
     """
 
-    def __init__(self, db_path: str = "fractal_memory.db"):
+    def __init__(
+        self,
+        db_path: str = "fractal_memory.db",
+        lazy: bool = False,
+        cache_size: int = 10000,
+    ):
         self.db_path = Path(db_path)
-        self.fragments: Dict[str, MemoryFragment] = {}
+        self.lazy = lazy
+
+        # In lazy mode only ids/timestamps/tags are loaded at startup and full
+        # fragments are hydrated on demand through a bounded LRU cache
+        self.fragments: MutableMapping[str, MemoryFragment] = (
+            LazyRecordStore(self._load_fragments_by_id, cache_size=cache_size)
+            if lazy
+            else {}
+        )
         self.concept_clusters: Dict[str, ConceptCluster] = {}
         self.episodic_chains: Dict[str, EpisodicChain] = {}
 
@@ -112,84 +128,160 @@ class FractalMeshCore:
         self.concept_index: Dict[str, Set[str]] = {}
         self.association_graph: Dict[str, Set[str]] = {}
 
+        # Incremental clustering/chaining indexes
+        self.episodic_window = timedelta(hours=24)
+        self._concept_cluster_index: Dict[str, str] = {}  # concept -> cluster_id
+        self._episodic_times: List[float] = []  # sorted episodic timestamps
+        self._episodic_ids: List[str] = []  # fragment ids parallel to _episodic_times
+        self._fragment_chain_index: Dict[str, str] = {}  # fragment_id -> chain_id
+        self._chain_confidence_totals: Dict[str, float] = {}
+
+        # Shared WAL connection with write-behind persistence
+        self._connections = acquire_connection_manager(self.db_path)
+
         self._init_database()
         self._load_existing_fragments()
 
     def _init_database(self):
         """Initialize the fractal mesh database"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS memory_fragments (
-                    fragment_id TEXT PRIMARY KEY,
-                    content TEXT NOT NULL,
-                    fragment_type TEXT NOT NULL,
-                    temporal_tags TEXT,
-                    symbolic_tags TEXT,
-                    associative_links TEXT,
-                    confidence_score REAL,
-                    access_pattern TEXT,
-                    narrative_role TEXT,
-                    created_at TEXT,
-                    last_evolved TEXT
-                )
-            """)
-
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS concept_clusters (
-                    cluster_id TEXT PRIMARY KEY,
-                    central_concept TEXT NOT NULL,
-                    related_concepts TEXT,
-                    member_fragments TEXT,
-                    cluster_strength REAL,
-                    temporal_evolution TEXT,
-                    narrative_themes TEXT
-                )
-            """)
-
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS episodic_chains (
-                    chain_id TEXT PRIMARY KEY,
-                    fragments TEXT NOT NULL,
-                    narrative_arc TEXT,
-                    causal_links TEXT,
-                    temporal_span_start TEXT,
-                    temporal_span_end TEXT,
-                    significance_score REAL
-                )
-            """)
-
-            # Indexes for performance
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_fragments_temporal ON memory_fragments (created_at)"
+        self._connections.execute("""
+            CREATE TABLE IF NOT EXISTS memory_fragments (
+                fragment_id TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                fragment_type TEXT NOT NULL,
+                temporal_tags TEXT,
+                symbolic_tags TEXT,
+                associative_links TEXT,
+                confidence_score REAL,
+                access_pattern TEXT,
+                narrative_role TEXT,
+                created_at TEXT,
+                last_evolved TEXT
             )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_fragments_type ON memory_fragments (fragment_type)"
+        """)
+
+        self._connections.execute("""
+            CREATE TABLE IF NOT EXISTS concept_clusters (
+                cluster_id TEXT PRIMARY KEY,
+                central_concept TEXT NOT NULL,
+                related_concepts TEXT,
+                member_fragments TEXT,
+                cluster_strength REAL,
+                temporal_evolution TEXT,
+                narrative_themes TEXT
             )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_clusters_concept ON concept_clusters (central_concept)"
+        """)
+
+        self._connections.execute("""
+            CREATE TABLE IF NOT EXISTS episodic_chains (
+                chain_id TEXT PRIMARY KEY,
+                fragments TEXT NOT NULL,
+                narrative_arc TEXT,
+                causal_links TEXT,
+                temporal_span_start TEXT,
+                temporal_span_end TEXT,
+                significance_score REAL
             )
+        """)
 
-            conn.commit()
-        finally:
-            conn.close()
+        # Indexes for performance
+        self._connections.execute(
+            "CREATE INDEX IF NOT EXISTS idx_fragments_temporal ON memory_fragments (created_at)"
+        )
+        self._connections.execute(
+            "CREATE INDEX IF NOT EXISTS idx_fragments_type ON memory_fragments (fragment_type)"
+        )
+        self._connections.execute(
+            "CREATE INDEX IF NOT EXISTS idx_clusters_concept ON concept_clusters (central_concept)"
+        )
 
     def _load_existing_fragments(self):
         """Load existing memory fragments from database"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.execute("SELECT * FROM memory_fragments")
-            for row in cursor.fetchall():
+        if self.lazy:
+            self._load_fragment_index()
+            return
+
+        rows = self._connections.query(
+            "SELECT * FROM memory_fragments ORDER BY created_at"
+        )
+        for row in rows:
+            fragment = self._row_to_fragment(row)
+            self.fragments[fragment.fragment_id] = fragment
+            self._update_indexes(fragment)
+
+    def _load_fragment_index(self, page_size: int = 5000):
+        """Rebuild the lightweight indexes without hydrating fragment content"""
+        last_rowid = 0
+        while True:
+            rows = self._connections.query(
+                """
+                SELECT rowid, fragment_id, fragment_type, symbolic_tags,
+                       associative_links, created_at
+                FROM memory_fragments WHERE rowid > ? ORDER BY rowid LIMIT ?
+            """,
+                (last_rowid, page_size),
+            )
+            if not rows:
+                break
+
+            for rowid, fragment_id, fragment_type, tags, links, created_at in rows:
+                self.fragments.register(fragment_id)
+                self._index_fields(
+                    fragment_id,
+                    MemoryFragmentType(fragment_type),
+                    datetime.fromisoformat(created_at),
+                    json.loads(tags) if tags else [],
+                    json.loads(links) if links else [],
+                )
+            last_rowid = rows[-1][0]
+
+    def _load_fragments_by_id(
+        self, fragment_ids: Iterable[str]
+    ) -> Dict[str, MemoryFragment]:
+        """Hydrate full fragments for the given ids"""
+        fragment_ids = list(fragment_ids)
+        fragments = {}
+        for offset in range(0, len(fragment_ids), 500):
+            batch = fragment_ids[offset : offset + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._connections.query(
+                f"SELECT * FROM memory_fragments WHERE fragment_id IN ({placeholders})",
+                batch,
+            )
+            for row in rows:
                 fragment = self._row_to_fragment(row)
-                self.fragments[fragment.fragment_id] = fragment
-                self._update_indexes(fragment)
-        finally:
-            conn.close()
+                fragments[fragment.fragment_id] = fragment
+        return fragments
+
+    def _get_fragments(self, fragment_ids: Iterable[str]) -> List[MemoryFragment]:
+        """Fetch several fragments, batching hydration in lazy mode"""
+        if self.lazy:
+            return self.fragments.get_many(fragment_ids)
+        return [self.fragments[fid] for fid in fragment_ids if fid in self.fragments]
+
+    def get_fragment_cache_stats(self) -> Dict[str, Any]:
+        """Hydration cache statistics (lazy mode) or resident fragment count"""
+        if self.lazy:
+            return self.fragments.get_cache_stats()
+        return {"known_records": len(self.fragments), "lazy": False}
+
+    def flush(self) -> int:
+        """Commit any fragment writes still waiting in the write-behind queue"""
+        return self._connections.flush()
+
+    def close(self):
+        """Flush pending writes and release the shared database connection"""
+        release_connection_manager(self.db_path)
+
+    def get_storage_metrics(self) -> Dict[str, Any]:
+        """Write-behind flush and lag metrics for the fragment database"""
+        return self._connections.get_metrics()
 
     def store_fragment(self, fragment: MemoryFragment) -> str:
         """Store a memory fragment in the fractal mesh"""
+        is_new = fragment.fragment_id not in self.fragments
         self.fragments[fragment.fragment_id] = fragment
-        self._update_indexes(fragment)
+        self._update_indexes(fragment, is_new=is_new)
         self._persist_fragment(fragment)
 
         # Trigger clustering and chain detection
@@ -203,9 +295,7 @@ class FractalMeshCore:
     ) -> List[MemoryFragment]:
         """Retrieve fragments related to a concept"""
         related_fragment_ids = self.concept_index.get(concept, set())
-        fragments = [
-            self.fragments[fid] for fid in related_fragment_ids if fid in self.fragments
-        ]
+        fragments = self._get_fragments(related_fragment_ids)
 
         # Sort by relevance (combination of confidence and recency)
         fragments.sort(
@@ -306,46 +396,77 @@ class FractalMeshCore:
             ),
         }
 
-    def _update_indexes(self, fragment: MemoryFragment):
+    def _update_indexes(self, fragment: MemoryFragment, is_new: bool = True):
         """Update internal indexes with new fragment"""
-        # Temporal index
-        day_key = fragment.created_at.replace(hour=0, minute=0, second=0, microsecond=0)
-        if day_key not in self.temporal_index:
-            self.temporal_index[day_key] = []
-        self.temporal_index[day_key].append(fragment.fragment_id)
+        self._index_fields(
+            fragment.fragment_id,
+            fragment.fragment_type,
+            fragment.created_at,
+            fragment.symbolic_tags,
+            fragment.associative_links,
+            is_new,
+        )
+
+    def _index_fields(
+        self,
+        fragment_id: str,
+        fragment_type: MemoryFragmentType,
+        created_at: datetime,
+        symbolic_tags: Iterable[str],
+        associative_links: Iterable[str],
+        is_new: bool = True,
+    ):
+        """Update internal indexes from the lightweight fields of a fragment"""
+        if is_new:
+            # Temporal index
+            day_key = created_at.replace(hour=0, minute=0, second=0, microsecond=0)
+            if day_key not in self.temporal_index:
+                self.temporal_index[day_key] = []
+            self.temporal_index[day_key].append(fragment_id)
+
+            # Sorted episodic time index for window lookups
+            if fragment_type == MemoryFragmentType.EPISODIC:
+                timestamp = created_at.timestamp()
+                position = bisect.bisect_right(self._episodic_times, timestamp)
+                self._episodic_times.insert(position, timestamp)
+                self._episodic_ids.insert(position, fragment_id)
 
         # Concept index
-        for concept in fragment.symbolic_tags:
+        for concept in symbolic_tags:
             if concept not in self.concept_index:
                 self.concept_index[concept] = set()
-            self.concept_index[concept].add(fragment.fragment_id)
+            self.concept_index[concept].add(fragment_id)
 
         # Association graph
-        if fragment.fragment_id not in self.association_graph:
-            self.association_graph[fragment.fragment_id] = set()
-        for linked_id in fragment.associative_links:
-            self.association_graph[fragment.fragment_id].add(linked_id)
+        if fragment_id not in self.association_graph:
+            self.association_graph[fragment_id] = set()
+        for linked_id in associative_links:
+            self.association_graph[fragment_id].add(linked_id)
             # Bidirectional links
             if linked_id not in self.association_graph:
                 self.association_graph[linked_id] = set()
-            self.association_graph[linked_id].add(fragment.fragment_id)
+            self.association_graph[linked_id].add(fragment_id)
 
     def _update_concept_clusters(self, fragment: MemoryFragment):
-        """Update concept clusters based on new fragment"""
-        # Simplified clustering - find existing clusters to join or create new
+        """Update concept clusters based on new fragment
+
+        Uses the concept -> cluster inverted index, so the cost depends only on
+        the number of tags on the fragment, not on the number of clusters.
+        """
         for concept in fragment.symbolic_tags:
-            existing_cluster = None
-            for cluster in self.concept_clusters.values():
-                if (
-                    concept in cluster.related_concepts
-                    or concept == cluster.central_concept
-                ):
-                    existing_cluster = cluster
-                    break
+            cluster_id = self._concept_cluster_index.get(concept)
+            existing_cluster = (
+                self.concept_clusters.get(cluster_id) if cluster_id else None
+            )
 
             if existing_cluster:
                 existing_cluster.member_fragments.add(fragment.fragment_id)
-                existing_cluster.related_concepts.update(fragment.symbolic_tags)
+                new_concepts = (
+                    fragment.symbolic_tags - existing_cluster.related_concepts
+                )
+                if new_concepts:
+                    existing_cluster.related_concepts.update(new_concepts)
+                    self._index_cluster_concepts(existing_cluster, new_concepts)
             else:
                 # Create new cluster
                 cluster_id = str(uuid.uuid4())
@@ -359,46 +480,131 @@ class FractalMeshCore:
                     narrative_themes=[],
                 )
                 self.concept_clusters[cluster_id] = new_cluster
+                self._index_cluster_concepts(
+                    new_cluster, {concept} | new_cluster.related_concepts
+                )
+
+    def _index_cluster_concepts(self, cluster: ConceptCluster, concepts: Set[str]):
+        """Point concepts at a cluster unless an older cluster already owns them"""
+        for concept in concepts:
+            self._concept_cluster_index.setdefault(concept, cluster.cluster_id)
 
     def _update_episodic_chains(self, fragment: MemoryFragment):
-        """Update episodic chains based on temporal and causal relationships"""
+        """Update episodic chains based on temporal and causal relationships
+
+        Chains group episodic fragments whose neighbours in time are no more
+        than ``episodic_window`` apart. A new fragment only needs to look at
+        its immediate predecessor and successor in the sorted time index, and
+        joins (or bridges) their chains in place instead of building a new
+        chain from scratch.
+        """
         if fragment.fragment_type != MemoryFragmentType.EPISODIC:
             return
+        if fragment.fragment_id in self._fragment_chain_index:
+            return
 
-        # Find nearby fragments in time to potentially chain
-        time_window = timedelta(hours=24)  # Look within 24 hours
-        nearby_fragments = []
+        window = self.episodic_window.total_seconds()
+        timestamp = fragment.created_at.timestamp()
+        position = bisect.bisect_left(self._episodic_times, timestamp)
+
+        # Skip over the fragment's own entry (and exact-timestamp duplicates)
+        # to find its nearest neighbours on each side.
+        neighbours = []
+        left = position - 1
+        if left >= 0 and timestamp - self._episodic_times[left] <= window:
+            neighbours.append(self._episodic_ids[left])
+        right = position
+        while (
+            right < len(self._episodic_ids)
+            and self._episodic_ids[right] == fragment.fragment_id
+        ):
+            right += 1
+        if (
+            right < len(self._episodic_times)
+            and self._episodic_times[right] - timestamp <= window
+        ):
+            neighbours.append(self._episodic_ids[right])
+
+        if not neighbours:
+            return
 
-        for other_id, other_fragment in self.fragments.items():
-            if (
-                other_id != fragment.fragment_id
-                and other_fragment.fragment_type == MemoryFragmentType.EPISODIC
-                and abs(
-                    (fragment.created_at - other_fragment.created_at).total_seconds()
-                )
-                <= time_window.total_seconds()
+        chain_ids = []
+        for neighbour_id in neighbours:
+            chain_id = self._fragment_chain_index.get(neighbour_id)
+            if chain_id is None:
+                chain_id = self._start_chain(self.fragments[neighbour_id])
+            if chain_id not in chain_ids:
+                chain_ids.append(chain_id)
+
+        chain = self.episodic_chains[chain_ids[0]]
+        self._add_to_chain(chain, fragment)
+        for other_chain_id in chain_ids[1:]:
+            self._merge_chains(chain, self.episodic_chains[other_chain_id])
+
+    def _start_chain(self, fragment: MemoryFragment) -> str:
+        """Create a single-fragment episodic chain seeded by ``fragment``"""
+        chain_id = str(uuid.uuid4())
+        self.episodic_chains[chain_id] = EpisodicChain(
+            chain_id=chain_id,
+            fragments=[fragment.fragment_id],
+            narrative_arc="Temporal sequence",  # Would be enhanced by narrative generator
+            causal_links={},  # Would be enhanced by causal analysis
+            temporal_span=(fragment.created_at, fragment.created_at),
+            significance_score=fragment.confidence_score,
+        )
+        self._fragment_chain_index[fragment.fragment_id] = chain_id
+        self._chain_confidence_totals[chain_id] = fragment.confidence_score
+        return chain_id
+
+    def _add_to_chain(self, chain: EpisodicChain, fragment: MemoryFragment):
+        """Insert a fragment into a chain, keeping it ordered by creation time"""
+        start, end = chain.temporal_span
+        if fragment.created_at >= end:
+            chain.fragments.append(fragment.fragment_id)
+        elif fragment.created_at <= start:
+            chain.fragments.insert(0, fragment.fragment_id)
+        else:
+            # Out-of-order arrivals are rare and usually land near the tail
+            index = len(chain.fragments)
+            while (
+                index > 0
+                and self.fragments[chain.fragments[index - 1]].created_at
+                > fragment.created_at
             ):
-                nearby_fragments.append(other_fragment)
-
-        if nearby_fragments:
-            # Simplified chain creation - group by temporal proximity
-            chain_id = str(uuid.uuid4())
-            all_fragments = [fragment] + nearby_fragments
-            all_fragments.sort(key=lambda f: f.created_at)
-
-            new_chain = EpisodicChain(
-                chain_id=chain_id,
-                fragments=[f.fragment_id for f in all_fragments],
-                narrative_arc="Temporal sequence",  # Would be enhanced by narrative generator
-                causal_links={},  # Would be enhanced by causal analysis
-                temporal_span=(
-                    all_fragments[0].created_at,
-                    all_fragments[-1].created_at,
-                ),
-                significance_score=sum(f.confidence_score for f in all_fragments)
-                / len(all_fragments),
+                index -= 1
+            chain.fragments.insert(index, fragment.fragment_id)
+
+        chain.temporal_span = (
+            min(start, fragment.created_at),
+            max(end, fragment.created_at),
+        )
+        self._fragment_chain_index[fragment.fragment_id] = chain.chain_id
+        total = (
+            self._chain_confidence_totals[chain.chain_id] + fragment.confidence_score
+        )
+        self._chain_confidence_totals[chain.chain_id] = total
+        chain.significance_score = total / len(chain.fragments)
+
+    def _merge_chains(self, target: EpisodicChain, source: EpisodicChain):
+        """Merge ``source`` into ``target`` when a fragment bridges the two"""
+        if source.temporal_span[0] >= target.temporal_span[1]:
+            # Common case: the bridged chain follows the target in time
+            target.fragments.extend(source.fragments)
+            for fragment_id in source.fragments:
+                self._fragment_chain_index[fragment_id] = target.chain_id
+            target.temporal_span = (target.temporal_span[0], source.temporal_span[1])
+            total = (
+                self._chain_confidence_totals[target.chain_id]
+                + self._chain_confidence_totals[source.chain_id]
             )
-            self.episodic_chains[chain_id] = new_chain
+            self._chain_confidence_totals[target.chain_id] = total
+            target.significance_score = total / len(target.fragments)
+        else:
+            for fragment_id in source.fragments:
+                self._add_to_chain(target, self.fragments[fragment_id])
+        target.causal_links.update(source.causal_links)
+        del self.episodic_chains[source.chain_id]
+        del self._chain_confidence_totals[source.chain_id]
 
     def _temporal_relevance(self, timestamp: datetime) -> float:
         """Calculate temporal relevance (more recent = higher score)"""
@@ -427,34 +633,29 @@ class FractalMeshCore:
         return changes
 
     def _persist_fragment(self, fragment: MemoryFragment):
-        """Persist fragment to database"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO memory_fragments
-                (fragment_id, content, fragment_type, temporal_tags, symbolic_tags,
-                 associative_links, confidence_score, access_pattern, narrative_role,
-                 created_at, last_evolved)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    fragment.fragment_id,
-                    json.dumps(fragment.content),
-                    fragment.fragment_type.value,
-                    json.dumps(fragment.temporal_tags),
-                    json.dumps(list(fragment.symbolic_tags)),
-                    json.dumps(fragment.associative_links),
-                    fragment.confidence_score,
-                    json.dumps(fragment.access_pattern),
-                    fragment.narrative_role,
-                    fragment.created_at.isoformat(),
-                    fragment.last_evolved.isoformat(),
-                ),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        """Queue fragment for write-behind persistence"""
+        self._connections.submit(
+            """
+            INSERT OR REPLACE INTO memory_fragments
+            (fragment_id, content, fragment_type, temporal_tags, symbolic_tags,
+             associative_links, confidence_score, access_pattern, narrative_role,
+             created_at, last_evolved)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                fragment.fragment_id,
+                json.dumps(fragment.content),
+                fragment.fragment_type.value,
+                json.dumps(fragment.temporal_tags),
+                json.dumps(list(fragment.symbolic_tags)),
+                json.dumps(fragment.associative_links),
+                fragment.confidence_score,
+                json.dumps(fragment.access_pattern),
+                fragment.narrative_role,
+                fragment.created_at.isoformat(),
+                fragment.last_evolved.isoformat(),
+            ),
+        )
 
     def _row_to_fragment(self, row) -> MemoryFragment:
         """Convert database row to MemoryFragment object"""
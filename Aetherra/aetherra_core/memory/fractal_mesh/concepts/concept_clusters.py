@@ -8,13 +8,17 @@ Enables thematic recall, contradiction detection, and concept evolution tracking
 
 import json
 import math
-import sqlite3
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, MutableMapping, Optional, Set, Tuple
 
 from ..base import ConceptCluster, MemoryFragment, MemoryFragmentType
+from ..connection_manager import (
+    acquire_connection_manager,
+    release_connection_manager,
+)
+from ..lazy_store import LazyRecordStore
 
 
 @dataclass
@@ -51,78 +55,177 @@ class ConceptClusterManager:
     - Narrative theme identification
     """
 
-    def __init__(self, db_path: str = "concept_clusters.db"):
+    def __init__(
+        self,
+        db_path: str = "concept_clusters.db",
+        lazy: bool = False,
+        cache_size: int = 10000,
+    ):
         self.db_path = db_path
-        self.clusters: Dict[str, ConceptCluster] = {}
-        self.concept_evolution: Dict[str, ConceptEvolution] = {}
+        self.lazy = lazy
+        self.clusters: MutableMapping[str, ConceptCluster] = (
+            LazyRecordStore(self._load_clusters_by_id, cache_size=cache_size)
+            if lazy
+            else {}
+        )
+        self.concept_evolution: MutableMapping[str, ConceptEvolution] = (
+            LazyRecordStore(self._load_evolutions_by_concept, cache_size=cache_size)
+            if lazy
+            else {}
+        )
         self.detected_contradictions: List[ConceptContradiction] = []
         self.concept_similarity_threshold = 0.7
         self.min_cluster_size = 3
 
+        # Lightweight concept indexes kept resident in both modes
+        self._cluster_concepts: Dict[str, Set[str]] = {}  # cluster_id -> concepts
+        self._concept_cluster_index: Dict[str, str] = {}  # concept -> cluster_id
+
+        # Shared WAL connection with write-behind persistence
+        self._connections = acquire_connection_manager(self.db_path)
+
         self._init_database()
         self._load_existing_clusters()
 
     def _init_database(self):
         """Initialize concept clustering database"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS concept_clusters (
-                    cluster_id TEXT PRIMARY KEY,
-                    central_concept TEXT NOT NULL,
-                    related_concepts TEXT,
-                    member_fragments TEXT,
-                    cluster_strength REAL,
-                    temporal_evolution TEXT,
-                    narrative_themes TEXT,
-                    created_at TEXT,
-                    last_updated TEXT
-                )
-            """)
-
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS concept_evolution (
-                    concept TEXT PRIMARY KEY,
-                    timestamps TEXT,
-                    confidence_scores TEXT,
-                    associated_fragments TEXT,
-                    narrative_contexts TEXT
+        self._connections.execute("""
+            CREATE TABLE IF NOT EXISTS concept_clusters (
+                cluster_id TEXT PRIMARY KEY,
+                central_concept TEXT NOT NULL,
+                related_concepts TEXT,
+                member_fragments TEXT,
+                cluster_strength REAL,
+                temporal_evolution TEXT,
+                narrative_themes TEXT,
+                created_at TEXT,
+                last_updated TEXT
+            )
+        """)
+
+        self._connections.execute("""
+            CREATE TABLE IF NOT EXISTS concept_evolution (
+                concept TEXT PRIMARY KEY,
+                timestamps TEXT,
+                confidence_scores TEXT,
+                associated_fragments TEXT,
+                narrative_contexts TEXT
+            )
+        """)
+
+        self._connections.execute("""
+            CREATE TABLE IF NOT EXISTS concept_contradictions (
+                contradiction_id TEXT PRIMARY KEY,
+                concept TEXT NOT NULL,
+                contradicting_fragments TEXT,
+                contradiction_type TEXT,
+                confidence REAL,
+                detected_at TEXT
+            )
+        """)
+
+    def _load_existing_clusters(self):
+        """Load existing clusters from database"""
+        if self.lazy:
+            # Only the concept indexes; clusters and evolution hydrate on demand
+            rows = self._connections.query(
+                "SELECT cluster_id, central_concept, related_concepts "
+                "FROM concept_clusters"
+            )
+            for cluster_id, central_concept, related_concepts in rows:
+                self.clusters.register(cluster_id)
+                self._index_cluster_concepts(
+                    cluster_id,
+                    central_concept,
+                    json.loads(related_concepts) if related_concepts else [],
                 )
-            """)
-
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS concept_contradictions (
-                    contradiction_id TEXT PRIMARY KEY,
-                    concept TEXT NOT NULL,
-                    contradicting_fragments TEXT,
-                    contradiction_type TEXT,
-                    confidence REAL,
-                    detected_at TEXT
+            for (concept,) in self._connections.query(
+                "SELECT concept FROM concept_evolution"
+            ):
+                self.concept_evolution.register(concept)
+            return
+
+        # Load clusters
+        for row in self._connections.query("SELECT * FROM concept_clusters"):
+            cluster = self._row_to_cluster(row)
+            self.clusters[cluster.cluster_id] = cluster
+            self._index_cluster(cluster)
+
+        # Load evolution data
+        for row in self._connections.query("SELECT * FROM concept_evolution"):
+            evolution = self._row_to_evolution(row)
+            self.concept_evolution[evolution.concept] = evolution
+
+    def _load_clusters_by_id(
+        self, cluster_ids: Iterable[str]
+    ) -> Dict[str, ConceptCluster]:
+        """Hydrate full clusters for the given ids"""
+        clusters = {}
+        for row in self._select_in("concept_clusters", "cluster_id", cluster_ids):
+            cluster = self._row_to_cluster(row)
+            clusters[cluster.cluster_id] = cluster
+        return clusters
+
+    def _load_evolutions_by_concept(
+        self, concepts: Iterable[str]
+    ) -> Dict[str, ConceptEvolution]:
+        """Hydrate evolution records for the given concepts"""
+        evolutions = {}
+        for row in self._select_in("concept_evolution", "concept", concepts):
+            evolution = self._row_to_evolution(row)
+            evolutions[evolution.concept] = evolution
+        return evolutions
+
+    def _select_in(self, table: str, column: str, keys: Iterable[str]) -> List[tuple]:
+        """SELECT * rows whose key column is in ``keys``, in SQLite-sized batches"""
+        keys = list(keys)
+        rows: List[tuple] = []
+        for offset in range(0, len(keys), 500):
+            batch = keys[offset : offset + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows.extend(
+                self._connections.query(
+                    f"SELECT * FROM {table} WHERE {column} IN ({placeholders})", batch
                 )
-            """)
+            )
+        return rows
 
-            conn.commit()
-        finally:
-            conn.close()
+    def _index_cluster(self, cluster: ConceptCluster):
+        """Refresh the lightweight concept indexes for a cluster"""
+        self._index_cluster_concepts(
+            cluster.cluster_id, cluster.central_concept, cluster.related_concepts
+        )
 
-    def _load_existing_clusters(self):
-        """Load existing clusters from database"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            # Load clusters
-            cursor = conn.execute("SELECT * FROM concept_clusters")
-            for row in cursor.fetchall():
-                cluster = self._row_to_cluster(row)
-                self.clusters[cluster.cluster_id] = cluster
-
-            # Load evolution data
-            cursor = conn.execute("SELECT * FROM concept_evolution")
-            for row in cursor.fetchall():
-                evolution = self._row_to_evolution(row)
-                self.concept_evolution[evolution.concept] = evolution
-
-        finally:
-            conn.close()
+    def _index_cluster_concepts(
+        self, cluster_id: str, central_concept: str, related_concepts: Iterable[str]
+    ):
+        concepts = self._cluster_concepts.setdefault(cluster_id, set())
+        concepts.add(central_concept)
+        concepts.update(related_concepts)
+        for concept in concepts:
+            self._concept_cluster_index.setdefault(concept, cluster_id)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hydration cache statistics for clusters and concept evolution"""
+        if not self.lazy:
+            return {"lazy": False, "clusters": len(self.clusters)}
+        return {
+            "lazy": True,
+            "clusters": self.clusters.get_cache_stats(),
+            "concept_evolution": self.concept_evolution.get_cache_stats(),
+        }
+
+    def flush(self) -> int:
+        """Commit any cluster writes still waiting in the write-behind queue"""
+        return self._connections.flush()
+
+    def close(self):
+        """Flush pending writes and release the shared database connection"""
+        release_connection_manager(self.db_path)
+
+    def get_storage_metrics(self) -> Dict[str, Any]:
+        """Write-behind flush and lag metrics for the cluster database"""
+        return self._connections.get_metrics()
 
     def process_new_fragment(self, fragment: MemoryFragment) -> List[str]:
         """Process a new memory fragment for concept clustering"""
@@ -236,17 +339,16 @@ class ConceptClusterManager:
     ) -> Optional[str]:
         """Find existing cluster for concept or create new one"""
         # Look for existing cluster with this concept
-        for cluster_id, cluster in self.clusters.items():
-            if (
-                concept == cluster.central_concept
-                or concept in cluster.related_concepts
-            ):
-                # Add fragment to existing cluster
-                cluster.member_fragments.add(fragment.fragment_id)
-                cluster.related_concepts.update(fragment.symbolic_tags)
-                cluster.cluster_strength = self._calculate_cluster_strength(cluster)
-                self._persist_cluster(cluster)
-                return cluster_id
+        cluster_id = self._concept_cluster_index.get(concept)
+        if cluster_id is not None and cluster_id in self.clusters:
+            # Add fragment to existing cluster
+            cluster = self.clusters[cluster_id]
+            cluster.member_fragments.add(fragment.fragment_id)
+            cluster.related_concepts.update(fragment.symbolic_tags)
+            cluster.cluster_strength = self._calculate_cluster_strength(cluster)
+            self._index_cluster(cluster)
+            self._persist_cluster(cluster)
+            return cluster_id
 
         # Check if we should create a cluster with similar concepts
         similar_cluster = self._find_similar_cluster(concept, fragment)
@@ -256,6 +358,7 @@ class ConceptClusterManager:
             similar_cluster.cluster_strength = self._calculate_cluster_strength(
                 similar_cluster
             )
+            self._index_cluster(similar_cluster)
             self._persist_cluster(similar_cluster)
             return similar_cluster.cluster_id
 
@@ -272,6 +375,7 @@ class ConceptClusterManager:
         )
 
         self.clusters[cluster_id] = new_cluster
+        self._index_cluster(new_cluster)
         self._persist_cluster(new_cluster)
         return cluster_id
 
@@ -279,14 +383,12 @@ class ConceptClusterManager:
         self, concept: str, fragment: MemoryFragment
     ) -> Optional[ConceptCluster]:
         """Find cluster with similar concepts"""
-        best_cluster = None
+        best_cluster_id = None
         best_similarity = 0.0
+        fragment_concepts = {concept} | fragment.symbolic_tags
 
-        for cluster in self.clusters.values():
+        for cluster_id, all_cluster_concepts in self._cluster_concepts.items():
             # Calculate concept similarity
-            all_cluster_concepts = {cluster.central_concept} | cluster.related_concepts
-            fragment_concepts = {concept} | fragment.symbolic_tags
-
             intersection = len(all_cluster_concepts & fragment_concepts)
             union = len(all_cluster_concepts | fragment_concepts)
 
@@ -297,9 +399,11 @@ class ConceptClusterManager:
                     and similarity >= self.concept_similarity_threshold
                 ):
                     best_similarity = similarity
-                    best_cluster = cluster
+                    best_cluster_id = cluster_id
 
-        return best_cluster
+        if best_cluster_id is None:
+            return None
+        return self.clusters.get(best_cluster_id)
 
     def _calculate_cluster_strength(self, cluster: ConceptCluster) -> float:
         """Calculate the strength/coherence of a concept cluster"""
@@ -394,12 +498,9 @@ class ConceptClusterManager:
         """Get all fragment IDs associated with a concept"""
         fragment_ids = []
 
-        for cluster in self.clusters.values():
-            if (
-                concept == cluster.central_concept
-                or concept in cluster.related_concepts
-            ):
-                fragment_ids.extend(cluster.member_fragments)
+        for cluster_id, concepts in self._cluster_concepts.items():
+            if concept in concepts and cluster_id in self.clusters:
+                fragment_ids.extend(self.clusters[cluster_id].member_fragments)
 
         return list(set(fragment_ids))  # Remove duplicates
 
@@ -486,84 +587,69 @@ class ConceptClusterManager:
 
     def _persist_cluster(self, cluster: ConceptCluster):
         """Persist cluster to database"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO concept_clusters
-                (cluster_id, central_concept, related_concepts, member_fragments,
-                 cluster_strength, temporal_evolution, narrative_themes, created_at, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    cluster.cluster_id,
-                    cluster.central_concept,
-                    json.dumps(list(cluster.related_concepts)),
-                    json.dumps(list(cluster.member_fragments)),
-                    cluster.cluster_strength,
-                    json.dumps(
-                        [
-                            (ts.isoformat(), score)
-                            for ts, score in cluster.temporal_evolution
-                        ]
-                    ),
-                    json.dumps(cluster.narrative_themes),
-                    datetime.now().isoformat(),
-                    datetime.now().isoformat(),
+        self._connections.submit(
+            """
+            INSERT OR REPLACE INTO concept_clusters
+            (cluster_id, central_concept, related_concepts, member_fragments,
+             cluster_strength, temporal_evolution, narrative_themes, created_at, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                cluster.cluster_id,
+                cluster.central_concept,
+                json.dumps(list(cluster.related_concepts)),
+                json.dumps(list(cluster.member_fragments)),
+                cluster.cluster_strength,
+                json.dumps(
+                    [
+                        (ts.isoformat(), score)
+                        for ts, score in cluster.temporal_evolution
+                    ]
                 ),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+                json.dumps(cluster.narrative_themes),
+                datetime.now().isoformat(),
+                datetime.now().isoformat(),
+            ),
+        )
 
     def _persist_concept_evolution(self, evolution: ConceptEvolution):
         """Persist concept evolution to database"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO concept_evolution
-                (concept, timestamps, confidence_scores, associated_fragments, narrative_contexts)
-                VALUES (?, ?, ?, ?, ?)
-            """,
-                (
-                    evolution.concept,
-                    json.dumps([ts.isoformat() for ts in evolution.timestamps]),
-                    json.dumps(evolution.confidence_scores),
-                    json.dumps(evolution.associated_fragments),
-                    json.dumps(evolution.narrative_contexts),
-                ),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        self._connections.submit(
+            """
+            INSERT OR REPLACE INTO concept_evolution
+            (concept, timestamps, confidence_scores, associated_fragments, narrative_contexts)
+            VALUES (?, ?, ?, ?, ?)
+        """,
+            (
+                evolution.concept,
+                json.dumps([ts.isoformat() for ts in evolution.timestamps]),
+                json.dumps(evolution.confidence_scores),
+                json.dumps(evolution.associated_fragments),
+                json.dumps(evolution.narrative_contexts),
+            ),
+        )
 
     def _persist_contradiction(self, contradiction: ConceptContradiction):
         """Persist detected contradiction to database"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            contradiction_id = str(uuid.uuid4())
-            conn.execute(
-                """
-                INSERT INTO concept_contradictions
-                (contradiction_id, concept, contradicting_fragments, contradiction_type,
-                 confidence, detected_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    contradiction_id,
-                    contradiction.concept,
-                    json.dumps(
-                        [list(pair) for pair in contradiction.contradicting_fragments]
-                    ),
-                    contradiction.contradiction_type,
-                    contradiction.confidence,
-                    contradiction.detected_at.isoformat(),
+        contradiction_id = str(uuid.uuid4())
+        self._connections.submit(
+            """
+            INSERT INTO concept_contradictions
+            (contradiction_id, concept, contradicting_fragments, contradiction_type,
+             confidence, detected_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """,
+            (
+                contradiction_id,
+                contradiction.concept,
+                json.dumps(
+                    [list(pair) for pair in contradiction.contradicting_fragments]
                 ),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+                contradiction.contradiction_type,
+                contradiction.confidence,
+                contradiction.detected_at.isoformat(),
+            ),
+        )
 
     def _row_to_cluster(self, row) -> ConceptCluster:
         """Convert database row to ConceptCluster object"""
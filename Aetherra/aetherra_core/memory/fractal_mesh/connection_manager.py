@@ -0,0 +1,330 @@
+"""
+🗄️ FractalMesh Connection Manager
+================================
+
+Shared SQLite access for the fractal mesh stack (FractalMeshCore,
+ConceptClusterManager, EpisodicTimeline).
+
+Each database file gets one long-lived WAL-mode connection shared by every
+component that opens it. Row writes go through a bounded write-behind queue
+that is flushed in a single transaction when it reaches ``batch_size`` or
+when the oldest pending write is ``flush_interval`` seconds old. Pending
+writes are flushed before reads and on clean shutdown.
+
+If a batch fails its rows are retried one at a time, so a single bad row
+cannot hold back the rest. Rows that keep failing for ``max_attempts``
+flushes are moved to a dead-letter list, as are rows still failing when
+the manager is closed.
+"""
+
+import atexit
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# (sql, params, submitted at, failed attempts)
+PendingWrite = Tuple[str, Sequence[Any], float, int]
+
+
+class MeshConnectionManager:
+    """
+    Thread-safe connection plus write-behind queue for one SQLite database
+
+    Features:
+    - Single shared connection in WAL mode with a prepared-statement cache
+    - Bounded write-behind queue flushed by size or age
+    - Consecutive writes with the same SQL are batched with executemany
+    - Per-row retry and a dead-letter list for rows that keep failing
+    - Flush and lag metrics for monitoring
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+        max_pending: int = 10000,
+        max_attempts: int = 3,
+        max_dead_letters: int = 1000,
+    ):
+        self.db_path = str(db_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=256
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        self._conn_lock = threading.RLock()
+        self._pending: Deque[PendingWrite] = deque()
+        self.dead_letters: Deque[Tuple[str, Sequence[Any], str]] = deque(
+            maxlen=max_dead_letters
+        )
+        self._pending_cond = threading.Condition()
+        self._flusher: Optional[threading.Thread] = None
+        self._closed = False
+
+        self.metrics = {
+            "writes_submitted": 0,
+            "rows_flushed": 0,
+            "flushes": 0,
+            "flush_errors": 0,
+            "row_errors": 0,
+            "dead_letters": 0,
+            "backpressure_flushes": 0,
+            "last_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+            "max_lag_ms": 0.0,
+        }
+
+    # Immediate operations
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> None:
+        """Execute and commit a statement immediately (schema changes etc.)"""
+        with self._conn_lock:
+            self._conn.execute(sql, params)
+            self._conn.commit()
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        """Run a read query, flushing pending writes first"""
+        self.flush()
+        with self._conn_lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    # Write-behind
+    def submit(self, sql: str, params: Sequence[Any] = ()) -> None:
+        """Queue a row write; it is committed by the next flush"""
+        if self._closed:
+            raise RuntimeError(f"Connection manager for {self.db_path} is closed")
+
+        with self._pending_cond:
+            self._pending.append((sql, params, time.monotonic(), 0))
+            self.metrics["writes_submitted"] += 1
+            pending_count = len(self._pending)
+            if pending_count >= self.batch_size:
+                self._pending_cond.notify()
+
+        self._ensure_flusher()
+
+        if pending_count >= self.max_pending:
+            # Backpressure: producers outrunning the flusher pay for a flush
+            self.metrics["backpressure_flushes"] += 1
+            self.flush()
+
+    def flush(self) -> int:
+        """Commit all pending writes in one transaction; returns rows written"""
+        with self._conn_lock:
+            with self._pending_cond:
+                batch = list(self._pending)
+                self._pending.clear()
+            if not batch:
+                return 0
+
+            started = time.monotonic()
+            try:
+                with self._conn:
+                    for sql, rows in self._group_consecutive(batch):
+                        self._conn.executemany(sql, rows)
+                written = len(batch)
+            except sqlite3.Error:
+                # Nothing was committed: find the bad rows one at a time
+                self.metrics["flush_errors"] += 1
+                written = self._flush_rows(batch)
+
+            finished = time.monotonic()
+            flush_ms = (finished - started) * 1000
+            lag_ms = (finished - batch[0][2]) * 1000
+            self.metrics["flushes"] += 1
+            self.metrics["rows_flushed"] += written
+            self.metrics["last_flush_ms"] = flush_ms
+            self.metrics["total_flush_ms"] += flush_ms
+            self.metrics["max_lag_ms"] = max(self.metrics["max_lag_ms"], lag_ms)
+            return written
+
+    def _flush_rows(self, batch: List[PendingWrite]) -> int:
+        """Commit rows individually; failed rows are requeued or dead-lettered"""
+        written = 0
+        retry: List[PendingWrite] = []
+        for sql, params, submitted_at, attempts in batch:
+            try:
+                with self._conn:
+                    self._conn.execute(sql, params)
+                written += 1
+            except sqlite3.Error as e:
+                self.metrics["row_errors"] += 1
+                if attempts + 1 >= self.max_attempts:
+                    self.dead_letters.append((sql, params, str(e)))
+                    self.metrics["dead_letters"] += 1
+                else:
+                    retry.append((sql, params, submitted_at, attempts + 1))
+
+        if retry:
+            # Ahead of newer writes so row order is kept
+            with self._pending_cond:
+                self._pending.extendleft(reversed(retry))
+        return written
+
+    def close(self) -> None:
+        """Flush pending writes, stop the flusher and close the connection"""
+        if self._closed:
+            return
+        with self._pending_cond:
+            self._closed = True
+            self._pending_cond.notify()
+        if self._flusher and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=5)
+        self.flush()
+        with self._conn_lock:
+            with self._pending_cond:
+                lost = list(self._pending)
+                self._pending.clear()
+            for sql, params, _, _ in lost:
+                self.dead_letters.append((sql, params, "connection closed"))
+            self.metrics["dead_letters"] += len(lost)
+            self._conn.close()
+        if lost:
+            logger.warning(
+                f"{len(lost)} pending writes to {self.db_path} failed to flush "
+                "before close and were dead-lettered"
+            )
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return flush and lag metrics"""
+        with self._pending_cond:
+            pending = len(self._pending)
+            oldest = self._pending[0][2] if self._pending else None
+
+        metrics = dict(self.metrics)
+        metrics["db_path"] = self.db_path
+        metrics["pending_writes"] = pending
+        metrics["current_lag_ms"] = (
+            (time.monotonic() - oldest) * 1000 if oldest is not None else 0.0
+        )
+        flushes = metrics["flushes"] or 1
+        metrics["avg_flush_ms"] = metrics["total_flush_ms"] / flushes
+        metrics["avg_batch_size"] = metrics["rows_flushed"] / flushes
+        return metrics
+
+    # Internals
+    def _ensure_flusher(self):
+        if self._flusher is None:
+            with self._pending_cond:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_loop,
+                        name=f"mesh-flusher-{Path(self.db_path).name}",
+                        daemon=True,
+                    )
+                    self._flusher.start()
+
+    def _flush_loop(self):
+        while True:
+            with self._pending_cond:
+                while not self._closed:
+                    if len(self._pending) >= self.batch_size:
+                        break
+                    if self._pending:
+                        age = time.monotonic() - self._pending[0][2]
+                        if age >= self.flush_interval:
+                            break
+                        self._pending_cond.wait(self.flush_interval - age)
+                    else:
+                        self._pending_cond.wait()
+                if self._closed:
+                    return
+            if self.flush() == 0 and self._pending:
+                # Only failing rows left; wait before their next attempt
+                time.sleep(self.flush_interval)
+
+    @staticmethod
+    def _group_consecutive(
+        batch: List[PendingWrite],
+    ) -> List[Tuple[str, List[Sequence[Any]]]]:
+        """Group runs of identical SQL so they can use executemany in order"""
+        groups: List[Tuple[str, List[Sequence[Any]]]] = []
+        for sql, params, _, _ in batch:
+            if groups and groups[-1][0] == sql:
+                groups[-1][1].append(params)
+            else:
+                groups.append((sql, [params]))
+        return groups
+
+
+# Process-wide registry so components sharing a database share a connection
+_managers: Dict[str, MeshConnectionManager] = {}
+_manager_refs: Dict[str, int] = {}
+_registry_lock = threading.Lock()
+
+
+def _registry_key(db_path: Union[str, Path]) -> str:
+    path = str(db_path)
+    if path == ":memory:":
+        return path
+    return str(Path(path).resolve())
+
+
+def acquire_connection_manager(
+    db_path: Union[str, Path], **options: Any
+) -> MeshConnectionManager:
+    """Get (or create) the shared connection manager for a database"""
+    key = _registry_key(db_path)
+    with _registry_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = MeshConnectionManager(db_path, **options)
+            _managers[key] = manager
+            _manager_refs[key] = 0
+        _manager_refs[key] += 1
+        return manager
+
+
+def release_connection_manager(db_path: Union[str, Path]) -> None:
+    """Drop a reference; the last release flushes and closes the connection"""
+    key = _registry_key(db_path)
+    with _registry_lock:
+        if key not in _managers:
+            return
+        _manager_refs[key] -= 1
+        if _manager_refs[key] > 0:
+            return
+        manager = _managers.pop(key)
+        del _manager_refs[key]
+    manager.close()
+
+
+def flush_all_connection_managers() -> None:
+    """Flush every open connection manager"""
+    with _registry_lock:
+        managers = list(_managers.values())
+    for manager in managers:
+        manager.flush()
+
+
+def get_connection_metrics() -> List[Dict[str, Any]]:
+    """Flush/lag metrics for every open connection manager"""
+    with _registry_lock:
+        managers = list(_managers.values())
+    return [manager.get_metrics() for manager in managers]
+
+
+@atexit.register
+def _close_all_connection_managers():
+    """Guarantee pending writes reach disk on clean interpreter shutdown"""
+    with _registry_lock:
+        managers = list(_managers.values())
+        _managers.clear()
+        _manager_refs.clear()
+    for manager in managers:
+        try:
+            manager.close()
+        except sqlite3.Error:
+            pass
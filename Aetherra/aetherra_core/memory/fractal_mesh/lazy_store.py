@@ -0,0 +1,150 @@
+"""
+💤 Lazy Record Store
+===================
+
+Dictionary-like container used by the fractal mesh components in lazy mode.
+
+Only the keys are held in memory at startup; full records are hydrated from
+SQLite on demand and kept in a bounded LRU cache. Full scans (``values()``,
+``items()``) page through the database in batches and do not evict hot
+records from the cache.
+"""
+
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+V = TypeVar("V")
+
+RecordLoader = Callable[[Sequence[str]], Dict[str, Any]]
+
+
+class LazyRecordStore(MutableMapping, Generic[V]):
+    """
+    Mapping of record id -> record that hydrates records lazily
+
+    ``loader`` receives a batch of ids and returns the records it found,
+    keyed by id. Records assigned through ``store[key] = value`` are cached
+    immediately; persisting them remains the caller's responsibility.
+    """
+
+    def __init__(
+        self,
+        loader: RecordLoader,
+        keys: Iterable[str] = (),
+        cache_size: int = 10000,
+        page_size: int = 500,
+    ):
+        self._loader = loader
+        self._keys: Dict[str, None] = dict.fromkeys(keys)
+        self._cache: "OrderedDict[str, V]" = OrderedDict()
+        self.cache_size = cache_size
+        self.page_size = page_size
+
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "paged_loads": 0}
+
+    # Mapping protocol
+    def __getitem__(self, key: str) -> V:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.stats["hits"] += 1
+            return self._cache[key]
+        if key not in self._keys:
+            raise KeyError(key)
+
+        self.stats["misses"] += 1
+        record = self._loader([key]).get(key)
+        if record is None:
+            raise KeyError(key)
+        self._remember(key, record)
+        return record
+
+    def __setitem__(self, key: str, value: V):
+        self._keys[key] = None
+        self._remember(key, value)
+
+    def __delitem__(self, key: str):
+        del self._keys[key]
+        self._cache.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._keys))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def register(self, key: str):
+        """Record that ``key`` exists in storage without hydrating it"""
+        self._keys[key] = None
+
+    # Batched access
+    def get_many(self, keys: Iterable[str]) -> List[V]:
+        """Hydrate several records with one loader call for the misses"""
+        keys = [key for key in keys if key in self._keys]
+        missing = [key for key in keys if key not in self._cache]
+        loaded = self._loader(missing) if missing else {}
+        self.stats["misses"] += len(missing)
+        self.stats["hits"] += len(keys) - len(missing)
+
+        records = []
+        for key in keys:
+            record = self._cache.get(key)
+            if record is None:
+                record = loaded.get(key)
+                if record is None:
+                    continue
+            self._remember(key, record)
+            records.append(record)
+        return records
+
+    def items(self) -> Iterator[Tuple[str, V]]:  # type: ignore[override]
+        """Page through all records without disturbing the LRU cache"""
+        keys = list(self._keys)
+        for offset in range(0, len(keys), self.page_size):
+            page = keys[offset : offset + self.page_size]
+            missing = [key for key in page if key not in self._cache]
+            loaded = self._loader(missing) if missing else {}
+            if missing:
+                self.stats["paged_loads"] += 1
+            for key in page:
+                record = self._cache.get(key)
+                if record is None:
+                    record = loaded.get(key)
+                if record is not None:
+                    yield key, record
+
+    def values(self) -> Iterator[V]:  # type: ignore[override]
+        for _, record in self.items():
+            yield record
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Cache occupancy and hit/miss counters"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "known_records": len(self._keys),
+            "cached_records": len(self._cache),
+            "cache_size": self.cache_size,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            **self.stats,
+        }
+
+    def _remember(self, key: str, record: V):
+        self._cache[key] = record
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+            self.stats["evictions"] += 1
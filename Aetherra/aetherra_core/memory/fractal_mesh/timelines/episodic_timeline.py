@@ -7,13 +7,17 @@ Enables story-like recall, causal relationship tracking, and temporal pattern re
 """
 
 import json
-import sqlite3
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, MutableMapping, Optional, Set, Tuple
 
 from ..base import EpisodicChain, MemoryFragment, MemoryFragmentType
+from ..connection_manager import (
+    acquire_connection_manager,
+    release_connection_manager,
+)
+from ..lazy_store import LazyRecordStore
 
 
 @dataclass
@@ -66,103 +70,207 @@ class EpisodicTimeline:
     - Story-like memory retrieval
     """
 
-    def __init__(self, db_path: str = "episodic_timeline.db"):
+    def __init__(
+        self,
+        db_path: str = "episodic_timeline.db",
+        lazy: bool = False,
+        cache_size: int = 10000,
+    ):
         self.db_path = db_path
-        self.episodic_chains: Dict[str, EpisodicChain] = {}
-        self.narrative_arcs: Dict[str, NarrativeArc] = {}
+        self.lazy = lazy
+        self.episodic_chains: MutableMapping[str, EpisodicChain] = (
+            LazyRecordStore(self._load_chains_by_id, cache_size=cache_size)
+            if lazy
+            else {}
+        )
+        self.narrative_arcs: MutableMapping[str, NarrativeArc] = (
+            LazyRecordStore(self._load_arcs_by_id, cache_size=cache_size)
+            if lazy
+            else {}
+        )
+        # In lazy mode only links created by this process are held here;
+        # get_causal_network() reads the rest from the database
         self.causal_links: List[CausalLink] = []
         self.temporal_patterns: Dict[str, TemporalPattern] = {}
 
+        # Lightweight indexes kept resident in both modes
+        self._chain_spans: Dict[str, Tuple[datetime, datetime, float]] = {}
+        self._arc_themes: Dict[str, Set[str]] = {}
+
         self.max_chain_gap = timedelta(hours=6)  # Max time gap in episodic chains
         self.min_chain_length = 3  # Minimum fragments to form a chain
         self.causal_window = timedelta(hours=24)  # Max time for causal relationships
 
+        # Shared WAL connection with write-behind persistence
+        self._connections = acquire_connection_manager(self.db_path)
+
         self._init_database()
         self._load_existing_data()
 
     def _init_database(self):
         """Initialize episodic timeline database"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS episodic_chains (
-                    chain_id TEXT PRIMARY KEY,
-                    fragments TEXT NOT NULL,
-                    narrative_arc TEXT,
-                    causal_links TEXT,
-                    temporal_span_start TEXT,
-                    temporal_span_end TEXT,
-                    significance_score REAL,
-                    created_at TEXT,
-                    last_updated TEXT
-                )
-            """)
-
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS narrative_arcs (
-                    arc_id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    fragments TEXT,
-                    key_moments TEXT,
-                    themes TEXT,
-                    emotional_trajectory TEXT,
-                    resolution_status TEXT,
-                    significance_score REAL,
-                    created_at TEXT
-                )
-            """)
-
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS causal_links (
-                    link_id TEXT PRIMARY KEY,
-                    cause_fragment_id TEXT NOT NULL,
-                    effect_fragment_id TEXT NOT NULL,
-                    relationship_type TEXT,
-                    confidence REAL,
-                    temporal_delay TEXT,
-                    detected_at TEXT
-                )
-            """)
-
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS temporal_patterns (
-                    pattern_id TEXT PRIMARY KEY,
-                    pattern_type TEXT NOT NULL,
-                    fragments TEXT,
-                    temporal_signature TEXT,
-                    confidence REAL,
-                    last_occurrence TEXT
-                )
-            """)
+        self._connections.execute("""
+            CREATE TABLE IF NOT EXISTS episodic_chains (
+                chain_id TEXT PRIMARY KEY,
+                fragments TEXT NOT NULL,
+                narrative_arc TEXT,
+                causal_links TEXT,
+                temporal_span_start TEXT,
+                temporal_span_end TEXT,
+                significance_score REAL,
+                created_at TEXT,
+                last_updated TEXT
+            )
+        """)
+
+        self._connections.execute("""
+            CREATE TABLE IF NOT EXISTS narrative_arcs (
+                arc_id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                fragments TEXT,
+                key_moments TEXT,
+                themes TEXT,
+                emotional_trajectory TEXT,
+                resolution_status TEXT,
+                significance_score REAL,
+                created_at TEXT
+            )
+        """)
+
+        self._connections.execute("""
+            CREATE TABLE IF NOT EXISTS causal_links (
+                link_id TEXT PRIMARY KEY,
+                cause_fragment_id TEXT NOT NULL,
+                effect_fragment_id TEXT NOT NULL,
+                relationship_type TEXT,
+                confidence REAL,
+                temporal_delay TEXT,
+                detected_at TEXT
+            )
+        """)
+
+        self._connections.execute("""
+            CREATE TABLE IF NOT EXISTS temporal_patterns (
+                pattern_id TEXT PRIMARY KEY,
+                pattern_type TEXT NOT NULL,
+                fragments TEXT,
+                temporal_signature TEXT,
+                confidence REAL,
+                last_occurrence TEXT
+            )
+        """)
 
-            conn.commit()
-        finally:
-            conn.close()
+        self._connections.execute(
+            "CREATE INDEX IF NOT EXISTS idx_causal_cause ON causal_links (cause_fragment_id)"
+        )
+        self._connections.execute(
+            "CREATE INDEX IF NOT EXISTS idx_causal_effect ON causal_links (effect_fragment_id)"
+        )
 
     def _load_existing_data(self):
         """Load existing timeline data from database"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            # Load episodic chains
-            cursor = conn.execute("SELECT * FROM episodic_chains")
-            for row in cursor.fetchall():
-                chain = self._row_to_chain(row)
-                self.episodic_chains[chain.chain_id] = chain
-
-            # Load narrative arcs
-            cursor = conn.execute("SELECT * FROM narrative_arcs")
-            for row in cursor.fetchall():
-                arc = self._row_to_arc(row)
-                self.narrative_arcs[arc.arc_id] = arc
-
-            # Load causal links
-            cursor = conn.execute("SELECT * FROM causal_links")
-            for row in cursor.fetchall():
-                link = self._row_to_causal_link(row)
-                self.causal_links.append(link)
-
-        finally:
-            conn.close()
+        if self.lazy:
+            self._load_timeline_index()
+            return
+
+        # Load episodic chains
+        for row in self._connections.query("SELECT * FROM episodic_chains"):
+            chain = self._row_to_chain(row)
+            self.episodic_chains[chain.chain_id] = chain
+            self._index_chain(chain)
+
+        # Load narrative arcs
+        for row in self._connections.query("SELECT * FROM narrative_arcs"):
+            arc = self._row_to_arc(row)
+            self.narrative_arcs[arc.arc_id] = arc
+            self._arc_themes[arc.arc_id] = set(arc.themes)
+
+        # Load causal links
+        for row in self._connections.query("SELECT * FROM causal_links"):
+            link = self._row_to_causal_link(row)
+            self.causal_links.append(link)
+
+    def _load_timeline_index(self):
+        """Rebuild chain spans and arc themes without hydrating full records"""
+        rows = self._connections.query(
+            """
+            SELECT chain_id, temporal_span_start, temporal_span_end, significance_score
+            FROM episodic_chains
+        """
+        )
+        for chain_id, span_start, span_end, significance in rows:
+            self.episodic_chains.register(chain_id)
+            self._chain_spans[chain_id] = (
+                datetime.fromisoformat(span_start),
+                datetime.fromisoformat(span_end),
+                significance or 0.0,
+            )
+
+        for arc_id, themes in self._connections.query(
+            "SELECT arc_id, themes FROM narrative_arcs"
+        ):
+            self.narrative_arcs.register(arc_id)
+            self._arc_themes[arc_id] = set(json.loads(themes) if themes else [])
+
+    def _load_chains_by_id(self, chain_ids: Iterable[str]) -> Dict[str, EpisodicChain]:
+        """Hydrate full episodic chains for the given ids"""
+        chains = {}
+        for row in self._select_in("episodic_chains", "chain_id", chain_ids):
+            chain = self._row_to_chain(row)
+            chains[chain.chain_id] = chain
+        return chains
+
+    def _load_arcs_by_id(self, arc_ids: Iterable[str]) -> Dict[str, NarrativeArc]:
+        """Hydrate full narrative arcs for the given ids"""
+        arcs = {}
+        for row in self._select_in("narrative_arcs", "arc_id", arc_ids):
+            arc = self._row_to_arc(row)
+            arcs[arc.arc_id] = arc
+        return arcs
+
+    def _select_in(self, table: str, column: str, keys: Iterable[str]) -> List[tuple]:
+        """SELECT * rows whose key column is in ``keys``, in SQLite-sized batches"""
+        keys = list(keys)
+        rows: List[tuple] = []
+        for offset in range(0, len(keys), 500):
+            batch = keys[offset : offset + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows.extend(
+                self._connections.query(
+                    f"SELECT * FROM {table} WHERE {column} IN ({placeholders})", batch
+                )
+            )
+        return rows
+
+    def _index_chain(self, chain: EpisodicChain):
+        """Refresh the resident span/significance entry for a chain"""
+        self._chain_spans[chain.chain_id] = (
+            chain.temporal_span[0],
+            chain.temporal_span[1],
+            chain.significance_score,
+        )
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hydration cache statistics for chains and narrative arcs"""
+        if not self.lazy:
+            return {"lazy": False, "episodic_chains": len(self.episodic_chains)}
+        return {
+            "lazy": True,
+            "episodic_chains": self.episodic_chains.get_cache_stats(),
+            "narrative_arcs": self.narrative_arcs.get_cache_stats(),
+        }
+
+    def flush(self) -> int:
+        """Commit any timeline writes still waiting in the write-behind queue"""
+        return self._connections.flush()
+
+    def close(self):
+        """Flush pending writes and release the shared database connection"""
+        release_connection_manager(self.db_path)
+
+    def get_storage_metrics(self) -> Dict[str, Any]:
+        """Write-behind flush and lag metrics for the timeline database"""
+        return self._connections.get_metrics()
 
     def process_new_fragment(self, fragment: MemoryFragment) -> List[str]:
         """Process new fragment for episodic timeline integration"""
@@ -187,27 +295,23 @@ class EpisodicTimeline:
 
     def _find_or_create_chain(self, fragment: MemoryFragment) -> Optional[str]:
         """Find existing chain to extend or create new one"""
-        best_chain = None
+        best_chain_id = None
         best_score = 0.0
 
         # Look for chains within temporal window
-        for chain in self.episodic_chains.values():
-            if not chain.fragments:
-                continue
-
-            # Get the last fragment time in the chain (would need fragment access)
-            chain_end = chain.temporal_span[1]
+        for chain_id, (_, chain_end, _) in self._chain_spans.items():
             time_gap = fragment.created_at - chain_end
 
             if timedelta() <= time_gap <= self.max_chain_gap:
                 # Calculate compatibility score
-                compatibility = self._calculate_chain_compatibility(fragment, chain)
+                compatibility = self._calculate_chain_compatibility(fragment, chain_end)
                 if compatibility > best_score:
                     best_score = compatibility
-                    best_chain = chain
+                    best_chain_id = chain_id
 
         # Add to best chain if found
-        if best_chain and best_score > 0.3:  # Minimum compatibility threshold
+        if best_chain_id and best_score > 0.3:  # Minimum compatibility threshold
+            best_chain = self.episodic_chains[best_chain_id]
             best_chain.fragments.append(fragment.fragment_id)
             best_chain.temporal_span = (
                 best_chain.temporal_span[0],
@@ -216,6 +320,7 @@ class EpisodicTimeline:
             best_chain.significance_score = self._calculate_chain_significance(
                 best_chain
             )
+            self._index_chain(best_chain)
             self._persist_chain(best_chain)
             return best_chain.chain_id
 
@@ -232,15 +337,16 @@ class EpisodicTimeline:
             )
 
             self.episodic_chains[chain_id] = new_chain
+            self._index_chain(new_chain)
             self._persist_chain(new_chain)
             return chain_id
 
         return None
 
     def _calculate_chain_compatibility(
-        self, fragment: MemoryFragment, chain: EpisodicChain
+        self, fragment: MemoryFragment, chain_end: datetime
     ) -> float:
-        """Calculate how well a fragment fits into an existing chain"""
+        """Calculate how well a fragment fits onto the end of an existing chain"""
         # Factors: concept overlap, temporal proximity, narrative coherence
 
         # Simplified compatibility based on symbolic tags
@@ -252,7 +358,7 @@ class EpisodicTimeline:
             compatibility += 0.2
 
         # Temporal bonus (closer in time = more compatible)
-        time_gap = abs((fragment.created_at - chain.temporal_span[1]).total_seconds())
+        time_gap = abs((fragment.created_at - chain_end).total_seconds())
         temporal_bonus = max(0, 0.3 * (1 - time_gap / (6 * 3600)))  # 6 hour decay
         compatibility += temporal_bonus
 
@@ -336,8 +442,9 @@ class EpisodicTimeline:
     def _update_narrative_arcs(self, fragment: MemoryFragment):
         """Update narrative arc detection and tracking"""
         # Look for existing arcs that this fragment might continue
-        for arc in self.narrative_arcs.values():
-            if self._fragment_fits_arc(fragment, arc):
+        for arc_id, themes in self._arc_themes.items():
+            if self._fragment_fits_arc(fragment, themes):
+                arc = self.narrative_arcs[arc_id]
                 arc.fragments.append(fragment.fragment_id)
 
                 # Update emotional trajectory (simplified)
@@ -350,6 +457,7 @@ class EpisodicTimeline:
                 arc.themes.extend(
                     [tag for tag in fragment.symbolic_tags if tag not in arc.themes]
                 )
+                themes.update(fragment.symbolic_tags)
 
                 self._persist_narrative_arc(arc)
                 return
@@ -371,12 +479,15 @@ class EpisodicTimeline:
             )
 
             self.narrative_arcs[arc_id] = new_arc
+            self._arc_themes[arc_id] = set(new_arc.themes)
             self._persist_narrative_arc(new_arc)
 
-    def _fragment_fits_arc(self, fragment: MemoryFragment, arc: NarrativeArc) -> bool:
+    def _fragment_fits_arc(
+        self, fragment: MemoryFragment, arc_themes: Set[str]
+    ) -> bool:
         """Check if fragment fits into existing narrative arc"""
         # Check thematic overlap
-        theme_overlap = len(set(fragment.symbolic_tags) & set(arc.themes))
+        theme_overlap = len(set(fragment.symbolic_tags) & arc_themes)
         return theme_overlap > 0
 
     def _has_narrative_potential(self, fragment: MemoryFragment) -> bool:
@@ -413,13 +524,13 @@ class EpisodicTimeline:
 
         # Find relevant chains
         relevant_chains = []
-        for chain in self.episodic_chains.values():
+        for chain_id, (span_start, span_end, significance) in self._chain_spans.items():
             if (
-                chain.temporal_span[0] <= time_range[1]
-                and chain.temporal_span[1] >= time_range[0]
-                and chain.significance_score >= min_significance
+                span_start <= time_range[1]
+                and span_end >= time_range[0]
+                and significance >= min_significance
             ):
-                relevant_chains.append(chain)
+                relevant_chains.append(self.episodic_chains[chain_id])
 
         # Sort by temporal order
         relevant_chains.sort(key=lambda c: c.temporal_span[0])
@@ -450,8 +561,22 @@ class EpisodicTimeline:
             "indirect_relationships": [],
         }
 
+        if self.lazy:
+            links = [
+                self._row_to_causal_link(row)
+                for row in self._connections.query(
+                    """
+                    SELECT * FROM causal_links
+                    WHERE cause_fragment_id = ? OR effect_fragment_id = ?
+                """,
+                    (fragment_id, fragment_id),
+                )
+            ]
+        else:
+            links = self.causal_links
+
         # Direct causes and effects
-        for link in self.causal_links:
+        for link in links:
             if link.effect_fragment_id == fragment_id:
                 network["causes"].append(
                     {
@@ -486,107 +611,87 @@ class EpisodicTimeline:
     # Persistence methods
     def _persist_chain(self, chain: EpisodicChain):
         """Persist episodic chain to database"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO episodic_chains
-                (chain_id, fragments, narrative_arc, causal_links, temporal_span_start,
-                 temporal_span_end, significance_score, created_at, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    chain.chain_id,
-                    json.dumps(chain.fragments),
-                    chain.narrative_arc,
-                    json.dumps(chain.causal_links),
-                    chain.temporal_span[0].isoformat(),
-                    chain.temporal_span[1].isoformat(),
-                    chain.significance_score,
-                    datetime.now().isoformat(),
-                    datetime.now().isoformat(),
-                ),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        self._connections.submit(
+            """
+            INSERT OR REPLACE INTO episodic_chains
+            (chain_id, fragments, narrative_arc, causal_links, temporal_span_start,
+             temporal_span_end, significance_score, created_at, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                chain.chain_id,
+                json.dumps(chain.fragments),
+                chain.narrative_arc,
+                json.dumps(chain.causal_links),
+                chain.temporal_span[0].isoformat(),
+                chain.temporal_span[1].isoformat(),
+                chain.significance_score,
+                datetime.now().isoformat(),
+                datetime.now().isoformat(),
+            ),
+        )
 
     def _persist_narrative_arc(self, arc: NarrativeArc):
         """Persist narrative arc to database"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO narrative_arcs
-                (arc_id, title, fragments, key_moments, themes, emotional_trajectory,
-                 resolution_status, significance_score, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    arc.arc_id,
-                    arc.title,
-                    json.dumps(arc.fragments),
-                    json.dumps(arc.key_moments),
-                    json.dumps(arc.themes),
-                    json.dumps(arc.emotional_trajectory),
-                    arc.resolution_status,
-                    arc.significance_score,
-                    datetime.now().isoformat(),
-                ),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        self._connections.submit(
+            """
+            INSERT OR REPLACE INTO narrative_arcs
+            (arc_id, title, fragments, key_moments, themes, emotional_trajectory,
+             resolution_status, significance_score, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                arc.arc_id,
+                arc.title,
+                json.dumps(arc.fragments),
+                json.dumps(arc.key_moments),
+                json.dumps(arc.themes),
+                json.dumps(arc.emotional_trajectory),
+                arc.resolution_status,
+                arc.significance_score,
+                datetime.now().isoformat(),
+            ),
+        )
 
     def _persist_causal_link(self, link: CausalLink):
         """Persist causal link to database"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            link_id = str(uuid.uuid4())
-            conn.execute(
-                """
-                INSERT INTO causal_links
-                (link_id, cause_fragment_id, effect_fragment_id, relationship_type,
-                 confidence, temporal_delay, detected_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    link_id,
-                    link.cause_fragment_id,
-                    link.effect_fragment_id,
-                    link.relationship_type,
-                    link.confidence,
-                    str(link.temporal_delay),
-                    link.detected_at.isoformat(),
-                ),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        link_id = str(uuid.uuid4())
+        self._connections.submit(
+            """
+            INSERT INTO causal_links
+            (link_id, cause_fragment_id, effect_fragment_id, relationship_type,
+             confidence, temporal_delay, detected_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                link_id,
+                link.cause_fragment_id,
+                link.effect_fragment_id,
+                link.relationship_type,
+                link.confidence,
+                str(link.temporal_delay),
+                link.detected_at.isoformat(),
+            ),
+        )
 
     def _persist_temporal_pattern(self, pattern: TemporalPattern):
         """Persist temporal pattern to database"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO temporal_patterns
-                (pattern_id, pattern_type, fragments, temporal_signature,
-                 confidence, last_occurrence)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    pattern.pattern_id,
-                    pattern.pattern_type,
-                    json.dumps(pattern.fragments),
-                    json.dumps(pattern.temporal_signature),
-                    pattern.confidence,
-                    pattern.last_occurrence.isoformat(),
-                ),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        self._connections.submit(
+            """
+            INSERT OR REPLACE INTO temporal_patterns
+            (pattern_id, pattern_type, fragments, temporal_signature,
+             confidence, last_occurrence)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """,
+            (
+                pattern.pattern_id,
+                pattern.pattern_type,
+                json.dumps(pattern.fragments),
+                json.dumps(pattern.temporal_signature),
+                pattern.confidence,
+                pattern.last_occurrence.isoformat(),
+            ),
+        )
 
     # Database row conversion methods
     def _row_to_chain(self, row) -> EpisodicChain:
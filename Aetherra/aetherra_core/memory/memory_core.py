@@ -7,9 +7,13 @@ Lyrixa's memory capabilities for learning, context retention, and user preferenc
 Manages conversational memory, project context, and long-term learning.
 """
 
+import asyncio
 import hashlib
 import json
+import math
+import re
 import sqlite3
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -18,6 +22,18 @@ from typing import Any, Dict, List, Optional, Tuple
 # Webhook manager import disabled - not currently available
 # from src.aetherra.core.webhook_manager import WebhookManager
 
+# Bump when the schema gains derived structures that need backfilling
+SCHEMA_VERSION = 1
+
+# Blend of full-text relevance, stored importance and recency used to rank recalls
+RECALL_WEIGHTS = {"relevance": 0.6, "importance": 0.25, "recency": 0.15}
+RECENCY_HALF_LIFE_DAYS = 7.0
+
+MEMORY_COLUMNS = (
+    "m.id, m.content, m.context, m.tags, m.importance, m.created_at, "
+    "m.last_accessed, m.access_count, m.memory_type"
+)
+
 
 @dataclass
 class Memory:
@@ -55,13 +71,25 @@ class LyrixaMemorySystem:
     and learning from interactions to provide better assistance.
     """
 
-    def __init__(self, memory_db_path: str = ":memory:"):
+    def __init__(
+        self, memory_db_path: str = ":memory:", access_flush_interval: float = 0.0
+    ):
         self.db_path = memory_db_path
-        self.conn: Optional[sqlite3.Connection] = sqlite3.connect(
-            self.db_path
-        )  # Initialize connection
+        self.conn: Optional[sqlite3.Connection] = self._connect()
         self.memory_cache: Dict[str, Any] = {}
         self.consolidation_interval = 3600  # 1 hour in seconds
+
+        # Access bookkeeping: memory_id -> (pending increments, last accessed).
+        # With the default interval of 0 every recall flushes its own batch;
+        # a larger interval coalesces recalls and bounds what a crash can lose.
+        # A timer on the recalling event loop flushes once the interval has
+        # passed, even if no further recall comes.
+        self.access_flush_interval = access_flush_interval
+        self._pending_access: Dict[str, Tuple[int, str]] = {}
+        self._last_access_flush = time.monotonic()
+        self._access_flush_timer: Optional[asyncio.TimerHandle] = None
+        self._access_flush_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.access_metrics = {"access_flushes": 0, "access_rows_flushed": 0}
         # Webhook manager disabled - not currently available
         # self.webhook_manager = WebhookManager()
 
@@ -72,9 +100,21 @@ class LyrixaMemorySystem:
         """Ensures the database connection is open and returns it."""
         if self.conn is None:
             print("🔄 Reopening database connection...")
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = self._connect()
         return self.conn
 
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        # INSERT OR REPLACE must fire the delete triggers so the full-text
+        # index and tag table drop the replaced row
+        conn.execute("PRAGMA recursive_triggers = ON")
+        if self.db_path != ":memory:":
+            # Same durability trade-off as the fractal mesh stores: commits
+            # append to the WAL without an fsync each
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
     def _initialize_database_sync(self):
         """Initialize the SQLite database for memory storage (synchronous version)"""
         conn = self.ensure_connection()  # Ensure connection is open
@@ -108,6 +148,9 @@ class LyrixaMemorySystem:
             )
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_tags ON memories(tags)")
 
+            self._create_search_schema(cursor)
+            self._migrate_search_schema(cursor)
+
             conn.commit()
 
             print("✅ Lyrixa memory system initialized")
@@ -115,6 +158,76 @@ class LyrixaMemorySystem:
         except Exception as e:
             print(f"❌ Failed to initialize memory database: {e}")
 
+    def _create_search_schema(self, cursor: sqlite3.Cursor):
+        """Full-text index and tag join table, kept in sync by triggers"""
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+                content, tags, content='memories', content_rowid='rowid'
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS memory_tags (
+                tag TEXT NOT NULL,
+                memory_id TEXT NOT NULL,
+                PRIMARY KEY (tag, memory_id)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_memory_tags_memory "
+            "ON memory_tags(memory_id)"
+        )
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS memories_search_ai AFTER INSERT ON memories
+            BEGIN
+                INSERT INTO memories_fts(rowid, content, tags)
+                VALUES (new.rowid, new.content, new.tags);
+                INSERT OR IGNORE INTO memory_tags(tag, memory_id)
+                SELECT value, new.id FROM json_each(
+                    CASE WHEN json_valid(new.tags) THEN new.tags ELSE '[]' END
+                );
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS memories_search_ad AFTER DELETE ON memories
+            BEGIN
+                INSERT INTO memories_fts(memories_fts, rowid, content, tags)
+                VALUES ('delete', old.rowid, old.content, old.tags);
+                DELETE FROM memory_tags WHERE memory_id = old.id;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS memories_search_au
+            AFTER UPDATE OF content, tags ON memories
+            BEGIN
+                INSERT INTO memories_fts(memories_fts, rowid, content, tags)
+                VALUES ('delete', old.rowid, old.content, old.tags);
+                INSERT INTO memories_fts(rowid, content, tags)
+                VALUES (new.rowid, new.content, new.tags);
+                DELETE FROM memory_tags WHERE memory_id = old.id;
+                INSERT OR IGNORE INTO memory_tags(tag, memory_id)
+                SELECT value, new.id FROM json_each(
+                    CASE WHEN json_valid(new.tags) THEN new.tags ELSE '[]' END
+                );
+            END
+        """)
+
+    def _migrate_search_schema(self, cursor: sqlite3.Cursor):
+        """Backfill the search structures for databases created before them"""
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] >= SCHEMA_VERSION:
+            return
+
+        cursor.execute("INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')")
+        cursor.execute("DELETE FROM memory_tags")
+        cursor.execute("""
+            INSERT OR IGNORE INTO memory_tags(tag, memory_id)
+            SELECT j.value, m.id FROM memories m, json_each(
+                CASE WHEN json_valid(m.tags) THEN m.tags ELSE '[]' END
+            ) j
+        """)
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
     def normalize_importance(self, value: Any) -> float:
         """Normalize importance to a float between 0.0 and 1.0."""
         try:
@@ -232,48 +345,17 @@ class LyrixaMemorySystem:
             List of relevant memories
         """
         try:
-            cursor = self.ensure_connection().cursor()
-
-            # Build query
-            sql = """
-                SELECT id, content, context, tags, importance, created_at, last_accessed, access_count, memory_type
-                FROM memories
-                WHERE 1=1
-            """
-            params: List[Any] = []
-
-            if memory_type:
-                sql += " AND memory_type = ?"
-                params.append(memory_type)
-
-            # Simple text matching (in a real implementation, use vector search)
-            if query_text:
-                sql += " AND (content LIKE ? OR tags LIKE ?)"
-                params.extend([f"%{query_text}%", f"%{query_text}%"])
-
-            sql += " ORDER BY importance DESC, created_at DESC LIMIT ?"
-            params.append(limit)
-
-            cursor.execute(sql, params)
-            rows = cursor.fetchall()
-
-            memories = []
-            for row in rows:
-                memory = Memory(
-                    id=row[0],
-                    content=json.loads(row[1]),
-                    context=json.loads(row[2]) if row[2] else {},
-                    tags=json.loads(row[3]) if row[3] else [],
-                    importance=row[4],
-                    created_at=datetime.fromisoformat(row[5]),
-                    last_accessed=datetime.fromisoformat(row[6]),
-                    access_count=row[7],
-                    memory_type=row[8],
-                )
-                memories.append(memory)
+            memories = self._query_memories(
+                text=query_text, memory_type=memory_type, limit=limit
+            )
 
-                # Update access count
-                await self._update_memory_access(memory.id)
+            # Update access counts in one batch instead of a commit per row
+            self._record_access([memory.id for memory in memories])
+            elapsed = time.monotonic() - self._last_access_flush
+            if elapsed >= self.access_flush_interval:
+                self.flush_access_updates()
+            elif self._pending_access:
+                self._schedule_access_flush(self.access_flush_interval - elapsed)
 
             return memories
 
@@ -380,6 +462,8 @@ class LyrixaMemorySystem:
         - Updates importance scores based on access patterns
         """
         try:
+            # Access patterns must be on disk before they are used
+            self.flush_access_updates()
             cursor = self.ensure_connection().cursor()
 
             # Remove very old, low-importance memories
@@ -408,32 +492,69 @@ class LyrixaMemorySystem:
 
     async def _update_memory_access(self, memory_id: str):
         """Update memory access statistics"""
-        self.ensure_connection()  # Ensure the connection is open
+        self._record_access([memory_id])
+        self.flush_access_updates()
+
+        # Webhook functionality disabled - not currently available
+        # TODO: Implement webhook for memory update when available
+        # self.webhook_manager.trigger_webhook(
+        #     "memory_update",
+        #     {"memory_id": memory_id, "timestamp": datetime.now().isoformat()},
+        # )
+
+    def _record_access(self, memory_ids: List[str]):
+        """Count accesses in memory until the next flush"""
+        accessed_at = datetime.now().isoformat()
+        for memory_id in memory_ids:
+            count, _ = self._pending_access.get(memory_id, (0, accessed_at))
+            self._pending_access[memory_id] = (count + 1, accessed_at)
+
+    def _schedule_access_flush(self, delay: float):
+        """Flush pending access counts after ``delay`` on the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._access_flush_timer is not None:
+            if self._access_flush_loop is loop and not loop.is_closed():
+                return  # Already scheduled
+            self._access_flush_timer.cancel()
+        self._access_flush_loop = loop
+        self._access_flush_timer = loop.call_later(delay, self.flush_access_updates)
+
+    def flush_access_updates(self) -> int:
+        """Write pending access counts in one transaction; returns rows updated"""
+        if self._access_flush_timer is not None:
+            self._access_flush_timer.cancel()
+            self._access_flush_timer = None
+            self._access_flush_loop = None
+        self._last_access_flush = time.monotonic()
+        if not self._pending_access:
+            return 0
+
+        pending, self._pending_access = self._pending_access, {}
         try:
-            cursor = self.ensure_connection().cursor()
-
-            cursor.execute(
-                """
-                UPDATE memories
-                SET last_accessed = ?, access_count = access_count + 1
-                WHERE id = ?
-                """,
-                (datetime.now().isoformat(), memory_id),
-            )
-
-            self.ensure_connection().commit()
-
-            # Webhook functionality disabled - not currently available
-            # TODO: Implement webhook for memory update when available
-            # self.webhook_manager.trigger_webhook(
-            #     "memory_update",
-            #     {"memory_id": memory_id, "timestamp": datetime.now().isoformat()},
-            # )
-
-            print("🧠 Memory access updated")
-
+            conn = self.ensure_connection()
+            with conn:
+                conn.executemany(
+                    """
+                    UPDATE memories
+                    SET last_accessed = ?, access_count = access_count + ?
+                    WHERE id = ?
+                    """,
+                    [
+                        (accessed_at, count, memory_id)
+                        for memory_id, (count, accessed_at) in pending.items()
+                    ],
+                )
         except Exception as e:
+            # Keep the counts so the next flush retries them
+            for memory_id, (count, accessed_at) in pending.items():
+                previous, _ = self._pending_access.get(memory_id, (0, accessed_at))
+                self._pending_access[memory_id] = (previous + count, accessed_at)
             print(f"❌ Memory access update failed: {e}")
+            return 0
+
+        self.access_metrics["access_flushes"] += 1
+        self.access_metrics["access_rows_flushed"] += len(pending)
+        return len(pending)
 
     def _generate_memory_id(
         self, content: Dict[str, Any], context: Optional[Dict[str, Any]]
@@ -448,91 +569,123 @@ class LyrixaMemorySystem:
         """Advanced memory search with multiple criteria"""
         with self.db_session():
             try:
-                cursor = self.ensure_connection().cursor()
-
-                sql = """
-                    SELECT id, content, context, tags, importance, created_at, last_accessed, access_count, memory_type
-                    FROM memories
-                    WHERE importance >= ?
-                """
-                params: List[Any] = [query.importance_threshold]
-
-                if query.memory_type:
-                    sql += " AND memory_type = ?"
-                    params.append(str(query.memory_type))  # Cast to str explicitly
-
-                if query.text:
-                    sql += " AND (content LIKE ? OR tags LIKE ?)"
-
-                    params.extend(
-                        [f"%{query.text}%", f"%{query.text}%"]
-                    )  # Cast to str explicitly
-
-                if query.tags:
-                    for tag in query.tags:
-                        sql += " AND tags LIKE ?"
-                        params.append(f"%{tag}%")  # Cast to str explicitly
-
-                if query.time_range:
-                    start_time, end_time = query.time_range
-                    sql += " AND created_at BETWEEN ? AND ?"
-                    params.extend(
-                        [start_time.isoformat(), end_time.isoformat()]
-                    )  # Cast to str explicitly
-
-                if self.conn is None:
-                    self.ensure_connection()  # Ensure connection is initialized
-
-                # Validate and cast query parameters
-                if query.memory_type:
-                    sql += " AND memory_type = ?"
-                    params.append(str(query.memory_type))  # Cast to str explicitly
-
-                if query.text:
-                    sql += " AND (content LIKE ? OR tags LIKE ?)"
-                    params.extend(
-                        [f"%{query.text}%", f"%{query.text}%"]
-                    )  # Cast to str explicitly
-
-                if query.tags:
-                    for tag in query.tags:
-                        sql += " AND tags LIKE ?"
-                        params.append(f"%{tag}%")  # Cast to str explicitly
-
-                if query.time_range:
-                    start_time, end_time = query.time_range
-                    sql += " AND created_at BETWEEN ? AND ?"
-                    params.extend(
-                        [start_time.isoformat(), end_time.isoformat()]
-                    )  # Cast to str explicitly
-
-                sql += " ORDER BY importance DESC, created_at DESC LIMIT ?"
-                params.append(query.limit)
-
-                cursor.execute(sql, params)
-                rows = cursor.fetchall()
-
-                memories = []
-                for row in rows:
-                    memory = Memory(
-                        id=row[0],
-                        content=json.loads(row[1]),
-                        context=json.loads(row[2]) if row[2] else {},
-                        tags=json.loads(row[3]) if row[3] else [],
-                        importance=row[4],
-                        created_at=datetime.fromisoformat(row[5]),
-                        last_accessed=datetime.fromisoformat(row[6]),
-                        access_count=row[7],
-                        memory_type=row[8],
-                    )
-                    memories.append(memory)
-
-                return memories
+                return self._query_memories(
+                    text=query.text,
+                    memory_type=str(query.memory_type) if query.memory_type else None,
+                    tags=query.tags,
+                    importance_threshold=query.importance_threshold,
+                    time_range=query.time_range,
+                    limit=query.limit,
+                )
 
             except Exception as e:
                 print(f"❌ Memory search failed: {e}")
                 return []
 
+    def _query_memories(
+        self,
+        text: Optional[str] = None,
+        memory_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        importance_threshold: float = 0.0,
+        time_range: Optional[Tuple[datetime, datetime]] = None,
+        limit: int = 10,
+    ) -> List[Memory]:
+        """
+        Shared query path for recall and search
+
+        Text goes through the FTS5 index and is ranked by BM25 blended with
+        importance and recency; tag filters are exact matches on memory_tags.
+        Without text, results are ordered by importance then creation time.
+        """
+        cursor = self.ensure_connection().cursor()
+        match = self._build_match_expression(text) if text else None
+
+        if match:
+            sql = f"""
+                SELECT {MEMORY_COLUMNS}, bm25(memories_fts) AS text_rank
+                FROM memories_fts JOIN memories m ON m.rowid = memories_fts.rowid
+                WHERE memories_fts MATCH ?
+            """
+            params: List[Any] = [match]
+        else:
+            sql = f"SELECT {MEMORY_COLUMNS} FROM memories m WHERE 1=1"
+            params = []
+            if text:
+                # No indexable tokens (punctuation only): keep substring semantics
+                sql += " AND (m.content LIKE ? OR m.tags LIKE ?)"
+                params.extend([f"%{text}%", f"%{text}%"])
+
+        if importance_threshold:
+            sql += " AND m.importance >= ?"
+            params.append(importance_threshold)
+
+        if memory_type:
+            sql += " AND m.memory_type = ?"
+            params.append(memory_type)
+
+        for tag in tags or []:
+            sql += " AND m.id IN (SELECT memory_id FROM memory_tags WHERE tag = ?)"
+            params.append(tag)
+
+        if time_range:
+            start_time, end_time = time_range
+            sql += " AND m.created_at BETWEEN ? AND ?"
+            params.extend([start_time.isoformat(), end_time.isoformat()])
+
+        if not match:
+            sql += " ORDER BY m.importance DESC, m.created_at DESC LIMIT ?"
+            params.append(limit)
+            cursor.execute(sql, params)
+            return [self._row_to_memory(row) for row in cursor.fetchall()]
+
+        # Re-rank the best BM25 candidates with importance and recency
+        sql += " ORDER BY text_rank LIMIT ?"
+        params.append(max(limit * 20, 200))
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+        if not rows:
+            return []
+
+        best_relevance = max(-row[9] for row in rows) or 1.0
+        now = datetime.now()
+        scored = []
+        for row in rows:
+            memory = self._row_to_memory(row)
+            age_days = max((now - memory.created_at).total_seconds(), 0) / 86400
+            score = (
+                RECALL_WEIGHTS["relevance"] * (-row[9] / best_relevance)
+                + RECALL_WEIGHTS["importance"] * memory.importance
+                + RECALL_WEIGHTS["recency"]
+                * math.pow(0.5, age_days / RECENCY_HALF_LIFE_DAYS)
+            )
+            scored.append((score, memory))
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [memory for _, memory in scored[:limit]]
+
+    @staticmethod
+    def _build_match_expression(text: str) -> Optional[str]:
+        """Turn free text into an FTS5 query: every word, as a prefix, must match"""
+        words = re.findall(r"[^\W_]+", text.lower())
+        if not words:
+            return None
+        return " ".join(f'"{word}"*' for word in words)
+
+    @staticmethod
+    def _row_to_memory(row: Tuple[Any, ...]) -> Memory:
+        return Memory(
+            id=row[0],
+            content=json.loads(row[1]),
+            context=json.loads(row[2]) if row[2] else {},
+            tags=json.loads(row[3]) if row[3] else [],
+            importance=row[4],
+            created_at=datetime.fromisoformat(row[5]),
+            last_accessed=datetime.fromisoformat(row[6]),
+            access_count=row[7],
+            memory_type=row[8],
+        )
+
     async def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory system statistics"""
         try:
@@ -565,6 +718,8 @@ class LyrixaMemorySystem:
                 "average_importance": avg_importance,
                 "recent_memories": recent_memories,
                 "cache_size": len(self.memory_cache),
+                "pending_access_updates": len(self._pending_access),
+                **self.access_metrics,
             }
 
         except Exception as e:
@@ -636,6 +791,7 @@ class LyrixaMemorySystem:
         """Closes the database connection if open."""
         try:
             if self.conn:
+                self.flush_access_updates()
                 self.conn.close()
                 self.conn = None
                 print("✅ Database connection closed.")
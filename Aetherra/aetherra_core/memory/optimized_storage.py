@@ -3,22 +3,24 @@
 =================================================
 
 High-performance memory storage system with:
-- Write-ahead buffer for batched operations
-- Asynchronous tagging and scoring
-- Binary format optimization
-- Background processing queues
+- Single long-lived writer thread fed by a bounded queue
+- Batched transactions (by size or flush interval)
+- Versioned, struct-based binary codec for fragment payloads
+- Reused per-thread read connections with read-your-writes for pending data
+- Per-row retry and a dead-letter list for fragments that cannot be written
 """
 
 import asyncio
 import sqlite3
+import struct
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from queue import Queue
-from threading import Lock, Timer
-from typing import Any, Dict, List, Optional
+from queue import Empty, Full, Queue
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 try:
     import ujson as json  # Faster JSON processing
@@ -27,15 +29,144 @@ except ImportError:
 
 from .fractal_mesh.base import MemoryFragment, MemoryFragmentType
 
+CODEC_MAGIC = b"AM"
+CODEC_VERSION = 1
+_HEADER = struct.Struct(">2sB")
+_U32 = struct.Struct(">I")
+_I64 = struct.Struct(">q")
+_F64 = struct.Struct(">d")
+
+
+class FragmentCodec:
+    """
+    Compact binary encoding for fragment payloads
+
+    Layout: ``b"AM"`` magic, one version byte, then a tagged value tree.
+    Tags: ``N`` None, ``T``/``F`` bools, ``i`` int64, ``I`` big int,
+    ``d`` float64, ``s`` str, ``b`` bytes, ``l`` list/tuple, ``e`` set,
+    ``m`` dict. Payloads written before the codec existed (plain JSON) are
+    still decoded.
+    """
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        out = bytearray(_HEADER.pack(CODEC_MAGIC, CODEC_VERSION))
+        cls._encode_value(value, out)
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, data: bytes) -> Any:
+        data = bytes(data)
+        if data[:1] == b"{":
+            # Legacy JSON payload
+            return json.loads(data.decode("utf-8"))
+
+        magic, version = _HEADER.unpack_from(data, 0)
+        if magic != CODEC_MAGIC:
+            raise ValueError("Not a fragment payload")
+        if version != CODEC_VERSION:
+            raise ValueError(f"Unsupported fragment codec version {version}")
+
+        value, _ = cls._decode_value(data, _HEADER.size)
+        return value
+
+    @classmethod
+    def _encode_value(cls, value: Any, out: bytearray):
+        if value is None:
+            out += b"N"
+        elif value is True:
+            out += b"T"
+        elif value is False:
+            out += b"F"
+        elif isinstance(value, int):
+            if -(2**63) <= value < 2**63:
+                out += b"i"
+                out += _I64.pack(value)
+            else:
+                cls._encode_text(b"I", str(value), out)
+        elif isinstance(value, float):
+            out += b"d"
+            out += _F64.pack(value)
+        elif isinstance(value, str):
+            cls._encode_text(b"s", value, out)
+        elif isinstance(value, (bytes, bytearray)):
+            out += b"b"
+            out += _U32.pack(len(value))
+            out += value
+        elif isinstance(value, dict):
+            out += b"m"
+            out += _U32.pack(len(value))
+            for key, item in value.items():
+                cls._encode_value(key, out)
+                cls._encode_value(item, out)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            out += b"e" if isinstance(value, (set, frozenset)) else b"l"
+            out += _U32.pack(len(value))
+            for item in value:
+                cls._encode_value(item, out)
+        elif isinstance(value, datetime):
+            cls._encode_text(b"s", value.isoformat(), out)
+        elif isinstance(value, MemoryFragmentType):
+            cls._encode_text(b"s", value.value, out)
+        else:
+            raise TypeError(f"Cannot encode {type(value).__name__} in fragment")
+
+    @staticmethod
+    def _encode_text(tag: bytes, text: str, out: bytearray):
+        encoded = text.encode("utf-8")
+        out += tag
+        out += _U32.pack(len(encoded))
+        out += encoded
+
+    @classmethod
+    def _decode_value(cls, data: bytes, offset: int) -> Tuple[Any, int]:
+        tag = data[offset : offset + 1]
+        offset += 1
+        if tag == b"N":
+            return None, offset
+        if tag == b"T":
+            return True, offset
+        if tag == b"F":
+            return False, offset
+        if tag == b"i":
+            return _I64.unpack_from(data, offset)[0], offset + _I64.size
+        if tag == b"d":
+            return _F64.unpack_from(data, offset)[0], offset + _F64.size
+
+        (length,) = _U32.unpack_from(data, offset)
+        offset += _U32.size
+        if tag in (b"s", b"I", b"b"):
+            raw = data[offset : offset + length]
+            offset += length
+            if tag == b"b":
+                return raw, offset
+            text = raw.decode("utf-8")
+            return (int(text) if tag == b"I" else text), offset
+        if tag == b"m":
+            result: Dict[Any, Any] = {}
+            for _ in range(length):
+                key, offset = cls._decode_value(data, offset)
+                result[key], offset = cls._decode_value(data, offset)
+            return result, offset
+        if tag in (b"l", b"e"):
+            items = []
+            for _ in range(length):
+                item, offset = cls._decode_value(data, offset)
+                items.append(item)
+            return (set(items) if tag == b"e" else items), offset
+        raise ValueError(f"Corrupt fragment payload (tag {tag!r})")
+
 
 @dataclass
 class WriteOperation:
     """Represents a pending write operation"""
 
-    operation_type: str  # 'insert', 'update', 'batch_insert'
+    operation_type: str  # 'insert', 'batch_insert', 'flush', 'stop'
     fragment: Optional[MemoryFragment] = None
     fragments: Optional[List[MemoryFragment]] = None
     timestamp: Optional[datetime] = None
+    done: Optional[threading.Event] = None  # Set once the operation is durable
+    failed: bool = False  # Set with done if the covering write did not commit
 
     def __post_init__(self):
         if self.timestamp is None:
@@ -45,6 +176,15 @@ class WriteOperation:
 class OptimizedMemoryStorage:
     """
     High-performance memory storage with batch processing and async operations
+
+    All writes go through one writer thread that owns its connection and
+    commits a transaction per batch. Readers reuse one connection per thread;
+    fragments that are queued but not yet committed are served from memory.
+
+    When a batch fails its fragments are written one at a time. A fragment
+    that cannot be encoded, or still fails after ``max_attempts`` batches,
+    is moved to ``dead_letters``, as is any fragment whose final write on
+    cleanup fails.
     """
 
     def __init__(
@@ -52,24 +192,39 @@ class OptimizedMemoryStorage:
         db_path: str = "optimized_memory.db",
         batch_size: int = 50,
         flush_interval_ms: int = 100,
+        max_pending: int = 10000,
+        max_attempts: int = 3,
+        max_dead_letters: int = 1000,
     ):
         self.db_path = Path(db_path)
         self.batch_size = batch_size
         self.flush_interval = flush_interval_ms / 1000.0  # Convert to seconds
+        self.max_attempts = max_attempts
+
+        # Writer queue; a full queue blocks producers (backpressure)
+        self.write_queue: "Queue[WriteOperation]" = Queue(maxsize=max_pending)
+        self._pending: Dict[str, MemoryFragment] = {}
+        self._attempts: Dict[str, int] = {}  # Failed writes per pending fragment
+        self.buffer_lock = threading.Lock()
+        # Held across the closed check and the put, so nothing is queued
+        # behind the writer's stop operation
+        self._enqueue_lock = threading.Lock()
+
+        # Fragments given up on, with the reason: (fragment, error)
+        self.dead_letters: Deque[Tuple[MemoryFragment, str]] = deque(
+            maxlen=max_dead_letters
+        )
 
-        # Write-ahead buffer
-        self.write_buffer: List[WriteOperation] = []
-        self.buffer_lock = Lock()
+        # Hand-off point for tagging/scoring consumers (bounded, drops oldest)
+        self.processing_queue: Queue = Queue(maxsize=max_pending)
 
-        # Background processing
-        self.executor = ThreadPoolExecutor(
-            max_workers=3, thread_name_prefix="memory_storage"
-        )
-        self.processing_queue = Queue()
+        # Per-thread read connections, closed on cleanup
+        self._reader_local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
 
         # Timing control
         self.last_flush = time.time()
-        self.flush_timer: Optional[Timer] = None
 
         # Performance metrics
         self.metrics: Dict[str, float] = {
@@ -78,32 +233,59 @@ class OptimizedMemoryStorage:
             "buffer_flushes": 0.0,
             "avg_batch_size": 0.0,
             "last_flush_duration": 0.0,
+            "max_flush_duration": 0.0,
+            "rows_written": 0.0,
+            "bytes_written": 0.0,
+            "encode_errors": 0.0,
+            "write_errors": 0.0,
+            "dead_letters": 0.0,
+            "dropped_processing_tasks": 0.0,
         }
 
         # Initialize database
         self._init_database()
 
-        # Start background flush timer
-        self._schedule_flush()
+        # Start the writer
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="memory_storage_writer", daemon=True
+        )
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")  # Faster writes
+        conn.execute("PRAGMA cache_size=10000")  # Larger cache
+        conn.execute("PRAGMA temp_store=MEMORY")  # Memory temp storage
+        return conn
 
     def _init_database(self):
         """Initialize optimized database schema"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         try:
-            # Optimized schema with better indexing
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS memory_fragments_optimized (
                     fragment_id TEXT PRIMARY KEY,
-                    content_binary BLOB,  -- Binary format for faster I/O
-                    fragment_type INTEGER,
+                    content_binary BLOB,  -- FragmentCodec payload
+                    fragment_type TEXT,
                     confidence_score REAL,
-                    created_at INTEGER,  -- Unix timestamp for faster sorting
-                    last_evolved INTEGER,
-                    INDEX(created_at),
-                    INDEX(fragment_type),
-                    INDEX(confidence_score)
+                    created_at REAL,  -- Unix timestamp for faster sorting
+                    last_evolved REAL
                 )
             """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_optimized_created_at "
+                "ON memory_fragments_optimized(created_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_optimized_fragment_type "
+                "ON memory_fragments_optimized(fragment_type)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_optimized_confidence "
+                "ON memory_fragments_optimized(confidence_score)"
+            )
 
             # Separate table for tags to normalize storage
             conn.execute("""
@@ -116,12 +298,10 @@ class OptimizedMemoryStorage:
                     FOREIGN KEY (fragment_id) REFERENCES memory_fragments_optimized(fragment_id)
                 )
             """)
-
-            # Enable WAL mode for better concurrency
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")  # Faster writes
-            conn.execute("PRAGMA cache_size=10000")  # Larger cache
-            conn.execute("PRAGMA temp_store=MEMORY")  # Memory temp storage
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_fragment_tags_value "
+                "ON fragment_tags(tag_type, tag_value)"
+            )
 
             conn.commit()
         finally:
@@ -129,16 +309,9 @@ class OptimizedMemoryStorage:
 
     def store_fragment_fast(self, fragment: MemoryFragment) -> str:
         """
-        Fast, non-blocking fragment storage using write-ahead buffer
+        Fast, non-blocking fragment storage using the writer queue
         """
-        operation = WriteOperation(operation_type="insert", fragment=fragment)
-
-        with self.buffer_lock:
-            self.write_buffer.append(operation)
-
-            # Check if immediate flush is needed
-            if len(self.write_buffer) >= self.batch_size:
-                self._flush_buffer_sync()
+        self._enqueue(WriteOperation(operation_type="insert", fragment=fragment))
 
         # Schedule tagging and scoring for background processing
         self._schedule_background_processing(fragment)
@@ -150,11 +323,9 @@ class OptimizedMemoryStorage:
         """
         Batch storage for multiple fragments
         """
-        operation = WriteOperation(operation_type="batch_insert", fragments=fragments)
-
-        with self.buffer_lock:
-            self.write_buffer.append(operation)
-            self._flush_buffer_sync()  # Immediate flush for batches
+        self._enqueue(
+            WriteOperation(operation_type="batch_insert", fragments=fragments)
+        )
 
         # Schedule background processing for all fragments
         for fragment in fragments:
@@ -165,65 +336,178 @@ class OptimizedMemoryStorage:
 
         return [f.fragment_id for f in fragments]
 
-    def _flush_buffer_sync(self):
+    def _enqueue(self, operation: WriteOperation):
+        with self._enqueue_lock:
+            if self._closed:
+                raise RuntimeError("OptimizedMemoryStorage has been cleaned up")
+
+            with self.buffer_lock:
+                for fragment in operation.fragments or [operation.fragment]:
+                    if fragment is not None:
+                        self._pending[fragment.fragment_id] = fragment
+                        self._attempts.pop(fragment.fragment_id, None)
+            self.write_queue.put(operation)
+
+    def _writer_loop(self):
         """
-        Synchronously flush the write buffer to database
+        Drain the queue into batched transactions on one long-lived connection
         """
-        if not self.write_buffer:
-            return
-
-        start_time = time.time()
-        operations_to_flush = self.write_buffer.copy()
-        self.write_buffer.clear()
+        conn = self._connect()
+        retry: List[MemoryFragment] = []  # From a failed batch
+        try:
+            while True:
+                try:
+                    # With rows to retry, back off for one interval at most
+                    operation = self.write_queue.get(
+                        timeout=self.flush_interval if retry else None
+                    )
+                except Empty:
+                    operation = WriteOperation(operation_type="flush")
+                fragments, retry = retry, []
+                waiters: List[WriteOperation] = []
+                stop = False
+                deadline = time.monotonic() + self.flush_interval
+
+                def collect(operation: WriteOperation):
+                    if operation.fragments:
+                        fragments.extend(operation.fragments)
+                    elif operation.fragment is not None:
+                        fragments.append(operation.fragment)
+                    if operation.done is not None:
+                        waiters.append(operation)
+
+                while True:
+                    if operation.operation_type == "stop":
+                        stop = True
+                    collect(operation)
+
+                    # Commit now for barriers, full batches or an expired interval
+                    if stop or waiters or len(fragments) >= self.batch_size:
+                        break
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        operation = self.write_queue.get(timeout=timeout)
+                    except Empty:
+                        break
+
+                if stop:
+                    # Anything still queued gets the final write too
+                    while True:
+                        try:
+                            collect(self.write_queue.get_nowait())
+                        except Empty:
+                            break
+
+                failed = False
+                if fragments and not self._try_write(conn, fragments):
+                    failed = True
+                    retry = self._write_one_by_one(conn, fragments)
+                if stop:
+                    for fragment in retry:
+                        self._dead_letter(fragment, "write failed before cleanup")
+                for waiter in waiters:
+                    waiter.failed = failed
+                    waiter.done.set()
+                if stop:
+                    return
+        finally:
+            conn.close()
 
-        # Execute batch write in background thread
-        self.executor.submit(self._execute_batch_write, operations_to_flush)
+    def _try_write(
+        self, conn: sqlite3.Connection, fragments: List[MemoryFragment]
+    ) -> bool:
+        """_execute_batch_write that reports unexpected errors as a failure"""
+        try:
+            return self._execute_batch_write(conn, fragments)
+        except Exception as e:
+            self.metrics["write_errors"] += 1
+            print(f"Batch write error: {e}")
+            return False
+
+    def _write_one_by_one(
+        self, conn: sqlite3.Connection, fragments: List[MemoryFragment]
+    ) -> List[MemoryFragment]:
+        """
+        Write the still-pending fragments of a failed batch individually
+
+        Returns the fragments to retry with the next batch; those that have
+        failed ``max_attempts`` times are dead-lettered instead.
+        """
+        retry = []
+        for fragment in self._still_pending(fragments):
+            if self._try_write(conn, [fragment]):
+                continue
+            with self.buffer_lock:
+                if self._pending.get(fragment.fragment_id) is not fragment:
+                    continue  # Superseded meanwhile
+                attempts = self._attempts.get(fragment.fragment_id, 0) + 1
+                self._attempts[fragment.fragment_id] = attempts
+            if attempts >= self.max_attempts:
+                self._dead_letter(fragment, f"write failed {attempts} times")
+            else:
+                retry.append(fragment)
+        return retry
+
+    def _still_pending(self, fragments: List[MemoryFragment]) -> List[MemoryFragment]:
+        """Fragments not committed or superseded since they were queued"""
+        latest = {fragment.fragment_id: fragment for fragment in fragments}
+        with self.buffer_lock:
+            return [f for f in latest.values() if self._pending.get(f.fragment_id) is f]
 
-        self.metrics["buffer_flushes"] += 1
-        self.metrics["last_flush_duration"] = time.time() - start_time
-        self.last_flush = time.time()
+    def _dead_letter(self, fragment: MemoryFragment, reason: str):
+        """Stop retrying a fragment and record it in dead_letters"""
+        with self.buffer_lock:
+            if self._pending.get(fragment.fragment_id) is fragment:
+                del self._pending[fragment.fragment_id]
+            self._attempts.pop(fragment.fragment_id, None)
+        self.dead_letters.append((fragment, reason))
+        self.metrics["dead_letters"] += 1
 
-    def _execute_batch_write(self, operations: List[WriteOperation]):
+    def _execute_batch_write(
+        self, conn: sqlite3.Connection, fragments_to_write: List[MemoryFragment]
+    ) -> bool:
         """
-        Execute a batch of write operations efficiently
+        Execute a batch of write operations in one transaction
+
+        Returns False if the transaction failed (the fragments stay pending)
+        or if a fragment could not be encoded (it is dead-lettered).
         """
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute("BEGIN TRANSACTION")
-
-            fragments_to_write = []
-
-            # Collect all fragments from operations
-            for op in operations:
-                if op.operation_type == "insert" and op.fragment:
-                    fragments_to_write.append(op.fragment)
-                elif op.operation_type == "batch_insert" and op.fragments:
-                    fragments_to_write.extend(op.fragments)
-
-            if fragments_to_write:
-                # Batch insert fragments
-                fragment_data = []
-                tag_data = []
-
-                for fragment in fragments_to_write:
-                    # Serialize fragment to binary format
-                    content_binary = self._serialize_fragment_binary(fragment)
-
-                    fragment_data.append(
-                        (
-                            fragment.fragment_id,
-                            content_binary,
-                            fragment.fragment_type.value,
-                            fragment.confidence_score,
-                            int(fragment.created_at.timestamp()),
-                            int(fragment.last_evolved.timestamp()),
-                        )
-                    )
+        start_time = time.perf_counter()
 
-                    # Collect tag data
-                    tag_data.extend(self._extract_tag_data(fragment))
+        # Last write wins for duplicate ids inside one batch
+        latest = {fragment.fragment_id: fragment for fragment in fragments_to_write}
+
+        fragment_data = []
+        tag_data = []
+        encoded = True
+        for fragment in list(latest.values()):
+            try:
+                content_binary = self._serialize_fragment_binary(fragment)
+            except (TypeError, ValueError) as e:
+                # Encoding is deterministic, so retrying cannot help
+                self.metrics["encode_errors"] += 1
+                self._dead_letter(fragment, f"encode error: {e}")
+                del latest[fragment.fragment_id]
+                encoded = False
+                continue
+
+            fragment_data.append(
+                (
+                    fragment.fragment_id,
+                    content_binary,
+                    fragment.fragment_type.value,
+                    fragment.confidence_score,
+                    fragment.created_at.timestamp(),
+                    fragment.last_evolved.timestamp(),
+                )
+            )
+            tag_data.extend(self._extract_tag_data(fragment))
+            self.metrics["bytes_written"] += len(content_binary)
 
-                # Execute batch inserts
+        try:
+            with conn:
                 conn.executemany(
                     """
                     INSERT OR REPLACE INTO memory_fragments_optimized
@@ -234,54 +518,57 @@ class OptimizedMemoryStorage:
                 )
 
                 # Clear existing tags and insert new ones
-                fragment_ids = [f.fragment_id for f in fragments_to_write]
-                placeholders = ",".join("?" * len(fragment_ids))
-                conn.execute(
-                    f"DELETE FROM fragment_tags WHERE fragment_id IN ({placeholders})",
-                    fragment_ids,
+                conn.executemany(
+                    "DELETE FROM fragment_tags WHERE fragment_id = ?",
+                    [(row[0],) for row in fragment_data],
                 )
-
-                if tag_data:
-                    conn.executemany(
-                        """
-                        INSERT INTO fragment_tags (fragment_id, tag_type, tag_key, tag_value)
-                        VALUES (?, ?, ?, ?)
-                    """,
-                        tag_data,
-                    )
-
-            conn.execute("COMMIT")
-
-            # Update metrics
-            avg_batch = len(fragments_to_write)
-            current_avg = self.metrics.get("avg_batch_size", 0)
-            total_batches = self.metrics.get("batch_writes", 0) + 1
-            self.metrics["avg_batch_size"] = (
-                current_avg * (total_batches - 1) + avg_batch
-            ) / total_batches
-
-        except Exception as e:
-            conn.execute("ROLLBACK")
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO fragment_tags (fragment_id, tag_type, tag_key, tag_value)
+                    VALUES (?, ?, ?, ?)
+                """,
+                    tag_data,
+                )
+        except sqlite3.Error as e:
+            self.metrics["write_errors"] += 1
             print(f"Batch write error: {e}")
-        finally:
-            conn.close()
+            return False
+
+        with self.buffer_lock:
+            for fragment_id, fragment in latest.items():
+                if self._pending.get(fragment_id) is fragment:
+                    del self._pending[fragment_id]
+                    self._attempts.pop(fragment_id, None)
+
+        # Update metrics
+        duration = time.perf_counter() - start_time
+        flushes = self.metrics["buffer_flushes"] + 1
+        self.metrics["avg_batch_size"] = (
+            self.metrics["avg_batch_size"] * (flushes - 1) + len(fragment_data)
+        ) / flushes
+        self.metrics["buffer_flushes"] = flushes
+        self.metrics["rows_written"] += len(fragment_data)
+        self.metrics["last_flush_duration"] = duration
+        self.metrics["max_flush_duration"] = max(
+            self.metrics["max_flush_duration"], duration
+        )
+        self.last_flush = time.time()
+        return encoded
 
     def _serialize_fragment_binary(self, fragment: MemoryFragment) -> bytes:
         """
-        Serialize fragment to compact binary format using ujson
-        """
-        fragment_dict = {
-            "content": fragment.content,
-            "temporal_tags": fragment.temporal_tags,
-            "symbolic_tags": list(fragment.symbolic_tags),
-            "associative_links": fragment.associative_links,
-            "access_pattern": fragment.access_pattern,
-            "narrative_role": fragment.narrative_role,
-        }
-
-        # Use json for faster serialization
-        json_str = json.dumps(fragment_dict)
-        return json_str.encode("utf-8")
+        Serialize fragment payload with the versioned binary codec
+        """
+        return FragmentCodec.encode(
+            {
+                "content": fragment.content,
+                "temporal_tags": fragment.temporal_tags,
+                "symbolic_tags": fragment.symbolic_tags,
+                "associative_links": fragment.associative_links,
+                "access_pattern": fragment.access_pattern,
+                "narrative_role": fragment.narrative_role,
+            }
+        )
 
     def _extract_tag_data(self, fragment: MemoryFragment) -> List[tuple]:
         """
@@ -293,9 +580,9 @@ class OptimizedMemoryStorage:
         for key, value in fragment.temporal_tags.items():
             tag_data.append((fragment.fragment_id, "temporal", key, str(value)))
 
-        # Symbolic tags
+        # Symbolic tags (the tag is its own key so several fit the primary key)
         for tag in fragment.symbolic_tags:
-            tag_data.append((fragment.fragment_id, "symbolic", "tag", str(tag)))
+            tag_data.append((fragment.fragment_id, "symbolic", str(tag), str(tag)))
 
         # Associative links
         for i, link in enumerate(fragment.associative_links):
@@ -307,133 +594,129 @@ class OptimizedMemoryStorage:
 
     def _schedule_background_processing(self, fragment: MemoryFragment):
         """
-        Schedule asynchronous tagging and scoring with 1-2 tick delay
+        Hand the fragment to tagging/scoring consumers without blocking
         """
-        # Add small delay to avoid blocking main storage operation
-        delay = 0.001  # 1ms delay
-
-        def delayed_processing():
-            time.sleep(delay)
-            self.processing_queue.put(("process_fragment", fragment))
-
-        self.executor.submit(delayed_processing)
-
-    def _schedule_flush(self):
-        """
-        Schedule periodic buffer flush
-        """
-
-        def flush_if_needed():
-            current_time = time.time()
-            if (current_time - self.last_flush) >= self.flush_interval:
-                with self.buffer_lock:
-                    if self.write_buffer:
-                        self._flush_buffer_sync()
-
-            # Schedule next flush
-            self._schedule_flush()
-
-        self.flush_timer = Timer(self.flush_interval, flush_if_needed)
-        self.flush_timer.start()
+        try:
+            self.processing_queue.put_nowait(("process_fragment", fragment))
+        except Full:
+            # Nobody is draining: drop the oldest task rather than grow forever
+            try:
+                self.processing_queue.get_nowait()
+            except Empty:
+                pass
+            self.metrics["dropped_processing_tasks"] += 1
+            try:
+                self.processing_queue.put_nowait(("process_fragment", fragment))
+            except Full:
+                pass
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until everything queued so far has gone through a write
+
+        Rows from a failed write stay pending (and readable) and are retried.
+        Returns False on timeout, if the writer thread has died, or if the
+        write did not commit everything (see ``dead_letters``).
+        """
+        barrier = WriteOperation(operation_type="flush", done=threading.Event())
+        with self._enqueue_lock:
+            if self._closed:
+                return True
+            self.write_queue.put(barrier)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not barrier.done.wait(0.1):
+            if not self._writer.is_alive():
+                return False
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+        return not barrier.failed
 
     async def force_flush(self):
         """
         Force flush of write buffer (useful for testing)
         """
-        with self.buffer_lock:
-            if self.write_buffer:
-                self._flush_buffer_sync()
-
-        # Wait for background operations to complete
-        await asyncio.sleep(0.01)
+        await asyncio.get_running_loop().run_in_executor(None, self.flush)
 
     def get_performance_metrics(self) -> Dict[str, Any]:
         """
         Get current performance metrics
         """
+        with self.buffer_lock:
+            pending = len(self._pending)
         return {
             **self.metrics,
-            "buffer_size": len(self.write_buffer),
+            "buffer_size": pending,
+            "writer_queue_depth": self.write_queue.qsize(),
             "queue_size": self.processing_queue.qsize(),
+            "codec_version": CODEC_VERSION,
             "time_since_last_flush": time.time() - self.last_flush,
         }
 
+    def _reader(self) -> sqlite3.Connection:
+        """Reuse one read connection per thread"""
+        conn = getattr(self._reader_local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._reader_local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
     def retrieve_fragment(self, fragment_id: str) -> Optional[MemoryFragment]:
         """
         Fast fragment retrieval with binary deserialization
         """
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.execute(
-                """
-                SELECT fragment_id, content_binary, fragment_type, confidence_score, created_at, last_evolved
-                FROM memory_fragments_optimized
-                WHERE fragment_id = ?
-            """,
-                (fragment_id,),
-            )
-
-            row = cursor.fetchone()
-            if not row:
-                return None
-
-            # Deserialize binary content
-            content_binary = row[1]
-            fragment_dict = json.loads(content_binary.decode("utf-8"))
-
-            # Load tags
-            tag_cursor = conn.execute(
-                """
-                SELECT tag_type, tag_key, tag_value
-                FROM fragment_tags
-                WHERE fragment_id = ?
-            """,
-                (fragment_id,),
-            )
-
-            temporal_tags = {}
-            symbolic_tags = set()
-            associative_links = []
-
-            for tag_type, tag_key, tag_value in tag_cursor.fetchall():
-                if tag_type == "temporal":
-                    temporal_tags[tag_key] = tag_value
-                elif tag_type == "symbolic" and tag_key == "tag":
-                    symbolic_tags.add(tag_value)
-                elif tag_type == "associative":
-                    associative_links.append(tag_value)
-
-            return MemoryFragment(
-                fragment_id=row[0],
-                content=fragment_dict["content"],
-                fragment_type=MemoryFragmentType(row[2]),
-                temporal_tags=temporal_tags,
-                symbolic_tags=symbolic_tags,
-                associative_links=associative_links,
-                confidence_score=row[3],
-                access_pattern=fragment_dict.get("access_pattern", {}),
-                narrative_role=fragment_dict.get("narrative_role"),
-                created_at=datetime.fromtimestamp(row[4]),
-                last_evolved=datetime.fromtimestamp(row[5]),
-            )
-
-        finally:
-            conn.close()
+        with self.buffer_lock:
+            pending = self._pending.get(fragment_id)
+        if pending is not None:
+            return pending
+
+        conn = self._reader()
+        row = conn.execute(
+            """
+            SELECT fragment_id, content_binary, fragment_type, confidence_score, created_at, last_evolved
+            FROM memory_fragments_optimized
+            WHERE fragment_id = ?
+        """,
+            (fragment_id,),
+        ).fetchone()
+        if not row:
+            return None
+
+        # Deserialize binary content; it carries the exact tag values
+        fragment_dict = FragmentCodec.decode(row[1])
+
+        return MemoryFragment(
+            fragment_id=row[0],
+            content=fragment_dict["content"],
+            fragment_type=MemoryFragmentType(row[2]),
+            temporal_tags=fragment_dict.get("temporal_tags", {}),
+            symbolic_tags=set(fragment_dict.get("symbolic_tags", [])),
+            associative_links=list(fragment_dict.get("associative_links", [])),
+            confidence_score=row[3],
+            access_pattern=fragment_dict.get("access_pattern", {}),
+            narrative_role=fragment_dict.get("narrative_role"),
+            created_at=datetime.fromtimestamp(row[4]),
+            last_evolved=datetime.fromtimestamp(row[5]),
+        )
 
     def cleanup(self):
         """
         Clean up resources
         """
-        if self.flush_timer:
-            self.flush_timer.cancel()
-
-        # Final flush
-        with self.buffer_lock:
-            if self.write_buffer:
-                self._flush_buffer_sync()
-
-        # Shutdown executor
-        self.executor.shutdown(wait=True)
+        with self._enqueue_lock:
+            if self._closed:
+                return
+            self._closed = True
+            # Final flush, then stop the writer
+            self.write_queue.put(WriteOperation(operation_type="stop"))
+        self._writer.join(timeout=10)
+
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for conn in readers:
+            conn.close()
+        self._reader_local = threading.local()
 
 
 class AsyncMemoryProcessor:
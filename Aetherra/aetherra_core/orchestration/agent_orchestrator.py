@@ -4,15 +4,23 @@
 
 Coordinates multiple AI agents and manages task distribution across the Aetherra ecosystem.
 Handles agent discovery, capability matching, task scheduling, and result aggregation.
+
+Queued tasks wait in one priority heap per required capability, and the
+available agents are indexed by capability, so a task is matched the moment
+it is submitted or an agent able to run it frees up. State is journaled to
+SQLite one task or agent row at a time.
 """
 
 import asyncio
+import heapq
 import json
 import logging
+import sqlite3
+from collections import defaultdict
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -91,72 +99,226 @@ class AgentOrchestrator:
         self.db_path = Path(db_path)
         self.agents: Dict[str, Agent] = {}
         self.tasks: Dict[str, Task] = {}
-        self.task_queue: List[str] = []
         self.running_tasks: Dict[str, asyncio.Task] = {}
         self.orchestration_active = False
         self._task_counter = 0
 
+        # capability -> heap of (priority value, seq, task_id). A task sits in
+        # the heap of each capability it requires; entries for tasks no longer
+        # in _queued are stale and dropped when they reach the top.
+        self._queues: Dict[str, List[Tuple[int, int, str]]] = defaultdict(list)
+        self._queued: Set[str] = set()
+        self._seq = 0
+        # capability -> IDs of available agents having it
+        self._available_agents: Dict[str, Set[str]] = defaultdict(set)
+
+        # Rows changed since the last journal write
+        self._dirty_tasks: Set[str] = set()
+        self._dirty_agents: Set[str] = set()
+        self._flush_handle: Optional[asyncio.Handle] = None
+
         # Load persistent data
+        self._db = self._open_journal()
         self._load_state()
 
-        logger.info(f"[AGENT] Agent Orchestrator initialized with {len(self.agents)} agents")
+        logger.info(
+            f"[AGENT] Agent Orchestrator initialized with {len(self.agents)} agents"
+        )
+
+    def _open_journal(self) -> sqlite3.Connection:
+        """Open the SQLite journal, importing a legacy JSON state file."""
+        legacy = None
+        if self.db_path.is_file() and self.db_path.stat().st_size:
+            with open(self.db_path, "rb") as f:
+                is_sqlite = f.read(16) == b"SQLite format 3\x00"
+            if not is_sqlite:
+                try:
+                    with open(self.db_path, "r") as f:
+                        legacy = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"⚠️ Could not read legacy orchestrator state: {e}")
+                backup = self.db_path.with_name(self.db_path.name + ".json")
+                self.db_path.replace(backup)
+                logger.info(f"📦 Moved legacy orchestrator state to {backup}")
+
+        db = sqlite3.connect(str(self.db_path))
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript("""
+            CREATE TABLE IF NOT EXISTS agents (
+                agent_id TEXT PRIMARY KEY,
+                data TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS tasks (
+                task_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
+            """)
+
+        if legacy:
+            with db:
+                db.executemany(
+                    "INSERT OR REPLACE INTO agents (agent_id, data) VALUES (?, ?)",
+                    [
+                        (a["agent_id"], json.dumps(a, default=str))
+                        for a in legacy.get("agents", [])
+                    ],
+                )
+                db.executemany(
+                    "INSERT OR REPLACE INTO tasks (task_id, status, data) VALUES (?, ?, ?)",
+                    [
+                        (
+                            t["task_id"],
+                            t.get("status", "pending"),
+                            json.dumps(t, default=str),
+                        )
+                        for t in legacy.get("tasks", [])
+                    ],
+                )
+        return db
 
     def _load_state(self):
         """Load orchestrator state from persistent storage."""
         try:
-            if self.db_path.exists():
-                with open(self.db_path, 'r') as f:
-                    data = json.load(f)
-
-                # Restore agents
-                for agent_data in data.get('agents', []):
-                    agent = Agent(**agent_data)
-                    agent.last_seen = datetime.fromisoformat(agent_data.get('last_seen', datetime.now().isoformat()))
-                    agent.status = AgentStatus.OFFLINE  # Reset to offline on startup
-                    self.agents[agent.agent_id] = agent
-
-                # Restore pending tasks
-                for task_data in data.get('tasks', []):
-                    task = Task(**task_data)
-                    task.created_at = datetime.fromisoformat(task_data.get('created_at', datetime.now().isoformat()))
-                    if task.status in [TaskStatus.PENDING, TaskStatus.ASSIGNED]:
-                        self.tasks[task.task_id] = task
-                        self.task_queue.append(task.task_id)
-
-                logger.info(f"✅ Loaded {len(self.agents)} agents and {len(self.tasks)} pending tasks")
+            # Restore agents
+            for (data,) in self._db.execute("SELECT data FROM agents ORDER BY rowid"):
+                agent_data = json.loads(data)
+                agent_data["last_seen"] = datetime.fromisoformat(
+                    agent_data.get("last_seen", datetime.now().isoformat())
+                )
+                agent = Agent(**agent_data)
+                agent.status = AgentStatus.OFFLINE  # Reset to offline on startup
+                agent.current_task = None
+                self.agents[agent.agent_id] = agent
+
+            # Restore unfinished tasks; their agents are offline now, so
+            # assigned and running ones go back to the queue
+            rows = self._db.execute(
+                "SELECT data FROM tasks WHERE status IN (?, ?, ?) ORDER BY rowid",
+                (
+                    TaskStatus.PENDING.value,
+                    TaskStatus.ASSIGNED.value,
+                    TaskStatus.RUNNING.value,
+                ),
+            )
+            for (data,) in rows:
+                task_data = json.loads(data)
+                for key in ("created_at", "started_at", "completed_at"):
+                    if task_data.get(key):
+                        task_data[key] = datetime.fromisoformat(task_data[key])
+                task_data["created_at"] = task_data.get("created_at") or datetime.now()
+                task_data["priority"] = TaskPriority(
+                    task_data.get("priority", "normal")
+                )
+                task = Task(**task_data)
+                task.status = TaskStatus.PENDING
+                task.assigned_agent = None
+                task.started_at = None
+                self.tasks[task.task_id] = task
+                self._enqueue(task)
+
+            logger.info(
+                f"✅ Loaded {len(self.agents)} agents and {len(self.tasks)} pending tasks"
+            )
 
         except Exception as e:
             logger.warning(f"⚠️ Could not load orchestrator state: {e}")
 
+    def _mark_dirty(self, task: Optional[Task] = None, agent: Optional[Agent] = None):
+        """
+        Queue a task and/or agent row for the journal.
+
+        Writes are coalesced and flushed once the current event loop
+        iteration is done, so a burst of submissions is one transaction.
+        """
+        if task is not None:
+            self._dirty_tasks.add(task.task_id)
+        if agent is not None:
+            self._dirty_agents.add(agent.agent_id)
+        if self._flush_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._save_state()
+                return
+            self._flush_handle = loop.call_soon(self._save_state)
+
     def _save_state(self):
-        """Save orchestrator state to persistent storage."""
+        """Write changed tasks and agents to the journal."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not (self._dirty_tasks or self._dirty_agents):
+            return
+
         try:
-            data = {
-                'agents': [
-                    {
-                        **agent.__dict__,
-                        'last_seen': agent.last_seen.isoformat(),
-                        'status': agent.status.value
-                    } for agent in self.agents.values()
-                ],
-                'tasks': [
-                    {
-                        **task.__dict__,
-                        'created_at': task.created_at.isoformat(),
-                        'started_at': task.started_at.isoformat() if task.started_at else None,
-                        'completed_at': task.completed_at.isoformat() if task.completed_at else None,
-                        'priority': task.priority.value,
-                        'status': task.status.value
-                    } for task in self.tasks.values()
-                ]
-            }
+            agent_rows = [
+                (
+                    agent.agent_id,
+                    json.dumps(
+                        {
+                            **agent.__dict__,
+                            "last_seen": agent.last_seen.isoformat(),
+                            "status": agent.status.value,
+                        },
+                        default=str,
+                    ),
+                )
+                for agent in map(self.agents.get, self._dirty_agents)
+                if agent is not None
+            ]
+            task_rows = [
+                (
+                    task.task_id,
+                    task.status.value,
+                    json.dumps(
+                        {
+                            **task.__dict__,
+                            "created_at": task.created_at.isoformat(),
+                            "started_at": (
+                                task.started_at.isoformat() if task.started_at else None
+                            ),
+                            "completed_at": (
+                                task.completed_at.isoformat()
+                                if task.completed_at
+                                else None
+                            ),
+                            "priority": task.priority.value,
+                            "status": task.status.value,
+                        },
+                        default=str,
+                    ),
+                )
+                for task in map(self.tasks.get, self._dirty_tasks)
+                if task is not None
+            ]
+            with self._db:
+                self._db.executemany(
+                    "INSERT INTO agents (agent_id, data) VALUES (?, ?) "
+                    "ON CONFLICT(agent_id) DO UPDATE SET data = excluded.data",
+                    agent_rows,
+                )
+                self._db.executemany(
+                    "INSERT INTO tasks (task_id, status, data) VALUES (?, ?, ?) "
+                    "ON CONFLICT(task_id) DO UPDATE SET "
+                    "status = excluded.status, data = excluded.data",
+                    task_rows,
+                )
 
-            with open(self.db_path, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            # Only once committed; a failed write is retried with the next one
+            self._dirty_agents.clear()
+            self._dirty_tasks.clear()
 
         except Exception as e:
             logger.error(f"❌ Could not save orchestrator state: {e}")
 
+    def close(self):
+        """Flush pending journal writes and close the journal."""
+        self._save_state()
+        self._db.close()
+
     async def start_orchestration(self):
         """Start the orchestration process."""
         if self.orchestration_active:
@@ -172,6 +334,9 @@ class AgentOrchestrator:
         if not self.agents:
             await self._register_default_agents()
 
+        # Hand out tasks submitted while orchestration was stopped
+        await self._process_task_queue()
+
     async def stop_orchestration(self):
         """Stop the orchestration process."""
         if not self.orchestration_active:
@@ -211,19 +376,35 @@ class AgentOrchestrator:
             await self.register_agent(**agent_data)
 
     async def register_agent(self, agent_id: str, name: str, capabilities: List[str]) -> bool:
-        """Register a new agent with the orchestrator."""
+        """
+        Register a new agent with the orchestrator.
+
+        An agent that is busy with a task cannot be re-registered until the
+        task has finished.
+        """
         try:
+            previous = self.agents.get(agent_id)
+            if previous is not None and previous.status == AgentStatus.BUSY:
+                logger.warning(
+                    f"⚠️ Agent {agent_id} is busy with task {previous.current_task}; "
+                    "not re-registering it"
+                )
+                return False
+
             agent = Agent(
                 agent_id=agent_id,
                 name=name,
                 capabilities=capabilities,
-                status=AgentStatus.AVAILABLE
+                status=AgentStatus.OFFLINE
             )
 
+            if previous is not None:
+                self._set_agent_status(previous, AgentStatus.OFFLINE)
             self.agents[agent_id] = agent
-            self._save_state()
+            self._set_agent_status(agent, AgentStatus.AVAILABLE)
 
             logger.info(f"✅ Registered agent '{name}' with capabilities: {capabilities}")
+            await self._dispatch_to_agent(agent)
             return True
 
         except Exception as e:
@@ -231,20 +412,31 @@ class AgentOrchestrator:
             return False
 
     async def submit_task(self, task: Task) -> str:
-        """Submit a task for execution."""
+        """
+        Submit a task for execution.
+
+        While orchestration is active the task is assigned straight away if
+        an agent is free to run it; otherwise it is queued.
+        """
         try:
             # Generate task ID if not provided
             if not task.task_id:
                 self._task_counter += 1
                 task.task_id = f"task_{self._task_counter:06d}"
 
-            # Add to task registry and queue
+            # Add to task registry
             self.tasks[task.task_id] = task
-            self.task_queue.append(task.task_id)
+            self._mark_dirty(task=task)
+            logger.info(f"📋 Submitted task '{task.name}' (ID: {task.task_id})")
 
-            self._save_state()
+            agent = None
+            if self.orchestration_active:
+                agent = self._find_suitable_agent(task.required_capabilities)
+            if agent:
+                await self._assign_task_to_agent(task, agent)
+            else:
+                self._enqueue(task)
 
-            logger.info(f"📋 Submitted task '{task.name}' (ID: {task.task_id})")
             return task.task_id
 
         except Exception as e:
@@ -255,8 +447,8 @@ class AgentOrchestrator:
         """Main orchestration loop that assigns tasks to agents."""
         while self.orchestration_active:
             try:
-                # Process pending tasks
-                await self._process_task_queue()
+                # Tasks are dispatched as they are submitted and as agents
+                # free up; the loop only does housekeeping
 
                 # Check for completed tasks
                 await self._check_completed_tasks()
@@ -275,23 +467,49 @@ class AgentOrchestrator:
 
     async def _process_task_queue(self):
         """Process pending tasks and assign them to available agents."""
-        if not self.task_queue:
+        for agent in list(self.agents.values()):
+            await self._dispatch_to_agent(agent)
+
+    def _enqueue(self, task: Task):
+        """Queue a pending task under each capability it requires."""
+        self._seq += 1
+        entry = (self._get_task_priority_value(task.task_id), self._seq, task.task_id)
+        self._queued.add(task.task_id)
+        for capability in set(task.required_capabilities):
+            heapq.heappush(self._queues[capability], entry)
+
+    async def _dispatch_to_agent(self, agent: Agent):
+        """Give an available agent the most urgent queued task it can run."""
+        if not self.orchestration_active or agent.status != AgentStatus.AVAILABLE:
             return
 
-        # Sort tasks by priority
-        self.task_queue.sort(key=lambda tid: self._get_task_priority_value(tid))
-
-        for task_id in self.task_queue[:]:  # Copy to avoid modification during iteration
-            task = self.tasks.get(task_id)
-            if not task or task.status != TaskStatus.PENDING:
-                self.task_queue.remove(task_id)
+        best = None
+        for capability in set(agent.capabilities):
+            queue = self._queues.get(capability)
+            if queue is None:
                 continue
-
-            # Find suitable agent
-            agent = self._find_suitable_agent(task.required_capabilities)
-            if agent:
-                await self._assign_task_to_agent(task, agent)
-                self.task_queue.remove(task_id)
+            while queue and queue[0][2] not in self._queued:
+                heapq.heappop(queue)
+            if not queue:
+                del self._queues[capability]
+            elif best is None or queue[0] < best[0]:
+                best = (queue[0], capability)
+
+        if best is not None:
+            (_, _, task_id), capability = best
+            heapq.heappop(self._queues[capability])
+            await self._assign_task_to_agent(self.tasks[task_id], agent)
+
+    def _set_agent_status(self, agent: Agent, status: AgentStatus):
+        """Change an agent's status, keeping the available-agent index current."""
+        if agent.status == AgentStatus.AVAILABLE:
+            for capability in agent.capabilities:
+                self._available_agents[capability].discard(agent.agent_id)
+        agent.status = status
+        if status == AgentStatus.AVAILABLE:
+            for capability in agent.capabilities:
+                self._available_agents[capability].add(agent.agent_id)
+        self._mark_dirty(agent=agent)
 
     def _get_task_priority_value(self, task_id: str) -> int:
         """Get numeric priority value for sorting."""
@@ -309,39 +527,37 @@ class AgentOrchestrator:
 
     def _find_suitable_agent(self, required_capabilities: List[str]) -> Optional[Agent]:
         """Find the best available agent for the given capabilities."""
-        available_agents = [
-            agent for agent in self.agents.values()
-            if agent.status == AgentStatus.AVAILABLE
-        ]
-
-        if not available_agents:
+        # Count matching capabilities, looking only at available agents
+        # indexed under the required ones
+        capability_scores: Dict[str, int] = defaultdict(int)
+        for capability in set(required_capabilities):
+            for agent_id in self._available_agents.get(capability, ()):
+                capability_scores[agent_id] += 1
+
+        if not capability_scores:
             return None
 
         # Score agents by capability match and performance
-        scored_agents = []
-        for agent in available_agents:
-            capability_score = len(set(required_capabilities) & set(agent.capabilities))
-            performance_score = agent.performance_metrics.get('success_rate', 0.5)
-            total_score = capability_score * 10 + performance_score
-
-            if capability_score > 0:  # Agent must have at least one required capability
-                scored_agents.append((total_score, agent))
-
-        if not scored_agents:
-            return None
+        def total_score(agent_id: str) -> float:
+            performance_score = self.agents[agent_id].performance_metrics.get(
+                "success_rate", 0.5
+            )
+            return capability_scores[agent_id] * 10 + performance_score
 
         # Return agent with highest score
-        return max(scored_agents, key=lambda x: x[0])[1]
+        return self.agents[max(capability_scores, key=total_score)]
 
     async def _assign_task_to_agent(self, task: Task, agent: Agent):
         """Assign a task to a specific agent."""
         try:
+            self._queued.discard(task.task_id)
             task.assigned_agent = agent.agent_id
             task.status = TaskStatus.ASSIGNED
             task.started_at = datetime.now()
 
-            agent.status = AgentStatus.BUSY
             agent.current_task = task.task_id
+            self._set_agent_status(agent, AgentStatus.BUSY)
+            self._mark_dirty(task=task)
 
             # Start task execution
             task_future = asyncio.create_task(self._execute_task(task, agent))
@@ -353,24 +569,15 @@ class AgentOrchestrator:
             logger.error(f"❌ Failed to assign task {task.task_id} to agent {agent.agent_id}: {e}")
             task.status = TaskStatus.FAILED
             task.error_message = str(e)
+            self._mark_dirty(task=task)
 
     async def _execute_task(self, task: Task, agent: Agent) -> Dict[str, Any]:
         """Execute a task using the assigned agent."""
         try:
             task.status = TaskStatus.RUNNING
+            self._mark_dirty(task=task)
 
-            # Simulate task execution (in real implementation, this would call the actual agent)
-            await asyncio.sleep(2.0)  # Simulate processing time
-
-            # Mock successful result
-            result = {
-                "status": "completed",
-                "agent_id": agent.agent_id,
-                "task_id": task.task_id,
-                "result": f"Mock result for task '{task.name}' by agent '{agent.name}'",
-                "execution_time": 2.0,
-                "timestamp": datetime.now().isoformat()
-            }
+            result = await self._run_agent(task, agent)
 
             # Update task status
             task.status = TaskStatus.COMPLETED
@@ -378,7 +585,6 @@ class AgentOrchestrator:
             task.completed_at = datetime.now()
 
             # Update agent status and metrics
-            agent.status = AgentStatus.AVAILABLE
             agent.current_task = None
             agent.total_tasks_completed += 1
             agent.last_seen = datetime.now()
@@ -392,7 +598,8 @@ class AgentOrchestrator:
                 )
             agent.performance_metrics['success_rate'] = min(1.0, agent.performance_metrics.get('success_rate', 0.5) + 0.1)
 
-            self._save_state()
+            self._release_agent(agent)
+            self._mark_dirty(task=task)
             logger.info(f"✅ Task '{task.name}' completed by agent '{agent.name}'")
 
             return result
@@ -401,8 +608,9 @@ class AgentOrchestrator:
             logger.error(f"❌ Task execution failed: {e}")
             task.status = TaskStatus.FAILED
             task.error_message = str(e)
-            agent.status = AgentStatus.AVAILABLE
             agent.current_task = None
+            self._release_agent(agent)
+            self._mark_dirty(task=task)
 
             return {"status": "failed", "error": str(e)}
 
@@ -411,6 +619,29 @@ class AgentOrchestrator:
             if task.task_id in self.running_tasks:
                 del self.running_tasks[task.task_id]
 
+            # Hand the freed agent its next task
+            await self._dispatch_to_agent(agent)
+
+    def _release_agent(self, agent: Agent):
+        """Make an agent available again, unless it was re-registered meanwhile."""
+        if self.agents.get(agent.agent_id) is agent:
+            self._set_agent_status(agent, AgentStatus.AVAILABLE)
+
+    async def _run_agent(self, task: Task, agent: Agent) -> Dict[str, Any]:
+        """Run a task on its agent and return the result."""
+        # Simulate task execution (in real implementation, this would call the actual agent)
+        await asyncio.sleep(2.0)  # Simulate processing time
+
+        # Mock successful result
+        return {
+            "status": "completed",
+            "agent_id": agent.agent_id,
+            "task_id": task.task_id,
+            "result": f"Mock result for task '{task.name}' by agent '{agent.name}'",
+            "execution_time": 2.0,
+            "timestamp": datetime.now().isoformat(),
+        }
+
     async def _check_completed_tasks(self):
         """Check for and clean up completed tasks."""
         completed_tasks = []
@@ -431,14 +662,15 @@ class AgentOrchestrator:
             if agent.status != AgentStatus.OFFLINE:
                 time_since_last_seen = current_time - agent.last_seen
                 if time_since_last_seen > timeout_threshold:
-                    agent.status = AgentStatus.OFFLINE
                     if agent.current_task:
                         # Mark current task as failed due to agent timeout
                         task = self.tasks.get(agent.current_task)
                         if task:
                             task.status = TaskStatus.FAILED
                             task.error_message = "Agent became unavailable"
+                            self._mark_dirty(task=task)
                         agent.current_task = None
+                    self._set_agent_status(agent, AgentStatus.OFFLINE)
 
     def get_system_status(self) -> Dict[str, Any]:
         """Get comprehensive system status."""
@@ -460,7 +692,7 @@ class AgentOrchestrator:
             "pending_tasks": pending_tasks,
             "running_tasks": running_tasks,
             "completed_tasks": completed_tasks,
-            "queue_length": len(self.task_queue),
+            "queue_length": len(self._queued),
             "timestamp": datetime.now().isoformat()
         }
 
@@ -509,6 +741,8 @@ class AgentOrchestrator:
 
         # Cancel the task
         task.status = TaskStatus.CANCELLED
+        self._queued.discard(task_id)  # Its heap entries are now stale
+        self._mark_dirty(task=task)
 
         # If task is running, cancel the future
         if task_id in self.running_tasks:
@@ -519,14 +753,10 @@ class AgentOrchestrator:
         if task.assigned_agent:
             agent = self.agents.get(task.assigned_agent)
             if agent and agent.current_task == task_id:
-                agent.status = AgentStatus.AVAILABLE
                 agent.current_task = None
+                self._set_agent_status(agent, AgentStatus.AVAILABLE)
+                await self._dispatch_to_agent(agent)
 
-        # Remove from queue if pending
-        if task_id in self.task_queue:
-            self.task_queue.remove(task_id)
-
-        self._save_state()
         logger.info(f"🚫 Cancelled task '{task.name}' (ID: {task_id})")
 
         return True
@@ -580,6 +810,7 @@ async def test_orchestrator():
 
     finally:
         await orchestrator.stop_orchestration()
+        orchestrator.close()
 
 
 if __name__ == "__main__":
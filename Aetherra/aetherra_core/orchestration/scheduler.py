@@ -9,9 +9,15 @@ of various Aetherra subsystems.
 """
 
 import asyncio
+import heapq
+import inspect
 import logging
+import math
+import threading
+import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -35,6 +41,14 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
+class MisfirePolicy(Enum):
+    """What to do with a run that starts later than the misfire grace time."""
+
+    RUN_ONCE = "run_once"  # Run it now, then continue with the next future slot
+    RUN_ALL = "run_all"  # Run every missed occurrence back to back
+    SKIP = "skip"  # Drop the missed run and wait for the next future slot
+
+
 @dataclass
 class ScheduledTask:
     """A scheduled task with execution details."""
@@ -51,6 +65,8 @@ class ScheduledTask:
     last_run: Optional[datetime] = None
     run_count: int = 0
     max_runs: Optional[int] = None
+    misfire_policy: MisfirePolicy = MisfirePolicy.RUN_ONCE
+    misfire_count: int = 0
 
     def __post_init__(self):
         if self.kwargs is None:
@@ -67,14 +83,42 @@ class AetherraScheduler:
 
     Manages the execution of scheduled tasks across the Aetherra system.
     Supports one-time tasks, recurring tasks, and priority-based execution.
+
+    Pending runs sit in a min-heap keyed on their deadline. The scheduler
+    loop sleeps exactly until the earliest deadline and is woken early when
+    a task is scheduled ahead of it or cancelled. Due runs are dispatched
+    concurrently, highest priority first, with at most ``max_concurrency``
+    running at once; coroutine functions run on the event loop and plain
+    functions in the default executor. Recurring tasks run at a fixed rate
+    (``interval`` after the previous deadline) and never overlap themselves.
     """
 
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 10, misfire_grace_time: float = 1.0):
         self.tasks: Dict[str, ScheduledTask] = {}
         self.running = False
+        self.max_concurrency = max_concurrency
+        self.misfire_grace_time = misfire_grace_time
         self._scheduler_task: Optional[asyncio.Task] = None
         self._task_counter = 0
 
+        # (deadline, -priority, seq, task_id); entries whose seq no longer
+        # matches _entry_seq[task_id] are stale and skipped
+        self._timers: List[Tuple[float, int, int, str]] = []
+        # Due runs waiting for a free slot: (-priority, deadline, seq, task_id)
+        self._ready: List[Tuple[int, float, int, str]] = []
+        self._entry_seq: Dict[str, int] = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._sleep_until = math.inf
+        self._running_runs: Set[asyncio.Task] = set()
+
+        self._dispatched = 0
+        self._misfires = 0
+        self._latencies: Deque[float] = deque(maxlen=1000)
+
     async def start(self):
         """Start the scheduler."""
         if self.running:
@@ -83,6 +127,8 @@ class AetherraScheduler:
 
         logger.info("🗓️ Starting Aetherra Scheduler...")
         self.running = True
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
         self._scheduler_task = asyncio.create_task(self._scheduler_loop())
         logger.info("✅ Aetherra Scheduler started")
 
@@ -101,6 +147,13 @@ class AetherraScheduler:
             except asyncio.CancelledError:
                 pass
 
+        # Interrupt runs still in progress, as stopping the loop used to
+        runs = list(self._running_runs)
+        for run in runs:
+            run.cancel()
+        if runs:
+            await asyncio.gather(*runs, return_exceptions=True)
+
         logger.info("✅ Aetherra Scheduler stopped")
 
     def schedule_task(
@@ -112,7 +165,8 @@ class AetherraScheduler:
         priority: TaskPriority = TaskPriority.NORMAL,
         delay: float = 0,
         interval: Optional[float] = None,
-        max_runs: Optional[int] = None
+        max_runs: Optional[int] = None,
+        misfire_policy: MisfirePolicy = MisfirePolicy.RUN_ONCE,
     ) -> str:
         """
         Schedule a task for execution.
@@ -126,14 +180,15 @@ class AetherraScheduler:
             delay: Delay before first execution (seconds)
             interval: Interval for recurring tasks (seconds)
             max_runs: Maximum number of executions (None for unlimited)
+            misfire_policy: Handling of runs that start more than
+                misfire_grace_time seconds late
 
         Returns:
             Task ID
         """
-        self._task_counter += 1
-        task_id = f"task_{self._task_counter}_{name.replace(' ', '_').lower()}"
-
-        next_run = datetime.now() + timedelta(seconds=delay)
+        with self._lock:
+            self._task_counter += 1
+            task_id = f"task_{self._task_counter}_{name.replace(' ', '_').lower()}"
 
         task = ScheduledTask(
             task_id=task_id,
@@ -143,22 +198,32 @@ class AetherraScheduler:
             kwargs=kwargs or {},
             priority=priority,
             interval=interval,
-            next_run=next_run,
-            max_runs=max_runs
+            next_run=datetime.now() + timedelta(seconds=delay),
+            max_runs=max_runs,
+            misfire_policy=misfire_policy,
         )
 
         self.tasks[task_id] = task
+        self._push_timer(task, time.monotonic() + delay)
         logger.info(f"📋 Scheduled task '{name}' (ID: {task_id})")
 
         return task_id
 
     def cancel_task(self, task_id: str) -> bool:
         """Cancel a scheduled task."""
-        if task_id in self.tasks:
-            self.tasks[task_id].status = TaskStatus.CANCELLED
-            logger.info(f"❌ Cancelled task {task_id}")
-            return True
-        return False
+        task = self.tasks.get(task_id)
+        if task is None:
+            return False
+
+        with self._lock:
+            task.status = TaskStatus.CANCELLED
+            self._entry_seq.pop(task_id, None)
+            was_next = bool(self._timers) and self._timers[0][3] == task_id
+        if was_next:
+            self._wake()  # Recompute how long to sleep
+
+        logger.info(f"❌ Cancelled task {task_id}")
+        return True
 
     def get_task_status(self, task_id: str) -> Optional[TaskStatus]:
         """Get the status of a task."""
@@ -178,20 +243,48 @@ class AetherraScheduler:
                 "last_run": task.last_run.isoformat() if task.last_run else None,
                 "run_count": task.run_count,
                 "max_runs": task.max_runs,
-                "interval": task.interval
+                "interval": task.interval,
+                "misfire_policy": task.misfire_policy.value,
+                "misfire_count": task.misfire_count,
             }
             task_list.append(task_info)
 
         return task_list
 
+    def _push_timer(self, task: ScheduledTask, deadline: float):
+        """Queue the task's next run and wake the loop if it is now the earliest."""
+        with self._lock:
+            self._seq += 1
+            self._entry_seq[task.task_id] = self._seq
+            heapq.heappush(
+                self._timers, (deadline, -task.priority.value, self._seq, task.task_id)
+            )
+            wake = deadline < self._sleep_until
+        task.next_run = datetime.now() + timedelta(seconds=deadline - time.monotonic())
+        if wake:
+            self._wake()
+
+    def _wake(self):
+        """Wake the scheduler loop (callable from any thread)."""
+        if self._loop is not None and self._wakeup is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:
+                pass  # Event loop already closed
+
     async def _scheduler_loop(self):
-        """Main scheduler loop."""
+        """Main scheduler loop: sleep until the next deadline, then dispatch."""
         logger.info("🔄 Scheduler loop started")
 
         while self.running:
             try:
-                await self._process_pending_tasks()
-                await asyncio.sleep(1)  # Check every second
+                self._wakeup.clear()
+                timeout = self._process_pending_tasks()
+                if timeout is None or timeout > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
 
             except asyncio.CancelledError:
                 break
@@ -199,29 +292,86 @@ class AetherraScheduler:
                 logger.error(f"❌ Error in scheduler loop: {e}")
                 await asyncio.sleep(5)  # Wait before retrying
 
-    async def _process_pending_tasks(self):
-        """Process tasks that are ready to run."""
-        now = datetime.now()
-        ready_tasks = []
-
-        # Find tasks ready to run
-        for task in self.tasks.values():
-            if (task.status == TaskStatus.PENDING and
-                task.next_run and
-                task.next_run <= now):
-                ready_tasks.append(task)
-
-        # Sort by priority
-        ready_tasks.sort(key=lambda t: t.priority.value, reverse=True)
-
-        # Execute ready tasks
-        for task in ready_tasks:
-            if not self.running:
-                break
-
-            await self._execute_task(task)
+    def _process_pending_tasks(self) -> Optional[float]:
+        """
+        Dispatch due runs while worker slots are free.
 
-    async def _execute_task(self, task: ScheduledTask):
+        Returns the number of seconds until the next deadline, 0 to go
+        again immediately, or None to sleep until woken.
+        """
+        now = time.monotonic()
+        with self._lock:
+            # Move every due run to the ready queue
+            while self._timers and self._timers[0][0] <= now:
+                deadline, priority, seq, task_id = heapq.heappop(self._timers)
+                if self._entry_seq.get(task_id) == seq:
+                    heapq.heappush(self._ready, (priority, deadline, seq, task_id))
+
+            # Drop stale entries so the head is the real next deadline
+            while self._timers and (
+                self._entry_seq.get(self._timers[0][3]) != self._timers[0][2]
+            ):
+                heapq.heappop(self._timers)
+
+            due = []
+            while self._ready and len(self._running_runs) + len(due) < (
+                self.max_concurrency
+            ):
+                _, deadline, seq, task_id = heapq.heappop(self._ready)
+                if self._entry_seq.get(task_id) == seq:
+                    del self._entry_seq[task_id]
+                    due.append((self.tasks[task_id], deadline))
+
+            if self._ready:
+                # Waiting for a slot; a finishing run wakes the loop
+                self._sleep_until = now
+                timeout = None
+            elif self._timers:
+                self._sleep_until = self._timers[0][0]
+                timeout = self._sleep_until - now
+            else:
+                self._sleep_until = math.inf
+                timeout = None
+
+        for task, deadline in due:
+            self._dispatch(task, deadline, now)
+        return timeout
+
+    def _dispatch(self, task: ScheduledTask, deadline: float, now: float):
+        """Start one run, or apply the task's misfire policy if it is late."""
+        lateness = now - deadline
+        if lateness > self.misfire_grace_time:
+            task.misfire_count += 1
+            self._misfires += 1
+            if task.misfire_policy == MisfirePolicy.SKIP:
+                logger.debug(f"⏭️ Skipping late run of task '{task.name}'")
+                if task.interval:
+                    self._push_timer(task, self._next_slot(deadline, task, now))
+                else:
+                    task.status = TaskStatus.CANCELLED
+                return
+
+        self._dispatched += 1
+        self._latencies.append(lateness)
+        task.status = TaskStatus.RUNNING
+        run = asyncio.create_task(self._execute_task(task, deadline))
+        self._running_runs.add(run)
+        run.add_done_callback(self._run_finished)
+
+    def _run_finished(self, run: asyncio.Task):
+        self._running_runs.discard(run)
+        self._wakeup.set()  # A worker slot is free
+
+    def _next_slot(self, deadline: float, task: ScheduledTask, now: float) -> float:
+        """Next fixed-rate deadline, skipping slots already missed by the grace time."""
+        next_deadline = deadline + task.interval
+        if task.misfire_policy != MisfirePolicy.RUN_ALL:
+            missed = now - self.misfire_grace_time - next_deadline
+            if missed > 0:
+                next_deadline += math.ceil(missed / task.interval) * task.interval
+        return next_deadline
+
+    async def _execute_task(self, task: ScheduledTask, deadline: float):
         """Execute a single task."""
         try:
             logger.debug(f"🏃 Executing task '{task.name}' (ID: {task.task_id})")
@@ -232,51 +382,83 @@ class AetherraScheduler:
             # Execute the task function
             kwargs_to_use = task.kwargs or {}
             if asyncio.iscoroutinefunction(task.func):
-                result = await task.func(*task.args, **kwargs_to_use)
+                await task.func(*task.args, **kwargs_to_use)
             else:
-                result = task.func(*task.args, **kwargs_to_use)
-
+                result = await asyncio.get_running_loop().run_in_executor(
+                    None, lambda: task.func(*task.args, **kwargs_to_use)
+                )
+                if inspect.isawaitable(result):
+                    await result  # e.g. a partial or callable object wrapping a coroutine
+
+            if task.status == TaskStatus.CANCELLED:
+                return
             task.status = TaskStatus.COMPLETED
             logger.debug(f"✅ Task '{task.name}' completed")
 
             # Schedule next run if recurring
             if task.interval and (not task.max_runs or task.run_count < task.max_runs):
-                task.next_run = datetime.now() + timedelta(seconds=task.interval)
                 task.status = TaskStatus.PENDING
-                logger.debug(f"🔄 Rescheduled recurring task '{task.name}' for {task.next_run}")
+                self._push_timer(
+                    task, self._next_slot(deadline, task, time.monotonic())
+                )
+                logger.debug(
+                    f"🔄 Rescheduled recurring task '{task.name}' for {task.next_run}"
+                )
 
         except Exception as e:
-            task.status = TaskStatus.FAILED
+            if task.status != TaskStatus.CANCELLED:
+                task.status = TaskStatus.FAILED
             logger.error(f"❌ Task '{task.name}' failed: {e}")
 
     def get_status(self) -> Dict[str, Any]:
         """Get scheduler status information."""
         task_counts = {}
         for status in TaskStatus:
-            task_counts[status.value] = sum(1 for t in self.tasks.values() if t.status == status)
+            task_counts[status.value] = sum(
+                1 for t in self.tasks.values() if t.status == status
+            )
 
         return {
             "running": self.running,
             "total_tasks": len(self.tasks),
             "task_counts": task_counts,
-            "next_task": self._get_next_task_info()
+            "next_task": self._get_next_task_info(),
+            "max_concurrency": self.max_concurrency,
+            "active_runs": len(self._running_runs),
+            "waiting_for_worker": len(self._ready),
+            "dispatched": self._dispatched,
+            "misfires": self._misfires,
+            "dispatch_latency_ms": self._latency_summary(),
+        }
+
+    def _latency_summary(self) -> Dict[str, float]:
+        """Lateness of recent runs relative to their deadlines."""
+        if not self._latencies:
+            return {}
+        ordered = sorted(self._latencies)
+        return {
+            "avg": sum(ordered) / len(ordered) * 1000,
+            "p50": ordered[len(ordered) // 2] * 1000,
+            "p99": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+            "max": ordered[-1] * 1000,
         }
 
     def _get_next_task_info(self) -> Optional[Dict[str, Any]]:
         """Get information about the next task to run."""
-        pending_tasks = [t for t in self.tasks.values()
-                        if t.status == TaskStatus.PENDING and t.next_run is not None]
-
-        if not pending_tasks:
-            return None
-
-        next_task = min(pending_tasks, key=lambda t: t.next_run)  # type: ignore
+        with self._lock:
+            while self._timers and (
+                self._entry_seq.get(self._timers[0][3]) != self._timers[0][2]
+            ):
+                heapq.heappop(self._timers)
+            if not self._timers:
+                return None
+            next_task = self.tasks[self._timers[0][3]]
 
         return {
             "id": next_task.task_id,
             "name": next_task.name,
             "next_run": next_task.next_run.isoformat(),
-            "priority": next_task.priority.name
+            "priority": next_task.priority.name,
         }
 
 
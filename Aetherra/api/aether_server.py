@@ -15,7 +15,7 @@ from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from .job_controller import job_controller
+from .job_controller import JobQueueFull, job_controller
 from .models import (
     CancelResponse,
     ErrorResponse,
@@ -25,6 +25,7 @@ from .models import (
     RunResponse,
     StatusResponse,
 )
+from .websocket.routes import router as job_events_router
 
 # Create FastAPI application
 app = FastAPI(
@@ -44,6 +45,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Push-based job status (WebSocket and Server-Sent Events)
+app.include_router(job_events_router)
+
 # Store server start time for uptime calculation
 server_start_time = time.time()
 
@@ -61,6 +65,8 @@ async def root():
             "job_status": "/status/{job_id}",
             "cancel_job": "/cancel/{job_id}",
             "list_jobs": "/jobs",
+            "job_events": "/events/jobs",
+            "job_events_ws": "/ws/jobs",
             "documentation": "/docs",
         },
     }
@@ -92,6 +98,8 @@ async def run_script(request: RunRequest):
     - **script_name**: Name of the .aether script to execute (e.g., "goal_autopilot.aether")
     - **parameters**: Optional parameters to pass to the script
     - **context**: Optional execution context
+
+    Returns 429 when the worker pool queue is full.
     """
     try:
         job_id = job_controller.run_script(
@@ -107,6 +115,10 @@ async def run_script(request: RunRequest):
 
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=f"Script not found: {str(e)}")
+    except JobQueueFull as e:
+        raise HTTPException(
+            status_code=429, detail=str(e), headers={"Retry-After": "1"}
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to start script execution: {str(e)}"
@@ -165,18 +177,23 @@ async def list_jobs(
     limit: Optional[int] = Query(
         50, description="Maximum number of jobs to return", le=1000
     ),
+    before: Optional[str] = Query(
+        None, description="Page cursor: return jobs created before this job ID"
+    ),
 ):
     """
-    List jobs with optional filtering
+    List jobs with optional filtering, newest first
 
     - **status**: Optional status filter
     - **limit**: Maximum number of jobs to return (default: 50, max: 1000)
+    - **before**: Page cursor (``next_cursor`` of the previous page)
     """
     try:
-        jobs_data = job_controller.list_jobs(status, limit)
+        jobs_data = job_controller.list_jobs(status, limit, before)
         jobs = [StatusResponse(**job) for job in jobs_data]
+        next_cursor = jobs[-1].job_id if limit and len(jobs) == limit else None
 
-        return JobListResponse(jobs=jobs, total=len(jobs))
+        return JobListResponse(jobs=jobs, total=len(jobs), next_cursor=next_cursor)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list jobs: {str(e)}")
@@ -263,7 +280,7 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on application shutdown"""
     print("🛑 Aetherra Script Execution API shutting down...")
-    # Perform any necessary cleanup here
+    job_controller.shutdown()
     print("✅ Shutdown complete")
 
 
@@ -5,46 +5,62 @@ Job Controller for Aetherra .aether Script Execution API
 
 Orchestrates the execution of .aether scripts, manages job lifecycle,
 and provides interfaces for monitoring and control.
+
+Jobs run on a bounded worker pool (threads or processes, see
+``AETHERRA_JOB_MODE`` and ``AETHERRA_JOB_WORKERS``). At most
+``AETHERRA_JOB_QUEUE`` jobs wait for a worker; beyond that run_script raises
+JobQueueFull, which the server turns into HTTP 429.
 """
 
+import os
 import threading
+import time
 import traceback
 import uuid
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from Aetherra.runtime.aether_runtime import AetherRuntime
+
+from .job_store import JobStatus, JobStore, job_store
+
+DEFAULT_SCRIPT_DIRS = ("Aetherra/system", "Aetherra/scripts/system")
+
+# Minimum seconds between progress updates a running job publishes
+PROGRESS_INTERVAL = 0.5
+
 
-from .job_store import JobStatus, job_store
+class JobQueueFull(Exception):
+    """Raised when a job is rejected because the worker pool queue is full"""
 
 
 class AetherScriptRunner:
     """
     Handles the actual execution of .aether scripts
 
-    This is a simplified implementation that can be enhanced to integrate
-    with the actual Aetherra runtime system.
+    Scripts are interpreted by the Aetherra runtime (AetherRuntime); job
+    parameters are available to the script as variables.
     """
 
-    def __init__(self):
-        self.script_base_path = Path("Aetherra/system")
+    def __init__(self, script_dirs: Optional[Iterable[str]] = None):
+        self.script_dirs = [Path(d) for d in (script_dirs or DEFAULT_SCRIPT_DIRS)]
 
     def find_script(self, script_name: str) -> Optional[Path]:
         """Find a .aether script by name"""
-        script_path = self.script_base_path / script_name
+        for base_path in self.script_dirs:
+            script_path = base_path / script_name
 
-        # If no extension provided, add .aether
-        if not script_path.suffix:
-            script_path = script_path.with_suffix(".aether")
+            # If no extension provided, add .aether
+            if not script_path.suffix:
+                script_path = script_path.with_suffix(".aether")
 
-        if script_path.exists():
-            return script_path
-
-        # Also check scripts directory
-        alt_path = Path("Aetherra/scripts/system") / script_name
-        if not alt_path.suffix:
-            alt_path = alt_path.with_suffix(".aether")
-        if alt_path.exists():
-            return alt_path
+            # Names may not escape the script directories
+            if base_path.resolve() not in script_path.resolve().parents:
+                continue
+            if script_path.is_file():
+                return script_path
 
         return None
 
@@ -53,46 +69,124 @@ class AetherScriptRunner:
         script_name: str,
         parameters: Optional[Dict[str, Any]] = None,
         context: Optional[Dict[str, Any]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
     ) -> Dict[str, Any]:
         """
         Execute a .aether script
 
-        This is a placeholder implementation that simulates script execution.
-        In the real implementation, this would integrate with the Aetherra
-        enhanced language interpreter.
+        ``should_stop`` is polled between script commands for cooperative
+        cancellation; a stopped run returns with ``"stopped": True``.
+        ``on_progress(started, total)`` is called before each command.
         """
         script_path = self.find_script(script_name)
         if not script_path:
             raise FileNotFoundError(f"Script '{script_name}' not found")
 
-        # Read script content
-        with open(script_path, "r", encoding="utf-8") as f:
-            script_content = f.read()
+        runtime = AetherRuntime()
+        runtime.load_script(str(script_path))
+        runtime.context.variables.update(parameters or {})
+
+        executed = 0
+        stopped = False
+
+        def check_stop() -> bool:
+            nonlocal executed, stopped
+            if should_stop is not None and should_stop():
+                stopped = True
+                return True
+            executed += 1
+            if on_progress is not None:
+                on_progress(executed, len(runtime.script_lines))
+            return False
+
+        started = time.perf_counter()
+        runtime.execute(should_stop=check_stop)
 
-        # Simulate script execution
-        # TODO: Integrate with enhanced Aetherra interpreter
-        result = {
+        return {
             "script_name": script_name,
             "script_path": str(script_path),
             "parameters": parameters or {},
             "context": context or {},
             "executed_at": datetime.now(timezone.utc).isoformat(),
-            "simulated": True,
-            "content_length": len(script_content),
-            "lines": len(script_content.split("\n")),
+            "execution_time": time.perf_counter() - started,
+            "lines": len(runtime.script_lines),
+            "lines_executed": executed,
+            "stopped": stopped,
+            "goals": list(runtime.context.goals),
+            "variables": dict(runtime.context.variables),
         }
 
-        # Add some simulated results based on script type
-        if "goal_autopilot" in script_name:
-            result.update({"processed": 5, "resumed": 2, "escalated": 1, "failed": 0})
-        elif "test_" in script_name:
-            result.update({"tests_run": 10, "passed": 9, "failed": 1, "success": True})
-        else:
-            result.update(
-                {"status": "completed", "message": "Script executed successfully"}
+
+def _run_job(
+    store: JobStore,
+    runner: AetherScriptRunner,
+    job_id: str,
+    cancel_event: Optional[threading.Event] = None,
+    poll_interval: float = 0.05,
+):
+    """Execute one job on a pool worker"""
+    # Claim the job; it may have been cancelled while it was queued
+    job = store.start_job(job_id)
+    if not job:
+        return
+
+    last_poll = time.monotonic()
+
+    def should_stop() -> bool:
+        # The local event is set by cancel_job in this process; the store is
+        # polled so cancellations from other API workers are seen too
+        nonlocal last_poll
+        if cancel_event is not None and cancel_event.is_set():
+            return True
+        now = time.monotonic()
+        if now - last_poll < poll_interval:
+            return False
+        last_poll = now
+        return store.get_status(job_id) == JobStatus.CANCELLED
+
+    last_progress = time.monotonic()
+
+    def report_progress(executed: int, total: int):
+        nonlocal last_progress
+        now = time.monotonic()
+        if now - last_progress >= PROGRESS_INTERVAL:
+            last_progress = now
+            store.update_job_progress(
+                job_id, {"lines_executed": executed, "lines": total}
             )
 
-        return result
+    try:
+        result = runner.execute_script(
+            job.script_name, job.parameters, job.context, should_stop, report_progress
+        )
+
+        # Update job with successful result (a no-op if it was cancelled)
+        store.update_job_status(job_id, JobStatus.COMPLETED, output=result)
+
+    except Exception as e:
+        # Update job with error
+        error_msg = f"{type(e).__name__}: {str(e)}"
+        store.update_job_status(job_id, JobStatus.FAILED, error=error_msg)
+
+        # Log full traceback for debugging
+        print(f"Job {job_id} failed with error: {error_msg}")
+        print(traceback.format_exc())
+
+
+# Per-process state for the process pool, set up by _init_job_process
+_process_store: Optional[JobStore] = None
+_process_runner: Optional[AetherScriptRunner] = None
+
+
+def _init_job_process(db_path: str, script_dirs: List[str]):
+    global _process_store, _process_runner
+    _process_store = JobStore(db_path)
+    _process_runner = AetherScriptRunner(script_dirs)
+
+
+def _run_job_in_process(job_id: str, poll_interval: float):
+    _run_job(_process_store, _process_runner, job_id, None, poll_interval)
 
 
 class JobController:
@@ -100,9 +194,53 @@ class JobController:
     Main controller for managing .aether script execution jobs
     """
 
-    def __init__(self):
-        self.script_runner = AetherScriptRunner()
-        self.running_jobs: Dict[str, threading.Thread] = {}
+    def __init__(
+        self,
+        store: Optional[JobStore] = None,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        mode: Optional[str] = None,
+        script_dirs: Optional[Iterable[str]] = None,
+        poll_interval: float = 0.05,
+    ):
+        self.store = store or job_store
+        self.script_runner = AetherScriptRunner(script_dirs)
+        self.max_workers = max_workers or int(os.environ.get("AETHERRA_JOB_WORKERS", 4))
+        self.max_queue = (
+            max_queue
+            if max_queue is not None
+            else int(os.environ.get("AETHERRA_JOB_QUEUE", 100))
+        )
+        self.mode = mode or os.environ.get("AETHERRA_JOB_MODE", "thread")
+        if self.mode not in ("thread", "process"):
+            raise ValueError(f"Unknown job execution mode: {self.mode}")
+        if self.mode == "process" and self.store.db_path == ":memory:":
+            raise ValueError("Process workers need a file-backed job store")
+        self.poll_interval = poll_interval
+
+        # Jobs admitted by this controller (queued or running)
+        self.running_jobs: Dict[str, Future] = {}
+        self._cancel_events: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _get_executor(self):
+        """Create the worker pool on first use"""
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_job_process,
+                    initargs=(
+                        self.store.db_path,
+                        [str(d) for d in self.script_runner.script_dirs],
+                    ),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="AetherJob"
+                )
+        return self._executor
 
     def run_script(
         self,
@@ -111,95 +249,99 @@ class JobController:
         context: Optional[Dict[str, Any]] = None,
     ) -> str:
         """
-        Start execution of a .aether script asynchronously
+        Queue execution of a .aether script on the worker pool
 
         Returns:
             job_id: Unique identifier for tracking the job
-        """
-        job_id = str(uuid.uuid4())
-
-        # Create job in store
-        job_store.create_job(job_id, script_name, parameters, context)
-
-        # Start execution in background thread
-        thread = threading.Thread(
-            target=self._execute_job,
-            args=(job_id,),
-            daemon=True,
-            name=f"AetherJob-{job_id[:8]}",
-        )
 
-        self.running_jobs[job_id] = thread
-        thread.start()
+        Raises:
+            FileNotFoundError: if the script does not exist
+            JobQueueFull: if max_workers + max_queue jobs are already in flight
+        """
+        if not self.script_runner.find_script(script_name):
+            raise FileNotFoundError(f"Script '{script_name}' not found")
 
+        job_id = str(uuid.uuid4())
+        with self._lock:
+            capacity = self.max_workers + self.max_queue
+            if len(self.running_jobs) >= capacity:
+                raise JobQueueFull(f"Job queue is full ({capacity} jobs in flight)")
+
+            # Create job in store
+            self.store.create_job(job_id, script_name, parameters, context)
+
+            if self.mode == "process":
+                future = self._get_executor().submit(
+                    _run_job_in_process, job_id, self.poll_interval
+                )
+            else:
+                cancel_event = threading.Event()
+                self._cancel_events[job_id] = cancel_event
+                future = self._get_executor().submit(
+                    _run_job,
+                    self.store,
+                    self.script_runner,
+                    job_id,
+                    cancel_event,
+                    self.poll_interval,
+                )
+            self.running_jobs[job_id] = future
+
+        future.add_done_callback(lambda f: self._job_done(job_id, f))
         return job_id
 
-    def _execute_job(self, job_id: str):
-        """Execute a job in background thread"""
-        job = job_store.get_job(job_id)
-        if not job:
-            return
-
-        try:
-            # Update job to running status
-            job_store.update_job_status(job_id, JobStatus.RUNNING)
-
-            # Execute the script
-            result = self.script_runner.execute_script(
-                job.script_name, job.parameters, job.context
+    def _job_done(self, job_id: str, future: Future):
+        """Release a job's pool slot once it finished or was cancelled"""
+        with self._lock:
+            self.running_jobs.pop(job_id, None)
+            self._cancel_events.pop(job_id, None)
+
+        if future.cancelled():
+            # Dropped from the queue, e.g. on shutdown
+            self.store.cancel_job(job_id)
+        elif future.exception() is not None:
+            # A worker that died (e.g. a broken process pool) never reported back
+            error = future.exception()
+            self.store.update_job_status(
+                job_id, JobStatus.FAILED, error=f"{type(error).__name__}: {error}"
             )
 
-            # Update job with successful result
-            job_store.update_job_status(job_id, JobStatus.COMPLETED, output=result)
-
-        except Exception as e:
-            # Update job with error
-            error_msg = f"{type(e).__name__}: {str(e)}"
-            job_store.update_job_status(job_id, JobStatus.FAILED, error=error_msg)
-
-            # Log full traceback for debugging
-            print(f"Job {job_id} failed with error: {error_msg}")
-            print(traceback.format_exc())
-
-        finally:
-            # Clean up running job reference
-            if job_id in self.running_jobs:
-                del self.running_jobs[job_id]
-
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a job"""
-        job = job_store.get_job(job_id)
+        job = self.store.get_job(job_id)
         if not job:
             return None
         return job.to_dict()
 
     def cancel_job(self, job_id: str) -> bool:
         """
-        Cancel a running job
+        Cancel a pending or running job
 
-        Note: This is a simplified implementation. For proper cancellation,
-        we would need to implement cooperative cancellation in the script runner.
+        The job is marked cancelled in the shared store. A queued job is
+        dropped from the pool; a running one stops before its next script
+        command, whichever API worker is running it.
         """
-        job = job_store.get_job(job_id)
-        if not job:
+        # Mark job as cancelled in store (fails if missing or finished)
+        if not self.store.cancel_job(job_id):
             return False
 
-        # If job is already finished, cannot cancel
-        if job.status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
-            return False
-
-        # Mark job as cancelled in store
-        success = job_store.cancel_job(job_id)
-
-        # TODO: Implement actual thread interruption for running jobs
-        # For now, we just mark it as cancelled in the store
+        with self._lock:
+            future = self.running_jobs.get(job_id)
+            cancel_event = self._cancel_events.get(job_id)
+        if future is not None:
+            future.cancel()  # Only succeeds while the job is still queued
+        if cancel_event is not None:
+            cancel_event.set()
 
-        return success
+        return True
 
     def list_jobs(
-        self, status_filter: Optional[str] = None, limit: Optional[int] = None
+        self,
+        status_filter: Optional[str] = None,
+        limit: Optional[int] = None,
+        before: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """List jobs with optional filtering"""
+        """List jobs with optional filtering, paging with a job ID cursor"""
         status_enum = None
         if status_filter:
             try:
@@ -207,15 +349,22 @@ class JobController:
             except ValueError:
                 pass  # Invalid status filter, ignore
 
-        jobs = job_store.list_jobs(status_enum, limit)
+        jobs = self.store.list_jobs(status_enum, limit, before)
         return [job.to_dict() for job in jobs]
 
     def get_system_stats(self) -> Dict[str, Any]:
         """Get system statistics"""
-        stats = job_store.get_stats()
+        stats = self.store.get_stats()
+        with self._lock:
+            in_flight = len(self.running_jobs)
         stats.update(
             {
-                "running_threads": len(self.running_jobs),
+                "worker_pool": {
+                    "mode": self.mode,
+                    "max_workers": self.max_workers,
+                    "max_queue": self.max_queue,
+                    "in_flight": in_flight,
+                },
                 "available_scripts": self._get_available_scripts(),
             }
         )
@@ -225,23 +374,23 @@ class JobController:
         """Get list of available .aether scripts"""
         scripts = []
 
-        # Check system directory
-        system_path = Path("Aetherra/system")
-        if system_path.exists():
-            for script_file in system_path.glob("*.aether"):
-                scripts.append(script_file.name)
-
-        # Check scripts/system directory
-        scripts_path = Path("Aetherra/scripts/system")
-        if scripts_path.exists():
-            for script_file in scripts_path.glob("*.aether"):
-                scripts.append(script_file.name)
+        for script_dir in self.script_runner.script_dirs:
+            if script_dir.exists():
+                for script_file in script_dir.glob("*.aether"):
+                    scripts.append(script_file.name)
 
         return sorted(list(set(scripts)))  # Remove duplicates and sort
 
     def cleanup_old_jobs(self) -> int:
         """Clean up old completed jobs"""
-        return job_store.cleanup_old_jobs()
+        return self.store.cleanup_old_jobs()
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker pool, dropping jobs that have not started"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
 
 
 # Global job controller instance
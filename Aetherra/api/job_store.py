@@ -3,15 +3,24 @@
 Job Store for Aetherra .aether Script Execution API
 ===================================================
 
-In-memory storage for tracking job states, results, and metadata.
-In production, this could be replaced with a database or Redis.
+SQLite-backed storage for tracking job states, results, and metadata.
+Every API worker process opens the same database file (``AETHERRA_JOB_DB``),
+so a job created by one uvicorn worker can be queried or cancelled through
+any other. Every state transition and progress update is also appended to a
+``job_events`` log that subscribers tail by sequence number.
 """
 
+import json
+import os
+import sqlite3
 import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from enum import Enum
-from threading import Lock
-from typing import Any, Dict, List, Optional
+from threading import RLock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_DB_PATH = os.environ.get("AETHERRA_JOB_DB", "aetherra_jobs.db")
 
 
 class JobStatus(Enum):
@@ -24,6 +33,10 @@ class JobStatus(Enum):
     CANCELLED = "cancelled"
 
 
+FINISHED_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+_FINISHED_VALUES = tuple(status.value for status in FINISHED_STATUSES)
+
+
 class Job:
     """Job data model"""
 
@@ -62,18 +75,225 @@ class Job:
             "context": self.context,
         }
 
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "Job":
+        """Rebuild a job from its database row"""
+        job = cls(
+            row["job_id"],
+            row["script_name"],
+            _loads(row["parameters"]),
+            _loads(row["context"]),
+        )
+        job.status = JobStatus(row["status"])
+        job.output = _loads(row["output"])
+        job.error = row["error"]
+        job.progress = _loads(row["progress"])
+        job.created_at = _from_timestamp(row["created_at"])
+        job.started_at = _from_timestamp(row["started_at"])
+        job.completed_at = _from_timestamp(row["completed_at"])
+        return job
+
+
+def _dumps(value: Any) -> Optional[str]:
+    return None if value is None else json.dumps(value, default=str)
+
+
+def _loads(value: Optional[str]) -> Any:
+    return None if value is None else json.loads(value)
+
+
+def _event_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "seq": row["seq"],
+        "job_id": row["job_id"],
+        "type": row["type"],
+        "status": row["status"],
+        "progress": _loads(row["progress"]),
+        "timestamp": row["created_at"],
+    }
+
+
+def _from_timestamp(value: Optional[float]) -> Optional[datetime]:
+    return None if value is None else datetime.fromtimestamp(value, timezone.utc)
+
 
 class JobStore:
     """
-    In-memory job storage with thread safety
+    SQLite job storage with thread safety
 
     Provides methods to create, update, query, and manage job lifecycle.
+    Status changes are single conditional UPDATEs, so a job cancelled by one
+    process is never marked running or completed by another.
+
+    Listing and paging walk the (status, created_at) and created_at indexes,
+    and per-status counts are kept up to date by triggers, so neither
+    depends on the total number of jobs.
     """
 
-    def __init__(self):
-        self.jobs: Dict[str, Job] = {}
-        self.lock = Lock()
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self.lock = RLock()
         self.start_time = time.time()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._listeners: List[Callable[[int], None]] = []
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connection for the current process (opened on first use and after a fork)"""
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(
+                self.db_path, timeout=30.0, check_same_thread=False
+            )
+            self._conn.row_factory = sqlite3.Row
+            self._pid = os.getpid()
+            if self.db_path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    script_name TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    parameters TEXT,
+                    context TEXT,
+                    output TEXT,
+                    error TEXT,
+                    progress TEXT,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    completed_at REAL
+                );
+                CREATE INDEX IF NOT EXISTS idx_jobs_status_created
+                    ON jobs (status, created_at, job_id);
+                CREATE INDEX IF NOT EXISTS idx_jobs_created
+                    ON jobs (created_at, job_id);
+
+                CREATE TABLE IF NOT EXISTS job_events (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    progress TEXT,
+                    created_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_job_events_job
+                    ON job_events (job_id, seq);
+
+                CREATE TABLE IF NOT EXISTS job_counts (
+                    status TEXT PRIMARY KEY,
+                    count INTEGER NOT NULL
+                );
+                INSERT INTO job_counts (status, count)
+                    SELECT status, COUNT(*) FROM jobs
+                    WHERE NOT EXISTS (SELECT 1 FROM job_counts)
+                    GROUP BY status;
+                CREATE TRIGGER IF NOT EXISTS jobs_count_insert AFTER INSERT ON jobs
+                BEGIN
+                    INSERT INTO job_counts (status, count) VALUES (NEW.status, 1)
+                        ON CONFLICT (status) DO UPDATE SET count = count + 1;
+                END;
+                CREATE TRIGGER IF NOT EXISTS jobs_count_delete AFTER DELETE ON jobs
+                BEGIN
+                    UPDATE job_counts SET count = count - 1
+                        WHERE status = OLD.status;
+                END;
+                CREATE TRIGGER IF NOT EXISTS jobs_count_update
+                    AFTER UPDATE OF status ON jobs
+                    WHEN OLD.status != NEW.status
+                BEGIN
+                    UPDATE job_counts SET count = count - 1
+                        WHERE status = OLD.status;
+                    INSERT INTO job_counts (status, count) VALUES (NEW.status, 1)
+                        ON CONFLICT (status) DO UPDATE SET count = count + 1;
+                END;
+                """)
+        return self._conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                yield conn
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        with self._transaction() as conn:
+            return conn.execute(sql, params)
+
+    def _update_with_event(
+        self,
+        sql: str,
+        params: tuple,
+        job_id: str,
+        event_type: str,
+        progress: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Run an UPDATE and, if it changed the job, log an event atomically"""
+        with self._transaction() as conn:
+            if not conn.execute(sql, params).rowcount:
+                return False
+            seq = conn.execute(
+                "INSERT INTO job_events (job_id, type, status, progress, created_at) "
+                "SELECT job_id, ?, status, ?, ? FROM jobs WHERE job_id = ?",
+                (event_type, _dumps(progress), time.time(), job_id),
+            ).lastrowid
+        self._notify(seq)
+        return True
+
+    def close(self):
+        """Close this process's database connection"""
+        with self.lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    # Event subscriptions
+    def add_listener(self, listener: Callable[[int], None]):
+        """
+        Call ``listener(seq)`` after each event this process logs
+
+        Listeners run on the writing thread and must not block. Events
+        written by other processes are only visible through events_since().
+        """
+        with self.lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[int], None]):
+        """Stop calling a listener registered with add_listener"""
+        with self.lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _notify(self, seq: int):
+        with self.lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(seq)
+            except Exception as e:
+                print(f"Job event listener failed: {e}")
+
+    def events_since(
+        self, seq: int = 0, job_id: Optional[str] = None, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Events logged after sequence number ``seq``, oldest first"""
+        if job_id is None:
+            rows = self._execute(
+                "SELECT * FROM job_events WHERE seq > ? ORDER BY seq LIMIT ?",
+                (seq, limit),
+            ).fetchall()
+        else:
+            rows = self._execute(
+                "SELECT * FROM job_events WHERE job_id = ? AND seq > ? "
+                "ORDER BY seq LIMIT ?",
+                (job_id, seq, limit),
+            ).fetchall()
+        return [_event_from_row(row) for row in rows]
+
+    def last_event_seq(self) -> int:
+        """Sequence number of the newest event (0 if there are none)"""
+        row = self._execute("SELECT MAX(seq) FROM job_events").fetchone()
+        return row[0] or 0
 
     def create_job(
         self,
@@ -83,15 +303,50 @@ class JobStore:
         context: Optional[Dict[str, Any]] = None,
     ) -> Job:
         """Create a new job"""
-        with self.lock:
-            job = Job(job_id, script_name, parameters, context)
-            self.jobs[job_id] = job
-            return job
+        job = Job(job_id, script_name, parameters, context)
+        self._update_with_event(
+            "INSERT INTO jobs (job_id, script_name, status, parameters, context, "
+            "created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                job_id,
+                script_name,
+                job.status.value,
+                _dumps(job.parameters),
+                _dumps(job.context),
+                job.created_at.timestamp(),
+            ),
+            job_id,
+            "status",
+        )
+        return job
 
     def get_job(self, job_id: str) -> Optional[Job]:
         """Get job by ID"""
-        with self.lock:
-            return self.jobs.get(job_id)
+        row = self._execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return Job.from_row(row) if row else None
+
+    def get_status(self, job_id: str) -> Optional[JobStatus]:
+        """Get just the status of a job (cheap enough to poll)"""
+        row = self._execute(
+            "SELECT status FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return JobStatus(row["status"]) if row else None
+
+    def start_job(self, job_id: str) -> Optional[Job]:
+        """
+        Move a pending job to running and return it
+
+        Returns None if the job is gone or no longer pending (for example
+        cancelled while it was queued), in which case it must not run.
+        """
+        started = self._update_with_event(
+            "UPDATE jobs SET status = ?, started_at = ? "
+            "WHERE job_id = ? AND status = ?",
+            (JobStatus.RUNNING.value, time.time(), job_id, JobStatus.PENDING.value),
+            job_id,
+            "status",
+        )
+        return self.get_job(job_id) if started else None
 
     def update_job_status(
         self,
@@ -100,139 +355,142 @@ class JobStore:
         output: Optional[Dict[str, Any]] = None,
         error: Optional[str] = None,
     ) -> bool:
-        """Update job status and related fields"""
-        with self.lock:
-            job = self.jobs.get(job_id)
-            if not job:
-                return False
-
-            job.status = status
-
-            if status == JobStatus.RUNNING and not job.started_at:
-                job.started_at = datetime.now(timezone.utc)
-            elif status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
-                job.completed_at = datetime.now(timezone.utc)
-
-            if output is not None:
-                job.output = output
-            if error is not None:
-                job.error = error
+        """
+        Update job status and related fields
 
-            return True
+        Finished jobs are final: returns False without changing anything if
+        the job is missing or already completed, failed or cancelled.
+        """
+        now = time.time()
+        started_at = now if status == JobStatus.RUNNING else None
+        completed_at = now if status in FINISHED_STATUSES else None
+        placeholders = ", ".join("?" for _ in _FINISHED_VALUES)
+        return self._update_with_event(
+            "UPDATE jobs SET status = ?, "
+            "started_at = COALESCE(started_at, ?), "
+            "completed_at = COALESCE(?, completed_at), "
+            "output = COALESCE(?, output), "
+            "error = COALESCE(?, error) "
+            f"WHERE job_id = ? AND status NOT IN ({placeholders})",
+            (
+                status.value,
+                started_at,
+                completed_at,
+                _dumps(output),
+                error,
+                job_id,
+                *_FINISHED_VALUES,
+            ),
+            job_id,
+            "status",
+        )
 
     def update_job_progress(self, job_id: str, progress: Dict[str, Any]) -> bool:
         """Update job progress information"""
-        with self.lock:
-            job = self.jobs.get(job_id)
-            if not job:
-                return False
-            job.progress = progress
-            return True
+        return self._update_with_event(
+            "UPDATE jobs SET progress = ? WHERE job_id = ?",
+            (_dumps(progress), job_id),
+            job_id,
+            "progress",
+            progress,
+        )
 
     def cancel_job(self, job_id: str) -> bool:
-        """Cancel a job"""
-        with self.lock:
-            job = self.jobs.get(job_id)
-            if not job:
-                return False
-
-            if job.status in [
-                JobStatus.COMPLETED,
-                JobStatus.FAILED,
-                JobStatus.CANCELLED,
-            ]:
-                return False  # Cannot cancel already finished jobs
-
-            job.status = JobStatus.CANCELLED
-            job.completed_at = datetime.now(timezone.utc)
-            return True
+        """Cancel a job (False if it does not exist or already finished)"""
+        return self.update_job_status(job_id, JobStatus.CANCELLED)
 
     def list_jobs(
-        self, status_filter: Optional[JobStatus] = None, limit: Optional[int] = None
+        self,
+        status_filter: Optional[JobStatus] = None,
+        limit: Optional[int] = None,
+        before: Optional[str] = None,
     ) -> List[Job]:
-        """List jobs with optional filtering"""
-        with self.lock:
-            jobs = list(self.jobs.values())
-
-            if status_filter:
-                jobs = [job for job in jobs if job.status == status_filter]
-
-            # Sort by creation time (newest first)
-            jobs.sort(key=lambda x: x.created_at, reverse=True)
-
-            if limit:
-                jobs = jobs[:limit]
+        """
+        List jobs with optional filtering, newest first
 
-            return jobs
+        ``before`` is a job ID cursor: only jobs created before that job are
+        returned, so the last job ID of one page fetches the next.
+        """
+        conditions: List[str] = []
+        params: Tuple = ()
+        if status_filter:
+            conditions.append("status = ?")
+            params += (status_filter.value,)
+        if before:
+            cursor_row = self._execute(
+                "SELECT created_at FROM jobs WHERE job_id = ?", (before,)
+            ).fetchone()
+            if cursor_row is None:
+                return []
+            conditions.append("created_at <= ? AND (created_at < ? OR job_id < ?)")
+            params += (cursor_row[0], cursor_row[0], before)
+
+        sql = "SELECT * FROM jobs"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY created_at DESC, job_id DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params += (limit,)
+        return [Job.from_row(row) for row in self._execute(sql, params).fetchall()]
+
+    def _status_counts(self) -> Dict[str, int]:
+        counts = dict(self._execute("SELECT status, count FROM job_counts").fetchall())
+        return {status.value: counts.get(status.value, 0) for status in JobStatus}
 
     def get_active_jobs_count(self) -> int:
         """Get count of active (pending or running) jobs"""
-        with self.lock:
-            return sum(
-                1
-                for job in self.jobs.values()
-                if job.status in [JobStatus.PENDING, JobStatus.RUNNING]
-            )
+        counts = self._status_counts()
+        return counts["pending"] + counts["running"]
 
     def get_stats(self) -> Dict[str, Any]:
         """Get job store statistics"""
-        with self.lock:
-            stats = {
-                "total_jobs": len(self.jobs),
-                "active_jobs": self.get_active_jobs_count(),
-                "uptime_seconds": time.time() - self.start_time,
-                "status_breakdown": {},
-            }
-
-            # Count jobs by status
-            for status in JobStatus:
-                count = sum(1 for job in self.jobs.values() if job.status == status)
-                stats["status_breakdown"][status.value] = count
-
-            return stats
+        breakdown = self._status_counts()
+        return {
+            "total_jobs": sum(breakdown.values()),
+            "active_jobs": breakdown["pending"] + breakdown["running"],
+            "uptime_seconds": time.time() - self.start_time,
+            "status_breakdown": breakdown,
+        }
 
-    def cleanup_old_jobs(self, max_age_hours: int = 24, max_jobs: int = 1000) -> int:
+    def cleanup_old_jobs(
+        self, max_age_hours: int = 24, max_jobs: int = 1000, max_events: int = 10000
+    ) -> int:
         """
-        Clean up old completed/failed jobs to prevent memory bloat
+        Clean up old completed/failed jobs to prevent database bloat, and
+        trim the event log to its newest ``max_events`` entries
         Returns number of jobs cleaned up
         """
+        placeholders = ", ".join("?" for _ in _FINISHED_VALUES)
         with self.lock:
-            if len(self.jobs) <= max_jobs:
-                return 0
-
-            cutoff_time = datetime.now(timezone.utc).timestamp() - (
-                max_age_hours * 3600
+            self._execute(
+                "DELETE FROM job_events WHERE seq <= "
+                "(SELECT MAX(seq) FROM job_events) - ?",
+                (max_events,),
             )
 
-            jobs_to_remove = []
-            for job_id, job in self.jobs.items():
-                if (
-                    job.status
-                    in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]
-                    and job.created_at.timestamp() < cutoff_time
-                ):
-                    jobs_to_remove.append(job_id)
-
-            # Remove oldest jobs first if we're still over the limit
-            if len(self.jobs) - len(jobs_to_remove) > max_jobs:
-                finished_jobs = [
-                    (job_id, job.created_at)
-                    for job_id, job in self.jobs.items()
-                    if job.status
-                    in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]
-                    and job_id not in jobs_to_remove
-                ]
-                finished_jobs.sort(key=lambda x: x[1])  # Sort by creation time
-
-                additional_to_remove = len(self.jobs) - len(jobs_to_remove) - max_jobs
-                for job_id, _ in finished_jobs[:additional_to_remove]:
-                    jobs_to_remove.append(job_id)
-
-            # Remove the jobs
-            for job_id in jobs_to_remove:
-                del self.jobs[job_id]
-
-            return len(jobs_to_remove)
+            total = sum(self._status_counts().values())
+            if total <= max_jobs:
+                return 0
+
+            cutoff_time = time.time() - max_age_hours * 3600
+            removed = self._execute(
+                f"DELETE FROM jobs WHERE status IN ({placeholders}) "
+                "AND created_at < ?",
+                (*_FINISHED_VALUES, cutoff_time),
+            ).rowcount
+
+            # Remove oldest finished jobs first if we're still over the limit
+            excess = total - removed - max_jobs
+            if excess > 0:
+                removed += self._execute(
+                    "DELETE FROM jobs WHERE job_id IN (SELECT job_id FROM jobs "
+                    f"WHERE status IN ({placeholders}) "
+                    "ORDER BY created_at LIMIT ?)",
+                    (*_FINISHED_VALUES, excess),
+                ).rowcount
+
+            return removed
 
 
 # Global job store instance
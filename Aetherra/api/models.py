@@ -108,6 +108,9 @@ class JobListResponse(BaseModel):
 
     jobs: list[StatusResponse] = Field(..., description="List of job statuses")
     total: int = Field(..., description="Total number of jobs")
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as 'before' to fetch the next page"
+    )
 
     class Config:
         json_schema_extra = {
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Job Event Streaming for Aetherra .aether Script Execution API
+=============================================================
+
+Pushes job state transitions and progress updates to subscribers (the
+WebSocket and Server-Sent Events endpoints) by tailing the job store's
+event log, so clients no longer need to poll ``/status/{job_id}``.
+"""
+
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from ..job_store import FINISHED_STATUSES, JobStore, job_store
+
+_FINISHED_VALUES = {status.value for status in FINISHED_STATUSES}
+
+
+class _Subscriber:
+    """One subscription's queue, filled from the broker's tail thread"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, job_id: Optional[str]):
+        self.loop = loop
+        self.job_id = job_id
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+
+    def deliver(self, event: Dict[str, Any]):
+        if self.job_id is not None and event["job_id"] != self.job_id:
+            return
+        try:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, event)
+        except RuntimeError:
+            pass  # Subscriber's loop already closed
+
+
+class JobEventBroker:
+    """
+    Fans job events out to asyncio subscribers
+
+    A single tail thread per broker reads the store's event log and hands
+    each event to the subscribers' queues, so the number of subscribers
+    does not multiply the queries and none of them run on an event loop.
+    Events logged by this process wake the tail immediately through a store
+    listener; the log is also re-read every ``poll_interval`` seconds to
+    pick up events written by other API worker processes. The thread exits
+    when the last subscriber leaves.
+    """
+
+    def __init__(
+        self,
+        store: Optional[JobStore] = None,
+        poll_interval: float = 0.5,
+        batch_size: int = 100,
+    ):
+        self.store = store or job_store
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self._subscribers: Set[_Subscriber] = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._tail: Optional[threading.Thread] = None
+        self._tail_seq = 0
+        self._listening = False
+
+    def _on_event(self, seq: int):
+        """Store listener: runs on the writing thread"""
+        self._wakeup.set()
+
+    def _tail_loop(self):
+        """Read new events and deliver them until nobody is subscribed"""
+        while True:
+            self._wakeup.clear()
+            try:
+                events = self.store.events_since(self._tail_seq, None, self.batch_size)
+            except Exception as e:
+                print(f"Reading job events failed: {e}")
+                events = []
+            with self._lock:
+                if not self._subscribers:
+                    self._tail = None
+                    return
+                # Taken after the read: anyone subscribing later replays
+                # these events from the log
+                subscribers = list(self._subscribers)
+            for event in events:
+                self._tail_seq = event["seq"]
+                for subscriber in subscribers:
+                    subscriber.deliver(event)
+            if len(events) < self.batch_size:  # Otherwise catching up on a backlog
+                self._wakeup.wait(self.poll_interval)
+
+    def _add_subscriber(self, subscriber: _Subscriber, latest_seq: int):
+        with self._lock:
+            self._subscribers.add(subscriber)
+            if not self._listening:
+                self.store.add_listener(self._on_event)
+                self._listening = True
+            if self._tail is None:
+                self._tail_seq = latest_seq
+                self._tail = threading.Thread(
+                    target=self._tail_loop, name="job-event-tail", daemon=True
+                )
+                self._tail.start()
+
+    def _remove_subscriber(self, subscriber: _Subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+            if not self._subscribers:
+                self._wakeup.set()  # Let the tail thread exit now
+
+    async def subscribe(
+        self, job_id: Optional[str] = None, after: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield job events as they happen, oldest first
+
+        ``after`` is the sequence number of the last event the client has
+        seen (e.g. SSE's Last-Event-ID); the events logged since are
+        replayed first. By default only new events are sent. A subscription
+        to one job starts with a ``snapshot`` of its current state (unless
+        resuming) and ends once the job has finished, straight away if it
+        had finished before the subscription started.
+        """
+        latest = await asyncio.to_thread(self.store.last_event_seq)
+        seq = latest if after is None else after
+        subscriber = _Subscriber(asyncio.get_running_loop(), job_id)
+        # Registered before replaying, so nothing falls between the replay
+        # and the events delivered by the tail
+        self._add_subscriber(subscriber, latest)
+
+        try:
+            finished = False
+            if job_id is not None:
+                # Read before replaying: if the job has finished, the replay
+                # includes its final event or the client has already seen it
+                job = await asyncio.to_thread(self.store.get_job, job_id)
+                if job is None:
+                    return
+                finished = job.status in FINISHED_STATUSES
+                if after is None:
+                    yield {
+                        "seq": seq,
+                        "job_id": job_id,
+                        "type": "snapshot",
+                        "status": job.status.value,
+                        "progress": job.progress,
+                    }
+                    if finished:
+                        return
+
+            while True:
+                events = await asyncio.to_thread(
+                    self.store.events_since, seq, job_id, self.batch_size
+                )
+                for event in events:
+                    seq = event["seq"]
+                    yield event
+                    if job_id is not None and event["status"] in _FINISHED_VALUES:
+                        return
+                if len(events) < self.batch_size:
+                    break
+            if finished:
+                return
+
+            while True:
+                event = await subscriber.queue.get()
+                if event["seq"] <= seq:
+                    continue  # Already replayed
+                seq = event["seq"]
+                yield event
+                if job_id is not None and event["status"] in _FINISHED_VALUES:
+                    return
+        finally:
+            self._remove_subscriber(subscriber)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Subscriber count and newest event sequence number"""
+        with self._lock:
+            subscribers = len(self._subscribers)
+        return {
+            "subscribers": subscribers,
+            "last_event_seq": self.store.last_event_seq(),
+        }
+
+
+# Global job event broker instance
+job_event_broker = JobEventBroker()
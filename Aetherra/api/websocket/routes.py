@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Job Event Endpoints for Aetherra .aether Script Execution API
+=============================================================
+
+WebSocket (``/ws/jobs``) and Server-Sent Events (``/events/jobs``) feeds of
+job state transitions and progress updates. Both accept an optional
+``job_id`` to follow a single job.
+"""
+
+import asyncio
+import json
+from typing import Optional
+
+from fastapi import (
+    APIRouter,
+    Header,
+    HTTPException,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import StreamingResponse
+
+from .job_events import job_event_broker
+
+router = APIRouter()
+
+
+async def _job_exists(job_id: Optional[str]) -> bool:
+    if job_id is None:
+        return True
+    status = await asyncio.to_thread(job_event_broker.store.get_status, job_id)
+    return status is not None
+
+
+@router.websocket("/ws/jobs")
+async def job_events_websocket(
+    websocket: WebSocket,
+    job_id: Optional[str] = None,
+    after: Optional[int] = None,
+):
+    """
+    Push job events as JSON messages
+
+    - **job_id**: Optional job to follow; the feed starts with a snapshot
+      and closes when the job finishes
+    - **after**: Resume after this event sequence number
+    """
+    await websocket.accept()
+    if not await _job_exists(job_id):
+        await websocket.close(code=4404, reason=f"Job not found: {job_id}")
+        return
+
+    try:
+        async for event in job_event_broker.subscribe(job_id, after):
+            await websocket.send_json(event)
+    except WebSocketDisconnect:
+        return
+    await websocket.close()
+
+
+@router.get("/events/jobs")
+async def job_events_stream(
+    job_id: Optional[str] = Query(None, description="Follow a single job"),
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    Stream job events as Server-Sent Events
+
+    - **job_id**: Optional job to follow; the stream starts with a snapshot
+      and ends when the job finishes
+
+    Reconnecting clients resume from their ``Last-Event-ID``.
+    """
+    if not await _job_exists(job_id):
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    after = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+
+    async def stream():
+        async for event in job_event_broker.subscribe(job_id, after):
+            yield (
+                f"id: {event['seq']}\n"
+                f"event: {event['type']}\n"
+                f"data: {json.dumps(event)}\n\n"
+            )
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
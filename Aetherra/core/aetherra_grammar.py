@@ -8,12 +8,23 @@ This transforms AetherraCode from a framework into a true programming language
 with proper syntax, grammar rules, and AST generation.
 """
 
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
-from lark import Lark, Transformer
+import lark
+from lark import Lark, Token, Transformer, Tree
 from lark.exceptions import LarkError
 
+logger = logging.getLogger(__name__)
+
 # AetherraCode Formal Grammar Definition - Corrected Structure
 aetherra_GRAMMAR = r"""
     ?start: program
@@ -160,6 +171,15 @@ aetherra_GRAMMAR = r"""
     %ignore WS
 """
 
+# Bump when AetherraCodeTransformer produces differently shaped ASTs
+AST_FORMAT_VERSION = 1
+
+# Cached ASTs are only valid for the grammar, transformer and Lark release
+# that produced them
+GRAMMAR_VERSION = hashlib.sha256(
+    f"{aetherra_GRAMMAR}|{AST_FORMAT_VERSION}|{lark.__version__}".encode("utf-8")
+).hexdigest()[:16]
+
 
 @dataclass
 class AetherraCodeAST:
@@ -574,16 +594,285 @@ class AetherraCodeTransformer(Transformer):
         return AetherraCodeAST(type="value", value=self._extract_value(value))
 
 
+# Lark's serialized grammar tables. Lark unpickles this file, so it lives in
+# the user's own Aetherra directory rather than the shared temp directory.
+LARK_CACHE_PATH = Path.home() / ".aetherra" / "cache" / "aether_grammar.lark"
+
+_shared_parser: Optional[Lark] = None
+_shared_parser_lock = threading.Lock()
+
+
+def get_shared_parser() -> Lark:
+    """
+    The process-wide LALR parser
+
+    Built once per process. Lark keeps the analysed grammar tables in
+    LARK_CACHE_PATH, checked against a hash of grammar, options and Lark
+    version, so later processes load them instead of rebuilding.
+    """
+    global _shared_parser
+    with _shared_parser_lock:
+        if _shared_parser is None:
+            cache: Union[bool, str] = False
+            try:
+                LARK_CACHE_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+                cache = str(LARK_CACHE_PATH)
+            except OSError as e:
+                logger.debug(f"Not caching grammar tables: {e}")
+            _shared_parser = Lark(
+                aetherra_GRAMMAR,
+                parser="lalr",
+                transformer=AetherraCodeTransformer(),
+                start="program",
+                cache=cache,
+            )
+        return _shared_parser
+
+
+def _encode_ast(value: Any) -> Any:
+    """Reduce an AST to JSON data; raises TypeError for unknown values"""
+    if value is None or type(value) in (str, int, float, bool):
+        return value
+    if isinstance(value, AetherraCodeAST):
+        return {
+            "__ast__": [
+                value.type,
+                _encode_ast(value.value),
+                [_encode_ast(child) for child in value.children],
+                _encode_ast(value.metadata),
+            ]
+        }
+    if isinstance(value, Token):
+        return {
+            "__token__": [
+                value.type,
+                str(value),
+                value.start_pos,
+                value.line,
+                value.column,
+                value.end_line,
+                value.end_column,
+                value.end_pos,
+            ]
+        }
+    if isinstance(value, Tree):
+        return {
+            "__tree__": [
+                _encode_ast(value.data),
+                [_encode_ast(child) for child in value.children],
+            ]
+        }
+    if isinstance(value, list):
+        return [_encode_ast(item) for item in value]
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode_ast(item) for item in value]}
+    if isinstance(value, dict):
+        pairs = [[_encode_ast(k), _encode_ast(v)] for k, v in value.items()]
+        return {"__dict__": pairs}
+    raise TypeError(f"Cannot store {type(value).__name__} in the AST cache")
+
+
+def _decode_ast(data: Any) -> Any:
+    """Rebuild what _encode_ast produced"""
+    if isinstance(data, list):
+        return [_decode_ast(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    [(tag, body)] = data.items()  # One tag per encoded object
+    if tag == "__ast__":
+        node_type, value, children, metadata = body
+        return AetherraCodeAST(
+            type=node_type,
+            value=_decode_ast(value),
+            children=[_decode_ast(child) for child in children],
+            metadata=_decode_ast(metadata),
+        )
+    if tag == "__token__":
+        return Token(*body)
+    if tag == "__tree__":
+        return Tree(_decode_ast(body[0]), [_decode_ast(child) for child in body[1]])
+    if tag == "__tuple__":
+        return tuple(_decode_ast(item) for item in body)
+    if tag == "__dict__":
+        return {_decode_ast(k): _decode_ast(v) for k, v in body}
+    raise ValueError(f"Unknown AST cache tag {tag!r}")
+
+
+class ASTCache:
+    """
+    Source-hash -> AST cache with an optional SQLite persistent tier
+
+    ASTs are stored as tagged JSON, never pickled, so reading a cache file
+    cannot run code, and every hit hands out a fresh tree that the caller
+    may modify. Persistent entries from another grammar version are dropped
+    when the database is opened.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        max_entries: int = 256,
+        max_persistent_entries: int = 5000,
+        grammar_version: str = GRAMMAR_VERSION,
+    ):
+        self.db_path = str(db_path) if db_path else None
+        self.max_entries = max_entries
+        self.max_persistent_entries = max_persistent_entries
+        self.grammar_version = grammar_version
+
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes_since_prune = 0
+
+        self.stats = {
+            "hits": 0,
+            "memory_hits": 0,
+            "persistent_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+        }
+
+        if self.db_path:
+            self._init_database()
+
+    @staticmethod
+    def make_key(source: str) -> str:
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional["AetherraCodeAST"]:
+        with self._lock:
+            data = self._entries.get(key)
+            tier = "memory_hits"
+            if data is None:
+                data = self._load(key)
+                tier = "persistent_hits"
+            if data is None:
+                self.stats["misses"] += 1
+                return None
+            try:
+                ast = _decode_ast(json.loads(data))
+            except (ValueError, TypeError, KeyError) as e:
+                logger.debug(f"Discarding unreadable cached AST: {e}")
+                self._entries.pop(key, None)
+                self.stats["misses"] += 1
+                return None
+            self._remember(key, data)
+            self.stats["hits"] += 1
+            self.stats[tier] += 1
+        return ast
+
+    def put(self, key: str, ast: "AetherraCodeAST") -> None:
+        try:
+            data = json.dumps(_encode_ast(ast), separators=(",", ":"))
+        except (TypeError, ValueError) as e:
+            logger.debug(f"AST not cacheable: {e}")
+            return
+        with self._lock:
+            self._remember(key, data)
+            self.stats["stores"] += 1
+            if self._conn is not None:
+                self._persist(key, data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM aether_ast_json")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._entries)
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM aether_ast_json"
+                ).fetchone()
+                stats["persistent_entries"] = row[0]
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # Internals
+    def _remember(self, key: str, data: str):
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _init_database(self):
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        if self.db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS aether_ast_json (
+                    key TEXT PRIMARY KEY,
+                    grammar_version TEXT NOT NULL,
+                    ast TEXT NOT NULL,
+                    stored_at REAL NOT NULL
+                )
+                """)
+            self._conn.execute(
+                "DELETE FROM aether_ast_json WHERE grammar_version != ?",
+                (self.grammar_version,),
+            )
+
+    def _load(self, key: str) -> Optional[str]:
+        if self._conn is None:
+            return None
+        row = self._conn.execute(
+            "SELECT ast FROM aether_ast_json WHERE key = ? AND grammar_version = ?",
+            (key, self.grammar_version),
+        ).fetchone()
+        return row[0] if row else None
+
+    def _persist(self, key: str, data: str):
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO aether_ast_json "
+                    "(key, grammar_version, ast, stored_at) VALUES (?, ?, ?, ?)",
+                    (key, self.grammar_version, data, time.time()),
+                )
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= max(self.max_persistent_entries // 10, 1):
+                self._prune()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Could not persist cached AST: {e}")
+
+    def _prune(self):
+        """Drop the oldest rows beyond the persistent bound"""
+        self._writes_since_prune = 0
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM aether_ast_json WHERE key IN ("
+                "SELECT key FROM aether_ast_json ORDER BY stored_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_persistent_entries,),
+            )
+
+
+# Shared by every parser that is not given its own cache
+_shared_ast_cache = ASTCache()
+
+
 class AetherraParser:
     """Formal AetherraCode parser using Lark grammar"""
 
-    def __init__(self):
-        self.parser = Lark(
-            aetherra_GRAMMAR,
-            parser="lalr",
-            transformer=AetherraCodeTransformer(),
-            start="program",
-        )
+    def __init__(self, ast_cache: Optional[ASTCache] = None):
+        self.parser = get_shared_parser()
+        self.ast_cache = ast_cache if ast_cache is not None else _shared_ast_cache
         self.last_ast = None
 
     def parse(self, source_code: str) -> AetherraCodeAST:
@@ -603,6 +892,13 @@ class AetherraParser:
             # Clean source code
             cleaned_source = self._preprocess_source(source_code)
 
+            # Identical scripts are only parsed once
+            key = self.ast_cache.make_key(cleaned_source)
+            ast = self.ast_cache.get(key)
+            if ast is not None:
+                self.last_ast = ast
+                return ast
+
             # Parse with Lark - transformer automatically converts to AetherraCodeAST
             ast = self.parser.parse(cleaned_source)
             self.last_ast = ast
@@ -611,6 +907,7 @@ class AetherraParser:
             if not isinstance(ast, AetherraCodeAST):
                 raise AetherraCodeSyntaxError("Parser did not return AetherraCodeAST")
 
+            self.ast_cache.put(key, ast)
             return ast
 
         except LarkError as e:
@@ -0,0 +1,317 @@
+"""
+Aetherra LLM Response Cache
+Two-tier (in-memory LRU + SQLite) cache for LLM completions keyed on the
+normalized prompt, model and sampling parameters.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Values that change on every turn (timestamps, session and request ids) but
+# carry no meaning for whether a cached answer is still the right answer.
+# Other numbers (counts, load figures, status values) are kept: a different
+# figure can call for a different answer.
+_VOLATILE_PATTERNS = [
+    re.compile(
+        r"\d{4}-\d{2}-\d{2}(?:[t ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?"
+        r"(?:z|[+-]\d{2}:?\d{2})?)?"
+    ),
+    re.compile(r"\b\d{1,2}:\d{2}(?::\d{2})?(?:\s?[ap]m)?"),
+    re.compile(r"\b1\d{9}(?:\.\d+)?\b"),  # Unix epoch seconds
+    re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b"),
+    re.compile(r"\b(?=[0-9a-f]*\d)[0-9a-f]{16,}\b"),  # Hex hashes and ids
+]
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class CachedResponse:
+    """A cached completion plus what it cost to produce"""
+
+    key: str
+    response: str
+    model: str
+    created_at: float
+    expires_at: float
+    latency_ms: float = 0.0
+    cost_usd: float = 0.0
+    hits: int = 0
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.time()) >= self.expires_at
+
+
+def normalize_prompt(text: str, mask_volatile: bool = False) -> str:
+    """Case-fold and collapse whitespace; optionally mask timestamps and ids"""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    if mask_volatile:
+        for pattern in _VOLATILE_PATTERNS:
+            text = pattern.sub("#", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class LLMResponseCache:
+    """
+    LRU + TTL response cache with an optional SQLite persistent tier
+
+    Only deterministic calls (temperature 0) are cached unless
+    ``cache_sampled_responses`` is set. Hits from the persistent tier are
+    promoted back into memory. Hit ratio and the latency/cost that hits
+    avoided are reported by ``get_stats``.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        max_entries: int = 512,
+        max_persistent_entries: int = 10000,
+        ttl_seconds: float = 3600.0,
+        cache_sampled_responses: bool = False,
+    ):
+        self.db_path = str(db_path) if db_path else None
+        self.max_entries = max_entries
+        self.max_persistent_entries = max_persistent_entries
+        self.ttl_seconds = ttl_seconds
+        self.cache_sampled_responses = cache_sampled_responses
+
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes_since_prune = 0
+
+        self.stats = {
+            "hits": 0,
+            "memory_hits": 0,
+            "persistent_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "skipped_uncacheable": 0,
+            "expired": 0,
+            "evictions": 0,
+            "latency_saved_ms": 0.0,
+            "cost_saved_usd": 0.0,
+        }
+
+        if self.db_path:
+            self._init_database()
+
+    # Keys
+    def make_key(
+        self,
+        prompt: str,
+        model: str,
+        params: Optional[Mapping[str, Any]] = None,
+        context: str = "",
+    ) -> str:
+        """
+        Build a cache key
+
+        ``prompt`` is the user-visible part (question plus history) and is
+        only case/whitespace normalized. ``context`` is the system prompt; its
+        timestamps and ids are masked so a new minute does not invalidate
+        every entry.
+        """
+        material = {
+            "model": model,
+            "params": {k: params[k] for k in sorted(params or {})},
+            "prompt": normalize_prompt(prompt),
+            "context": normalize_prompt(context, mask_volatile=True),
+        }
+        encoded = json.dumps(material, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def is_cacheable(self, params: Optional[Mapping[str, Any]] = None) -> bool:
+        """Deterministic calls are always cacheable; sampled ones by opt-in"""
+        temperature = (params or {}).get("temperature", 0)
+        return temperature == 0 or self.cache_sampled_responses
+
+    # Lookup / store
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return a live entry and record the hit, or None"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            tier = "memory_hits"
+            if entry is None:
+                entry = self._load(key)
+                tier = "persistent_hits"
+
+            if entry is not None and entry.is_expired(now):
+                self.stats["expired"] += 1
+                self._delete(key)
+                entry = None
+
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            entry.hits += 1
+            self._remember(entry)
+            self.stats["hits"] += 1
+            self.stats[tier] += 1
+            self.stats["latency_saved_ms"] += entry.latency_ms
+            self.stats["cost_saved_usd"] += entry.cost_usd
+            return entry
+
+    def put(
+        self,
+        key: str,
+        response: str,
+        model: str,
+        latency_ms: float = 0.0,
+        cost_usd: float = 0.0,
+        ttl_seconds: Optional[float] = None,
+    ) -> CachedResponse:
+        """Store a completion in both tiers"""
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        entry = CachedResponse(
+            key=key,
+            response=response,
+            model=model,
+            created_at=now,
+            expires_at=now + ttl,
+            latency_ms=latency_ms,
+            cost_usd=cost_usd,
+        )
+        with self._lock:
+            self._remember(entry)
+            self.stats["stores"] += 1
+            if self._conn is not None:
+                self._persist(entry)
+        return entry
+
+    def record_uncacheable(self):
+        """Count a call that bypassed the cache because it was sampled"""
+        with self._lock:
+            self.stats["skipped_uncacheable"] += 1
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._delete(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM llm_responses")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._entries)
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM llm_responses"
+                ).fetchone()
+                stats["persistent_entries"] = row[0]
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # Internals
+    def _remember(self, entry: CachedResponse):
+        self._entries[entry.key] = entry
+        self._entries.move_to_end(entry.key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _delete(self, key: str):
+        self._entries.pop(key, None)
+        if self._conn is not None:
+            with self._conn:
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+
+    def _init_database(self):
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        if self.db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    latency_ms REAL NOT NULL DEFAULT 0,
+                    cost_usd REAL NOT NULL DEFAULT 0,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )
+                """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_responses_created "
+                "ON llm_responses(created_at)"
+            )
+            self._conn.execute(
+                "DELETE FROM llm_responses WHERE expires_at <= ?", (time.time(),)
+            )
+
+    def _load(self, key: str) -> Optional[CachedResponse]:
+        if self._conn is None:
+            return None
+        row = self._conn.execute(
+            "SELECT key, response, model, created_at, expires_at, latency_ms, "
+            "cost_usd, hits FROM llm_responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        return CachedResponse(*row) if row else None
+
+    def _persist(self, entry: CachedResponse):
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses "
+                    "(key, response, model, created_at, expires_at, latency_ms, "
+                    "cost_usd, hits) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        entry.key,
+                        entry.response,
+                        entry.model,
+                        entry.created_at,
+                        entry.expires_at,
+                        entry.latency_ms,
+                        entry.cost_usd,
+                        entry.hits,
+                    ),
+                )
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= max(self.max_persistent_entries // 10, 1):
+                self._prune()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Could not persist cached LLM response: {e}")
+
+    def _prune(self):
+        """Drop expired rows and the oldest rows beyond the persistent bound"""
+        self._writes_since_prune = 0
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM llm_responses WHERE expires_at <= ?", (time.time(),)
+            )
+            self._conn.execute(
+                "DELETE FROM llm_responses WHERE key IN ("
+                "SELECT key FROM llm_responses ORDER BY created_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_persistent_entries,),
+            )
@@ -4,6 +4,7 @@ Advanced memory management system for AI operations and data persistence.
 """
 
 import asyncio
+import heapq
 import json
 import logging
 import pickle
@@ -11,11 +12,14 @@ import sqlite3
 import threading
 import uuid
 import zlib
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .vector_index import EmbeddingFunction, VectorIndex, hash_embedding
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +43,14 @@ class MemoryPriority(Enum):
     CRITICAL = 4
 
 
+class MemoryTier(Enum):
+    """Where an entry's value currently lives"""
+
+    HOT = "hot"  # Resident, stored as given
+    COMPRESSED = "compressed"  # Resident, demoted to zlib bytes
+    DISK = "disk"  # SQLite only, loaded on next access
+
+
 @dataclass
 class MemoryEntry:
     """Individual memory entry"""
@@ -55,6 +67,7 @@ class MemoryEntry:
     tags: List[str]
     size_bytes: int
     compressed: bool = False
+    tier: MemoryTier = MemoryTier.HOT
 
 
 class MemoryIndex:
@@ -64,7 +77,17 @@ class MemoryIndex:
         self.key_index: Dict[str, str] = {}  # key -> entry_id
         self.tag_index: Dict[str, Set[str]] = {}  # tag -> set of entry_ids
         self.type_index: Dict[MemoryType, Set[str]] = {}  # type -> set of entry_ids
-        self.access_time_index: List[tuple] = []  # (access_time, entry_id) sorted list
+
+        # Recency order per priority level (oldest first): O(1) touch/insert/evict
+        self.lru_index: Dict[MemoryPriority, "OrderedDict[str, None]"] = {
+            priority: OrderedDict() for priority in MemoryPriority
+        }
+        # Lazy-deletion min-heap of (priority, access_count, accessed_at, entry_id)
+        self.lfu_heap: List[Tuple[int, int, float, str]] = []
+        self._lfu_current: Dict[str, Tuple[int, int, float, str]] = {}
+        self._entry_sizes: Dict[str, int] = {}
+        self.total_size_bytes = 0
+        self.type_size_bytes: Dict[MemoryType, int] = {}
 
     def add_entry(self, entry: MemoryEntry):
         """Add entry to index"""
@@ -81,13 +104,15 @@ class MemoryIndex:
                 self.tag_index[tag] = set()
             self.tag_index[tag].add(entry.entry_id)
 
-        # Add to access time index
-        self.access_time_index.append((entry.accessed_at, entry.entry_id))
-        self.access_time_index.sort()
+        # Add to recency/frequency indexes and size accounting
+        self.lru_index[entry.priority][entry.entry_id] = None
+        self.lru_index[entry.priority].move_to_end(entry.entry_id)
+        self._push_lfu(entry)
+        self._account_size(entry, entry.size_bytes)
 
     def remove_entry(self, entry: MemoryEntry):
         """Remove entry from index"""
-        if entry.key in self.key_index:
+        if self.key_index.get(entry.key) == entry.entry_id:
             del self.key_index[entry.key]
 
         # Remove from type index
@@ -99,12 +124,22 @@ class MemoryIndex:
             if tag in self.tag_index:
                 self.tag_index[tag].discard(entry.entry_id)
 
-        # Remove from access time index
-        self.access_time_index = [
-            (timestamp, eid)
-            for timestamp, eid in self.access_time_index
-            if eid != entry.entry_id
-        ]
+        # Remove from recency/frequency indexes; stale heap items are skipped
+        self.lru_index[entry.priority].pop(entry.entry_id, None)
+        self._lfu_current.pop(entry.entry_id, None)
+        self._account_size(entry, 0)
+
+    def resize_entry(self, entry: MemoryEntry):
+        """Re-account an entry whose resident size changed"""
+        if entry.entry_id in self._entry_sizes:
+            self._account_size(entry, entry.size_bytes)
+
+    def touch(self, entry: MemoryEntry):
+        """Record an access: entry becomes most recently used"""
+        bucket = self.lru_index[entry.priority]
+        if entry.entry_id in bucket:
+            bucket.move_to_end(entry.entry_id)
+            self._push_lfu(entry)
 
     def find_by_key(self, key: str) -> Optional[str]:
         """Find entry ID by key"""
@@ -125,18 +160,75 @@ class MemoryIndex:
         """Find entry IDs by memory type"""
         return self.type_index.get(memory_type, set())
 
-    def get_lru_entries(self, count: int) -> List[str]:
-        """Get least recently used entry IDs"""
-        return [eid for _, eid in self.access_time_index[:count]]
+    def iter_lru(self) -> Iterator[str]:
+        """
+        Entry IDs in eviction order: lowest priority first, then least recent
+
+        Walks the live recency lists from the cold end without copying them,
+        so the index must not change while iterating; collect the IDs first
+        if entries are going to be removed.
+        """
+        for priority in sorted(MemoryPriority, key=lambda p: p.value):
+            yield from self.lru_index[priority]
+
+    def pop_lfu_candidate(self) -> Optional[Tuple[int, int, float, str]]:
+        """
+        Pop the next live LFU heap item, discarding stale ones on the way
+
+        The entry stays indexed; hand the item back with push_back_lfu unless
+        the entry is removed.
+        """
+        while self.lfu_heap:
+            item = heapq.heappop(self.lfu_heap)
+            if self._lfu_current.get(item[3]) == item:
+                return item
+        return None
+
+    def push_back_lfu(self, items: List[Tuple[int, int, float, str]]):
+        """Return popped LFU candidates whose entries are still indexed"""
+        for item in items:
+            if self._lfu_current.get(item[3]) == item:
+                heapq.heappush(self.lfu_heap, item)
+
+    def _account_size(self, entry: MemoryEntry, size: int):
+        """Set an entry's counted size (0 removes it) in the byte totals"""
+        delta = size - self._entry_sizes.pop(entry.entry_id, 0)
+        if size:
+            self._entry_sizes[entry.entry_id] = size
+        self.total_size_bytes += delta
+        self.type_size_bytes[entry.memory_type] = (
+            self.type_size_bytes.get(entry.memory_type, 0) + delta
+        )
+
+    def _push_lfu(self, entry: MemoryEntry):
+        item = (
+            entry.priority.value,
+            entry.access_count,
+            entry.accessed_at.timestamp(),
+            entry.entry_id,
+        )
+        self._lfu_current[entry.entry_id] = item
+        heapq.heappush(self.lfu_heap, item)
+
+        # Rebuild once stale items dominate so the heap stays O(live entries)
+        if len(self.lfu_heap) > 2 * len(self._lfu_current) + 64:
+            self.lfu_heap = list(self._lfu_current.values())
+            heapq.heapify(self.lfu_heap)
 
 
 class CompressionManager:
     """Manages memory compression"""
 
     @staticmethod
-    def compress_data(data: Any) -> bytes:
+    def serialize(data: Any) -> bytes:
+        """Serialize data once so size, compression and persistence can share it"""
+        return pickle.dumps(data)
+
+    @staticmethod
+    def compress_data(data: Any, serialized: Optional[bytes] = None) -> bytes:
         """Compress data using zlib"""
-        serialized = pickle.dumps(data)
+        if serialized is None:
+            serialized = pickle.dumps(data)
         compressed = zlib.compress(serialized)
         return compressed
 
@@ -149,6 +241,8 @@ class CompressionManager:
     @staticmethod
     def calculate_size(data: Any) -> int:
         """Calculate size of data in bytes"""
+        if isinstance(data, (bytes, bytearray)):
+            return len(data)
         try:
             return len(pickle.dumps(data))
         except Exception:
@@ -161,12 +255,101 @@ class CompressionManager:
         return size > threshold
 
 
+class MemoryBudget:
+    """
+    Resident-byte accountant for MemoryManager
+
+    Tracks how many bytes each resident entry occupies in the hot and
+    compressed tiers, updated on every store, demotion, promotion and evict,
+    plus per-tier hit counters for sizing.
+    """
+
+    def __init__(self, max_bytes: int, low_water_ratio: float = 0.9):
+        self.max_bytes = max_bytes
+        self.low_water_bytes = int(max_bytes * low_water_ratio)
+        self.resident_bytes = 0
+        self._resident: Dict[str, Tuple[MemoryTier, int]] = {}
+        self.tier_bytes = {MemoryTier.HOT: 0, MemoryTier.COMPRESSED: 0}
+        self.tier_entries = {MemoryTier.HOT: 0, MemoryTier.COMPRESSED: 0}
+        self.spilled_entries = 0
+        self.hits = {tier: 0 for tier in MemoryTier}
+        self.misses = 0
+        self.demotions = {MemoryTier.COMPRESSED: 0, MemoryTier.DISK: 0}
+        self.promotions = {MemoryTier.COMPRESSED: 0, MemoryTier.DISK: 0}
+
+    def account(self, entry_id: str, tier: MemoryTier, size_bytes: int):
+        """Set the resident tier and size of an entry"""
+        self.release(entry_id)
+        self._resident[entry_id] = (tier, size_bytes)
+        self.tier_bytes[tier] += size_bytes
+        self.tier_entries[tier] += 1
+        self.resident_bytes += size_bytes
+
+    def release(self, entry_id: str):
+        """Stop counting an entry (evicted or spilled)"""
+        previous = self._resident.pop(entry_id, None)
+        if previous is None:
+            return
+        tier, size_bytes = previous
+        self.tier_bytes[tier] -= size_bytes
+        self.tier_entries[tier] -= 1
+        self.resident_bytes -= size_bytes
+
+    def over_budget(self) -> bool:
+        return self.resident_bytes > self.max_bytes
+
+    def under_low_water(self) -> bool:
+        return self.resident_bytes <= self.low_water_bytes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-tier byte counts, entry counts and hit rates"""
+        lookups = sum(self.hits.values()) + self.misses
+        tiers = {}
+        for tier in MemoryTier:
+            tiers[tier.value] = {
+                "entries": (
+                    self.spilled_entries
+                    if tier == MemoryTier.DISK
+                    else self.tier_entries[tier]
+                ),
+                "bytes": self.tier_bytes.get(tier, 0),
+                "hits": self.hits[tier],
+                "hit_rate": self.hits[tier] / lookups if lookups else 0.0,
+            }
+        return {
+            "resident_bytes": self.resident_bytes,
+            "budget_bytes": self.max_bytes,
+            "misses": self.misses,
+            "tiers": tiers,
+            "demotions": {tier.value: n for tier, n in self.demotions.items()},
+            "promotions": {tier.value: n for tier, n in self.promotions.items()},
+        }
+
+
 class MemoryEvictionPolicy:
     """Memory eviction policies"""
 
     @staticmethod
-    def lru_eviction(entries: Dict[str, MemoryEntry], target_size: int) -> List[str]:
+    def lru_eviction(
+        entries: Dict[str, MemoryEntry],
+        target_size: int,
+        index: Optional[MemoryIndex] = None,
+    ) -> List[str]:
         """Least Recently Used eviction"""
+        if index is not None:
+            # Walk the recency index instead of sorting every entry
+            evict_ids = []
+            current_size = index.total_size_bytes
+            for entry_id in index.iter_lru():
+                if current_size <= target_size:
+                    break
+                entry = entries.get(entry_id)
+                if entry is None:
+                    continue
+                evict_ids.append(entry_id)
+                current_size -= entry.size_bytes
+            return evict_ids
+
         sorted_entries = sorted(
             entries.values(), key=lambda e: (e.priority.value, e.accessed_at)
         )
@@ -184,9 +367,35 @@ class MemoryEvictionPolicy:
 
     @staticmethod
     def priority_eviction(
-        entries: Dict[str, MemoryEntry], target_size: int
+        entries: Dict[str, MemoryEntry],
+        target_size: int,
+        index: Optional[MemoryIndex] = None,
     ) -> List[str]:
         """Priority-based eviction"""
+        if index is not None:
+            # Pop candidates lazily from the LFU heap; CRITICAL entries sort
+            # last and are never taken. Candidates stay indexed until the
+            # caller evicts them, so every popped item is pushed back.
+            evict_ids = []
+            popped = []
+            current_size = index.total_size_bytes
+            try:
+                while current_size > target_size:
+                    item = index.pop_lfu_candidate()
+                    if item is None:
+                        break
+                    popped.append(item)
+                    if item[0] >= MemoryPriority.CRITICAL.value:
+                        break
+                    entry = entries.get(item[3])
+                    if entry is None:
+                        continue
+                    evict_ids.append(item[3])
+                    current_size -= entry.size_bytes
+            finally:
+                index.push_back_lfu(popped)
+            return evict_ids
+
         sorted_entries = sorted(
             entries.values(),
             key=lambda e: (e.priority.value, e.access_count, e.accessed_at),
@@ -220,57 +429,41 @@ class MemoryEvictionPolicy:
 class SemanticSearch:
     """Semantic search capabilities for memory"""
 
-    def __init__(self):
-        self.embeddings: Dict[str, List[float]] = {}
+    def __init__(
+        self,
+        embedding_function: Optional[EmbeddingFunction] = None,
+        dimensions: int = 100,
+    ):
+        # Hash embedding is the offline default; plug in a model-backed
+        # function (text -> vector of ``dimensions`` floats) when available
+        self.embedding_function = embedding_function or (
+            lambda text: hash_embedding(text, dimensions)
+        )
+        self.vector_index = VectorIndex(dimensions)
 
     def add_embedding(self, entry_id: str, text: str):
         """Add text embedding for semantic search"""
-        # Simple word-based embedding (in production, use proper embeddings)
-        words = text.lower().split()
-        embedding = self._simple_embedding(words)
-        self.embeddings[entry_id] = embedding
-
-    def _simple_embedding(self, words: List[str]) -> List[float]:
-        """Simple word-based embedding"""
-        # Create a simple hash-based embedding
-        embedding = [0.0] * 100
-        for word in words:
-            hash_val = hash(word) % 100
-            embedding[hash_val] += 1.0
-
-        # Normalize
-        total = sum(embedding)
-        if total > 0:
-            embedding = [x / total for x in embedding]
-
-        return embedding
+        self.vector_index.add(entry_id, self.embedding_function(text))
+
+    def remove_embedding(self, entry_id: str) -> bool:
+        """Remove an entry from the search index"""
+        return self.vector_index.remove(entry_id)
 
     def search_similar(self, query: str, top_k: int = 10) -> List[str]:
         """Search for semantically similar entries"""
-        query_embedding = self._simple_embedding(query.lower().split())
+        return [entry_id for entry_id, _ in self.search_with_scores(query, top_k)]
 
-        similarities = []
-        for entry_id, embedding in self.embeddings.items():
-            similarity = self._cosine_similarity(query_embedding, embedding)
-            similarities.append((similarity, entry_id))
+    def search_with_scores(self, query: str, top_k: int = 10) -> List[tuple]:
+        """Search for similar entries, returning (entry_id, cosine similarity)"""
+        return self.vector_index.search(self.embedding_function(query), top_k)
 
-        # Sort by similarity and return top k
-        similarities.sort(reverse=True)
-        return [entry_id for _, entry_id in similarities[:top_k]]
+    def save(self, path: str):
+        """Persist the vector index (memory-mappable on load)"""
+        self.vector_index.save(path)
 
-    def _cosine_similarity(self, a: List[float], b: List[float]) -> float:
-        """Calculate cosine similarity"""
-        if len(a) != len(b):
-            return 0.0
-
-        dot_product = sum(x * y for x, y in zip(a, b))
-        norm_a = sum(x * x for x in a) ** 0.5
-        norm_b = sum(x * x for x in b) ** 0.5
-
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-
-        return dot_product / (norm_a * norm_b)
+    def load(self, path: str):
+        """Load a previously saved vector index"""
+        self.vector_index = VectorIndex.load(path)
 
 
 class MemoryManager:
@@ -278,14 +471,20 @@ class MemoryManager:
     Advanced memory management system for Aetherra AI
     """
 
-    def __init__(self, db_path: str = "memory_manager.db", max_memory_mb: int = 512):
+    def __init__(
+        self,
+        db_path: str = "memory_manager.db",
+        max_memory_mb: int = 512,
+        embedding_function: Optional[EmbeddingFunction] = None,
+    ):
         self.db_path = Path(db_path)
-        self.max_memory_bytes = max_memory_mb * 1024 * 1024
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
         self.entries: Dict[str, MemoryEntry] = {}
         self.index = MemoryIndex()
         self.compression_manager = CompressionManager()
-        self.semantic_search = SemanticSearch()
+        self.semantic_search = SemanticSearch(embedding_function)
         self.eviction_policy = MemoryEvictionPolicy()
+        self.budget = MemoryBudget(self.max_memory_bytes)
         self.access_lock = threading.RLock()
         self.cleanup_active = False
         self.cleanup_task = None
@@ -372,15 +571,11 @@ class MemoryManager:
             ttl_evict_ids = self.eviction_policy.ttl_eviction(self.entries)
             for entry_id in ttl_evict_ids:
                 await self._evict_entry(entry_id)
+            self._purge_expired_spilled()
 
-            # Size-based eviction if over memory limit
-            current_size = sum(e.size_bytes for e in self.entries.values())
-            if current_size > self.max_memory_bytes:
-                target_size = int(self.max_memory_bytes * 0.8)  # Target 80% of max
-                evict_ids = self.eviction_policy.lru_eviction(self.entries, target_size)
-
-                for entry_id in evict_ids:
-                    await self._evict_entry(entry_id)
+            # Size is enforced on every store; this catches budget changes
+            self._enforce_budget()
+            current_size = self.budget.resident_bytes
 
             logger.debug(
                 f"Memory cleanup completed. Current size: {current_size / 1024 / 1024:.1f}MB"
@@ -402,14 +597,15 @@ class MemoryManager:
         now = datetime.now()
         tags = tags or []
 
-        # Calculate size and compression
-        should_compress = self.compression_manager.should_compress(value)
+        # Calculate size and compression from a single serialization
+        serialized = self.compression_manager.serialize(value)
+        should_compress = len(serialized) > 1024
         if should_compress:
-            stored_value = self.compression_manager.compress_data(value)
+            stored_value = self.compression_manager.compress_data(value, serialized)
             size_bytes = len(stored_value)
         else:
             stored_value = value
-            size_bytes = self.compression_manager.calculate_size(value)
+            size_bytes = len(serialized)
 
         # Create memory entry
         entry = MemoryEntry(
@@ -432,17 +628,27 @@ class MemoryManager:
             existing_id = self.index.find_by_key(key)
             if existing_id and existing_id in self.entries:
                 await self._evict_entry(existing_id)
+            elif self.budget.spilled_entries:
+                # The previous version may only exist on disk (spilled)
+                self._purge_spilled("key_name", key)
 
             # Store new entry
             self.entries[entry_id] = entry
             self.index.add_entry(entry)
+            self.budget.account(entry_id, MemoryTier.HOT, size_bytes)
 
             # Add to semantic search if enabled
             if enable_search and isinstance(value, str):
                 self.semantic_search.add_embedding(entry_id, value)
 
         # Persist to database
-        await self._persist_entry(entry)
+        await self._persist_entry(
+            entry, value_data=stored_value if should_compress else serialized
+        )
+
+        # Demote cold entries once the new entry is safely on disk
+        with self.access_lock:
+            self._enforce_budget(keep_id=entry_id)
 
         logger.debug(
             f"Stored {key} in {memory_type.value} memory (compressed: {should_compress})"
@@ -458,16 +664,21 @@ class MemoryManager:
                 # Try loading from database
                 entry = await self._load_entry_by_key(key)
                 if not entry:
+                    self.budget.misses += 1
                     return None
-                self.entries[entry.entry_id] = entry
-                self.index.add_entry(entry)
+                self._promote_from_disk(entry)
                 entry_id = entry.entry_id
-
-            entry = self.entries[entry_id]
+            else:
+                entry = self.entries[entry_id]
+                self.budget.hits[entry.tier] += 1
+                if entry.tier == MemoryTier.COMPRESSED:
+                    self._promote_from_compressed(entry)
 
             # Update access information
             entry.accessed_at = datetime.now()
             entry.access_count += 1
+            self.index.touch(entry)
+            self._enforce_budget(keep_id=entry_id)
 
             # Decompress if needed
             if entry.compressed:
@@ -500,11 +711,16 @@ class MemoryManager:
         self, query: str, top_k: int = 10
     ) -> List[Dict[str, Any]]:
         """Perform semantic search on memory"""
-        entry_ids = self.semantic_search.search_similar(query, top_k)
+        matches = self.semantic_search.search_with_scores(query, top_k)
 
         results = []
         with self.access_lock:
-            for entry_id in entry_ids:
+            for entry_id, score in matches:
+                if entry_id not in self.entries:
+                    # Spilled to disk: bring it back like a retrieve would
+                    spilled = await self._load_entry_by_id(entry_id)
+                    if spilled:
+                        self._promote_from_disk(spilled)
                 if entry_id in self.entries:
                     entry = self.entries[entry_id]
                     value = entry.value
@@ -516,10 +732,11 @@ class MemoryManager:
                             "key": entry.key,
                             "value": value,
                             "memory_type": entry.memory_type.value,
-                            "score": 1.0,  # Placeholder for similarity score
+                            "score": score,
                             "tags": entry.tags,
                         }
                     )
+            self._enforce_budget()
 
         return results
 
@@ -553,7 +770,8 @@ class MemoryManager:
                 await self._evict_entry(entry_id)
                 return True
 
-            return False
+            # Spilled entries only live in SQLite
+            return bool(self._purge_spilled("key_name", key))
 
     async def _evict_entry(self, entry_id: str):
         """Evict entry from memory"""
@@ -564,10 +782,10 @@ class MemoryManager:
 
         # Remove from indexes
         self.index.remove_entry(entry)
+        self.budget.release(entry_id)
 
         # Remove from semantic search
-        if entry_id in self.semantic_search.embeddings:
-            del self.semantic_search.embeddings[entry_id]
+        self.semantic_search.remove_embedding(entry_id)
 
         # Remove from memory
         del self.entries[entry_id]
@@ -577,48 +795,210 @@ class MemoryManager:
 
         logger.debug(f"Evicted entry {entry.key} from memory")
 
+    def _enforce_budget(self, keep_id: Optional[str] = None):
+        """
+        Bring resident bytes back under budget
+
+        The least recently used hot entries (lru_eviction) are demoted to the
+        compressed tier first. If that is not enough, the least frequently
+        used entries (priority_eviction, never CRITICAL) are spilled to
+        SQLite only. Both stop at the low-water mark so steady-state stores
+        do not demote on every call.
+        """
+        if not self.budget.over_budget():
+            return
+
+        target = self.budget.low_water_bytes
+        for entry_id in self.eviction_policy.lru_eviction(
+            self.entries, target, self.index
+        ):
+            if self.budget.under_low_water():
+                break
+            entry = self.entries[entry_id]
+            if entry_id == keep_id or entry.tier != MemoryTier.HOT or entry.compressed:
+                continue
+            compressed = self.compression_manager.compress_data(entry.value)
+            if len(compressed) < entry.size_bytes:
+                entry.value = compressed
+                entry.compressed = True
+                self._set_resident_size(entry, MemoryTier.COMPRESSED, len(compressed))
+                self.budget.demotions[MemoryTier.COMPRESSED] += 1
+
+        spilled: List[MemoryEntry] = []
+        if not self.budget.under_low_water():
+            for entry_id in self.eviction_policy.priority_eviction(
+                self.entries, target, self.index
+            ):
+                if self.budget.under_low_water():
+                    break
+                if entry_id == keep_id:
+                    continue
+                entry = self.entries[entry_id]
+                self._spill_to_disk(entry)
+                spilled.append(entry)
+
+        if spilled:
+            self._persist_access_info(spilled)
+
+    def _promote_from_compressed(self, entry: MemoryEntry):
+        """Decompress a demoted entry back into the hot tier"""
+        entry.value = self.compression_manager.decompress_data(entry.value)
+        entry.compressed = False
+        self._set_resident_size(
+            entry,
+            MemoryTier.HOT,
+            len(self.compression_manager.serialize(entry.value)),
+        )
+        self.budget.promotions[MemoryTier.COMPRESSED] += 1
+
+    def _set_resident_size(self, entry: MemoryEntry, tier: MemoryTier, size: int):
+        """Move an entry to a tier, keeping entry, index and budget sizes in step"""
+        entry.tier = tier
+        entry.size_bytes = size
+        self.index.resize_entry(entry)
+        self.budget.account(entry.entry_id, tier, size)
+
+    def _promote_from_disk(self, entry: MemoryEntry):
+        """Make an entry loaded from SQLite resident again"""
+        entry.tier = MemoryTier.HOT
+        self.entries[entry.entry_id] = entry
+        self.index.add_entry(entry)
+        self.budget.account(
+            entry.entry_id,
+            MemoryTier.HOT,
+            len(entry.value) if entry.compressed else entry.size_bytes,
+        )
+        self.budget.hits[MemoryTier.DISK] += 1
+        self.budget.promotions[MemoryTier.DISK] += 1
+        self.budget.spilled_entries = max(0, self.budget.spilled_entries - 1)
+
+    def _spill_to_disk(self, entry: MemoryEntry):
+        """Drop an entry's resident copy; SQLite keeps the value"""
+        self.index.remove_entry(entry)
+        self.budget.release(entry.entry_id)
+        del self.entries[entry.entry_id]
+        self.budget.demotions[MemoryTier.DISK] += 1
+        self.budget.spilled_entries += 1
+
+    def _purge_spilled(self, column: str, value: str) -> List[str]:
+        """Delete non-resident rows matching column = value"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            entry_ids = [
+                row[0]
+                for row in conn.execute(
+                    f"SELECT entry_id FROM memory_entries WHERE {column} = ?",
+                    (value,),
+                )
+                if row[0] not in self.entries
+            ]
+            conn.executemany(
+                "DELETE FROM memory_entries WHERE entry_id = ?",
+                [(entry_id,) for entry_id in entry_ids],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        for entry_id in entry_ids:
+            self.semantic_search.remove_embedding(entry_id)
+        self.budget.spilled_entries = max(
+            0, self.budget.spilled_entries - len(entry_ids)
+        )
+        return entry_ids
+
+    def _purge_expired_spilled(self):
+        """Drop spilled rows whose TTL has passed"""
+        now = datetime.now()
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute(
+                "SELECT entry_id, created_at, ttl_seconds FROM memory_entries "
+                "WHERE ttl_seconds IS NOT NULL"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        for entry_id, created_at, ttl_seconds in rows:
+            if entry_id in self.entries:
+                continue
+            if now - datetime.fromisoformat(created_at) > timedelta(
+                seconds=ttl_seconds
+            ):
+                self._purge_spilled("entry_id", entry_id)
+
+    def _persist_access_info(self, entries: List[MemoryEntry]):
+        """Write back access info for entries leaving memory, in one transaction"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.executemany(
+                """
+                UPDATE memory_entries SET accessed_at = ?, access_count = ?
+                WHERE entry_id = ?
+            """,
+                [
+                    (e.accessed_at.isoformat(), e.access_count, e.entry_id)
+                    for e in entries
+                ],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory usage statistics"""
         with self.access_lock:
             total_entries = len(self.entries)
-            total_size = sum(e.size_bytes for e in self.entries.values())
+            total_size = self.index.total_size_bytes
 
             type_stats = {}
             for memory_type in MemoryType:
                 type_entries = len(self.index.find_by_type(memory_type))
-                type_size = sum(
-                    e.size_bytes
-                    for e in self.entries.values()
-                    if e.memory_type == memory_type
-                )
+                type_size = self.index.type_size_bytes.get(memory_type, 0)
                 type_stats[memory_type.value] = {
                     "entries": type_entries,
                     "size_mb": type_size / 1024 / 1024,
                 }
 
+            budget_stats = self.budget.get_stats()
+            resident_size = budget_stats["resident_bytes"]
+
             return {
                 "total_entries": total_entries,
                 "total_size_mb": total_size / 1024 / 1024,
                 "max_size_mb": self.max_memory_bytes / 1024 / 1024,
-                "usage_percent": (total_size / self.max_memory_bytes) * 100,
+                "resident_size_mb": resident_size / 1024 / 1024,
+                "usage_percent": (resident_size / self.max_memory_bytes) * 100,
                 "type_breakdown": type_stats,
                 "compressed_entries": len(
                     [e for e in self.entries.values() if e.compressed]
                 ),
+                "tiers": budget_stats["tiers"],
+                "tier_misses": budget_stats["misses"],
+                "demotions": budget_stats["demotions"],
+                "promotions": budget_stats["promotions"],
             }
 
-    async def _persist_entry(self, entry: MemoryEntry):
+    async def _persist_entry(
+        self, entry: MemoryEntry, value_data: Optional[bytes] = None
+    ):
         """Persist entry to database"""
         conn = sqlite3.connect(self.db_path)
         try:
-            # Serialize value
-            if entry.compressed:
-                value_data = entry.value
-            else:
-                value_data = pickle.dumps(entry.value)
+            # Serialize value unless the caller already did
+            if value_data is None:
+                if entry.compressed:
+                    value_data = entry.value
+                else:
+                    value_data = pickle.dumps(entry.value)
 
             ttl_seconds = int(entry.ttl.total_seconds()) if entry.ttl else None
 
+            # Older versions of this key may only exist on disk (spilled)
+            conn.execute(
+                "DELETE FROM memory_entries WHERE key_name = ? AND entry_id != ?",
+                (entry.key, entry.entry_id),
+            )
             conn.execute(
                 """
                 INSERT OR REPLACE INTO memory_entries
@@ -647,61 +1027,71 @@ class MemoryManager:
 
     async def _load_entry_by_key(self, key: str) -> Optional[MemoryEntry]:
         """Load entry from database by key"""
+        return self._load_entry("key_name", key)
+
+    async def _load_entry_by_id(self, entry_id: str) -> Optional[MemoryEntry]:
+        """Load entry from database by entry ID"""
+        return self._load_entry("entry_id", entry_id)
+
+    def _load_entry(self, column: str, value: str) -> Optional[MemoryEntry]:
         conn = sqlite3.connect(self.db_path)
         try:
             cursor = conn.execute(
-                """
-                SELECT * FROM memory_entries WHERE key_name = ?
-            """,
-                (key,),
+                f"SELECT * FROM memory_entries WHERE {column} = ?", (value,)
             )
 
             row = cursor.fetchone()
-            if not row:
-                return None
-
-            # Reconstruct entry
-            (
-                entry_id,
-                key_name,
-                value_data,
-                memory_type,
-                priority,
-                created_at,
-                accessed_at,
-                access_count,
-                ttl_seconds,
-                tags,
-                size_bytes,
-                compressed,
-            ) = row
-
-            # Deserialize value
-            if compressed:
-                value = value_data
-            else:
-                value = pickle.loads(value_data)
-
-            ttl = timedelta(seconds=ttl_seconds) if ttl_seconds else None
-
-            return MemoryEntry(
-                entry_id=entry_id,
-                key=key_name,
-                value=value,
-                memory_type=MemoryType(memory_type),
-                priority=MemoryPriority(priority),
-                created_at=datetime.fromisoformat(created_at),
-                accessed_at=datetime.fromisoformat(accessed_at),
-                access_count=access_count,
-                ttl=ttl,
-                tags=json.loads(tags),
-                size_bytes=size_bytes,
-                compressed=compressed,
-            )
-
         finally:
             conn.close()
 
+        if not row:
+            return None
+
+        # Reconstruct entry
+        (
+            entry_id,
+            key_name,
+            value_data,
+            memory_type,
+            priority,
+            created_at,
+            accessed_at,
+            access_count,
+            ttl_seconds,
+            tags,
+            size_bytes,
+            compressed,
+        ) = row
+
+        created_at = datetime.fromisoformat(created_at)
+        ttl = timedelta(seconds=ttl_seconds) if ttl_seconds else None
+
+        # Expired while spilled: purge instead of promoting
+        if ttl and (datetime.now() - created_at) > ttl:
+            self._purge_spilled("entry_id", entry_id)
+            return None
+
+        # Deserialize value
+        if compressed:
+            value = value_data
+        else:
+            value = pickle.loads(value_data)
+
+        return MemoryEntry(
+            entry_id=entry_id,
+            key=key_name,
+            value=value,
+            memory_type=MemoryType(memory_type),
+            priority=MemoryPriority(priority),
+            created_at=created_at,
+            accessed_at=datetime.fromisoformat(accessed_at),
+            access_count=access_count,
+            ttl=ttl,
+            tags=json.loads(tags),
+            size_bytes=size_bytes,
+            compressed=compressed,
+        )
+
     async def _delete_entry_from_db(self, entry_id: str):
         """Delete entry from database"""
         conn = sqlite3.connect(self.db_path)
@@ -16,14 +16,33 @@ making it truly independent and privacy-focused.
 """
 
 import asyncio
+import contextvars
+import functools
 import importlib
 import importlib.util
 import json
 import logging
 import os
-from dataclasses import dataclass
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -40,6 +59,7 @@ class LLMProvider(Enum):
     GEMINI = "gemini"
     AZURE = "azure"
     LOCAL_GGUF = "local_gguf"
+    FAKE = "fake"
 
 
 @dataclass
@@ -56,16 +76,397 @@ class LLMConfig:
     timeout: int = 30
     context_window: int = 4096
     supports_streaming: bool = True
+    cost_per_1k_tokens: float = 0.0  # Blended USD estimate, 0 for local models
+
+
+# Local backends run one generation at a time by default: llama.cpp models
+# are not thread-safe and Ollama serializes requests per model anyway
+DEFAULT_PROVIDER_CONCURRENCY = {
+    LLMProvider.OLLAMA: 1,
+    LLMProvider.LLAMACPP: 1,
+    LLMProvider.LOCAL_GGUF: 1,
+}
+
+# Queue time accumulated by the request running in the current task
+_request_timing: contextvars.ContextVar[Dict[str, float]] = contextvars.ContextVar(
+    "llm_request_timing"
+)
+
+
+def _percentile(values: Iterable[float], ratio: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+@dataclass
+class ProviderMetrics:
+    """Per-provider request counters and timings"""
+
+    requests: int = 0
+    errors: int = 0
+    queued: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    total_latency_ms: float = 0.0
+    total_queue_ms: float = 0.0
+    last_latency_ms: float = 0.0
+    last_queue_ms: float = 0.0
+    recent_latency_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=256))
+    # Streaming: time from request submission to the first chunk
+    streams: int = 0
+    total_ttft_ms: float = 0.0
+    last_ttft_ms: float = 0.0
+    recent_ttft_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=256))
+
+    def to_dict(self) -> Dict[str, Any]:
+        completed = self.requests or 1
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "queued": self.queued,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "avg_latency_ms": self.total_latency_ms / completed,
+            "avg_queue_ms": self.total_queue_ms / completed,
+            "p50_latency_ms": _percentile(self.recent_latency_ms, 0.5),
+            "p95_latency_ms": _percentile(self.recent_latency_ms, 0.95),
+            "last_latency_ms": self.last_latency_ms,
+            "last_queue_ms": self.last_queue_ms,
+            "streams": self.streams,
+            "avg_time_to_first_token_ms": self.total_ttft_ms / (self.streams or 1),
+            "p95_time_to_first_token_ms": _percentile(self.recent_ttft_ms, 0.95),
+            "last_time_to_first_token_ms": self.last_ttft_ms,
+        }
+
+
+class ProviderExecutor:
+    """
+    Execution layer shared by all LLM providers
+
+    Features:
+    - Per-provider concurrency semaphores (one set per event loop)
+    - Bounded thread pool for SDKs that only offer blocking clients
+    - Blocking SDK streams bridged to async iterators with backpressure
+    - A long-lived background event loop for synchronous callers
+    - Per-request latency, queue-time and time-to-first-token metrics
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        default_concurrency: int = 4,
+        provider_concurrency: Optional[Dict[LLMProvider, int]] = None,
+    ):
+        self.max_workers = max_workers
+        self.default_concurrency = default_concurrency
+        self.provider_concurrency = dict(DEFAULT_PROVIDER_CONCURRENCY)
+        self.provider_concurrency.update(provider_concurrency or {})
+
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        # event loop -> {provider: semaphore}
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._metrics: Dict[LLMProvider, ProviderMetrics] = {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    async def submit(
+        self, provider: LLMProvider, call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run ``call()`` under the provider's concurrency limit"""
+        metrics = self._metrics.setdefault(provider, ProviderMetrics())
+        semaphore = self._semaphore(provider)
+
+        timing = {"queue_ms": 0.0}
+        token = _request_timing.set(timing)
+        queued_at = time.perf_counter()
+        metrics.queued += 1
+        acquired = False
+        try:
+            async with semaphore:
+                acquired = True
+                metrics.queued -= 1
+                started = time.perf_counter()
+                timing["queue_ms"] += (started - queued_at) * 1000
+                metrics.in_flight += 1
+                metrics.max_in_flight = max(metrics.max_in_flight, metrics.in_flight)
+                try:
+                    return await call()
+                except Exception:
+                    metrics.errors += 1
+                    raise
+                finally:
+                    metrics.in_flight -= 1
+                    self._record(metrics, timing, started)
+        finally:
+            if not acquired:
+                # Cancelled while waiting for a slot
+                metrics.queued -= 1
+            _request_timing.reset(token)
+
+    async def submit_stream(
+        self, provider: LLMProvider, open_stream: Callable[[], AsyncIterator[str]]
+    ) -> AsyncIterator[str]:
+        """Stream chunks from ``open_stream()`` under the provider's limit
+
+        The concurrency slot is held until the stream is exhausted or closed,
+        and closing this iterator closes the provider stream.
+        """
+        metrics = self._metrics.setdefault(provider, ProviderMetrics())
+        semaphore = self._semaphore(provider)
+
+        queued_at = time.perf_counter()
+        metrics.queued += 1
+        acquired = False
+        try:
+            async with semaphore:
+                acquired = True
+                metrics.queued -= 1
+                started = time.perf_counter()
+                timing = {"queue_ms": (started - queued_at) * 1000}
+                metrics.in_flight += 1
+                metrics.max_in_flight = max(metrics.max_in_flight, metrics.in_flight)
+                stream = open_stream()
+                first_chunk = True
+                try:
+                    async for chunk in stream:
+                        if first_chunk:
+                            first_chunk = False
+                            self._record_first_chunk(metrics, queued_at)
+                        yield chunk
+                except Exception:
+                    metrics.errors += 1
+                    raise
+                finally:
+                    metrics.in_flight -= 1
+                    aclose = getattr(stream, "aclose", None)
+                    if aclose is not None:
+                        await aclose()
+                    self._record(metrics, timing, started)
+        finally:
+            if not acquired:
+                metrics.queued -= 1
+
+    async def iterate_blocking(
+        self, open_iterator: Callable[[], Iterable[Any]], max_buffer: int = 32
+    ) -> AsyncIterator[Any]:
+        """Consume a blocking iterator on the thread pool as an async iterator
+
+        The worker stops pulling from the SDK once ``max_buffer`` items are
+        waiting, so a slow consumer throttles the producer. Closing the async
+        iterator stops the worker before its next item.
+        """
+        loop = asyncio.get_running_loop()
+        items: asyncio.Queue = asyncio.Queue()
+        slots = threading.Semaphore(max_buffer)
+        stop = threading.Event()
+        finished = object()
+
+        def deliver(item, error=None):
+            try:
+                loop.call_soon_threadsafe(items.put_nowait, (item, error))
+            except RuntimeError:
+                stop.set()  # Loop closed under us
+
+        def produce():
+            error = None
+            try:
+                iterator = open_iterator()
+                try:
+                    for item in iterator:
+                        while not slots.acquire(timeout=0.1):
+                            if stop.is_set():
+                                return
+                        if stop.is_set():
+                            return
+                        deliver(item)
+                finally:
+                    close = getattr(iterator, "close", None)
+                    if close is not None:
+                        close()
+            except Exception as e:
+                error = e
+            if not stop.is_set():
+                deliver(finished, error)
+
+        loop.run_in_executor(self._get_pool(), produce)
+        try:
+            while True:
+                item, error = await items.get()
+                if item is finished:
+                    if error is not None:
+                        raise error
+                    return
+                slots.release()
+                yield item
+        finally:
+            stop.set()
+
+    def iterate_sync(
+        self, stream: AsyncIterator[Any], cancel: Optional[threading.Event] = None
+    ) -> Iterator[Any]:
+        """Iterate an async iterator from synchronous code
+
+        Each item is pulled on the shared background loop only when the
+        caller asks for it. Setting ``cancel`` interrupts the pending pull and
+        closes the stream.
+        """
+        loop = self._ensure_loop()
+        try:
+            while cancel is None or not cancel.is_set():
+                future = asyncio.run_coroutine_threadsafe(
+                    stream.__anext__(), loop  # type: ignore[arg-type]
+                )
+                while True:
+                    try:
+                        item = future.result(None if cancel is None else 0.05)
+                        break
+                    except StopAsyncIteration:
+                        return
+                    except FutureTimeoutError:
+                        if cancel is not None and cancel.is_set():
+                            future.cancel()
+                            return
+                yield item
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                try:
+                    asyncio.run_coroutine_threadsafe(aclose(), loop).result(5)
+                except (RuntimeError, FutureTimeoutError):
+                    pass  # Already closed by the cancelled pull
+
+    async def run_blocking(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking SDK call on the bounded thread pool"""
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+        started = []
+
+        def call():
+            started.append(time.perf_counter())
+            return func(*args, **kwargs)
+
+        try:
+            return await loop.run_in_executor(self._get_pool(), call)
+        finally:
+            # Time spent waiting for a free worker counts as queue time
+            timing = _request_timing.get(None)
+            if timing is not None and started:
+                timing["queue_ms"] += (started[0] - submitted) * 1000
+
+    def run_sync(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the shared background loop and wait for it"""
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._loop_thread:
+            coro.close()  # type: ignore[attr-defined]
+            raise RuntimeError("run_sync cannot be called from the executor loop")
+        future = asyncio.run_coroutine_threadsafe(coro, loop)  # type: ignore[arg-type]
+        return future.result(timeout)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Metrics per provider, keyed by provider name"""
+        return {
+            provider.value: metrics.to_dict()
+            for provider, metrics in self._metrics.items()
+        }
+
+    def shutdown(self):
+        """Stop the background loop and the thread pool"""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout=5)
+            loop.close()
+
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def _semaphore(self, provider: LLMProvider) -> asyncio.Semaphore:
+        # Semaphores bind to the loop they are first used on, so async callers
+        # and the sync background loop each get their own set
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.setdefault(loop, {})
+        semaphore = semaphores.get(provider)
+        if semaphore is None:
+            limit = self.provider_concurrency.get(provider, self.default_concurrency)
+            semaphore = semaphores[provider] = asyncio.Semaphore(limit)
+        return semaphore
+
+    def _record(
+        self, metrics: ProviderMetrics, timing: Dict[str, float], started: float
+    ):
+        latency_ms = (time.perf_counter() - started) * 1000
+        metrics.requests += 1
+        metrics.total_latency_ms += latency_ms
+        metrics.total_queue_ms += timing["queue_ms"]
+        metrics.last_latency_ms = latency_ms
+        metrics.last_queue_ms = timing["queue_ms"]
+        metrics.recent_latency_ms.append(latency_ms)
+
+    def _record_first_chunk(self, metrics: ProviderMetrics, queued_at: float):
+        ttft_ms = (time.perf_counter() - queued_at) * 1000
+        metrics.streams += 1
+        metrics.total_ttft_ms += ttft_ms
+        metrics.last_ttft_ms = ttft_ms
+        metrics.recent_ttft_ms.append(ttft_ms)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="llm-provider"
+                )
+            return self._pool
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="llm-sync-loop", daemon=True
+                )
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+            return self._loop
+
+
+_shared_executor: Optional[ProviderExecutor] = None
+_shared_executor_lock = threading.Lock()
+
+
+def get_shared_executor() -> ProviderExecutor:
+    """Executor used by providers that are not bound to a manager"""
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = ProviderExecutor()
+        return _shared_executor
 
 
 class MultiLLMManager:
     """Manages multiple LLM backends for AetherraCode"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: int = 8,
+        provider_concurrency: Optional[Dict[LLMProvider, int]] = None,
+    ):
         self.providers = {}
         self.current_model = None
         self.model_configs = {}
         self.available_models = {}
+        self.executor = ProviderExecutor(
+            max_workers=max_workers, provider_concurrency=provider_concurrency
+        )
 
         # Initialize supported providers
         self._initialize_providers()
@@ -74,30 +475,43 @@ class MultiLLMManager:
     def _initialize_providers(self):
         """Initialize all supported LLM providers"""
 
+        # Offline provider for tests and development without model access
+        if os.environ.get("AETHERRA_FAKE_LLM"):
+            self.register_provider(
+                LLMProvider.FAKE,
+                FakeLLMProvider(),
+                {
+                    "fake-echo": LLMConfig(
+                        provider=LLMProvider.FAKE, model_name="fake-echo"
+                    )
+                },
+            )
+            logger.info("✅ Fake LLM provider initialized")
+
         # OpenAI Provider
         if importlib.util.find_spec("openai") is not None:
-            self.providers[LLMProvider.OPENAI] = OpenAIProvider()
+            self.register_provider(LLMProvider.OPENAI, OpenAIProvider())
             logger.info("✅ OpenAI provider initialized")
         else:
             logger.warning("⚠️ OpenAI not available (pip install openai)")
 
         # Ollama Provider (for local Mistral, LLaMA, etc.)
         if importlib.util.find_spec("ollama") is not None:
-            self.providers[LLMProvider.OLLAMA] = OllamaProvider()
+            self.register_provider(LLMProvider.OLLAMA, OllamaProvider())
             logger.info("✅ Ollama provider initialized")
         else:
             logger.warning("⚠️ Ollama not available (pip install ollama)")
 
         # llama-cpp-python Provider (for GGUF models)
         if importlib.util.find_spec("llama_cpp") is not None:
-            self.providers[LLMProvider.LLAMACPP] = LlamaCppProvider()
+            self.register_provider(LLMProvider.LLAMACPP, LlamaCppProvider())
             logger.info("✅ LlamaCpp provider initialized")
         else:
             logger.warning("⚠️ LlamaCpp not available (pip install llama-cpp-python)")
 
         # Anthropic Provider
         if importlib.util.find_spec("anthropic") is not None:
-            self.providers[LLMProvider.ANTHROPIC] = AnthropicProvider()
+            self.register_provider(LLMProvider.ANTHROPIC, AnthropicProvider())
             logger.info("✅ Anthropic provider initialized")
         else:
             logger.warning("⚠️ Anthropic not available (pip install anthropic)")
@@ -105,7 +519,7 @@ class MultiLLMManager:
         # Google Gemini Provider
         try:
             if importlib.util.find_spec("google.generativeai") is not None:
-                self.providers[LLMProvider.GEMINI] = GeminiProvider()
+                self.register_provider(LLMProvider.GEMINI, GeminiProvider())
                 logger.info("✅ Gemini provider initialized")
             else:
                 logger.warning(
@@ -132,6 +546,18 @@ class MultiLLMManager:
         # Add default configurations
         self._add_default_configs()
 
+    def register_provider(
+        self,
+        provider_type: LLMProvider,
+        provider: Any,
+        configs: Optional[Dict[str, LLMConfig]] = None,
+    ):
+        """Register a provider instance and any model configs it serves"""
+        if isinstance(provider, BaseLLMProvider):
+            provider.executor = self.executor
+        self.providers[provider_type] = provider
+        self.model_configs.update(configs or {})
+
     def _add_default_configs(self):
         """Add default model configurations"""
 
@@ -144,12 +570,14 @@ class MultiLLMManager:
                         model_name="gpt-4o",
                         context_window=8192,
                         max_tokens=4096,
+                        cost_per_1k_tokens=0.01,
                     ),
                     "gpt-3.5-turbo": LLMConfig(
                         provider=LLMProvider.OPENAI,
                         model_name="gpt-3.5-turbo",
                         context_window=4096,
                         max_tokens=2048,
+                        cost_per_1k_tokens=0.001,
                     ),
                 }
             )
@@ -257,12 +685,14 @@ class MultiLLMManager:
                         model_name="claude-3-opus-20240229",
                         context_window=200000,
                         max_tokens=4096,
+                        cost_per_1k_tokens=0.045,
                     ),
                     "claude-3-sonnet": LLMConfig(
                         provider=LLMProvider.ANTHROPIC,
                         model_name="claude-3-sonnet-20240229",
                         context_window=200000,
                         max_tokens=4096,
+                        cost_per_1k_tokens=0.009,
                     ),
                 }
             )
@@ -276,6 +706,7 @@ class MultiLLMManager:
                         model_name="gemini-pro",
                         context_window=30720,
                         max_tokens=2048,
+                        cost_per_1k_tokens=0.001,
                     )
                 }
             )
@@ -332,18 +763,66 @@ class MultiLLMManager:
         if not self.current_model:
             raise ValueError("No model selected. Use set_model() first.")
 
-        provider = self.providers[self.current_model.provider]
+        config = self.current_model
+        provider = self.providers[config.provider]
 
         try:
-            response = await provider.generate(self.current_model, prompt, **kwargs)
+            response = await self.executor.submit(
+                config.provider,
+                functools.partial(provider.generate, config, prompt, **kwargs),
+            )
             return response
         except Exception as e:
             logger.error(f"❌ Error generating response: {e}")
             raise
 
+    async def stream_response(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Stream the current model's response as text chunks
+
+        Models whose config disables streaming yield the full response as a
+        single chunk. Closing the iterator cancels the provider request.
+        """
+        if not self.current_model:
+            raise ValueError("No model selected. Use set_model() first.")
+
+        config = self.current_model
+        provider = self.providers[config.provider]
+
+        if config.supports_streaming and hasattr(provider, "stream"):
+
+            def open_stream():
+                return provider.stream(config, prompt, **kwargs)
+
+        else:
+
+            async def open_stream():
+                yield await provider.generate(config, prompt, **kwargs)
+
+        try:
+            async for chunk in self.executor.submit_stream(
+                config.provider, open_stream
+            ):
+                yield chunk
+        except Exception as e:
+            logger.error(f"❌ Error streaming response: {e}")
+            raise
+
     def generate_response_sync(self, prompt: str, **kwargs) -> str:
-        """Synchronous wrapper for generate_response"""
-        return asyncio.run(self.generate_response(prompt, **kwargs))
+        """Synchronous wrapper for generate_response
+
+        Runs on the executor's long-lived background loop instead of creating
+        a new event loop per call, so async SDK clients and their connection
+        pools are reused across calls.
+        """
+        return self.executor.run_sync(self.generate_response(prompt, **kwargs))
+
+    def get_provider_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-provider request latency, queue time and concurrency metrics"""
+        return self.executor.get_metrics()
+
+    def close(self):
+        """Shut down the provider thread pool and background loop"""
+        self.executor.shutdown()
 
     def get_current_model_info(self) -> Optional[Dict[str, Any]]:
         """Get information about the current model"""
@@ -375,6 +854,7 @@ class MultiLLMManager:
                 "timeout": config.timeout,
                 "context_window": config.context_window,
                 "supports_streaming": config.supports_streaming,
+                "cost_per_1k_tokens": config.cost_per_1k_tokens,
             }
             configs.append(config_dict)
 
@@ -387,14 +867,60 @@ class MultiLLMManager:
 # Provider Implementations
 
 
-class OpenAIProvider:
+class BaseLLMProvider:
+    """
+    Common execution helpers for provider implementations
+
+    Blocking SDK calls go through ``run_blocking`` so they execute on the
+    executor's thread pool instead of the event loop. Native async clients
+    are created once per event loop because their connection pools are
+    bound to the loop that opened them.
+    """
+
+    executor: Optional[ProviderExecutor] = None
+
+    def __init__(self):
+        self._async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    async def run_blocking(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking call without stalling the event loop"""
+        executor = self.executor or get_shared_executor()
+        return await executor.run_blocking(func, *args, **kwargs)
+
+    def iterate_blocking(
+        self, open_iterator: Callable[[], Iterable[Any]]
+    ) -> AsyncIterator[Any]:
+        """Consume a blocking SDK stream without stalling the event loop"""
+        executor = self.executor or get_shared_executor()
+        return executor.iterate_blocking(open_iterator)
+
+    async def stream(
+        self, config: LLMConfig, prompt: str, **kwargs
+    ) -> AsyncIterator[str]:
+        """Yield the response in chunks; the default yields it whole"""
+        yield await self.generate(config, prompt, **kwargs)  # type: ignore
+
+    def async_client(self, factory: Optional[Callable[[], Any]]) -> Any:
+        """Native async client for the running loop, or None if unsupported"""
+        if factory is None:
+            return None
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = factory()
+        return client
+
+
+class OpenAIProvider(BaseLLMProvider):
     """OpenAI API provider"""
 
     def __init__(self):
+        super().__init__()
         try:
             import openai
 
             self.client = openai.OpenAI()
+            self.async_client_class = getattr(openai, "AsyncOpenAI", None)
         except ImportError as e:
             raise ImportError("OpenAI package not installed") from e
 
@@ -409,26 +935,61 @@ class OpenAIProvider:
     async def generate(self, config: LLMConfig, prompt: str, **kwargs) -> str:
         """Generate response using OpenAI"""
         try:
-            response = self.client.chat.completions.create(
-                model=config.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=kwargs.get("temperature", config.temperature),
-                max_tokens=kwargs.get("max_tokens", config.max_tokens),
-                timeout=config.timeout,
-            )
+            request = {
+                "model": config.model_name,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": kwargs.get("temperature", config.temperature),
+                "max_tokens": kwargs.get("max_tokens", config.max_tokens),
+                "timeout": config.timeout,
+            }
+            client = self.async_client(self.async_client_class)
+            if client is not None:
+                response = await client.chat.completions.create(**request)
+            else:
+                response = await self.run_blocking(
+                    self.client.chat.completions.create, **request
+                )
             return response.choices[0].message.content or ""
         except Exception as e:
             raise Exception(f"OpenAI API error: {e}") from e
 
+    async def stream(
+        self, config: LLMConfig, prompt: str, **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream response deltas from OpenAI"""
+        request = {
+            "model": config.model_name,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": kwargs.get("temperature", config.temperature),
+            "max_tokens": kwargs.get("max_tokens", config.max_tokens),
+            "timeout": config.timeout,
+            "stream": True,
+        }
+        try:
+            client = self.async_client(self.async_client_class)
+            if client is not None:
+                chunks = await client.chat.completions.create(**request)
+            else:
+                chunks = self.iterate_blocking(
+                    lambda: self.client.chat.completions.create(**request)
+                )
+            async for chunk in chunks:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {e}") from e
+
 
-class OllamaProvider:
+class OllamaProvider(BaseLLMProvider):
     """Ollama local model provider"""
 
     def __init__(self):
+        super().__init__()
         try:
             import ollama
 
             self.client = ollama.Client()
+            self.async_client_class = getattr(ollama, "AsyncClient", None)
         except ImportError as e:
             raise ImportError("Ollama package not installed") from e
 
@@ -458,23 +1019,63 @@ class OllamaProvider:
     async def generate(self, config: LLMConfig, prompt: str, **kwargs) -> str:
         """Generate response using Ollama"""
         try:
-            response = self.client.chat(
-                model=config.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                options={
+            request = {
+                "model": config.model_name,
+                "messages": [{"role": "user", "content": prompt}],
+                "options": {
                     "temperature": kwargs.get("temperature", config.temperature),
                     "num_predict": kwargs.get("max_tokens", config.max_tokens),
                 },
-            )
+            }
+            client = self.async_client(self.async_client_class)
+            if client is not None:
+                response = await client.chat(**request)
+            else:
+                response = await self.run_blocking(self.client.chat, **request)
             return response["message"]["content"]
         except Exception as e:
             raise Exception(f"Ollama error: {e}") from e
 
+    async def stream(
+        self, config: LLMConfig, prompt: str, **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream response parts from Ollama"""
+        request = {
+            "model": config.model_name,
+            "messages": [{"role": "user", "content": prompt}],
+            "options": {
+                "temperature": kwargs.get("temperature", config.temperature),
+                "num_predict": kwargs.get("max_tokens", config.max_tokens),
+            },
+            "stream": True,
+        }
+        try:
+            client = self.async_client(self.async_client_class)
+            if client is not None:
+                parts = await client.chat(**request)
+            else:
+                parts = self.iterate_blocking(lambda: self.client.chat(**request))
+            async for part in parts:
+                content = part["message"]["content"]
+                if content:
+                    yield content
+        except Exception as e:
+            raise Exception(f"Ollama error: {e}") from e
+
 
-class LlamaCppProvider:
+class LlamaCppProvider(BaseLLMProvider):
     """llama-cpp-python provider for GGUF models"""
 
+    # Loaded models keyed by (model_path, n_ctx), shared by every instance in
+    # the process; loading a GGUF file takes seconds, so it happens once
+    # rather than on every request. A Llama object is not thread-safe, so
+    # each has a lock held for the whole completion, streams included.
+    _models: Dict[Tuple[str, int], Any] = {}
+    _model_locks: Dict[Tuple[str, int], threading.Lock] = {}
+    _models_lock = threading.Lock()
+
     def __init__(self):
+        super().__init__()
         try:
             from llama_cpp import Llama
 
@@ -488,23 +1089,50 @@ class LlamaCppProvider:
             return os.path.exists(config.model_path)
         return False
 
-    async def generate(self, config: LLMConfig, prompt: str, **kwargs) -> str:
-        """Generate response using llama-cpp-python"""
-        try:
-            if not config.model_path:
-                raise ValueError("Model path is required for LlamaCpp provider")
+    def _get_model(self, config: LLMConfig) -> Tuple[Any, threading.Lock]:
+        key = (config.model_path, config.context_window)
+        with self._models_lock:
+            model = self._models.get(key)
+            if model is None:
+                model = self._models[key] = self.Llama(
+                    model_path=config.model_path,
+                    n_ctx=config.context_window,
+                    verbose=False,
+                )
+                self._model_locks[key] = threading.Lock()
+            return model, self._model_locks[key]
 
-            llm = self.Llama(
-                model_path=config.model_path, n_ctx=config.context_window, verbose=False
-            )
+    def _complete(self, config: LLMConfig, prompt: str, stream=False, **kwargs):
+        llm, lock = self._get_model(config)
 
-            response = llm(
+        def call():
+            return llm(
                 prompt,
                 max_tokens=kwargs.get("max_tokens", config.max_tokens),
                 temperature=kwargs.get("temperature", config.temperature),
                 stop=["</s>", "\n\n"],
+                stream=stream,
             )
 
+        if stream:
+            return self._locked_stream(lock, call)
+        with lock:
+            return call()
+
+    @staticmethod
+    def _locked_stream(lock: threading.Lock, open_stream: Callable[[], Iterable]):
+        """Hold the model's lock until the stream is exhausted or closed"""
+        with lock:
+            yield from open_stream()
+
+    async def generate(self, config: LLMConfig, prompt: str, **kwargs) -> str:
+        """Generate response using llama-cpp-python"""
+        try:
+            if not config.model_path:
+                raise ValueError("Model path is required for LlamaCpp provider")
+
+            response = await self.run_blocking(self._complete, config, prompt, **kwargs)
+
             # llama-cpp-python returns a dict, not an iterator
             if isinstance(response, dict):
                 return response["choices"][0]["text"]
@@ -514,15 +1142,34 @@ class LlamaCppProvider:
         except Exception as e:
             raise Exception(f"LlamaCpp error: {e}") from e
 
+    async def stream(
+        self, config: LLMConfig, prompt: str, **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream completion text from llama-cpp-python"""
+        if not config.model_path:
+            raise ValueError("Model path is required for LlamaCpp provider")
+        try:
+            chunks = self.iterate_blocking(
+                lambda: self._complete(config, prompt, stream=True, **kwargs)
+            )
+            async for chunk in chunks:
+                text = chunk["choices"][0]["text"]
+                if text:
+                    yield text
+        except Exception as e:
+            raise Exception(f"LlamaCpp error: {e}") from e
 
-class AnthropicProvider:
+
+class AnthropicProvider(BaseLLMProvider):
     """Anthropic Claude provider"""
 
     def __init__(self):
+        super().__init__()
         try:
             import anthropic
 
             self.client = anthropic.Anthropic()
+            self.async_client_class = getattr(anthropic, "AsyncAnthropic", None)
         except ImportError as e:
             raise ImportError("Anthropic package not installed") from e
 
@@ -533,12 +1180,19 @@ class AnthropicProvider:
     async def generate(self, config: LLMConfig, prompt: str, **kwargs) -> str:
         """Generate response using Anthropic"""
         try:
-            message = self.client.messages.create(
-                model=config.model_name,
-                max_tokens=kwargs.get("max_tokens", config.max_tokens),
-                temperature=kwargs.get("temperature", config.temperature),
-                messages=[{"role": "user", "content": prompt}],
-            )
+            request = {
+                "model": config.model_name,
+                "max_tokens": kwargs.get("max_tokens", config.max_tokens),
+                "temperature": kwargs.get("temperature", config.temperature),
+                "messages": [{"role": "user", "content": prompt}],
+            }
+            client = self.async_client(self.async_client_class)
+            if client is not None:
+                message = await client.messages.create(**request)
+            else:
+                message = await self.run_blocking(
+                    self.client.messages.create, **request
+                )
             # Safely extract text content from Anthropic response
             if message.content and len(message.content) > 0:
                 content_block = message.content[0]
@@ -548,11 +1202,39 @@ class AnthropicProvider:
         except Exception as e:
             raise Exception(f"Anthropic error: {e}") from e
 
+    async def stream(
+        self, config: LLMConfig, prompt: str, **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream text deltas from Anthropic"""
+        request = {
+            "model": config.model_name,
+            "max_tokens": kwargs.get("max_tokens", config.max_tokens),
+            "temperature": kwargs.get("temperature", config.temperature),
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        try:
+            client = self.async_client(self.async_client_class)
+            if client is not None:
+                async with client.messages.stream(**request) as message_stream:
+                    async for text in message_stream.text_stream:
+                        yield text
+            else:
+
+                def text_stream():
+                    with self.client.messages.stream(**request) as message_stream:
+                        yield from message_stream.text_stream
+
+                async for text in self.iterate_blocking(text_stream):
+                    yield text
+        except Exception as e:
+            raise Exception(f"Anthropic error: {e}") from e
+
 
-class GeminiProvider:
+class GeminiProvider(BaseLLMProvider):
     """Google Gemini provider"""
 
     def __init__(self):
+        super().__init__()
         try:
             import google.generativeai as genai  # type: ignore
 
@@ -587,14 +1269,84 @@ class GeminiProvider:
                         max_output_tokens=kwargs.get("max_tokens", config.max_tokens),
                     )
 
-            response = genai_model.generate_content(
-                prompt, generation_config=generation_config
-            )
+            generate_async = getattr(genai_model, "generate_content_async", None)
+            if generate_async is not None:
+                response = await generate_async(
+                    prompt, generation_config=generation_config
+                )
+            else:
+                response = await self.run_blocking(
+                    genai_model.generate_content,
+                    prompt,
+                    generation_config=generation_config,
+                )
             return response.text or "No response generated"
         except Exception as e:
             raise Exception(f"Gemini error: {e}") from e
 
 
+class FakeLLMProvider(BaseLLMProvider):
+    """
+    Deterministic offline provider for tests and local development
+
+    Returns the scripted response for a prompt when one is configured and
+    otherwise echoes the last user line. Every prompt is recorded in
+    ``calls``.
+    """
+
+    def __init__(
+        self,
+        responses: Optional[Dict[str, str]] = None,
+        latency=0.0,
+        chunk_delay=0.0,
+    ):
+        super().__init__()
+        self.responses = dict(responses or {})
+        self.latency = latency
+        self.chunk_delay = chunk_delay
+        self.calls = []
+        self.streams_closed = 0
+
+    def is_model_available(self, config: LLMConfig) -> bool:
+        return True
+
+    async def generate(self, config: LLMConfig, prompt: str, **kwargs) -> str:
+        """Return a canned or echoed response"""
+        self.calls.append(prompt)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._response_for(config, prompt)
+
+    async def stream(
+        self, config: LLMConfig, prompt: str, **kwargs
+    ) -> AsyncIterator[str]:
+        """Yield the same response word by word"""
+        self.calls.append(prompt)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            words = self._response_for(config, prompt).split(" ")
+            for i, word in enumerate(words):
+                if i and self.chunk_delay:
+                    await asyncio.sleep(self.chunk_delay)
+                yield word if i == 0 else " " + word
+        finally:
+            self.streams_closed += 1
+
+    def _response_for(self, config: LLMConfig, prompt: str) -> str:
+        if prompt in self.responses:
+            return self.responses[prompt]
+        return f"Echo from {config.model_name}: {self._last_user_line(prompt)}"
+
+    @staticmethod
+    def _last_user_line(prompt: str) -> str:
+        lines = [line.strip() for line in prompt.strip().splitlines() if line.strip()]
+        for line in reversed(lines):
+            if line.startswith("USER:"):
+                return line[len("USER:") :].strip()
+        return lines[-1] if lines else ""
+
+
 # Global instance for AetherraCode integration
 # Only create global instance if running as main module
 if __name__ == "__main__":
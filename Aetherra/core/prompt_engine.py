@@ -1,9 +1,11 @@
 import json
 import logging
 import random
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import psutil
 
@@ -12,63 +14,182 @@ logger = logging.getLogger(__name__)
 
 # Local memory storage setup
 MEMORY_FILE = Path(__file__).parent / "lyrixa_memory.json"
+MAX_MEMORIES = 1000
+
+
+def _matches(memory: Dict, query_dict: Dict) -> bool:
+    """Check a memory against a recall query"""
+    for key, value in query_dict.items():
+        if key == "type" and memory.get("type") != value:
+            return False
+        elif key == "user_id" and memory.get("user_id") != value:
+            return False
+        elif key == "timestamp_gte" and memory.get("timestamp", 0) < value:
+            return False
+        elif key == "timestamp_lte" and memory.get("timestamp", 0) > value:
+            return False
+    return True
+
+
+class JsonMemoryStore:
+    """
+    In-memory view of the JSON memory file with a write-through append log
+
+    The snapshot file is parsed once. New memories are appended to the
+    in-memory list and to ``<file>.log`` (one JSON object per line), which is
+    replayed on load and folded back into the snapshot once it reaches
+    ``compact_every`` lines. The store is trimmed to ``max_memories`` only
+    during compaction, so it may briefly hold up to ``compact_every`` extra
+    memories rather than rewriting the snapshot on every append. ``version`` increases on every change so callers
+    can cache anything derived from the store.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_memories: int = MAX_MEMORIES,
+        compact_every: int = 200,
+    ):
+        self.path = Path(path)
+        self.log_path = self.path.with_suffix(".log")
+        self.max_memories = max_memories
+        self.compact_every = compact_every
+        self.version = 0
+
+        self._memories: List[Dict] = []
+        self._newest_first: Optional[List[Dict]] = None
+        self._log_lines = 0
+        self._loaded_stat: Optional[Tuple[float, int]] = None
+        self._lock = threading.RLock()
+
+    def all(self) -> List[Dict]:
+        """Copy of every memory, oldest first"""
+        with self._lock:
+            self._ensure_loaded()
+            return [dict(memory) for memory in self._memories]
+
+    def query(self, query_dict: Dict, limit: Optional[int] = None) -> List[Dict]:
+        """Memories matching ``query_dict``, newest first"""
+        with self._lock:
+            self._ensure_loaded()
+            if self._newest_first is None:
+                self._newest_first = sorted(
+                    self._memories, key=lambda x: x.get("timestamp", 0), reverse=True
+                )
+            ordered = self._newest_first
+        results = []
+        for memory in ordered:
+            if _matches(memory, query_dict):
+                results.append(dict(memory))
+                if limit and len(results) >= limit:
+                    break
+        return results
+
+    def append(self, memory: Dict):
+        """Add a memory and write it through to the append log"""
+        with self._lock:
+            self._ensure_loaded()
+            self._memories.append(memory)
+            self._newest_first = None
+            self.version += 1
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(memory, ensure_ascii=False) + "\n")
+                self._log_lines += 1
+            except Exception as e:
+                logger.warning(f"Could not append to memory log: {e}")
+
+            if (
+                self._log_lines >= self.compact_every
+                or len(self._memories) > self.max_memories + self.compact_every
+            ):
+                self.compact()
+
+    def replace(self, memories: List[Dict]):
+        """Replace every memory and rewrite the snapshot"""
+        with self._lock:
+            self._memories = list(memories)
+            self._newest_first = None
+            self._loaded_stat = self._stat()
+            self.version += 1
+            self.compact()
+
+    def compact(self):
+        """Fold the append log into the snapshot file, trimming to capacity"""
+        with self._lock:
+            if len(self._memories) > self.max_memories:
+                self._memories = self._memories[-self.max_memories :]
+                self._newest_first = None
+            try:
+                tmp_path = self.path.with_suffix(".json.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._memories, f, indent=2, ensure_ascii=False)
+                tmp_path.replace(self.path)
+                if self.log_path.exists():
+                    self.log_path.unlink()
+                self._log_lines = 0
+                self._loaded_stat = self._stat()
+            except Exception as e:
+                logger.warning(f"Could not save memory file: {e}")
+
+    def _stat(self) -> Optional[Tuple[float, int]]:
+        try:
+            stat = self.path.stat()
+            return stat.st_mtime, stat.st_size
+        except OSError:
+            return None
+
+    def _ensure_loaded(self):
+        """Load once; reload only if the snapshot was replaced externally"""
+        stat = self._stat()
+        if self._loaded_stat is not None and stat == self._loaded_stat:
+            return
+        if self._loaded_stat is None and stat is None and self.version:
+            return
+
+        memories: List[Dict] = []
+        try:
+            if self.path.exists():
+                with open(self.path, "r", encoding="utf-8") as f:
+                    memories = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load memory file: {e}")
+
+        log_lines = 0
+        try:
+            if self.log_path.exists():
+                with open(self.log_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            memories.append(json.loads(line))
+                            log_lines += 1
+        except Exception as e:
+            logger.warning(f"Could not replay memory log: {e}")
+
+        self._memories = memories
+        self._newest_first = None
+        self._log_lines = log_lines
+        self._loaded_stat = stat
+        self.version += 1
+
+
+_memory_store = JsonMemoryStore(MEMORY_FILE)
 
 
 def _load_memory() -> List[Dict]:
     """Load memory from JSON file"""
-    try:
-        if MEMORY_FILE.exists():
-            with open(MEMORY_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-    except Exception as e:
-        logger.warning(f"Could not load memory file: {e}")
-    return []
+    return _memory_store.all()
 
 
 def _save_memory(memories: List[Dict]):
     """Save memory to JSON file"""
-    try:
-        with open(MEMORY_FILE, "w", encoding="utf-8") as f:
-            json.dump(memories, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        logger.warning(f"Could not save memory file: {e}")
+    _memory_store.replace(memories)
 
 
 def recall(query_dict, limit=None) -> List[Dict]:
     """Enhanced memory recall function with filtering"""
-    memories = _load_memory()
-
-    # Filter memories based on query
-    filtered = []
-    for memory in memories:
-        match = True
-
-        # Check each query parameter
-        for key, value in query_dict.items():
-            if key == "type" and memory.get("type") != value:
-                match = False
-                break
-            elif key == "user_id" and memory.get("user_id") != value:
-                match = False
-                break
-            elif key == "timestamp_gte" and memory.get("timestamp", 0) < value:
-                match = False
-                break
-            elif key == "timestamp_lte" and memory.get("timestamp", 0) > value:
-                match = False
-                break
-
-        if match:
-            filtered.append(memory)
-
-    # Sort by timestamp (newest first)
-    filtered.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
-
-    # Apply limit
-    if limit:
-        filtered = filtered[:limit]
-
-    return filtered
+    return _memory_store.query(query_dict, limit)
 
 
 def search_memory_one(query_dict) -> Optional[Dict]:
@@ -79,39 +200,97 @@ def search_memory_one(query_dict) -> Optional[Dict]:
 
 def store_memory(memory_data: Dict):
     """Store a memory entry"""
-    memories = _load_memory()
-
     # Add timestamp if not present
     if "timestamp" not in memory_data:
         memory_data["timestamp"] = datetime.now().timestamp()
 
-    memories.append(memory_data)
+    _memory_store.append(memory_data)
+
+
+class SystemMetricsSampler:
+    """
+    Background sampler publishing a cached system metrics snapshot
+
+    psutil is queried on a daemon thread every ``interval`` seconds, so
+    readers never block on ``cpu_percent`` or process enumeration. CPU usage
+    is measured between consecutive samples rather than over a blocking
+    0.1 s window.
+    """
+
+    def __init__(self, interval: float = 5.0):
+        self.interval = interval
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.samples = 0
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Latest metrics; the first call samples inline and starts the thread"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    psutil.cpu_percent(interval=None)  # Prime the CPU counter
+                    self._snapshot = self._sample()
+                    self._start()
+                snapshot = self._snapshot
+        return snapshot
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="system-metrics-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self._snapshot = self._sample()
+            except Exception as e:
+                logger.warning(f"Could not sample system metrics: {e}")
+
+    def _sample(self) -> Dict[str, Any]:
+        self.samples += 1
+        return {
+            "memory_percent": psutil.virtual_memory().percent,
+            "cpu_percent": psutil.cpu_percent(interval=None),
+            "process_count": len(psutil.pids()),
+            # Sometimes report the conversational agent; drawn per sample so
+            # the prompt stays stable between samples
+            "conversation_active": random.random() > 0.7,
+            "sampled_at": time.time(),
+        }
 
-    # Keep only last 1000 memories to prevent file from growing too large
-    if len(memories) > 1000:
-        memories = memories[-1000:]
 
-    _save_memory(memories)
+_system_sampler = SystemMetricsSampler()
 
 
 def get_system_status() -> Dict[str, Any]:
     """Enhanced system status function with real data"""
     try:
-        # Get actual system metrics
-        memory_percent = psutil.virtual_memory().percent
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        # Get actual system metrics from the background sampler
+        snapshot = _system_sampler.get_snapshot()
+        memory_percent = snapshot["memory_percent"]
+        cpu_percent = snapshot["cpu_percent"]
 
         # Count running processes (simulate plugins)
-        process_count = len(psutil.pids())
+        process_count = snapshot["process_count"]
         plugin_count = min(max(process_count // 20, 1), 15)  # Simulate 1-15 plugins
-
         # Simulate active agents based on CPU usage
         active_agents = []
         if cpu_percent > 20:
             active_agents.append("system_monitor")
         if memory_percent > 70:
             active_agents.append("memory_optimizer")
-        if random.random() > 0.7:  # Sometimes add conversational agent
+        if snapshot.get("conversation_active"):
             active_agents.append("conversation_handler")
 
         # Simulate recent errors based on system load
@@ -199,6 +378,50 @@ except ImportError:
 _initialize_sample_memories()
 
 
+class PromptFragmentCache:
+    """Prompt sections memoized on the inputs they are built from"""
+
+    def __init__(self):
+        self._fragments: Dict[str, Tuple[Any, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name: str, inputs: Any, build: Callable[[], Any]) -> Any:
+        """Return the cached section unless ``inputs`` changed"""
+        cached = self._fragments.get(name)
+        if cached is not None and cached[0] == inputs:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        text = build()
+        self._fragments[name] = (inputs, text)
+        return text
+
+    def clear(self):
+        self._fragments.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "fragments": len(self._fragments),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+_prompt_fragments = PromptFragmentCache()
+
+
+def _memory_inputs(user_id: str) -> Tuple[int, str, int]:
+    """Cache inputs for memory-derived sections
+
+    Recall windows are relative to now, so sections are also refreshed once
+    a minute even when no memory was written.
+    """
+    return _memory_store.version, user_id, int(time.time() // 60)
+
+
 def build_dynamic_prompt(user_id: str = "default_user") -> str:
     """Build a dynamic, contextual, and human-like prompt for Lyrixa"""
 
@@ -236,18 +459,65 @@ Your Plugin Editor is a native PySide6 tab with the following ACTUAL features:
     active_agents = system_summary.get("active_agents", [])
     memory_load = system_summary.get("memory_usage", 0)
 
-    system_context = f"""
+    system_context = _prompt_fragments.get(
+        "system_context",
+        (plugin_count, tuple(active_agents), memory_load),
+        lambda: f"""
 [TOOL] CURRENT SYSTEM STATE:
 - Running {plugin_count} plugins
 - Active agents: {", ".join(active_agents) if active_agents else "None"}
 - Memory usage: {memory_load}%
 - System health: {"Optimal" if memory_load < 80 else "High load" if memory_load < 95 else "Critical"}
-"""
+""",
+    )
 
     # 🎭 3. Contextual Personality Layer (NEW!)
     personality_layer = get_contextual_personality_layer(user_id, system_summary)
 
     # 🔍 4. User Preferences and Learning
+    user_context = _prompt_fragments.get(
+        "user_context",
+        (_memory_store.version, user_id),
+        lambda: _build_user_context(user_id),
+    )
+
+    # 🧠 5. Memory and Reflection Integration
+    reflection_summary, memory_context = _prompt_fragments.get(
+        "memory_context",
+        _memory_inputs(user_id),
+        lambda: _build_memory_context(user_id),
+    )
+
+    # 🕒 6. Temporal and Emotional Context
+    time_context = LyrixaTimeAwareness.get_time_context()
+    current_time = datetime.now()
+
+    temporal_context = _prompt_fragments.get(
+        "temporal_context",
+        (tuple(time_context.items()), current_time.date()),
+        lambda: f"""
+⏰ TIME & CONTEXT:
+- Current time: {time_context["current_time"]} on {time_context["day"]}
+- Time mood: {time_context["time_mood"]}
+- Weekend mode: {"Active" if time_context["weekend_modifier"] == "relaxed" else "Inactive"}
+- Date: {current_time.strftime("%B %d, %Y")}
+""",
+    )
+
+    # 🧬 7. Final Integrated Prompt
+    return _assemble_prompt(
+        core_personality,
+        plugin_editor_context,
+        system_context,
+        personality_layer,
+        user_context,
+        temporal_context,
+        reflection_summary,
+        memory_context,
+    )
+
+
+def _build_user_context(user_id: str) -> str:
     try:
         user_profile = (
             search_memory_one({"type": "user_profile", "user_id": user_id}) or {}
@@ -260,14 +530,16 @@ Your Plugin Editor is a native PySide6 tab with the following ACTUAL features:
     communication_style = user_profile.get("communication_style", "adaptive")
     interests = user_profile.get("interests", [])
 
-    user_context = f"""
+    return f"""
 👤 USER PROFILE:
 - Preferred tone: {preferred_tone}
 - Communication style: {communication_style}
 - Known interests: {", ".join(interests) if interests else "Discovering..."}
 """
 
-    # 🧠 5. Memory and Reflection Integration
+
+def _build_memory_context(user_id: str) -> Tuple[str, str]:
+    """Return (reflection summary, recent memory context)"""
     try:
         recent_reflection = recall(
             {"type": "reflection", "timestamp_gte": datetime.now().timestamp() - 86400},
@@ -301,19 +573,19 @@ Your Plugin Editor is a native PySide6 tab with the following ACTUAL features:
         reflection_summary = "System running smoothly."
         memory_context = ""
 
-    # 🕒 6. Temporal and Emotional Context
-    time_context = LyrixaTimeAwareness.get_time_context()
-    current_time = datetime.now()
+    return reflection_summary, memory_context
 
-    temporal_context = f"""
-⏰ TIME & CONTEXT:
-- Current time: {time_context["current_time"]} on {time_context["day"]}
-- Time mood: {time_context["time_mood"]}
-- Weekend mode: {"Active" if time_context["weekend_modifier"] == "relaxed" else "Inactive"}
-- Date: {current_time.strftime("%B %d, %Y")}
-"""
 
-    # 🧬 7. Final Integrated Prompt
+def _assemble_prompt(
+    core_personality: str,
+    plugin_editor_context: str,
+    system_context: str,
+    personality_layer: str,
+    user_context: str,
+    temporal_context: str,
+    reflection_summary: str,
+    memory_context: str,
+) -> str:
     prompt = f"""
 {core_personality}
 
@@ -538,28 +810,48 @@ def get_contextual_personality_layer(
     time_context = time_awareness.get_time_context()
 
     # Get recent user interactions for learning
-    try:
-        recent_interactions = (
-            recall(
-                {
-                    "type": "user_interaction",
-                    "user_id": user_id,
-                    "timestamp_gte": datetime.now().timestamp()
-                    - 7 * 86400,  # Last 7 days
-                },
-                limit=10,
+    def analyze_user_style() -> Dict[str, Any]:
+        try:
+            recent_interactions = (
+                recall(
+                    {
+                        "type": "user_interaction",
+                        "user_id": user_id,
+                        "timestamp_gte": datetime.now().timestamp()
+                        - 7 * 86400,  # Last 7 days
+                    },
+                    limit=10,
+                )
+                or []
             )
-            or []
-        )
 
-        user_style = learning_engine.analyze_user_interaction_style(
-            user_id, recent_interactions
-        )
-    except Exception as e:
-        logger.warning(f"Could not retrieve user interactions: {e}")
-        user_style = {"style": "standard", "complexity": "medium", "humor": "subtle"}
+            return learning_engine.analyze_user_interaction_style(
+                user_id, recent_interactions
+            )
+        except Exception as e:
+            logger.warning(f"Could not retrieve user interactions: {e}")
+            return {"style": "standard", "complexity": "medium", "humor": "subtle"}
+
+    user_style = _prompt_fragments.get(
+        "user_style", _memory_inputs(user_id), analyze_user_style
+    )
 
     # Build contextual personality
+    return _prompt_fragments.get(
+        "personality_layer",
+        (current_mood, tuple(time_context.items()), tuple(user_style.items())),
+        lambda: _format_personality_layer(
+            current_mood, mood_modifiers, time_context, user_style
+        ),
+    )
+
+
+def _format_personality_layer(
+    current_mood: str,
+    mood_modifiers: Dict[str, str],
+    time_context: Dict[str, str],
+    user_style: Dict[str, Any],
+) -> str:
     personality_layer = f"""
 CONTEXTUAL PERSONALITY LAYER:
 
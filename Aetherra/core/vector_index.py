@@ -0,0 +1,190 @@
+"""
+Aetherra Vector Index
+Contiguous float32 vector store with vectorized top-k search for semantic memory.
+"""
+
+import json
+import logging
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EmbeddingFunction = Callable[[str], Sequence[float]]
+
+
+def hash_embedding(text: str, dimensions: int = 100) -> np.ndarray:
+    """
+    Offline bag-of-words embedding using stable word hashing
+
+    Each word increments one of ``dimensions`` buckets and the result is
+    normalized to sum to one. CRC32 is used instead of ``hash()`` so vectors
+    stay comparable across processes and can be saved to disk.
+    """
+    embedding = np.zeros(dimensions, dtype=np.float32)
+    words = text.lower().split()
+    for word in words:
+        embedding[zlib.crc32(word.encode("utf-8")) % dimensions] += 1.0
+
+    total = embedding.sum()
+    if total > 0:
+        embedding /= total
+    return embedding
+
+
+class VectorIndex:
+    """
+    Dense vector index backed by a single float32 matrix
+
+    Rows are stored L2-normalized so cosine similarity is a single matrix
+    product. Deletes leave tombstones that are compacted once they make up
+    ``compact_ratio`` of the rows. Indexes can be saved and re-opened as
+    memory-mapped ``.npy`` files.
+    """
+
+    def __init__(
+        self,
+        dimensions: int = 100,
+        initial_capacity: int = 1024,
+        compact_ratio: float = 0.25,
+    ):
+        self.dimensions = dimensions
+        self.compact_ratio = compact_ratio
+        self._matrix = np.zeros((initial_capacity, dimensions), dtype=np.float32)
+        self._alive = np.zeros(initial_capacity, dtype=bool)
+        self._row_ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._tombstones = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, entry_id: object) -> bool:
+        return entry_id in self._rows
+
+    def add(self, entry_id: str, vector: Sequence[float]):
+        """Insert or replace the vector for ``entry_id``"""
+        normalized = self._normalize(vector)
+
+        row = self._rows.get(entry_id)
+        if row is None:
+            row = len(self._row_ids)
+            if row >= self._matrix.shape[0]:
+                self._grow(row + 1)
+            self._row_ids.append(entry_id)
+            self._rows[entry_id] = row
+
+        self._matrix[row] = normalized
+        self._alive[row] = True
+
+    def remove(self, entry_id: str) -> bool:
+        """Tombstone the vector for ``entry_id``"""
+        row = self._rows.pop(entry_id, None)
+        if row is None:
+            return False
+
+        self._alive[row] = False
+        self._row_ids[row] = None
+        self._tombstones += 1
+
+        if self._tombstones > self.compact_ratio * len(self._row_ids):
+            self.compact()
+        return True
+
+    def search(
+        self, query: Sequence[float], top_k: int = 10
+    ) -> List[Tuple[str, float]]:
+        """Return up to ``top_k`` (entry_id, cosine similarity) pairs"""
+        used = len(self._row_ids)
+        if used == 0 or top_k <= 0 or not self._rows:
+            return []
+
+        scores = self._matrix[:used] @ self._normalize(query)
+        if self._tombstones:
+            scores[~self._alive[:used]] = -np.inf
+
+        k = min(top_k, len(self._rows))
+        if k < used:
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(used)
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        return [
+            (self._row_ids[row], float(scores[row]))
+            for row in ranked
+            if self._alive[row]
+        ]
+
+    def compact(self):
+        """Drop tombstoned rows so the matrix is dense again"""
+        used = len(self._row_ids)
+        keep = np.flatnonzero(self._alive[:used])
+        capacity = max(len(keep), 1)
+
+        matrix = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        matrix[: len(keep)] = self._matrix[keep]
+        self._matrix = matrix
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._alive[: len(keep)] = True
+        self._row_ids = [self._row_ids[row] for row in keep]
+        self._rows = {entry_id: row for row, entry_id in enumerate(self._row_ids)}
+        self._tombstones = 0
+
+    def save(self, path: Union[str, Path]):
+        """Write vectors to ``<path>.npy`` (memory-mappable) and ids to ``<path>.json``"""
+        if self._tombstones:
+            self.compact()
+
+        path = Path(path)
+        used = len(self._row_ids)
+        vectors = np.lib.format.open_memmap(
+            str(path.with_suffix(".npy")),
+            mode="w+",
+            dtype=np.float32,
+            shape=(used, self.dimensions),
+        )
+        vectors[:] = self._matrix[:used]
+        vectors.flush()
+        del vectors
+
+        with open(path.with_suffix(".json"), "w", encoding="utf-8") as f:
+            json.dump({"dimensions": self.dimensions, "ids": self._row_ids}, f)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], **kwargs) -> "VectorIndex":
+        """Open a saved index; vectors stay memory-mapped until the index grows"""
+        path = Path(path)
+        with open(path.with_suffix(".json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        index = cls(dimensions=meta["dimensions"], initial_capacity=1, **kwargs)
+        # Copy-on-write mapping: searches read straight from the file and
+        # in-place updates never touch it
+        index._matrix = np.load(str(path.with_suffix(".npy")), mmap_mode="c")
+        index._alive = np.ones(len(meta["ids"]), dtype=bool)
+        index._row_ids = list(meta["ids"])
+        index._rows = {entry_id: row for row, entry_id in enumerate(index._row_ids)}
+        return index
+
+    def _grow(self, minimum: int):
+        capacity = max(minimum, self._matrix.shape[0] * 2, 1)
+        matrix = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        used = len(self._row_ids)
+        matrix[:used] = self._matrix[:used]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:used] = self._alive[:used]
+        self._matrix = matrix
+        self._alive = alive
+
+    def _normalize(self, vector: Sequence[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32).reshape(-1)
+        if array.shape[0] != self.dimensions:
+            raise ValueError(
+                f"Expected {self.dimensions}-dimensional vector, got {array.shape[0]}"
+            )
+        norm = float(np.linalg.norm(array))
+        return array / norm if norm > 0 else array
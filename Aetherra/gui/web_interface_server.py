@@ -9,6 +9,8 @@ import random
 import sqlite3
 import sys
 import threading
+import time
+import uuid
 import webbrowser
 from contextlib import redirect_stderr, redirect_stdout
 from datetime import datetime, timedelta
@@ -272,6 +274,8 @@ class AetherraWebServer:
 
         # Track connected clients
         self.connected_clients = set()
+        # Cancellation flags for in-progress streamed replies, keyed by session
+        self.active_streams = {}
 
         # Initialize Lyrixa components
         self._initialize_lyrixa_components()
@@ -1567,6 +1571,7 @@ class AetherraWebServer:
         def handle_disconnect():
             session_id = request.sid if hasattr(request, "sid") else "unknown"
             self.connected_clients.discard(session_id)
+            self._cancel_stream(session_id)
             logger.info(
                 f"🔗 SocketIO: Client {session_id} disconnected. Total clients: {len(self.connected_clients)}"
             )
@@ -1581,7 +1586,18 @@ class AetherraWebServer:
                 logger.info(f"📨 Received message from {session_id}: {message}")
 
                 # Use conversation manager if available, otherwise mock response
-                if self.conversation_manager:
+                stream_info = {}
+                if self.conversation_manager and hasattr(
+                    self.conversation_manager, "stream_response"
+                ):
+                    logger.info("🔄 Streaming message through conversation manager...")
+                    response, stream_info = self._stream_conversation_message(
+                        message, session_id
+                    )
+                    if stream_info["cancelled"]:
+                        logger.info(f"🛑 Stream for {session_id} cancelled")
+                        return
+                elif self.conversation_manager:
                     logger.info("🔄 Processing message through conversation manager...")
                     response = self._process_conversation_message(message, session_id)
                     logger.info(f"✅ Generated response: {len(response)} characters")
@@ -1589,7 +1605,7 @@ class AetherraWebServer:
                     logger.info("🤖 Using mock response...")
                     response = self._generate_mock_response(message)
 
-                # Emit response back to client
+                # Emit response back to client (the full text, also for streams)
                 logger.info(f"📤 Sending response to client {session_id}")
                 emit(
                     "message_response",
@@ -1597,6 +1613,7 @@ class AetherraWebServer:
                         "response": response,
                         "timestamp": datetime.now().isoformat(),
                         "agent": "lyrixa",
+                        **stream_info,
                     },
                 )
 
@@ -1625,6 +1642,12 @@ class AetherraWebServer:
                     },
                 )
 
+        @self.socketio.on("cancel_message")
+        def handle_cancel_message(data=None):
+            """Stop the reply currently streaming to this client"""
+            session_id = request.sid if hasattr(request, "sid") else "default"
+            self._cancel_stream(session_id)
+
         @self.socketio.on("switch_model")
         def handle_model_switch(data):
             """Handle model switching requests"""
@@ -2668,6 +2691,72 @@ class AetherraWebServer:
 
         return f"{random.choice(responses)} Regarding: '{message}'"
 
+    def _stream_conversation_message(self, message: str, session_id: str):
+        """Emit a reply as incremental message_chunk events
+
+        Chunks are pulled from the conversation manager one at a time, so
+        generation never runs ahead of what has been emitted. Returns the full
+        text plus stream details (message id, time to first token, cancelled).
+        """
+        message_id = f"msg_{uuid.uuid4().hex[:12]}"
+        cancel = threading.Event()
+        previous = self.active_streams.get(session_id)
+        if previous is not None:
+            previous.set()  # A new message supersedes the one still streaming
+        self.active_streams[session_id] = cancel
+
+        started = time.perf_counter()
+        first_chunk_ms = None
+        chunks = []
+        try:
+            stream = self.conversation_manager.stream_response(message)
+            for index, chunk in enumerate(
+                self._stream_executor().iterate_sync(stream, cancel=cancel)
+            ):
+                if first_chunk_ms is None:
+                    first_chunk_ms = (time.perf_counter() - started) * 1000
+                chunks.append(chunk)
+                emit(
+                    "message_chunk",
+                    {
+                        "message_id": message_id,
+                        "index": index,
+                        "chunk": chunk,
+                        "agent": "lyrixa",
+                    },
+                )
+                self.socketio.sleep(0)
+        finally:
+            if self.active_streams.get(session_id) is cancel:
+                del self.active_streams[session_id]
+
+        logger.info(
+            f"✅ Streamed {len(chunks)} chunks, first after "
+            f"{first_chunk_ms or 0:.0f} ms"
+        )
+        return "".join(chunks), {
+            "message_id": message_id,
+            "streamed": True,
+            "time_to_first_token_ms": first_chunk_ms,
+            "cancelled": cancel.is_set(),
+        }
+
+    def _cancel_stream(self, session_id: str):
+        """Signal an in-progress streamed reply for a session to stop"""
+        cancel = self.active_streams.pop(session_id, None)
+        if cancel is not None:
+            cancel.set()
+
+    def _stream_executor(self):
+        """Executor whose background loop drives streamed replies"""
+        llm_manager = getattr(self.conversation_manager, "llm_manager", None)
+        executor = getattr(llm_manager, "executor", None)
+        if executor is None:
+            from Aetherra.core.multi_llm_manager import get_shared_executor
+
+            executor = get_shared_executor()
+        return executor
+
     def _process_conversation_message(self, message: str, session_id: str) -> str:
         """Process message through conversation manager"""
         try:
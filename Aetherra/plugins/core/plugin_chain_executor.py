@@ -4,16 +4,27 @@ Advanced plugin chain execution and orchestration system.
 """
 
 import asyncio
+import contextlib
+import heapq
+import itertools
 import json
 import logging
 import sqlite3
 import traceback
 import uuid
-from dataclasses import asdict, dataclass
+import weakref
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .plugin_result_cache import (
+    COALESCED,
+    HIT,
+    PluginResultCache,
+    is_deterministic,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +48,7 @@ class ChainStrategy(Enum):
     CONDITIONAL = "conditional"
     PIPELINE = "pipeline"
     ADAPTIVE = "adaptive"
+    DAG = "dag"
 
 
 @dataclass
@@ -63,6 +75,7 @@ class ChainExecution:
     end_time: datetime | None = None
     results: List[PluginResult] | None = None
     context: Dict[str, Any] | None = None
+    dependencies: Dict[str, List[str]] | None = None
 
 
 class PluginInterface:
@@ -72,6 +85,10 @@ class PluginInterface:
         self.plugin_id = plugin_id
         self.dependencies = []
         self.capabilities = []
+        # Deterministic plugins have their results cached on their input and
+        # the context keys listed here
+        self.deterministic = False
+        self.cache_context_keys: List[str] = []
 
     async def execute(self, input_data: Any, context: Dict[str, Any]) -> PluginResult:
         """Execute the plugin"""
@@ -141,6 +158,35 @@ class ChainOptimizer:
 
         return sorted(plugins, key=get_avg_time)
 
+    def estimate_time(self, plugin_id: str, default: float = 1.0) -> float:
+        """Average recorded execution time, or ``default`` without history"""
+        history = self.performance_history.get(plugin_id)
+        return sum(history) / len(history) if history else default
+
+    def critical_path_priorities(
+        self, plugins: List[str], dependencies: Dict[str, List[str]]
+    ) -> Dict[str, float]:
+        """
+        Upward rank of every node: its estimated time plus the longest
+        estimated path through its dependents. Nodes with the highest rank
+        sit on the critical path and should be started first.
+        """
+        known = [
+            self.estimate_time(p) for p in plugins if self.performance_history.get(p)
+        ]
+        default = sum(known) / len(known) if known else 1.0
+
+        dependents: Dict[str, List[str]] = {p: [] for p in plugins}
+        for plugin_id, upstream in dependencies.items():
+            for dep in upstream:
+                dependents[dep].append(plugin_id)
+
+        ranks: Dict[str, float] = {}
+        for plugin_id in reversed(_topological_order(plugins, dependencies)):
+            tail = max((ranks[d] for d in dependents[plugin_id]), default=0.0)
+            ranks[plugin_id] = self.estimate_time(plugin_id, default) + tail
+        return ranks
+
     def record_performance(self, plugin_id: str, execution_time: float):
         """Record plugin performance"""
         if plugin_id not in self.performance_history:
@@ -154,12 +200,90 @@ class ChainOptimizer:
             ]
 
 
+def _check_dependencies(plugins: List[str], dependencies: Dict[str, List[str]]):
+    """Reject dependency keys or values that are not plugins of the chain"""
+    for plugin_id, upstream in dependencies.items():
+        unknown = [p for p in [plugin_id, *upstream] if p not in plugins]
+        if unknown:
+            raise ValueError(f"Dependencies reference plugins not in chain: {unknown}")
+
+
+def _topological_order(
+    plugins: List[str], dependencies: Dict[str, List[str]]
+) -> List[str]:
+    """Order plugins so every plugin follows its dependencies"""
+    _check_dependencies(plugins, dependencies)
+
+    remaining = {p: len(set(dependencies.get(p, []))) for p in plugins}
+    dependents: Dict[str, List[str]] = {p: [] for p in plugins}
+    for plugin_id in plugins:
+        for dep in set(dependencies.get(plugin_id, [])):
+            dependents[dep].append(plugin_id)
+
+    order = []
+    ready = [p for p in plugins if remaining[p] == 0]
+    while ready:
+        plugin_id = ready.pop()
+        order.append(plugin_id)
+        for child in dependents[plugin_id]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                ready.append(child)
+
+    if len(order) != len(plugins):
+        cycle = [p for p in plugins if remaining[p] > 0]
+        raise ValueError(f"Dependency cycle between plugins: {cycle}")
+    return order
+
+
+class _PriorityGate:
+    """
+    Counting semaphore that admits the lowest-ranked waiter first
+
+    Used for a DAG chain's own concurrency cap so that, among tasks ready to
+    run, those on the critical path get the next free slot.
+    """
+
+    def __init__(self, slots: int):
+        self._free = slots
+        self._waiters: List[Tuple[Any, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    async def acquire(self, rank: Any):
+        if self._free and not self._waiters:
+            self._free -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (rank, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Handed a slot just as we were cancelled: pass it on
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._free += 1
+
+
 class PluginChainExecutor:
     """
     Advanced plugin chain executor with multiple execution strategies
     """
 
-    def __init__(self, db_path: str = "plugin_chains.db"):
+    def __init__(
+        self,
+        db_path: str = "plugin_chains.db",
+        max_concurrency: int = 8,
+        plugin_concurrency: Dict[str, int] | None = None,
+        result_cache: PluginResultCache | None = None,
+    ):
         self.db_path = Path(db_path)
         self.registered_plugins: Dict[str, PluginInterface] = {}
         self.active_executions: Dict[str, ChainExecution] = {}
@@ -167,6 +291,14 @@ class PluginChainExecutor:
         self.optimizer = ChainOptimizer()
         self.max_concurrent_chains = 5
         self.execution_timeout = 300  # 5 minutes default
+
+        # DAG strategy limits: plugins running at once across all chains,
+        # and per plugin for plugins that cannot run many copies
+        self.max_concurrency = max_concurrency
+        self.plugin_concurrency: Dict[str, int] = dict(plugin_concurrency or {})
+        # Semaphores bind to the loop they are first awaited on
+        self._limits: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.result_cache = result_cache or PluginResultCache()
         self._init_database()
 
     def _init_database(self):
@@ -222,6 +354,7 @@ class PluginChainExecutor:
         """Unregister a plugin"""
         if plugin_id in self.registered_plugins:
             del self.registered_plugins[plugin_id]
+            self.result_cache.invalidate_plugin(plugin_id)
             logger.info(f"Unregistered plugin: {plugin_id}")
 
     async def execute_chain(
@@ -230,8 +363,14 @@ class PluginChainExecutor:
         strategy: ChainStrategy = ChainStrategy.SEQUENTIAL,
         context: Dict[str, Any] | None = None,
         conditions: Dict[str, str] | None = None,
+        dependencies: Dict[str, List[str]] | None = None,
     ) -> ChainExecution:
-        """Execute a plugin chain with specified strategy"""
+        """
+        Execute a plugin chain with specified strategy
+
+        ``dependencies`` maps a plugin to the plugins whose output it consumes
+        and is used by the DAG strategy.
+        """
 
         chain_id = str(uuid.uuid4())
         execution = ChainExecution(
@@ -241,6 +380,7 @@ class PluginChainExecutor:
             status=ExecutionStatus.PENDING,
             start_time=datetime.now(),
             context=context or {},
+            dependencies=dependencies or {},
         )
 
         self.active_executions[chain_id] = execution
@@ -277,6 +417,10 @@ class PluginChainExecutor:
                 results = await self._execute_adaptive(
                     plugins, execution.context, conditions
                 )
+            elif strategy == ChainStrategy.DAG:
+                results = await self._execute_dag(
+                    plugins, execution.context, conditions, execution.dependencies
+                )
             else:
                 raise ValueError(f"Unsupported strategy: {strategy}")
 
@@ -499,8 +643,203 @@ class PluginChainExecutor:
                 optimized_plugins, context, conditions
             )
 
+    async def _execute_dag(
+        self,
+        plugins: List[str],
+        context: Dict[str, Any],
+        conditions: Dict[str, str] | None = None,
+        dependencies: Dict[str, List[str]] | None = None,
+    ) -> List[PluginResult]:
+        """
+        Execute plugins as a dependency graph
+
+        A plugin starts as soon as all of its dependencies have finished,
+        receiving the single upstream output directly or a dict of upstream
+        outputs keyed by plugin id. Ready plugins take the chain's
+        ``max_concurrency`` slots in order of their critical-path rank from
+        the optimizer's history, once they hold their per-plugin limit.
+        Dependents of a failed plugin are skipped; a plugin skipped by its
+        condition passes its input through.
+        """
+        _check_dependencies(plugins, dependencies or {})
+        dependencies = {
+            p: list(dict.fromkeys((dependencies or {}).get(p, []))) for p in plugins
+        }
+        priorities = self.optimizer.critical_path_priorities(plugins, dependencies)
+        position = {plugin_id: i for i, plugin_id in enumerate(plugins)}
+
+        dependents: Dict[str, List[str]] = {p: [] for p in plugins}
+        for plugin_id in plugins:
+            for dep in dependencies[plugin_id]:
+                dependents[dep].append(plugin_id)
+        waiting = {p: len(dependencies[p]) for p in plugins}
+
+        outputs: Dict[str, Any] = {}
+        failed: Set[str] = set()
+        results: List[PluginResult] = []
+        ready: List[tuple] = []
+
+        def release(plugin_id: str):
+            for child in dependents[plugin_id]:
+                waiting[child] -= 1
+                if waiting[child] == 0:
+                    heapq.heappush(ready, (-priorities[child], position[child], child))
+
+        for plugin_id in plugins:
+            if waiting[plugin_id] == 0:
+                heapq.heappush(
+                    ready, (-priorities[plugin_id], position[plugin_id], plugin_id)
+                )
+
+        chain_slots = _PriorityGate(self.max_concurrency)
+        running: Dict[asyncio.Task, str] = {}
+        try:
+            while ready or running:
+                while ready:
+                    rank = heapq.heappop(ready)
+                    plugin_id = rank[2]
+                    upstream = dependencies[plugin_id]
+
+                    failed_upstream = [d for d in upstream if d in failed]
+                    if failed_upstream:
+                        failed.add(plugin_id)
+                        results.append(
+                            PluginResult(
+                                plugin_id=plugin_id,
+                                success=False,
+                                output=None,
+                                execution_time=0,
+                                error_message=f"Upstream failed: {failed_upstream}",
+                            )
+                        )
+                        release(plugin_id)
+                        continue
+
+                    if not upstream:
+                        input_data = context.get("initial_input")
+                    elif len(upstream) == 1:
+                        input_data = outputs[upstream[0]]
+                    else:
+                        input_data = {d: outputs[d] for d in upstream}
+
+                    if conditions and plugin_id in conditions:
+                        if not self.conditional_executor.evaluate_condition(
+                            conditions[plugin_id], context
+                        ):
+                            logger.info(f"Skipping plugin {plugin_id} due to condition")
+                            outputs[plugin_id] = input_data
+                            release(plugin_id)
+                            continue
+
+                    task = asyncio.create_task(
+                        self._execute_limited_plugin(
+                            self.registered_plugins[plugin_id],
+                            input_data,
+                            context,
+                            chain_slot=(chain_slots, rank),
+                        )
+                    )
+                    running[task] = plugin_id
+
+                if not running:
+                    continue
+
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    plugin_id = running.pop(task)
+                    result = task.result()
+                    results.append(result)
+                    if result.success:
+                        outputs[plugin_id] = result.output
+                        context[f"{plugin_id}_output"] = result.output
+                    else:
+                        failed.add(plugin_id)
+                    release(plugin_id)
+        finally:
+            for task in running:
+                task.cancel()
+
+        return results
+
+    async def _execute_limited_plugin(
+        self,
+        plugin: PluginInterface,
+        input_data: Any,
+        context: Dict[str, Any],
+        chain_slot: Optional[Tuple[_PriorityGate, Any]] = None,
+    ) -> PluginResult:
+        """
+        Execute a plugin under the global and per-plugin concurrency limits
+
+        ``chain_slot`` is an optional (gate, rank) pair for the calling
+        chain's own cap, taken after the per-plugin limit.
+        """
+        limits = self._limits.get(asyncio.get_running_loop())
+        if limits is None:
+            limits = {"": asyncio.Semaphore(self.max_concurrency)}
+            self._limits[asyncio.get_running_loop()] = limits
+
+        plugin_limit = self.plugin_concurrency.get(plugin.plugin_id)
+        if plugin_limit and plugin.plugin_id not in limits:
+            limits[plugin.plugin_id] = asyncio.Semaphore(plugin_limit)
+
+        # Per-plugin limit first: a task queued behind a saturated plugin must
+        # not hold a global slot that other plugins could use
+        async with contextlib.AsyncExitStack() as slots:
+            if plugin_limit:
+                await slots.enter_async_context(limits[plugin.plugin_id])
+            if chain_slot:
+                gate, rank = chain_slot
+                await gate.acquire(rank)
+                slots.callback(gate.release)
+            await slots.enter_async_context(limits[""])
+            try:
+                return await asyncio.wait_for(
+                    self._execute_single_plugin(plugin, input_data, context),
+                    timeout=self.execution_timeout,
+                )
+            except asyncio.TimeoutError:
+                return PluginResult(
+                    plugin_id=plugin.plugin_id,
+                    success=False,
+                    output=None,
+                    execution_time=self.execution_timeout,
+                    error_message=f"Timed out after {self.execution_timeout}s",
+                )
+
     async def _execute_single_plugin(
         self, plugin: PluginInterface, input_data: Any, context: Dict[str, Any]
+    ) -> PluginResult:
+        """Execute a single plugin, serving deterministic plugins from cache"""
+        if not is_deterministic(plugin):
+            return await self._run_single_plugin(plugin, input_data, context)
+
+        payload = {
+            "input": input_data,
+            "context": {
+                key: context.get(key)
+                for key in getattr(plugin, "cache_context_keys", [])
+            },
+        }
+        result, source = await self.result_cache.call_async(
+            plugin.plugin_id,
+            self.result_cache.source_hash(plugin),
+            payload,
+            lambda: self._run_single_plugin(plugin, input_data, context),
+            is_success=lambda r: r.success,
+        )
+        if source in (HIT, COALESCED):
+            result = replace(
+                result,
+                execution_time=0.0,
+                metadata={**(result.metadata or {}), "cache": source},
+            )
+        return result
+
+    async def _run_single_plugin(
+        self, plugin: PluginInterface, input_data: Any, context: Dict[str, Any]
     ) -> PluginResult:
         """Execute a single plugin with timing and error handling"""
         start_time = asyncio.get_event_loop().time()
@@ -611,6 +950,10 @@ class PluginChainExecutor:
             "execution_count": len(history),
         }
 
+    def get_plugin_cache_stats(self, plugin_id: str) -> Dict[str, Any]:
+        """Result cache hit/miss counters for a deterministic plugin"""
+        return self.result_cache.get_stats(plugin_id)
+
 
 # Example plugin implementation
 class ExamplePlugin(PluginInterface):
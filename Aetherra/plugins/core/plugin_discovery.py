@@ -9,8 +9,37 @@ Automatically discovers, categorizes, and suggests relevant plugins.
 import hashlib
 import json
 import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .plugin_search_index import PluginSearchIndex, tokenize
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+    WATCHDOG_AVAILABLE = False
+
+# Modules in the plugins directory that are part of the plugin system itself
+SYSTEM_PLUGIN_FILES = {
+    "plugin_manager",
+    "enhanced_plugin_manager",
+    "plugin_analytics",
+    "plugin_quality_control",
+    "plugin_discovery",
+}
+
+# (size, mtime_ns, inode) - a file whose stat signature is unchanged is not
+# re-hashed or re-analyzed
+StatSignature = Tuple[int, int, int]
 
 
 class PluginMetadata:
@@ -53,17 +82,377 @@ class PluginMetadata:
         self.compatibility_score = 0.0
 
 
+def _metadata_to_dict(meta: PluginMetadata) -> Dict:
+    """Serialize one plugin's metadata to a JSON-compatible dict."""
+    return {
+        "name": meta.name,
+        "path": meta.path,
+        "category": meta.category,
+        "description": meta.description,
+        "author": meta.author,
+        "version": meta.version,
+        "tags": meta.tags,
+        "dependencies": meta.dependencies,
+        "capabilities": meta.capabilities,
+        "file_hash": meta.file_hash,
+        "last_modified": meta.last_modified.isoformat() if meta.last_modified else None,
+        "discovery_time": meta.discovery_time.isoformat(),
+        "usage_count": meta.usage_count,
+        "rating": meta.rating,
+        "compatibility_score": meta.compatibility_score,
+    }
+
+
+def _metadata_from_dict(plugin_data: Dict) -> PluginMetadata:
+    """Rebuild plugin metadata from its serialized dict."""
+    meta = PluginMetadata(plugin_data["name"], plugin_data["path"])
+    meta.category = plugin_data.get("category", "unknown")
+    meta.description = plugin_data.get("description", "")
+    meta.author = plugin_data.get("author", "")
+    meta.version = plugin_data.get("version", "1.0.0")
+    meta.tags = plugin_data.get("tags", [])
+    meta.dependencies = plugin_data.get("dependencies", [])
+    meta.capabilities = plugin_data.get("capabilities", [])
+    meta.file_hash = plugin_data.get("file_hash", "")
+    meta.usage_count = plugin_data.get("usage_count", 0)
+    meta.rating = plugin_data.get("rating", 0.0)
+    meta.compatibility_score = plugin_data.get("compatibility_score", 0.0)
+
+    # Parse timestamps
+    if plugin_data.get("last_modified"):
+        meta.last_modified = datetime.fromisoformat(plugin_data["last_modified"])
+    if plugin_data.get("discovery_time"):
+        meta.discovery_time = datetime.fromisoformat(plugin_data["discovery_time"])
+    return meta
+
+
+def _analyze_plugin_file(
+    plugin_name: str, plugin_path: str
+) -> Optional[PluginMetadata]:
+    """Analyze a plugin file to extract metadata."""
+    try:
+        metadata = PluginMetadata(plugin_name, plugin_path)
+
+        # Calculate file hash
+        metadata.file_hash = _calculate_file_hash(plugin_path)
+        metadata.last_modified = datetime.fromtimestamp(os.path.getmtime(plugin_path))
+
+        # Read and parse file content
+        with open(plugin_path, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        # Extract metadata from content
+        _extract_metadata_from_content(content, metadata)
+
+        # Analyze code structure
+        _analyze_code_structure(content, metadata)
+
+        # Calculate compatibility score
+        metadata.compatibility_score = _calculate_compatibility_score(content, metadata)
+
+        return metadata
+
+    except Exception as e:
+        print(f"Error analyzing plugin {plugin_name}: {e}")
+        return None
+
+
+def _calculate_file_hash(file_path: str) -> str:
+    """Calculate SHA-256 hash of file content."""
+    try:
+        with open(file_path, "rb") as f:
+            content = f.read()
+            return hashlib.sha256(content).hexdigest()
+    except Exception:
+        return ""
+
+
+def _extract_metadata_from_content(content: str, metadata: PluginMetadata):
+    """Extract metadata from plugin file content."""
+    lines = content.split("\n")
+
+    # Look for metadata variables
+    for line in lines:
+        line = line.strip()
+
+        if line.startswith("__version__"):
+            metadata.version = _extract_string_value(line)
+        elif line.startswith("__author__"):
+            metadata.author = _extract_string_value(line)
+        elif line.startswith("__description__"):
+            metadata.description = _extract_string_value(line)
+        elif line.startswith("__category__"):
+            metadata.category = _extract_string_value(line)
+        elif line.startswith("__tags__"):
+            metadata.tags = _extract_list_value(line)
+        elif line.startswith("__dependencies__"):
+            metadata.dependencies = _extract_list_value(line)
+
+    # Extract description from docstring if not found
+    if not metadata.description:
+        docstring = _extract_module_docstring(content)
+        if docstring:
+            metadata.description = docstring.split("\\n")[0].strip()
+
+    # Auto-detect category if not specified
+    if metadata.category == "unknown":
+        metadata.category = _auto_detect_category(content)
+
+    # Auto-generate tags
+    auto_tags = _auto_generate_tags(content, metadata)
+    metadata.tags.extend(auto_tags)
+    metadata.tags = list(set(metadata.tags))  # Remove duplicates
+
+
+def _extract_string_value(line: str) -> str:
+    """Extract string value from a Python assignment line."""
+    try:
+        # Find the value after the equals sign
+        value_part = line.split("=", 1)[1].strip()
+        # Remove quotes
+        if value_part.startswith('"') and value_part.endswith('"'):
+            return value_part[1:-1]
+        elif value_part.startswith("'") and value_part.endswith("'"):
+            return value_part[1:-1]
+        return value_part
+    except Exception:
+        return ""
+
+
+def _extract_list_value(line: str) -> List[str]:
+    """Extract list value from a Python assignment line."""
+    try:
+        # Simple list extraction - assumes format: var = ["item1", "item2"]
+        value_part = line.split("=", 1)[1].strip()
+        if value_part.startswith("[") and value_part.endswith("]"):
+            # Remove brackets and split by comma
+            items = value_part[1:-1].split(",")
+            return [item.strip().strip("\"'") for item in items if item.strip()]
+        return []
+    except Exception:
+        return []
+
+
+def _extract_module_docstring(content: str) -> str:
+    """Extract module-level docstring."""
+    try:
+        import ast
+
+        tree = ast.parse(content)
+        if (
+            tree.body
+            and isinstance(tree.body[0], ast.Expr)
+            and isinstance(tree.body[0].value, ast.Constant)
+            and isinstance(tree.body[0].value.value, str)
+        ):
+            return tree.body[0].value.value
+    except Exception:
+        pass
+    return ""
+
+
+def _auto_detect_category(content: str) -> str:
+    """Auto-detect plugin category based on content analysis."""
+    content_lower = content.lower()
+
+    # Category detection patterns
+    if any(keyword in content_lower for keyword in ["api", "request", "http", "rest"]):
+        return "integration"
+    elif any(
+        keyword in content_lower for keyword in ["data", "process", "analyze", "filter"]
+    ):
+        return "data"
+    elif any(
+        keyword in content_lower for keyword in ["text", "string", "parse", "format"]
+    ):
+        return "text"
+    elif any(
+        keyword in content_lower for keyword in ["file", "directory", "path", "io"]
+    ):
+        return "file"
+    elif any(
+        keyword in content_lower for keyword in ["ui", "interface", "gui", "display"]
+    ):
+        return "interface"
+    elif any(keyword in content_lower for keyword in ["utility", "tool", "helper"]):
+        return "utility"
+
+    return "general"
+
+
+def _auto_generate_tags(content: str, metadata: PluginMetadata) -> List[str]:
+    """Auto-generate relevant tags based on content analysis."""
+    tags = []
+    content_lower = content.lower()
+
+    # Technology tags
+    tech_keywords = {
+        "json": "json",
+        "xml": "xml",
+        "csv": "csv",
+        "sql": "database",
+        "http": "web",
+        "api": "api",
+        "rest": "rest",
+        "async": "async",
+        "threading": "multithreading",
+        "multiprocessing": "parallel",
+        "regex": "regex",
+        "datetime": "time",
+        "pathlib": "filesystem",
+    }
+
+    for keyword, tag in tech_keywords.items():
+        if keyword in content_lower:
+            tags.append(tag)
+
+    # Functionality tags
+    if "class" in content_lower and "def execute" in content_lower:
+        tags.append("executable")
+
+    if "def main" in content_lower:
+        tags.append("standalone")
+
+    if "try:" in content and "except:" in content:
+        tags.append("error-handling")
+
+    # Category-specific tags
+    if metadata.category == "data":
+        tags.extend(["processing", "transformation"])
+    elif metadata.category == "integration":
+        tags.extend(["external", "connectivity"])
+
+    return tags
+
+
+def _analyze_code_structure(content: str, metadata: PluginMetadata):
+    """Analyze plugin code structure to determine capabilities."""
+    try:
+        import ast
+
+        tree = ast.parse(content)
+
+        # Find functions
+        functions = [
+            node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)
+        ]
+
+        capabilities = []
+
+        # Check for standard plugin methods
+        method_names = [func.name for func in functions]
+
+        if "execute" in method_names:
+            capabilities.append("execute")
+        if "main" in method_names:
+            capabilities.append("main")
+        if "get_info" in method_names:
+            capabilities.append("info")
+        if "cleanup" in method_names:
+            capabilities.append("cleanup")
+
+        # Check for data processing capabilities
+        if any(name in method_names for name in ["process", "analyze", "transform"]):
+            capabilities.append("data_processing")
+
+        # Check for file operations
+        if any(
+            name in method_names for name in ["read_file", "write_file", "process_file"]
+        ):
+            capabilities.append("file_operations")
+
+        metadata.capabilities = capabilities
+
+    except Exception as e:
+        print(f"Error analyzing code structure: {e}")
+
+
+def _calculate_compatibility_score(content: str, metadata: PluginMetadata) -> float:
+    """Calculate compatibility score based on code analysis."""
+    score = 100.0
+
+    try:
+        # Check for Python 3 compatibility
+        if "print(" in content:
+            score += 10
+        elif "print " in content:
+            score -= 20  # Python 2 style print
+
+        # Check for type hints
+        if "typing" in content or "->" in content:
+            score += 15
+
+        # Check for error handling
+        if "try:" in content and "except:" in content:
+            score += 10
+
+        # Check for documentation
+        if '"""' in content or "'''" in content:
+            score += 10
+
+        # Check for dangerous operations
+        dangerous_patterns = ["eval(", "exec(", "os.system(", "__import__"]
+        for pattern in dangerous_patterns:
+            if pattern in content:
+                score -= 30
+
+        # Normalize score
+        score = max(0, min(100, score))
+
+    except Exception:
+        score = 50.0  # Default score if analysis fails
+
+    return score
+
+
+def _analyze_plugin_task(task: Tuple[str, str]) -> Tuple[str, Optional[Dict]]:
+    """Process pool entry point: analyze one plugin file."""
+    plugin_name, plugin_path = task
+    metadata = _analyze_plugin_file(plugin_name, plugin_path)
+    return plugin_name, _metadata_to_dict(metadata) if metadata else None
+
+
+class _PluginDirEventHandler(FileSystemEventHandler):
+    """Forwards file system events for plugin files to the discovery engine."""
+
+    def __init__(self, discovery: "PluginDiscovery"):
+        super().__init__()
+        self.discovery = discovery
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if path and str(path).endswith(".py"):
+                self.discovery.mark_changed(str(path))
+
+
 class PluginDiscovery:
     """Plugin discovery and indexing system."""
 
     def __init__(self, plugins_dir: Optional[str] = None):
         self.plugins_dir = plugins_dir or os.path.join(os.path.dirname(__file__))
+        self.index_db = os.path.join(self.plugins_dir, ".plugin_index.db")
         self.plugin_index = {}
         self.categories = set()
         self.tags = set()
         self.discovery_history = []
-        self.search_cache = {}
         self.recommendation_engine = None
+
+        # Search: inverted index plus an LRU of results keyed on its generation
+        self.search_index = PluginSearchIndex()
+        self.search_cache: OrderedDict = OrderedDict()
+        self.search_cache_size = 256
+
+        # Incremental discovery state
+        self.max_workers: Optional[int] = None
+        self.parallel_threshold = 64  # Changed files before using processes
+        self._signatures: Dict[str, StatSignature] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.RLock()
+        self._observer = None
+        self._dirty_paths = set()
+        self._dirty_lock = threading.Lock()
         self._initialize_discovery()
 
     def _initialize_discovery(self):
@@ -72,7 +461,27 @@ class PluginDiscovery:
         self._setup_recommendation_engine()
 
     def _load_plugin_index(self):
-        """Load existing plugin index from cache."""
+        """Load existing plugin index from the SQLite index (or legacy JSON)."""
+        if os.path.exists(self.index_db):
+            try:
+                with self._db_lock:
+                    rows = (
+                        self._connect()
+                        .execute(
+                            "SELECT name, size, mtime_ns, inode, data FROM plugins"
+                        )
+                        .fetchall()
+                    )
+                for name, size, mtime_ns, inode, data in rows:
+                    self.plugin_index[name] = _metadata_from_dict(json.loads(data))
+                    if size is not None:
+                        self._signatures[name] = (size, mtime_ns, inode)
+                self._rebuild_facets()
+                self.search_index.rebuild(self.plugin_index)
+                return
+            except Exception as e:
+                print(f"Could not load plugin index: {e}")
+
         index_file = os.path.join(self.plugins_dir, ".plugin_index.json")
         if os.path.exists(index_file):
             try:
@@ -82,39 +491,80 @@ class PluginDiscovery:
             except Exception as e:
                 print(f"Could not load plugin index: {e}")
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index database, creating its schema on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.index_db, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS plugins (
+                    name TEXT PRIMARY KEY,
+                    path TEXT NOT NULL,
+                    size INTEGER,
+                    mtime_ns INTEGER,
+                    inode INTEGER,
+                    data TEXT NOT NULL
+                )
+            """)
+        return self._conn
+
+    def _save_plugin_entries(self, names: Iterable[str], removed: Iterable[str] = ()):
+        """Upsert the given index entries and delete removed ones."""
+        rows = []
+        for name in names:
+            meta = self.plugin_index[name]
+            size, mtime_ns, inode = self._signatures.get(name, (None, None, None))
+            rows.append(
+                (
+                    name,
+                    meta.path,
+                    size,
+                    mtime_ns,
+                    inode,
+                    json.dumps(_metadata_to_dict(meta)),
+                )
+            )
+        removed = [(name,) for name in removed]
+        if not rows and not removed:
+            return
+        try:
+            with self._db_lock:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO plugins "
+                        "(name, path, size, mtime_ns, inode, data) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    conn.executemany("DELETE FROM plugins WHERE name = ?", removed)
+        except Exception as e:
+            print(f"Could not save plugin index: {e}")
+
     def _save_plugin_index(self):
-        """Save plugin index to cache."""
-        index_file = os.path.join(self.plugins_dir, ".plugin_index.json")
+        """Rewrite the whole plugin index."""
         try:
-            data = self._serialize_index()
-            with open(index_file, "w") as f:
-                json.dump(data, f, indent=2)
+            with self._db_lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute("DELETE FROM plugins")
+            self._save_plugin_entries(list(self.plugin_index))
         except Exception as e:
             print(f"Could not save plugin index: {e}")
 
+    def close(self):
+        """Stop watching and close the index database."""
+        self.stop_watching()
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def _serialize_index(self) -> Dict:
         """Serialize plugin index to JSON-compatible format."""
         return {
             "plugins": {
-                name: {
-                    "name": meta.name,
-                    "path": meta.path,
-                    "category": meta.category,
-                    "description": meta.description,
-                    "author": meta.author,
-                    "version": meta.version,
-                    "tags": meta.tags,
-                    "dependencies": meta.dependencies,
-                    "capabilities": meta.capabilities,
-                    "file_hash": meta.file_hash,
-                    "last_modified": meta.last_modified.isoformat()
-                    if meta.last_modified
-                    else None,
-                    "discovery_time": meta.discovery_time.isoformat(),
-                    "usage_count": meta.usage_count,
-                    "rating": meta.rating,
-                    "compatibility_score": meta.compatibility_score,
-                }
+                name: _metadata_to_dict(meta)
                 for name, meta in self.plugin_index.items()
             },
             "categories": list(self.categories),
@@ -125,442 +575,232 @@ class PluginDiscovery:
     def _deserialize_index(self, data: Dict):
         """Deserialize plugin index from JSON data."""
         for name, plugin_data in data.get("plugins", {}).items():
-            meta = PluginMetadata(plugin_data["name"], plugin_data["path"])
-            meta.category = plugin_data.get("category", "unknown")
-            meta.description = plugin_data.get("description", "")
-            meta.author = plugin_data.get("author", "")
-            meta.version = plugin_data.get("version", "1.0.0")
-            meta.tags = plugin_data.get("tags", [])
-            meta.dependencies = plugin_data.get("dependencies", [])
-            meta.capabilities = plugin_data.get("capabilities", [])
-            meta.file_hash = plugin_data.get("file_hash", "")
-            meta.usage_count = plugin_data.get("usage_count", 0)
-            meta.rating = plugin_data.get("rating", 0.0)
-            meta.compatibility_score = plugin_data.get("compatibility_score", 0.0)
-
-            # Parse timestamps
-            if plugin_data.get("last_modified"):
-                meta.last_modified = datetime.fromisoformat(
-                    plugin_data["last_modified"]
-                )
-            if plugin_data.get("discovery_time"):
-                meta.discovery_time = datetime.fromisoformat(
-                    plugin_data["discovery_time"]
-                )
-
-            self.plugin_index[name] = meta
+            self.plugin_index[name] = _metadata_from_dict(plugin_data)
 
         self.categories = set(data.get("categories", []))
         self.tags = set(data.get("tags", []))
+        self.search_index.rebuild(self.plugin_index)
+
+    def _rebuild_facets(self):
+        """Recompute the category and tag sets from the index."""
+        self.categories = {meta.category for meta in self.plugin_index.values()}
+        self.tags = {tag for meta in self.plugin_index.values() for tag in meta.tags}
 
     def discover_plugins(
         self, force_refresh: bool = False
     ) -> Dict[str, PluginMetadata]:
-        """Discover all plugins in the plugins directory."""
-        if not force_refresh and self.plugin_index:
-            # Check if any files have been modified
-            needs_refresh = False
-            for name, meta in self.plugin_index.items():
-                if os.path.exists(meta.path):
-                    current_mtime = datetime.fromtimestamp(os.path.getmtime(meta.path))
-                    if meta.last_modified and current_mtime > meta.last_modified:
-                        needs_refresh = True
-                        break
-
-            if not needs_refresh:
-                return self.plugin_index
-
-        discovered_plugins = {}
-
+        """
+        Discover all plugins in the plugins directory.
+
+        Files whose (size, mtime_ns, inode) signature matches the index are
+        skipped without being read; files whose content hash still matches
+        are only re-stamped. Changed files are analyzed in a process pool
+        and only their index rows are rewritten. While watching, only the
+        paths reported by the file system watcher are examined.
+        """
         if not os.path.exists(self.plugins_dir):
-            return discovered_plugins
-
-        for file in os.listdir(self.plugins_dir):
-            if file.endswith(".py") and not file.startswith("__"):
-                plugin_name = file[:-3]  # Remove .py extension
-
-                # Skip system files
-                if plugin_name in [
-                    "plugin_manager",
-                    "enhanced_plugin_manager",
-                    "plugin_analytics",
-                    "plugin_quality_control",
-                    "plugin_discovery",
-                ]:
+            return {}
+
+        if self._observer is not None and not force_refresh:
+            with self._dirty_lock:
+                dirty_paths, self._dirty_paths = self._dirty_paths, set()
+            return self.apply_changes(dirty_paths)
+
+        found = self._scan_plugins_dir()
+        removed = [name for name in self.plugin_index if name not in found]
+        self._refresh_entries(found, removed, force_refresh)
+        return self.plugin_index
+
+    def apply_changes(self, paths: Iterable[str]) -> Dict[str, PluginMetadata]:
+        """Re-examine only the given plugin file paths (push-mode discovery)."""
+        found = {}
+        removed = []
+        for path in paths:
+            plugin_name = self._plugin_name_for(path)
+            if plugin_name is None:
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                if plugin_name in self.plugin_index:
+                    removed.append(plugin_name)
+                continue
+            found[plugin_name] = (path, (stat.st_size, stat.st_mtime_ns, stat.st_ino))
+
+        self._refresh_entries(found, removed, force_refresh=False)
+        return self.plugin_index
+
+    def mark_changed(self, path: str):
+        """Queue a changed plugin path for the next discovery call."""
+        with self._dirty_lock:
+            self._dirty_paths.add(path)
+
+    def start_watching(self) -> bool:
+        """Keep the index current from file system events (needs watchdog)."""
+        if self._observer is not None:
+            return True
+        if not WATCHDOG_AVAILABLE:
+            print("watchdog is not installed; plugin discovery stays in scan mode")
+            return False
+
+        self.discover_plugins()
+        self._observer = Observer()
+        self._observer.schedule(
+            _PluginDirEventHandler(self), self.plugins_dir, recursive=False
+        )
+        self._observer.start()
+        return True
+
+    def stop_watching(self):
+        """Stop file system watching and return to scan mode."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def _plugin_name_for(self, path: str) -> Optional[str]:
+        """Plugin name for a path in the plugins directory, if it is a plugin."""
+        directory, file = os.path.split(path)
+        if os.path.abspath(directory) != os.path.abspath(self.plugins_dir):
+            return None
+        if not file.endswith(".py") or file.startswith("__"):
+            return None
+        plugin_name = file[:-3]  # Remove .py extension
+        if plugin_name in SYSTEM_PLUGIN_FILES:
+            return None
+        return plugin_name
+
+    def _scan_plugins_dir(self) -> Dict[str, Tuple[str, StatSignature]]:
+        """Stat every plugin file; directory entries provide the stat cheaply."""
+        found = {}
+        with os.scandir(self.plugins_dir) as entries:
+            for entry in entries:
+                plugin_name = self._plugin_name_for(entry.path)
+                if plugin_name is None:
                     continue
-
-                plugin_path = os.path.join(self.plugins_dir, file)
-
-                # Check if plugin already exists and hasn't changed
-                if plugin_name in self.plugin_index and not force_refresh:
-                    existing_meta = self.plugin_index[plugin_name]
-                    current_hash = self._calculate_file_hash(plugin_path)
-
-                    if existing_meta.file_hash == current_hash:
-                        discovered_plugins[plugin_name] = existing_meta
-                        continue
-
-                # Analyze plugin file
-                metadata = self._analyze_plugin_file(plugin_name, plugin_path)
-                if metadata:
-                    discovered_plugins[plugin_name] = metadata
-
-                    # Update categories and tags
-                    self.categories.add(metadata.category)
-                    self.tags.update(metadata.tags)
-
-        # Update index
-        self.plugin_index = discovered_plugins
-        self._save_plugin_index()
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                found[plugin_name] = (
+                    entry.path,
+                    (stat.st_size, stat.st_mtime_ns, stat.st_ino),
+                )
+        return found
+
+    def _refresh_entries(
+        self,
+        found: Dict[str, Tuple[str, StatSignature]],
+        removed: List[str],
+        force_refresh: bool,
+    ):
+        """Update index entries for the examined files and persist the delta."""
+        to_analyze = []
+        restamped = []
+        for plugin_name, (plugin_path, signature) in found.items():
+            existing_meta = self.plugin_index.get(plugin_name)
+            if existing_meta is not None and not force_refresh:
+                if self._signatures.get(plugin_name) == signature:
+                    continue
+                # Touched but possibly unchanged: compare content before parsing
+                if existing_meta.file_hash == _calculate_file_hash(plugin_path):
+                    self._signatures[plugin_name] = signature
+                    restamped.append(plugin_name)
+                    continue
+            to_analyze.append((plugin_name, plugin_path))
+
+        analyzed = []
+        removed = list(removed)
+        for plugin_name, data in self._analyze_plugin_files(to_analyze):
+            if data is None:
+                # Unreadable now: drop the entry describing its old content
+                if plugin_name in self.plugin_index:
+                    removed.append(plugin_name)
+                continue
+            metadata = _metadata_from_dict(data)
+            previous = self.plugin_index.get(plugin_name)
+            if previous is not None:
+                metadata.usage_count = previous.usage_count
+                metadata.rating = previous.rating
+            self.plugin_index[plugin_name] = metadata
+            self._signatures[plugin_name] = found[plugin_name][1]
+            self.search_index.add(plugin_name, metadata)
+            analyzed.append(plugin_name)
+
+        for plugin_name in removed:
+            self.plugin_index.pop(plugin_name, None)
+            self._signatures.pop(plugin_name, None)
+            self.search_index.remove(plugin_name)
+
+        if analyzed or removed:
+            self._rebuild_facets()
+        self._save_plugin_entries(analyzed + restamped, removed)
 
         # Record discovery
         self.discovery_history.append(
             {
                 "timestamp": datetime.now().isoformat(),
-                "plugins_found": len(discovered_plugins),
+                "plugins_found": len(self.plugin_index),
+                "examined": len(found),
+                "analyzed": len(analyzed),
+                "removed": len(removed),
                 "force_refresh": force_refresh,
             }
         )
 
-        return discovered_plugins
-
-    def _analyze_plugin_file(
-        self, plugin_name: str, plugin_path: str
-    ) -> Optional[PluginMetadata]:
-        """Analyze a plugin file to extract metadata."""
-        try:
-            metadata = PluginMetadata(plugin_name, plugin_path)
-
-            # Calculate file hash
-            metadata.file_hash = self._calculate_file_hash(plugin_path)
-            metadata.last_modified = datetime.fromtimestamp(
-                os.path.getmtime(plugin_path)
-            )
-
-            # Read and parse file content
-            with open(plugin_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Extract metadata from content
-            self._extract_metadata_from_content(content, metadata)
-
-            # Analyze code structure
-            self._analyze_code_structure(content, metadata)
-
-            # Calculate compatibility score
-            metadata.compatibility_score = self._calculate_compatibility_score(
-                content, metadata
-            )
-
-            return metadata
-
-        except Exception as e:
-            print(f"Error analyzing plugin {plugin_name}: {e}")
-            return None
-
-    def _calculate_file_hash(self, file_path: str) -> str:
-        """Calculate SHA-256 hash of file content."""
-        try:
-            with open(file_path, "rb") as f:
-                content = f.read()
-                return hashlib.sha256(content).hexdigest()
-        except Exception:
-            return ""
-
-    def _extract_metadata_from_content(self, content: str, metadata: PluginMetadata):
-        """Extract metadata from plugin file content."""
-        lines = content.split("\n")
-
-        # Look for metadata variables
-        for line in lines:
-            line = line.strip()
-
-            if line.startswith("__version__"):
-                metadata.version = self._extract_string_value(line)
-            elif line.startswith("__author__"):
-                metadata.author = self._extract_string_value(line)
-            elif line.startswith("__description__"):
-                metadata.description = self._extract_string_value(line)
-            elif line.startswith("__category__"):
-                metadata.category = self._extract_string_value(line)
-            elif line.startswith("__tags__"):
-                metadata.tags = self._extract_list_value(line)
-            elif line.startswith("__dependencies__"):
-                metadata.dependencies = self._extract_list_value(line)
-
-        # Extract description from docstring if not found
-        if not metadata.description:
-            docstring = self._extract_module_docstring(content)
-            if docstring:
-                metadata.description = docstring.split("\\n")[0].strip()
-
-        # Auto-detect category if not specified
-        if metadata.category == "unknown":
-            metadata.category = self._auto_detect_category(content)
-
-        # Auto-generate tags
-        auto_tags = self._auto_generate_tags(content, metadata)
-        metadata.tags.extend(auto_tags)
-        metadata.tags = list(set(metadata.tags))  # Remove duplicates
-
-    def _extract_string_value(self, line: str) -> str:
-        """Extract string value from a Python assignment line."""
-        try:
-            # Find the value after the equals sign
-            value_part = line.split("=", 1)[1].strip()
-            # Remove quotes
-            if value_part.startswith('"') and value_part.endswith('"'):
-                return value_part[1:-1]
-            elif value_part.startswith("'") and value_part.endswith("'"):
-                return value_part[1:-1]
-            return value_part
-        except Exception:
-            return ""
-
-    def _extract_list_value(self, line: str) -> List[str]:
-        """Extract list value from a Python assignment line."""
-        try:
-            # Simple list extraction - assumes format: var = ["item1", "item2"]
-            value_part = line.split("=", 1)[1].strip()
-            if value_part.startswith("[") and value_part.endswith("]"):
-                # Remove brackets and split by comma
-                items = value_part[1:-1].split(",")
-                return [item.strip().strip("\"'") for item in items if item.strip()]
-            return []
-        except Exception:
-            return []
-
-    def _extract_module_docstring(self, content: str) -> str:
-        """Extract module-level docstring."""
-        try:
-            import ast
-
-            tree = ast.parse(content)
-            if (
-                tree.body
-                and isinstance(tree.body[0], ast.Expr)
-                and isinstance(tree.body[0].value, ast.Constant)
-                and isinstance(tree.body[0].value.value, str)
-            ):
-                return tree.body[0].value.value
-        except Exception:
-            pass
-        return ""
-
-    def _auto_detect_category(self, content: str) -> str:
-        """Auto-detect plugin category based on content analysis."""
-        content_lower = content.lower()
-
-        # Category detection patterns
-        if any(
-            keyword in content_lower for keyword in ["api", "request", "http", "rest"]
-        ):
-            return "integration"
-        elif any(
-            keyword in content_lower
-            for keyword in ["data", "process", "analyze", "filter"]
-        ):
-            return "data"
-        elif any(
-            keyword in content_lower
-            for keyword in ["text", "string", "parse", "format"]
-        ):
-            return "text"
-        elif any(
-            keyword in content_lower for keyword in ["file", "directory", "path", "io"]
-        ):
-            return "file"
-        elif any(
-            keyword in content_lower
-            for keyword in ["ui", "interface", "gui", "display"]
-        ):
-            return "interface"
-        elif any(keyword in content_lower for keyword in ["utility", "tool", "helper"]):
-            return "utility"
-
-        return "general"
-
-    def _auto_generate_tags(self, content: str, metadata: PluginMetadata) -> List[str]:
-        """Auto-generate relevant tags based on content analysis."""
-        tags = []
-        content_lower = content.lower()
-
-        # Technology tags
-        tech_keywords = {
-            "json": "json",
-            "xml": "xml",
-            "csv": "csv",
-            "sql": "database",
-            "http": "web",
-            "api": "api",
-            "rest": "rest",
-            "async": "async",
-            "threading": "multithreading",
-            "multiprocessing": "parallel",
-            "regex": "regex",
-            "datetime": "time",
-            "pathlib": "filesystem",
-        }
-
-        for keyword, tag in tech_keywords.items():
-            if keyword in content_lower:
-                tags.append(tag)
-
-        # Functionality tags
-        if "class" in content_lower and "def execute" in content_lower:
-            tags.append("executable")
-
-        if "def main" in content_lower:
-            tags.append("standalone")
-
-        if "try:" in content and "except:" in content:
-            tags.append("error-handling")
-
-        # Category-specific tags
-        if metadata.category == "data":
-            tags.extend(["processing", "transformation"])
-        elif metadata.category == "integration":
-            tags.extend(["external", "connectivity"])
-
-        return tags
-
-    def _analyze_code_structure(self, content: str, metadata: PluginMetadata):
-        """Analyze plugin code structure to determine capabilities."""
-        try:
-            import ast
-
-            tree = ast.parse(content)
-
-            # Find functions
-            functions = [
-                node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)
-            ]
-
-            capabilities = []
-
-            # Check for standard plugin methods
-            method_names = [func.name for func in functions]
-
-            if "execute" in method_names:
-                capabilities.append("execute")
-            if "main" in method_names:
-                capabilities.append("main")
-            if "get_info" in method_names:
-                capabilities.append("info")
-            if "cleanup" in method_names:
-                capabilities.append("cleanup")
-
-            # Check for data processing capabilities
-            if any(
-                name in method_names for name in ["process", "analyze", "transform"]
-            ):
-                capabilities.append("data_processing")
-
-            # Check for file operations
-            if any(
-                name in method_names
-                for name in ["read_file", "write_file", "process_file"]
-            ):
-                capabilities.append("file_operations")
-
-            metadata.capabilities = capabilities
-
-        except Exception as e:
-            print(f"Error analyzing code structure: {e}")
-
-    def _calculate_compatibility_score(
-        self, content: str, metadata: PluginMetadata
-    ) -> float:
-        """Calculate compatibility score based on code analysis."""
-        score = 100.0
-
-        try:
-            # Check for Python 3 compatibility
-            if "print(" in content:
-                score += 10
-            elif "print " in content:
-                score -= 20  # Python 2 style print
-
-            # Check for type hints
-            if "typing" in content or "->" in content:
-                score += 15
-
-            # Check for error handling
-            if "try:" in content and "except:" in content:
-                score += 10
-
-            # Check for documentation
-            if '"""' in content or "'''" in content:
-                score += 10
-
-            # Check for dangerous operations
-            dangerous_patterns = ["eval(", "exec(", "os.system(", "__import__"]
-            for pattern in dangerous_patterns:
-                if pattern in content:
-                    score -= 30
-
-            # Normalize score
-            score = max(0, min(100, score))
-
-        except Exception:
-            score = 50.0  # Default score if analysis fails
-
-        return score
+    def _analyze_plugin_files(
+        self, tasks: List[Tuple[str, str]]
+    ) -> List[Tuple[str, Optional[Dict]]]:
+        """Analyze plugin files, in a process pool when there are many."""
+        if len(tasks) >= self.parallel_threshold:
+            try:
+                workers = self.max_workers or os.cpu_count() or 1
+                chunksize = max(1, len(tasks) // (workers * 4))
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(
+                        pool.map(_analyze_plugin_task, tasks, chunksize=chunksize)
+                    )
+            except Exception as e:
+                print(f"Parallel plugin analysis failed, analyzing serially: {e}")
+        return [_analyze_plugin_task(task) for task in tasks]
 
     def search_plugins(
-        self, query: str, filters: Optional[Dict] = None
+        self, query: str, filters: Optional[Dict] = None, limit: Optional[int] = None
     ) -> List[PluginMetadata]:
-        """Search for plugins based on query and filters."""
-        # Check cache first
-        cache_key = f"{query}:{json.dumps(filters or {}, sort_keys=True)}"
-        if cache_key in self.search_cache:
-            return self.search_cache[cache_key]
-
-        results = []
-        query_lower = query.lower()
-        filters = filters or {}
-
-        for plugin_name, metadata in self.plugin_index.items():
-            score = 0
-
-            # Text matching
-            if query_lower in metadata.name.lower():
-                score += 10
-            if query_lower in metadata.description.lower():
-                score += 8
-            if any(query_lower in tag.lower() for tag in metadata.tags):
-                score += 6
-            if query_lower in metadata.category.lower():
-                score += 5
-            if any(query_lower in cap.lower() for cap in metadata.capabilities):
-                score += 4
-
-            # Apply filters
-            if filters.get("category") and metadata.category != filters["category"]:
-                continue
-            if filters.get("min_rating") and metadata.rating < filters["min_rating"]:
-                continue
-            if filters.get("tags") and not any(
-                tag in metadata.tags for tag in filters["tags"]
-            ):
-                continue
-            if (
-                filters.get("min_compatibility")
-                and metadata.compatibility_score < filters["min_compatibility"]
-            ):
-                continue
-
-            if score > 0:
-                results.append((score, metadata))
+        """
+        Search for plugins based on query and filters.
+
+        Query words match whole indexed terms, and the start of longer terms
+        for autocomplete; results are ranked with BM25. Supported filters are
+        category, tags (any of), min_rating and min_compatibility. ``limit``
+        returns only the best matches.
+        """
+        # Check cache first; entries from older index generations never match.
+        # Keyed on the tokens the index searches, as case carries word breaks
+        cache_key = (
+            self.search_index.generation,
+            tuple(tokenize(query)),
+            json.dumps(filters or {}, sort_keys=True),
+            limit,
+        )
+        cached = self.search_cache.get(cache_key)
+        if cached is not None:
+            self.search_cache.move_to_end(cache_key)
+            return list(cached)
 
-        # Sort by relevance score
-        results.sort(key=lambda x: x[0], reverse=True)
-        final_results = [metadata for score, metadata in results]
+        ranked = self.search_index.search(query, filters, limit=limit)
+        final_results = [self.plugin_index[name] for name, _ in ranked]
 
         # Cache results
         self.search_cache[cache_key] = final_results
+        while len(self.search_cache) > self.search_cache_size:
+            self.search_cache.popitem(last=False)
+
+        return list(final_results)
 
-        return final_results
+    def get_search_facets(self) -> Dict[str, Dict]:
+        """Plugin counts per category, tag, rating and compatibility bucket."""
+        return self.search_index.get_facets()
 
     def get_plugins_by_category(self, category: str) -> List[PluginMetadata]:
         """Get all plugins in a specific category."""
@@ -597,7 +837,7 @@ class PluginDiscovery:
         """Update plugin usage statistics."""
         if plugin_name in self.plugin_index:
             self.plugin_index[plugin_name].usage_count += 1
-            self._save_plugin_index()
+            self._save_plugin_entries([plugin_name])
 
     def rate_plugin(self, plugin_name: str, rating: float):
         """Rate a plugin (0.0 to 5.0)."""
@@ -608,7 +848,8 @@ class PluginDiscovery:
                 self.plugin_index[plugin_name].rating = rating
             else:
                 self.plugin_index[plugin_name].rating = (current_rating + rating) / 2
-            self._save_plugin_index()
+            self.search_index.add(plugin_name, self.plugin_index[plugin_name])
+            self._save_plugin_entries([plugin_name])
 
     def get_discovery_stats(self) -> Dict:
         """Get plugin discovery statistics."""
@@ -15,6 +15,8 @@ import time
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional
 
+from .plugin_result_cache import MISS, PluginResultCache, is_deterministic
+
 
 class PluginState:
     """Plugin state management."""
@@ -48,7 +50,11 @@ class PluginState:
 class PluginManager:
     """Enhanced plugin management system."""
 
-    def __init__(self, plugins_dir: str | None = None):
+    def __init__(
+        self,
+        plugins_dir: str | None = None,
+        result_cache: PluginResultCache | None = None,
+    ):
         self.plugins_dir = plugins_dir or os.path.join(os.path.dirname(__file__))
         self.plugins: Dict[str, Any] = {}
         self.plugin_states: Dict[str, str] = {}
@@ -57,6 +63,9 @@ class PluginManager:
         self.auto_reload = False
         self.monitoring_thread = None
 
+        # Results of plugins declaring themselves deterministic
+        self.result_cache = result_cache or PluginResultCache()
+
         # Analytics integration
         self.analytics = None
         self._initialize_analytics()
@@ -231,6 +240,7 @@ class PluginManager:
 
             # Remove from plugins
             del self.plugins[plugin_name]
+            self.result_cache.invalidate_plugin(plugin_name)
             self.plugin_states[plugin_name] = PluginState.INACTIVE
 
             # Trigger unloaded event
@@ -258,13 +268,17 @@ class PluginManager:
             start_time = time.time()
             self.track_plugin_event(plugin_name, "execute_start")
 
-            # Execute plugin
-            if hasattr(plugin, "execute"):
-                result = plugin.execute(*args, **kwargs)
-            elif hasattr(plugin, "main"):
-                result = plugin.main(*args, **kwargs)
+            # Execute plugin, sharing results of identical deterministic calls
+            if is_deterministic(plugin):
+                result, source = self.result_cache.call(
+                    plugin_name,
+                    self.result_cache.source_hash(plugin),
+                    {"args": args, "kwargs": kwargs},
+                    lambda: self._call_plugin(plugin, *args, **kwargs),
+                )
             else:
-                result = None
+                result = self._call_plugin(plugin, *args, **kwargs)
+                source = MISS
 
             # Analytics tracking - success
             execution_time = time.time() - start_time
@@ -275,6 +289,7 @@ class PluginManager:
                     "execution_time": execution_time,
                     "args_count": len(args),
                     "kwargs_count": len(kwargs),
+                    "cache": source,
                 },
             )
 
@@ -287,6 +302,18 @@ class PluginManager:
             print(f"Error executing plugin {plugin_name}: {e}")
             return None
 
+    def _call_plugin(self, plugin: Any, *args, **kwargs) -> Any:
+        """Invoke a plugin's execute or main entry point."""
+        if hasattr(plugin, "execute"):
+            return plugin.execute(*args, **kwargs)
+        if hasattr(plugin, "main"):
+            return plugin.main(*args, **kwargs)
+        return None
+
+    def get_plugin_cache_stats(self, plugin_name: str) -> Dict[str, Any]:
+        """Result cache hit/miss counters for a deterministic plugin."""
+        return self.result_cache.get_stats(plugin_name)
+
     def execute_chain(self, user_message: str) -> str:
         """Execute a chain of plugins based on the user message."""
         try:
@@ -310,6 +337,7 @@ class PluginManager:
             "loaded": plugin_name in self.plugins,
             "metadata": self.plugin_metadata.get(plugin_name, {}),
             "analytics": {},
+            "cache": self.get_plugin_cache_stats(plugin_name),
         }
 
         # Add analytics data
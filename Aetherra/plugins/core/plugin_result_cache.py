@@ -0,0 +1,332 @@
+"""
+Aetherra Plugin Result Cache
+Memoizes results of deterministic plugins and coalesces identical in-flight
+invocations so concurrent callers share a single execution.
+"""
+
+import asyncio
+import concurrent.futures
+import dataclasses
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How a result was obtained, as returned alongside it
+HIT = "hit"
+MISS = "miss"
+COALESCED = "coalesced"
+UNCACHED = "uncached"
+
+
+class UncacheableInput(TypeError):
+    """Raised by ``canonicalize`` for values it cannot reduce faithfully"""
+
+
+def canonicalize(value: Any) -> Any:
+    """
+    Reduce a value to JSON-compatible data with a stable ordering
+
+    Dict keys are sorted, sets are ordered, dataclasses become dicts, bytes
+    and numpy-style arrays are hashed over their contents. Anything else
+    raises UncacheableInput: a repr may be truncated ("...") or hide state,
+    and would let different inputs share a key.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return {
+            str(k): canonicalize(v)
+            for k, v in sorted(value.items(), key=lambda item: str(item[0]))
+        }
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((canonicalize(v) for v in value), key=repr)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return canonicalize(dataclasses.asdict(value))
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": hashlib.sha256(value).hexdigest()}
+    dtype = getattr(value, "dtype", None)
+    if (
+        dtype is not None
+        and hasattr(value, "shape")
+        and hasattr(value, "tobytes")
+        and getattr(dtype, "kind", "O") != "O"  # Object arrays hold pointers
+    ):
+        return {
+            "__array__": [
+                str(dtype),
+                list(value.shape),
+                hashlib.sha256(value.tobytes()).hexdigest(),
+            ]
+        }
+    raise UncacheableInput(f"Cannot canonicalize {type(value).__name__}")
+
+
+def is_deterministic(plugin: Any) -> bool:
+    """Plugins opt in with ``deterministic = True`` or ``__deterministic__``"""
+    return bool(
+        getattr(plugin, "deterministic", False)
+        or getattr(plugin, "__deterministic__", False)
+    )
+
+
+class PluginResultCache:
+    """
+    LRU + TTL cache of deterministic plugin results with single-flight calls
+
+    Keys combine the plugin id, a hash of the plugin's source file and the
+    canonicalized input, so editing a plugin invalidates its entries. Calls
+    whose input cannot be canonicalized run uncached. Only
+    results accepted by ``is_success`` are stored; failures are shared with
+    coalesced callers but never cached. Cached values are returned as-is and
+    must not be mutated by callers.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[str, Tuple[float, str, Any]]" = OrderedDict()
+        self._inflight: Dict[str, Any] = {}
+        self._waiters: Dict[asyncio.Future, int] = {}  # Callers per async run
+        self._source_hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.RLock()
+
+    # Keys
+    def source_hash(self, plugin: Any) -> str:
+        """Hash of the file defining ``plugin`` (module, class or instance)"""
+        target = plugin
+        if not inspect.ismodule(plugin) and not inspect.isclass(plugin):
+            target = type(plugin)
+        try:
+            path = inspect.getsourcefile(target) or getattr(target, "__file__", None)
+        except TypeError:
+            path = getattr(target, "__file__", None)
+        if not path:
+            return ""
+
+        try:
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            with self._lock:
+                cached = self._source_hashes.get(path)
+                if cached and cached[0] == signature:
+                    return cached[1]
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError as e:
+            logger.warning(f"Could not hash plugin source {path}: {e}")
+            return ""
+        with self._lock:
+            self._source_hashes[path] = (signature, digest)
+        return digest
+
+    def make_key(self, plugin_id: str, source_hash: str, payload: Any) -> str:
+        material = json.dumps(
+            [plugin_id, source_hash, canonicalize(payload)],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    # Calls
+    def call(
+        self,
+        plugin_id: str,
+        source_hash: str,
+        payload: Any,
+        run: Callable[[], Any],
+        is_success: Callable[[Any], bool] = lambda result: result is not None,
+    ) -> Tuple[Any, str]:
+        """Return ``(result, source)`` running ``run`` at most once per key"""
+        key = self._make_key_or_none(plugin_id, source_hash, payload)
+        if key is None:
+            return run(), UNCACHED
+        with self._lock:
+            found, value = self._lookup(key, plugin_id)
+            if found:
+                return value, HIT
+            pending = self._inflight.get(key)
+            if isinstance(pending, concurrent.futures.Future):
+                self._count(plugin_id, "coalesced")
+            else:
+                pending = None
+                future: concurrent.futures.Future = concurrent.futures.Future()
+                self._inflight[key] = future
+                self._count(plugin_id, "misses")
+
+        if pending is not None:
+            return pending.result(), COALESCED
+
+        try:
+            result = run()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            if is_success(result):
+                self._store(key, plugin_id, result)
+            future.set_result(result)
+            return result, MISS
+        finally:
+            self._release(key, future)
+
+    async def call_async(
+        self,
+        plugin_id: str,
+        source_hash: str,
+        payload: Any,
+        run: Callable[[], Awaitable[Any]],
+        is_success: Callable[[Any], bool] = lambda result: result is not None,
+    ) -> Tuple[Any, str]:
+        """
+        Async ``call``; callers on the same event loop share one execution
+
+        The execution runs in its own task. Cancelling a caller, the first
+        one included, leaves it running for the others; it is cancelled once
+        every caller has gone.
+        """
+        key = self._make_key_or_none(plugin_id, source_hash, payload)
+        if key is None:
+            return await run(), UNCACHED
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            found, value = self._lookup(key, plugin_id)
+            if found:
+                return value, HIT
+            shared = self._inflight.get(key)
+            if isinstance(shared, asyncio.Future) and shared.get_loop() is loop:
+                self._count(plugin_id, "coalesced")
+                source = COALESCED
+            else:
+                shared = loop.create_task(
+                    self._run_shared(key, plugin_id, run, is_success)
+                )
+                self._inflight[key] = shared
+                self._count(plugin_id, "misses")
+                source = MISS
+            self._waiters[shared] = self._waiters.get(shared, 0) + 1
+
+        try:
+            return await asyncio.shield(shared), source
+        except asyncio.CancelledError:
+            with self._lock:
+                remaining = self._waiters.get(shared)
+                if remaining is not None:
+                    if remaining > 1:
+                        self._waiters[shared] = remaining - 1
+                    else:
+                        del self._waiters[shared]
+                        shared.cancel()
+            raise
+
+    async def _run_shared(
+        self,
+        key: str,
+        plugin_id: str,
+        run: Callable[[], Awaitable[Any]],
+        is_success: Callable[[Any], bool],
+    ) -> Any:
+        task = asyncio.current_task()
+        try:
+            result = await run()
+            if is_success(result):
+                self._store(key, plugin_id, result)
+            return result
+        finally:
+            self._release(key, task)
+            with self._lock:
+                self._waiters.pop(task, None)
+
+    # Management
+    def invalidate_plugin(self, plugin_id: str):
+        with self._lock:
+            stale = [k for k, entry in self._entries.items() if entry[1] == plugin_id]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self, plugin_id: Optional[str] = None) -> Dict[str, Any]:
+        """Hit/miss counters for one plugin, or totals across plugins"""
+        with self._lock:
+            if plugin_id is not None:
+                stats = dict(self._stats.get(plugin_id) or self._empty_stats())
+            else:
+                stats = self._empty_stats()
+                for plugin_stats in self._stats.values():
+                    for name, count in plugin_stats.items():
+                        stats[name] += count
+                stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_ratio"] = (
+            (stats["hits"] + stats["coalesced"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+    # Internals
+    def _make_key_or_none(
+        self, plugin_id: str, source_hash: str, payload: Any
+    ) -> Optional[str]:
+        try:
+            return self.make_key(plugin_id, source_hash, payload)
+        except UncacheableInput as e:
+            logger.debug(f"Running {plugin_id} uncached: {e}")
+            with self._lock:
+                self._count(plugin_id, "uncacheable")
+            return None
+
+    def _empty_stats(self) -> Dict[str, int]:
+        return {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0,
+            "uncacheable": 0,
+        }
+
+    def _count(self, plugin_id: str, name: str):
+        stats = self._stats.get(plugin_id)
+        if stats is None:
+            stats = self._stats[plugin_id] = self._empty_stats()
+        stats[name] += 1
+
+    def _lookup(self, key: str, plugin_id: str) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        self._count(plugin_id, "hits")
+        return True, entry[2]
+
+    def _store(self, key: str, plugin_id: str, result: Any):
+        with self._lock:
+            self._entries[key] = (
+                time.monotonic() + self.ttl_seconds,
+                plugin_id,
+                result,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                _, (_, evicted_plugin, _) = self._entries.popitem(last=False)
+                self._count(evicted_plugin, "evictions")
+
+    def _release(self, key: str, future: Any):
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
@@ -0,0 +1,312 @@
+"""
+Plugin Search Index
+===================
+
+Tokenized inverted index over plugin metadata with BM25 ranking, prefix
+matching for autocomplete and precomputed filter facets.
+"""
+
+import bisect
+import heapq
+import math
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Field weights applied to term frequencies (a simple BM25F)
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "tags": 2.0,
+    "category": 1.5,
+    "capabilities": 1.2,
+    "description": 1.0,
+}
+
+# Prefix-only matches count for less than whole-word matches
+PREFIX_WEIGHT = 0.5
+MAX_PREFIX_EXPANSIONS = 64
+
+# Ranked postings are rebuilt once the average document length drifts by
+# more than this fraction from the value they were computed with
+NORM_DRIFT = 0.1
+
+_CAMEL_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens (snake_case and camelCase aware)."""
+    return _TOKEN.findall(_CAMEL_BOUNDARY.sub(r"\1 \2", text or "").lower())
+
+
+class PluginSearchIndex:
+    """
+    Incrementally maintained inverted index over plugin metadata.
+
+    Each term keeps a lazily built list of its postings ordered by BM25
+    term weight, dropped when the term's postings change, so single-term
+    and autocomplete queries read results off in rank order. ``generation``
+    increases on every change so callers can key result caches on it
+    instead of clearing them.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.generation = 0
+        self._reset()
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def _reset(self):
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._terms: List[str] = []  # Sorted, for prefix lookups
+        self._doc_terms: Dict[str, Dict[str, float]] = {}
+        self._doc_lengths: Dict[str, float] = {}
+        self._total_length = 0.0
+
+        # term -> (norm epoch, [(-weight, name), ...] best first)
+        self._ranked: Dict[str, Tuple[int, List[Tuple[float, str]]]] = {}
+        self._norm_average = 0.0
+        self._norm_epoch = 0
+
+        # Facets: value -> plugin names
+        self._categories: Dict[str, Set[str]] = defaultdict(set)
+        self._tags: Dict[str, Set[str]] = defaultdict(set)
+        self._rating_buckets: Dict[int, Set[str]] = defaultdict(set)
+        self._compatibility_buckets: Dict[int, Set[str]] = defaultdict(set)
+        self._facet_values: Dict[str, Tuple[str, List[str], float, float]] = {}
+
+    # Maintenance
+    def add(self, name: str, metadata: Any):
+        """Index (or re-index) one plugin."""
+        if name in self._doc_terms:
+            self._remove(name)
+
+        terms: Dict[str, float] = defaultdict(float)
+        fields = {
+            "name": [metadata.name],
+            "tags": metadata.tags,
+            "category": [metadata.category],
+            "capabilities": metadata.capabilities,
+            "description": [metadata.description],
+        }
+        for field, values in fields.items():
+            weight = FIELD_WEIGHTS[field]
+            for value in values:
+                for token in tokenize(value):
+                    terms[token] += weight
+
+        for term, frequency in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                bisect.insort(self._terms, term)
+            postings[name] = frequency
+            self._ranked.pop(term, None)
+        self._doc_terms[name] = dict(terms)
+        self._doc_lengths[name] = sum(terms.values())
+        self._total_length += self._doc_lengths[name]
+        self._check_norm_drift()
+
+        rating = float(metadata.rating or 0.0)
+        compatibility = float(metadata.compatibility_score or 0.0)
+        tags = list(metadata.tags)
+        self._categories[metadata.category].add(name)
+        for tag in tags:
+            self._tags[tag].add(name)
+        self._rating_buckets[int(rating)].add(name)
+        self._compatibility_buckets[int(compatibility // 10)].add(name)
+        self._facet_values[name] = (metadata.category, tags, rating, compatibility)
+        self.generation += 1
+
+    def remove(self, name: str):
+        """Drop one plugin from the index."""
+        if name in self._doc_terms:
+            self._remove(name)
+            self.generation += 1
+
+    def rebuild(self, plugins: Dict[str, Any]):
+        """Replace the whole index."""
+        self._reset()
+        self.generation += 1
+        for name, metadata in plugins.items():
+            self.add(name, metadata)
+
+    def _remove(self, name: str):
+        for term in self._doc_terms.pop(name):
+            postings = self._postings[term]
+            del postings[name]
+            self._ranked.pop(term, None)
+            if not postings:
+                del self._postings[term]
+                del self._terms[bisect.bisect_left(self._terms, term)]
+        self._total_length -= self._doc_lengths.pop(name)
+        self._check_norm_drift()
+
+        category, tags, rating, compatibility = self._facet_values.pop(name)
+        self._discard(self._categories, category, name)
+        for tag in tags:
+            self._discard(self._tags, tag, name)
+        self._discard(self._rating_buckets, int(rating), name)
+        self._discard(self._compatibility_buckets, int(compatibility // 10), name)
+
+    def _check_norm_drift(self):
+        documents = len(self._doc_terms)
+        average = self._total_length / documents if documents else 0.0
+        if abs(average - self._norm_average) > NORM_DRIFT * self._norm_average:
+            self._norm_average = average
+            self._norm_epoch += 1
+
+    @staticmethod
+    def _discard(facet: Dict[Any, Set[str]], value: Any, name: str):
+        members = facet.get(value)
+        if members is not None:
+            members.discard(name)
+            if not members:
+                del facet[value]
+
+    # Queries
+    def expand_prefix(self, prefix: str) -> List[str]:
+        """Indexed terms starting with ``prefix`` (autocomplete)."""
+        start = bisect.bisect_left(self._terms, prefix)
+        end = bisect.bisect_left(self._terms, prefix + "\uffff", lo=start)
+        return self._terms[start : min(end, start + MAX_PREFIX_EXPANSIONS)]
+
+    def search(
+        self,
+        query: str,
+        filters: Optional[Dict] = None,
+        prefix: bool = True,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank plugins for ``query`` as ``(name, score)``, best first.
+
+        Every query token matches whole terms; with ``prefix`` it also
+        matches terms it is a prefix of, at reduced weight. An empty query
+        returns every plugin passing the filters. ``limit`` keeps only the
+        best results.
+        """
+        allowed = self._filter(filters or {})
+        tokens = tokenize(query)
+        if not tokens:
+            names = sorted(self._doc_terms if allowed is None else allowed)
+            return [(name, 0.0) for name in names[:limit]]
+
+        term_weights: Dict[str, float] = {}
+        for token in dict.fromkeys(tokens):
+            matches = self.expand_prefix(token) if prefix else [token]
+            for term in matches:
+                if term in self._postings:
+                    weight = 1.0 if term == token else PREFIX_WEIGHT
+                    term_weights[term] = term_weights.get(term, 0.0) + weight
+        if not term_weights:
+            return []
+
+        if len(term_weights) == 1:
+            # Already in rank order: no accumulation or sort needed
+            ((term, weight),) = term_weights.items()
+            scale = weight * self._idf(term)
+            results = []
+            for negative, name in self._ranked_postings(term):
+                if allowed is None or name in allowed:
+                    results.append((name, -negative * scale))
+                    if limit and len(results) >= limit:
+                        break
+            return results
+
+        scores: Dict[str, float] = defaultdict(float)
+        for term, weight in term_weights.items():
+            scale = weight * self._idf(term)
+            for negative, name in self._ranked_postings(term):
+                if allowed is None or name in allowed:
+                    scores[name] -= negative * scale
+
+        def rank(item):
+            return (-item[1], item[0])
+
+        if limit:
+            return heapq.nsmallest(limit, scores.items(), key=rank)
+        return sorted(scores.items(), key=rank)
+
+    def _idf(self, term: str) -> float:
+        documents = len(self._doc_terms)
+        matching = len(self._postings[term])
+        return math.log(1 + (documents - matching + 0.5) / (matching + 0.5))
+
+    def _ranked_postings(self, term: str) -> List[Tuple[float, str]]:
+        """Postings of ``term`` as ``(-BM25 term weight, name)``, best first."""
+        cached = self._ranked.get(term)
+        if cached is not None and cached[0] == self._norm_epoch:
+            return cached[1]
+
+        k1, b = self.k1, self.b
+        norm = k1 * (1 - b)
+        norm_per_length = k1 * b / (self._norm_average or 1.0)
+        lengths = self._doc_lengths
+        ranked = sorted(
+            (
+                -frequency
+                * (k1 + 1)
+                / (frequency + norm + norm_per_length * lengths[n]),
+                n,
+            )
+            for n, frequency in self._postings[term].items()
+        )
+        self._ranked[term] = (self._norm_epoch, ranked)
+        return ranked
+
+    def _filter(self, filters: Dict) -> Optional[Set[str]]:
+        """Plugin names passing the filters, or None when unfiltered."""
+        allowed: Optional[Set[str]] = None
+
+        def narrow(names: Iterable[str]):
+            nonlocal allowed
+            names = set(names)
+            allowed = names if allowed is None else allowed & names
+
+        if filters.get("category"):
+            narrow(self._categories.get(filters["category"], ()))
+        if filters.get("tags"):
+            narrow(n for tag in filters["tags"] for n in self._tags.get(tag, ()))
+        if filters.get("min_rating"):
+            narrow(self._at_least(self._rating_buckets, filters["min_rating"], 2, 1.0))
+        if filters.get("min_compatibility"):
+            narrow(
+                self._at_least(
+                    self._compatibility_buckets, filters["min_compatibility"], 3, 10.0
+                )
+            )
+        return allowed
+
+    def _at_least(
+        self,
+        buckets: Dict[int, Set[str]],
+        minimum: float,
+        value_index: int,
+        bucket_size: float,
+    ) -> Set[str]:
+        """Members of buckets above ``minimum``; the boundary bucket is checked."""
+        boundary = int(minimum // bucket_size)
+        names: Set[str] = set()
+        for bucket, members in buckets.items():
+            if bucket > boundary:
+                names |= members
+            elif bucket == boundary:
+                names.update(
+                    n for n in members if self._facet_values[n][value_index] >= minimum
+                )
+        return names
+
+    def get_facets(self) -> Dict[str, Dict[Any, int]]:
+        """Plugin counts per category, tag, rating and compatibility bucket."""
+        return {
+            "category": {k: len(v) for k, v in self._categories.items()},
+            "tags": {k: len(v) for k, v in self._tags.items()},
+            "rating": {k: len(v) for k, v in sorted(self._rating_buckets.items())},
+            "compatibility": {
+                k * 10: len(v) for k, v in sorted(self._compatibility_buckets.items())
+            },
+        }
@@ -5,7 +5,7 @@ import re
 import time
 from datetime import datetime
 from queue import Queue
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 
 class ExecutionContext:
@@ -105,8 +105,13 @@ class AetherRuntime:
         print(f"✅ Processed {processed} goals from queue")
         return processed
 
-    def execute(self):
-        """Execute the loaded script."""
+    def execute(self, should_stop: Optional[Callable[[], bool]] = None):
+        """
+        Execute the loaded script.
+
+        ``should_stop`` is checked before every command; returning True stops
+        execution the same way stop_execution() does.
+        """
         if not self.script_lines:
             print("[WARN] No script loaded")
             return False
@@ -119,6 +124,8 @@ class AetherRuntime:
         )
 
         for i, line in enumerate(self.script_lines, 1):
+            if should_stop is not None and should_stop():
+                self.running = False
             if not self.running:
                 print("⏹️ Execution stopped")
                 break
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+📈 FractalMesh Ingest Benchmark
+==============================
+
+Measures per-insert latency of FractalMeshCore.store_fragment as the mesh
+grows. With the concept -> cluster inverted index and the sorted episodic
+time index, latency should stay flat from 1k to 1M fragments.
+
+Persistence is disabled so the numbers reflect the in-memory indexing,
+clustering and chaining work only.
+
+Usage:
+    python Aetherra/scripts/benchmarks/fractal_mesh_ingest_benchmark.py
+    python Aetherra/scripts/benchmarks/fractal_mesh_ingest_benchmark.py --max 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Add repository root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from Aetherra.aetherra_core.memory.fractal_mesh.base import (  # noqa: E402
+    FractalMeshCore,
+    MemoryFragment,
+    MemoryFragmentType,
+)
+
+CHECKPOINTS = [1_000, 10_000, 100_000, 1_000_000]
+SAMPLE_SIZE = 1_000
+VOCABULARY = [f"concept_{i}" for i in range(5_000)]
+
+
+def make_fragment(index: int, start: datetime) -> MemoryFragment:
+    """Build a synthetic fragment, roughly one per minute of simulated time"""
+    created_at = start + timedelta(minutes=index)
+    fragment_type = (
+        MemoryFragmentType.EPISODIC if index % 2 == 0 else MemoryFragmentType.SEMANTIC
+    )
+    return MemoryFragment(
+        fragment_id=f"fragment_{index}",
+        content={"text": f"synthetic memory {index}"},
+        fragment_type=fragment_type,
+        temporal_tags={},
+        symbolic_tags=set(random.sample(VOCABULARY, 3)),
+        associative_links=[],
+        confidence_score=random.random(),
+        access_pattern={},
+        narrative_role=None,
+        created_at=created_at,
+        last_evolved=created_at,
+    )
+
+
+def run_benchmark(max_fragments: int):
+    """Insert fragments and report latency around each checkpoint"""
+    checkpoints = [c for c in CHECKPOINTS if c <= max_fragments] or [max_fragments]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        mesh = FractalMeshCore(os.path.join(tmp_dir, "bench_fractal.db"))
+        mesh._persist_fragment = lambda fragment: None
+
+        start = datetime.now() - timedelta(minutes=max_fragments)
+        print(f"🧠 Ingesting up to {checkpoints[-1]:,} fragments")
+        print(f"{'fragments':>12} {'mean_us':>10} {'p99_us':>10} {'chains':>8}")
+
+        inserted = 0
+        for checkpoint in checkpoints:
+            # Fill up to just before the checkpoint without timing
+            while inserted < checkpoint - SAMPLE_SIZE:
+                mesh.store_fragment(make_fragment(inserted, start))
+                inserted += 1
+
+            samples = []
+            while inserted < checkpoint:
+                fragment = make_fragment(inserted, start)
+                began = time.perf_counter()
+                mesh.store_fragment(fragment)
+                samples.append(time.perf_counter() - began)
+                inserted += 1
+
+            samples.sort()
+            mean_us = sum(samples) / len(samples) * 1e6
+            p99_us = samples[int(len(samples) * 0.99) - 1] * 1e6
+            print(
+                f"{checkpoint:>12,} {mean_us:>10.1f} {p99_us:>10.1f} "
+                f"{len(mesh.episodic_chains):>8}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--max",
+        type=int,
+        default=CHECKPOINTS[-1],
+        help="largest mesh size to measure (default: 1,000,000)",
+    )
+    args = parser.parse_args()
+    random.seed(42)
+    run_benchmark(args.max)
+
+
+if __name__ == "__main__":
+    main()
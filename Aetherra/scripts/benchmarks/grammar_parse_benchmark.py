@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+🧬 Grammar Parse Benchmark
+=========================
+
+Cold and warm costs of parsing .aether scripts with AetherraParser.
+
+Parser start-up: building the LALR tables from the grammar, as every
+AetherraParser used to, against loading Lark's serialized tables from disk.
+Parsing: the same system script parsed again and again without an AST
+cache, from the in-memory tier and from the SQLite tier of a fresh cache
+(a new process that finds the script parsed by an earlier one).
+
+Usage:
+    python Aetherra/scripts/benchmarks/grammar_parse_benchmark.py
+    python Aetherra/scripts/benchmarks/grammar_parse_benchmark.py --lines 2000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# Add repository root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from lark import Lark  # noqa: E402
+
+from Aetherra.core.aetherra_grammar import (  # noqa: E402
+    AetherraCodeTransformer,
+    AetherraParser,
+    ASTCache,
+    aetherra_GRAMMAR,
+    get_shared_parser,
+)
+
+STATEMENTS = [
+    'goal: "keep memory usage under control" priority: high',
+    "agent: on",
+    'remember("nightly cleanup finished") as "maintenance"',
+    'status = "healthy"',
+    "# Housekeeping",
+]
+
+
+def make_script(lines):
+    return "\n".join(STATEMENTS[i % len(STATEMENTS)] for i in range(lines))
+
+
+def build_parser(cache):
+    return Lark(
+        aetherra_GRAMMAR,
+        parser="lalr",
+        transformer=AetherraCodeTransformer(),
+        start="program",
+        cache=cache,
+    )
+
+
+def time_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--lines", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    script = make_script(args.lines)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tables = os.path.join(tmp_dir, "aether.lark")
+        build_parser(tables)  # Writes the serialized tables
+
+        print(f"🧬 Parser start-up (median of {args.repeat})")
+        print(f"{'parser':<34} {'ms':>9}")
+        for label, fn in [
+            ("build LALR tables (legacy)", lambda: build_parser(False)),
+            ("load serialized tables", lambda: build_parser(tables)),
+            ("AetherraParser() (shared)", AetherraParser),
+        ]:
+            print(f"{label:<34} {time_ms(fn, args.repeat):>9.2f}")
+
+        db_path = os.path.join(tmp_dir, "asts.db")
+        memory = AetherraParser(ast_cache=ASTCache(db_path))
+        memory.parse(script)
+
+        def persistent_hit():
+            cache = ASTCache(db_path, max_entries=0)
+            AetherraParser(ast_cache=cache).parse(script)
+            cache.close()
+
+        lark_parser = get_shared_parser()
+        cleaned = memory._preprocess_source(script)
+        print()
+        print(f"📄 Parsing a {args.lines}-line script (median of {args.repeat})")
+        print(f"{'path':<34} {'ms':>9}")
+        for label, fn in [
+            ("legacy: new parser + parse", lambda: build_parser(False).parse(cleaned)),
+            ("shared parser, no AST cache", lambda: lark_parser.parse(cleaned)),
+            ("AST cache, memory tier", lambda: memory.parse(script)),
+            ("AST cache, SQLite tier", persistent_hit),
+        ]:
+            print(f"{label:<34} {time_ms(fn, args.repeat):>9.2f}")
+        memory.ast_cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+🚦 Job API Load Test
+===================
+
+Measures .aether job throughput (jobs/sec) through the worker-pool
+JobController, and how many submissions admission control turned away
+(the API answers those with HTTP 429). Rejected clients back off briefly
+and retry, as they would on a Retry-After header.
+
+By default jobs are submitted in-process against a temporary SQLite job
+store; with --url the same load is sent over HTTP to a running API server
+(start it with python Aetherra/api/run_server.py).
+
+Usage:
+    python Aetherra/scripts/benchmarks/job_api_load_test.py
+    python Aetherra/scripts/benchmarks/job_api_load_test.py --jobs 2000 --workers 8
+    python Aetherra/scripts/benchmarks/job_api_load_test.py --url http://localhost:8000
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+# Add repository root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from Aetherra.api.job_controller import (  # noqa: E402
+    AetherScriptRunner,
+    JobController,
+    JobQueueFull,
+    _run_job,
+)
+from Aetherra.api.job_store import FINISHED_STATUSES, JobStore  # noqa: E402
+
+LOAD_SCRIPT = "\n".join(
+    ['goal "keep the load test honest"']
+    + [f"$value_{i} = {i}" for i in range(20)]
+    + ["$copy = $value_19", "show goals"]
+)
+
+
+def run_in_process(args, script_dir, db_path, mode):
+    """Submit every job to a JobController; returns (seconds, rejections)"""
+    store = JobStore(db_path)
+    controller = JobController(
+        store=store,
+        max_workers=args.workers,
+        max_queue=args.queue,
+        mode=mode,
+        script_dirs=[script_dir],
+    )
+    rejected = 0
+    job_ids = []
+    started = time.perf_counter()
+    for i in range(args.jobs):
+        while True:
+            try:
+                job_ids.append(controller.run_script("load", {"index": i}))
+                break
+            except JobQueueFull:
+                rejected += 1
+                time.sleep(args.backoff)
+
+    # Wait until every job has finished
+    while controller.running_jobs:
+        time.sleep(0.005)
+    elapsed = time.perf_counter() - started
+    finished = sum(store.get_status(job_id) in FINISHED_STATUSES for job_id in job_ids)
+    assert finished == args.jobs, f"only {finished} of {args.jobs} jobs finished"
+    controller.shutdown()
+    store.close()
+    return elapsed, rejected
+
+
+def run_unbounded(args, script_dir, db_path):
+    """The original approach: one new thread per job, no admission control"""
+    store = JobStore(db_path)
+    runner = AetherScriptRunner([script_dir])
+    threads = []
+    started = time.perf_counter()
+    for i in range(args.jobs):
+        job_id = f"job-{i}"
+        store.create_job(job_id, "load", {"index": i})
+        thread = threading.Thread(
+            target=_run_job, args=(store, runner, job_id), daemon=True
+        )
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    store.close()
+    return elapsed, 0
+
+
+def run_http(args):
+    """Send the load to a running API server; returns (seconds, rejections)"""
+    rejected = 0
+    job_ids = []
+
+    def request(method, path, body=None):
+        data = json.dumps(body).encode() if body is not None else None
+        req = urllib.request.Request(
+            args.url.rstrip("/") + path,
+            data=data,
+            method=method,
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(req, timeout=30) as response:
+            return json.loads(response.read())
+
+    started = time.perf_counter()
+    for i in range(args.jobs):
+        while True:
+            try:
+                body = {"script_name": args.script, "parameters": {"index": i}}
+                job_ids.append(request("POST", "/run", body)["job_id"])
+                break
+            except urllib.error.HTTPError as e:
+                if e.code != 429:
+                    raise
+                rejected += 1
+                time.sleep(float(e.headers.get("Retry-After") or args.backoff))
+
+    pending = set(job_ids)
+    while pending:
+        for job_id in list(pending):
+            status = request("GET", f"/status/{job_id}")["status"]
+            if status in ("completed", "failed", "cancelled"):
+                pending.discard(job_id)
+        time.sleep(0.05)
+    return time.perf_counter() - started, rejected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue", type=int, default=50)
+    parser.add_argument("--backoff", type=float, default=0.002)
+    parser.add_argument("--url", help="Base URL of a running API server")
+    parser.add_argument("--script", default="goal_autopilot.aether")
+    args = parser.parse_args()
+
+    rows = []
+    if args.url:
+        rows.append(("http", *run_http(args)))
+    else:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, "load.aether"), "w") as f:
+                f.write(LOAD_SCRIPT)
+
+            # The runtime reports every command on stdout
+            with open(os.devnull, "w") as devnull:
+                with contextlib.redirect_stdout(devnull):
+                    for mode in ("thread", "process"):
+                        db_path = os.path.join(tmp_dir, f"{mode}.db")
+                        rows.append(
+                            (
+                                f"{mode} pool",
+                                *run_in_process(args, tmp_dir, db_path, mode),
+                            )
+                        )
+                    db_path = os.path.join(tmp_dir, "unbounded.db")
+                    rows.append(("unbounded", *run_unbounded(args, tmp_dir, db_path)))
+
+    print(
+        f"🚦 {args.jobs} jobs, {args.workers} workers, queue {args.queue}, "
+        f"{os.cpu_count()} CPUs"
+    )
+    print(f"{'runner':>12} {'seconds':>8} {'jobs/sec':>9} {'rejected':>9}")
+    for name, elapsed, rejected in rows:
+        print(f"{name:>12} {elapsed:>8.2f} {args.jobs / elapsed:>9.0f} {rejected:>9}")
+
+
+if __name__ == "__main__":
+    main()
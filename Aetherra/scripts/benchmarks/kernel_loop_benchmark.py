@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+⚡ Kernel Loop Benchmark
+=======================
+
+Throughput and queue wait of AetherraKernelLoop for a burst of mixed tasks
+(memory queries, plugin invocations and Lyrixa thoughts across the three
+priorities), each handler awaiting simulated I/O.
+
+Compares the original cycle loop (up to 5 high, 3 normal and 1 background
+task per cycle, awaited one at a time, then a sleep) with the concurrent
+dispatcher, with and without a memory system that accepts batched queries.
+The original loop is only run for a fixed window, as draining the burst
+would take minutes.
+
+Usage:
+    python Aetherra/scripts/benchmarks/kernel_loop_benchmark.py
+    python Aetherra/scripts/benchmarks/kernel_loop_benchmark.py --tasks 5000 --io-ms 50
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+
+# Add repository root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from aetherra_kernel_loop import AetherraKernelLoop  # noqa: E402
+
+TASK_TYPES = ["memory_query"] * 6 + ["plugin_invoke"] * 3 + ["lyrixa_thought"]
+PRIORITIES = ["high"] * 2 + ["normal"] * 5 + ["background"] * 3
+
+
+class SimulatedSystem:
+    """Memory system, plugin manager and Lyrixa engine with fixed I/O latency"""
+
+    def __init__(self, io_seconds):
+        self.io_seconds = io_seconds
+
+    async def process_query(self, data):
+        await asyncio.sleep(self.io_seconds)
+
+    async def invoke_plugin(self, data):
+        await asyncio.sleep(self.io_seconds)
+
+    async def process_thought(self, data):
+        await asyncio.sleep(self.io_seconds)
+
+
+class BatchingSystem(SimulatedSystem):
+    async def process_queries(self, batch):
+        await asyncio.sleep(self.io_seconds)  # One round trip for the batch
+
+
+def make_tasks(count):
+    return [
+        (
+            {"type": random.choice(TASK_TYPES), "data": {"n": i}},
+            random.choice(PRIORITIES),
+        )
+        for i in range(count)
+    ]
+
+
+async def legacy_run(system, tasks, window):
+    """The original _main_processing_loop; returns tasks done within the window"""
+    queues = {p: asyncio.Queue() for p in ["high", "normal", "background"]}
+    for task, priority in tasks:
+        await queues[priority].put(task)
+    kernel = AetherraKernelLoop()
+    kernel.inject_systems(system, system, system, None, None)
+
+    done = 0
+    deadline = time.monotonic() + window
+    while time.monotonic() < deadline:
+        cycle_start = time.time()
+        for priority, max_tasks in [("high", 5), ("normal", 3), ("background", 1)]:
+            processed = 0
+            while not queues[priority].empty() and processed < max_tasks:
+                await kernel._execute_task(await queues[priority].get())
+                processed += 1
+                done += 1
+        cycle_time = time.time() - cycle_start
+        await asyncio.sleep(max(0.1, 1.0 - cycle_time))
+    return done
+
+
+async def dispatcher_run(system, tasks):
+    """Drain the burst with the dispatcher; returns seconds taken and status"""
+    kernel = AetherraKernelLoop()
+    kernel.inject_systems(system, system, system, None, None)
+    kernel.running = True
+    dispatcher = asyncio.create_task(kernel._dispatch_loop())
+
+    started = time.monotonic()
+    for task, priority in tasks:
+        await kernel.add_task(task, priority)
+    while sum(kernel._queued_counts.values()) or kernel._runs:
+        await asyncio.sleep(0.001)
+    elapsed = time.monotonic() - started
+
+    kernel.running = False
+    kernel._work_available.set()
+    await dispatcher
+    return elapsed, kernel.get_status()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--io-ms", type=float, default=20.0)
+    parser.add_argument("--legacy-window", type=float, default=5.0)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    random.seed(3)
+    tasks = make_tasks(args.tasks)
+    io_seconds = args.io_ms / 1000
+
+    print(f"⚡ {args.tasks:,} tasks, {args.io_ms:g} ms simulated I/O per call")
+    print(
+        f"{'kernel':<20} {'tasks/s':>9} {'prio':>11} {'wait_p50':>9} "
+        f"{'wait_p99':>9} {'svc_p50':>8}"
+    )
+
+    done = asyncio.run(
+        legacy_run(SimulatedSystem(io_seconds), tasks, args.legacy_window)
+    )
+    print(f"{'legacy cycle loop':<20} {done / args.legacy_window:>9.1f}")
+
+    for label, system in [
+        ("dispatcher", SimulatedSystem(io_seconds)),
+        ("dispatcher+batching", BatchingSystem(io_seconds)),
+    ]:
+        elapsed, status = asyncio.run(dispatcher_run(system, tasks))
+        rate = f"{args.tasks / elapsed:.1f}"
+        for priority in ["high", "normal", "background"]:
+            wait = status["queue_wait_ms"][priority]
+            service = status["service_time_ms"][priority]
+            print(
+                f"{label:<20} {rate:>9} {priority:>11} {wait['p50_ms']:>9.1f} "
+                f"{wait['p99_ms']:>9.1f} {service['p50_ms']:>8.1f}"
+            )
+            label = rate = ""
+
+
+if __name__ == "__main__":
+    main()
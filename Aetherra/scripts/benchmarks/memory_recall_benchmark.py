@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+🔍 Memory Recall Benchmark
+=========================
+
+Compares recall latency of the original ``content LIKE '%q%' OR tags LIKE
+'%q%'`` scan with the FTS5-backed LyrixaMemorySystem.recall_memories path
+(BM25 blended with importance and recency) at 100k memories.
+
+Each query word appears in a few dozen memories (or none), so the LIKE
+path cannot stop early on the importance index and scans most of the table.
+
+Usage:
+    python Aetherra/scripts/benchmarks/memory_recall_benchmark.py
+    python Aetherra/scripts/benchmarks/memory_recall_benchmark.py --memories 20000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Add repository root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from Aetherra.aetherra_core.memory.memory_core import (  # noqa: E402
+    LyrixaMemorySystem,
+)
+
+VOCABULARY = [f"topic{i}" for i in range(50_000)]
+MEMORY_TYPES = ["conversation", "project", "preference", "learning"]
+QUERIES = 50
+
+LEGACY_SQL = """
+    SELECT id, content, context, tags, importance, created_at, last_accessed,
+           access_count, memory_type
+    FROM memories
+    WHERE 1=1 AND (content LIKE ? OR tags LIKE ?)
+    ORDER BY importance DESC, created_at DESC LIMIT ?
+"""
+
+
+def seed(memory: LyrixaMemorySystem, count: int, rng: random.Random):
+    """Bulk-insert synthetic memories; triggers populate the search index"""
+    now = datetime.now()
+    rows = []
+    for i in range(count):
+        created = (now - timedelta(minutes=i)).isoformat()
+        words = rng.sample(VOCABULARY, 8)
+        rows.append(
+            (
+                f"memory_{i}",
+                json.dumps({"text": " ".join(words)}),
+                "{}",
+                json.dumps(words[:2]),
+                rng.random(),
+                created,
+                created,
+                0,
+                rng.choice(MEMORY_TYPES),
+            )
+        )
+
+    conn = memory.ensure_connection()
+    conn.executemany("INSERT INTO memories VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+
+
+def measure(label: str, fn, queries):
+    started = time.perf_counter()
+    samples = []
+    for query in queries:
+        began = time.perf_counter()
+        fn(query)
+        samples.append((time.perf_counter() - began) * 1000)
+    total_s = time.perf_counter() - started
+    samples.sort()
+    p50 = samples[len(samples) // 2]
+    p99 = samples[max(int(len(samples) * 0.99) - 1, 0)]
+    print(f"{label:<12} {p50:>10.2f} {p99:>10.2f} {total_s:>10.2f}")
+    return p50
+
+
+def run_benchmark(count: int, limit: int):
+    rng = random.Random(42)
+    # Half the queries hit a handful of memories, half match nothing
+    queries = [
+        rng.choice(VOCABULARY) if i % 2 == 0 else f"missing{i}" for i in range(QUERIES)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        memory = LyrixaMemorySystem(os.path.join(tmp_dir, "recall_bench.db"))
+        started = time.perf_counter()
+        seed(memory, count, rng)
+        print(f"🧠 Seeded {count:,} memories in {time.perf_counter() - started:.1f}s")
+
+        conn = memory.ensure_connection()
+        print(f"{'path':<12} {'p50_ms':>10} {'p99_ms':>10} {'total_s':>10}")
+
+        legacy_p50 = measure(
+            "LIKE scan",
+            lambda q: conn.execute(LEGACY_SQL, (f"%{q}%", f"%{q}%", limit)).fetchall(),
+            queries,
+        )
+        fts_p50 = measure(
+            "FTS5 + BM25",
+            lambda q: memory._query_memories(text=q, limit=limit),
+            queries,
+        )
+        measure(
+            "recall",
+            lambda q: asyncio.run(memory.recall_memories(q, limit=limit)),
+            queries[:10],
+        )
+        print(f"Speedup (p50, query only): {legacy_p50 / fts_p50:.0f}x")
+        memory.close_connection()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory recall benchmark")
+    parser.add_argument("--memories", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=5)
+    args = parser.parse_args()
+    run_benchmark(args.memories, args.limit)
+
+
+if __name__ == "__main__":
+    main()
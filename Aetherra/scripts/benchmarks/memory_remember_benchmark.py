@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+🧠 remember() Pipeline Benchmark
+===============================
+
+Measures LyrixaMemoryEngine.remember p50/p99 latency for:
+
+- legacy: the pre-pipeline sequence (core store, mesh store, clustering,
+  timeline, then a second mesh store to add associative links)
+- staged: single-pass build -> enrich -> commit
+- deferred: staged with concept/timeline enrichment in the background stage
+
+Usage:
+    python Aetherra/scripts/benchmarks/memory_remember_benchmark.py
+    python Aetherra/scripts/benchmarks/memory_remember_benchmark.py --operations 500
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add repository root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from Aetherra.aetherra_core.kernel.memory_kernel import (  # noqa: E402
+    LyrixaMemoryEngine,
+    MemorySystemConfig,
+)
+from Aetherra.aetherra_core.memory.fractal_mesh.base import (  # noqa: E402
+    MemoryFragmentType,
+)
+
+VOCABULARY = [f"concept{i}" for i in range(300)]
+
+
+async def legacy_remember(engine: LyrixaMemoryEngine, content, tags, category):
+    """The remember() sequence before the staged pipeline"""
+    fragment = engine._build_fragment(
+        content, tags, category, MemoryFragmentType.SEMANTIC, 1.0, None
+    )
+    await engine.core_memory.store_memory(
+        content={"text": str(content), "category": category},
+        context={"category": category, "narrative_role": None},
+        tags=tags,
+        importance=0.8,
+        memory_type=category,
+    )
+    engine.fractal_mesh.store_fragment(fragment)
+    affected_clusters = engine.concept_manager.process_new_fragment(fragment)
+    engine.timeline_manager.process_new_fragment(fragment)
+    if affected_clusters:
+        fragment.associative_links.extend(affected_clusters[:5])
+        engine.fractal_mesh.store_fragment(fragment)
+
+
+def make_engine(work_dir: str, mode: str) -> LyrixaMemoryEngine:
+    def path(name: str) -> str:
+        return os.path.join(work_dir, f"{mode}_{name}.db")
+
+    return LyrixaMemoryEngine(
+        MemorySystemConfig(
+            core_db_path=path("core"),
+            fractal_db_path=path("fractal"),
+            concepts_db_path=path("concepts"),
+            timeline_db_path=path("timeline"),
+            pulse_db_path=path("pulse"),
+            reflector_db_path=path("reflector"),
+            defer_enrichment=mode == "deferred",
+        )
+    )
+
+
+async def run_mode(mode: str, operations: int, work_dir: str):
+    engine = make_engine(work_dir, mode)
+    rng = random.Random(7)
+    samples = []
+
+    started = time.perf_counter()
+    for i in range(operations):
+        tags = rng.sample(VOCABULARY, 3)
+        content = f"memory {i} about " + " ".join(rng.sample(VOCABULARY, 6))
+        began = time.perf_counter()
+        if mode == "legacy":
+            await legacy_remember(engine, content, tags, "benchmark")
+        else:
+            await engine.remember(content, tags=tags, category="benchmark")
+        samples.append((time.perf_counter() - began) * 1000)
+        # Let background stages run between calls, as an event loop would
+        await asyncio.sleep(0)
+
+    await engine.drain_enrichment()
+    engine.flush()
+    total_s = time.perf_counter() - started
+    engine.close()
+
+    samples.sort()
+    p50 = samples[len(samples) // 2]
+    p99 = samples[max(int(len(samples) * 0.99) - 1, 0)]
+    print(f"{mode:<10} {p50:>10.2f} {p99:>10.2f} {total_s:>10.2f}")
+
+
+async def main_async(operations: int):
+    print(f"🧠 remember() latency over {operations} operations")
+    print(f"{'mode':<10} {'p50_ms':>10} {'p99_ms':>10} {'total_s':>10}")
+    with tempfile.TemporaryDirectory() as work_dir:
+        for mode in ["legacy", "staged", "deferred"]:
+            await run_mode(mode, operations, work_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="remember() pipeline benchmark")
+    parser.add_argument("--operations", type=int, default=300)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.operations))
+
+
+if __name__ == "__main__":
+    main()
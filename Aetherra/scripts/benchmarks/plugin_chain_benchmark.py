@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+🔗 Plugin Chain Benchmark
+========================
+
+Compares chain makespan of the PIPELINE strategy with the DAG strategy on a
+synthetic 20-plugin chain: one ingest plugin fanning out to five branches
+that merge into a final report plugin. The critical path runs through the
+branch with the fewest but slowest plugins.
+
+The DAG strategy is run twice under a small concurrency limit: once without
+history (every plugin assumed equally slow, so the branch with the most
+plugins starts first) and once after the optimizer has recorded plugin
+timings (the slow branch starts first).
+
+Usage:
+    python Aetherra/scripts/benchmarks/plugin_chain_benchmark.py
+    python Aetherra/scripts/benchmarks/plugin_chain_benchmark.py --scale 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+# Add repository root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from Aetherra.plugins.core.plugin_chain_executor import (  # noqa: E402
+    ChainStrategy,
+    ExamplePlugin,
+    PluginChainExecutor,
+)
+
+# Per-plugin cost units of each branch; "heavy" is the critical path
+BRANCHES = {
+    "many": [1] * 8,
+    "short_a": [1, 1, 1],
+    "short_b": [1, 1],
+    "mid": [2, 2, 2],
+    "heavy": [10, 10],
+}
+
+
+def build_chain(scale: float):
+    """Return (plugins, dependencies) for the synthetic 20-plugin chain"""
+    plugins = [ExamplePlugin("ingest", scale)]
+    dependencies = {}
+    tails = []
+    for branch, costs in BRANCHES.items():
+        upstream = "ingest"
+        for i, cost in enumerate(costs):
+            plugin_id = f"{branch}_{i}"
+            plugins.append(ExamplePlugin(plugin_id, cost * scale))
+            dependencies[plugin_id] = [upstream]
+            upstream = plugin_id
+        tails.append(upstream)
+    plugins.append(ExamplePlugin("report", scale))
+    dependencies["report"] = tails
+    return plugins, dependencies
+
+
+async def run_chain(executor, plugin_ids, strategy, dependencies=None):
+    started = time.perf_counter()
+    execution = await executor.execute_chain(
+        plugins=plugin_ids,
+        strategy=strategy,
+        context={"initial_input": "payload"},
+        dependencies=dependencies,
+    )
+    elapsed = time.perf_counter() - started
+    assert execution.status.value == "completed", execution.status
+    return elapsed
+
+
+async def main_async(args):
+    plugins, dependencies = build_chain(args.scale)
+    plugin_ids = [p.plugin_id for p in plugins]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = PluginChainExecutor(
+            db_path=os.path.join(tmp_dir, "plugin_chains.db"),
+            max_concurrency=args.concurrency,
+        )
+        for plugin in plugins:
+            executor.register_plugin(plugin)
+
+        rows = [
+            ("pipeline", await run_chain(executor, plugin_ids, ChainStrategy.PIPELINE))
+        ]
+
+        executor.optimizer.performance_history.clear()
+        rows.append(
+            (
+                "dag (cold)",
+                await run_chain(executor, plugin_ids, ChainStrategy.DAG, dependencies),
+            )
+        )
+        rows.append(
+            (
+                "dag (warm)",
+                await run_chain(executor, plugin_ids, ChainStrategy.DAG, dependencies),
+            )
+        )
+
+    total_work = sum(p.processing_time for p in plugins)
+    print(
+        f"🔗 {len(plugins)} plugins, {total_work:.2f}s of work, "
+        f"max_concurrency={args.concurrency}"
+    )
+    print(f"{'strategy':>12} {'makespan_s':>12} {'speedup':>8}")
+    baseline = rows[0][1]
+    for name, elapsed in rows:
+        print(f"{name:>12} {elapsed:>12.3f} {baseline / elapsed:>7.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--scale", type=float, default=0.02, help="Seconds per unit")
+    parser.add_argument("--concurrency", type=int, default=2)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+🔍 Plugin Discovery Benchmark
+============================
+
+Times PluginDiscovery on a synthetic directory of plugin files (5,000 by
+default):
+
+- cold: empty index, every file analyzed (serially and in a process pool)
+- warm: nothing changed, files skipped on their stat signature
+- touched: every file's mtime bumped, content unchanged (hash only)
+- edit: a handful of files rewritten, found by a directory scan
+- push: the same edits applied from a list of changed paths, as the
+  file system watcher does
+- legacy: hash every file and rewrite a JSON index, which the original
+  implementation did whenever any file changed
+
+Usage:
+    python Aetherra/scripts/benchmarks/plugin_discovery_benchmark.py
+    python Aetherra/scripts/benchmarks/plugin_discovery_benchmark.py --plugins 1000
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add repository root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from Aetherra.plugins.core.plugin_discovery import PluginDiscovery  # noqa: E402
+
+CATEGORIES = ["data", "text", "integration", "utility", "file"]
+
+PLUGIN_TEMPLATE = '''"""
+Synthetic plugin {index} for {category} work
+"""
+
+import json
+from typing import Any, Dict
+
+__version__ = "1.{minor}.0"
+__author__ = "bench"
+__category__ = "{category}"
+__tags__ = ["synthetic", "{category}", "group{group}"]
+
+
+class Synthetic{index}Plugin:
+    """Processes {category} payloads"""
+
+    def execute(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return {{"result": json.dumps(payload), "status": "ok"}}
+        except Exception:
+            return {{"status": "error"}}
+
+    def process(self, data):
+        return [item for item in data if item]
+
+    def cleanup(self):
+        pass
+
+
+def main():
+    print(Synthetic{index}Plugin().execute({{"index": {index}}}))
+'''
+
+
+def write_plugin(directory: str, index: int, minor: int = 0):
+    path = os.path.join(directory, f"synthetic_plugin_{index}.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(
+            PLUGIN_TEMPLATE.format(
+                index=index,
+                minor=minor,
+                category=CATEGORIES[index % len(CATEGORIES)],
+                group=index % 50,
+            )
+        )
+    return path
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def legacy_change_pass(discovery: PluginDiscovery):
+    """Hash every indexed file and rewrite the whole JSON index"""
+    for meta in discovery.plugin_index.values():
+        with open(meta.path, "rb") as f:
+            hashlib.sha256(f.read()).hexdigest()
+    with open(os.path.join(discovery.plugins_dir, "legacy_index.json"), "w") as f:
+        json.dump(discovery._serialize_index(), f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--plugins", type=int, default=5000)
+    parser.add_argument("--edits", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    random.seed(7)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for i in range(args.plugins):
+            write_plugin(tmp_dir, i)
+
+        serial = PluginDiscovery(tmp_dir)
+        serial.parallel_threshold = args.plugins + 1
+        rows.append(("cold (serial)", *timed(serial.discover_plugins)))
+        serial.close()
+        os.remove(serial.index_db)
+
+        discovery = PluginDiscovery(tmp_dir)
+        discovery.max_workers = args.workers
+        rows.append(("cold (pool)", *timed(discovery.discover_plugins)))
+        discovery.close()
+
+        # A fresh instance loads the SQLite index written above
+        load_time, discovery = timed(lambda: PluginDiscovery(tmp_dir))
+        rows.append(("index load", load_time, discovery.plugin_index))
+        rows.append(("warm", *timed(discovery.discover_plugins)))
+
+        now = time.time()
+        for meta in discovery.plugin_index.values():
+            os.utime(meta.path, (now + 5, now + 5))
+        rows.append(("touched", *timed(discovery.discover_plugins)))
+
+        edited = random.sample(range(args.plugins), args.edits)
+        for i in edited:
+            write_plugin(tmp_dir, i, minor=1)
+        rows.append(("edit (scan)", *timed(discovery.discover_plugins)))
+
+        paths = [write_plugin(tmp_dir, i, minor=2) for i in edited]
+        rows.append(("edit (push)", *timed(lambda: discovery.apply_changes(paths))))
+
+        legacy_time, _ = timed(lambda: legacy_change_pass(discovery))
+        rows.append(("legacy", legacy_time, discovery.plugin_index))
+        discovery.close()
+
+    print(f"🔍 {args.plugins:,} plugins, {args.edits} edited, {os.cpu_count()} CPUs")
+    print(f"{'pass':>14} {'time_ms':>10} {'plugins':>8}")
+    for name, elapsed, index in rows:
+        print(f"{name:>14} {elapsed * 1000:>10.1f} {len(index):>8}")
+
+
+if __name__ == "__main__":
+    main()
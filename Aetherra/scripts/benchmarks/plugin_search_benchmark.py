@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+🔎 Plugin Search Benchmark
+=========================
+
+Measures PluginDiscovery.search_plugins over a synthetic index of plugin
+metadata (10,000 plugins by default) and compares it with the original
+linear substring scan.
+
+Cold queries follow an edit to one plugin, so the result cache misses and
+the edited plugin's terms are re-ranked; cached queries repeat the same
+query and filters.
+
+Usage:
+    python Aetherra/scripts/benchmarks/plugin_search_benchmark.py
+    python Aetherra/scripts/benchmarks/plugin_search_benchmark.py --plugins 50000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add repository root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from Aetherra.plugins.core.plugin_discovery import (  # noqa: E402
+    PluginDiscovery,
+    PluginMetadata,
+)
+
+CATEGORIES = ["data", "text", "integration", "utility", "file", "interface"]
+WORDS = (
+    "parse convert summarize translate fetch upload schedule monitor index "
+    "compress encrypt validate render export import sync cache search audit "
+    "report backup notify classify cluster embed tokenize stream merge"
+).split()
+TAGS = ["json", "csv", "web", "api", "async", "database", "time", "regex", "ml"]
+QUERIES = [
+    ("word", "summarize", None, None),
+    ("two words", "parse json", None, None),
+    ("prefix", "encr", None, None),
+    ("filtered", "export", {"category": "data", "min_rating": 3.5}, None),
+    ("common", "plugin", None, None),
+    ("top 20", "sync csv", None, 20),
+]
+
+
+def make_metadata(index: int) -> PluginMetadata:
+    words = random.sample(WORDS, 3)
+    meta = PluginMetadata(f"{words[0]}_{words[1]}_plugin_{index}", f"/p/{index}.py")
+    meta.category = CATEGORIES[index % len(CATEGORIES)]
+    meta.description = f"Plugin that can {' and '.join(words)} records"
+    meta.tags = random.sample(TAGS, 2)
+    meta.capabilities = ["execute"] + (["data_processing"] if index % 3 == 0 else [])
+    meta.rating = round(random.uniform(0, 5), 1)
+    meta.compatibility_score = random.uniform(40, 100)
+    return meta
+
+
+def legacy_search(plugin_index, query, filters=None):
+    """The original linear substring scan"""
+    results = []
+    query_lower = query.lower()
+    filters = filters or {}
+    for metadata in plugin_index.values():
+        score = 0
+        if query_lower in metadata.name.lower():
+            score += 10
+        if query_lower in metadata.description.lower():
+            score += 8
+        if any(query_lower in tag.lower() for tag in metadata.tags):
+            score += 6
+        if query_lower in metadata.category.lower():
+            score += 5
+        if any(query_lower in cap.lower() for cap in metadata.capabilities):
+            score += 4
+        if filters.get("category") and metadata.category != filters["category"]:
+            continue
+        if filters.get("min_rating") and metadata.rating < filters["min_rating"]:
+            continue
+        if score > 0:
+            results.append((score, metadata))
+    results.sort(key=lambda x: x[0], reverse=True)
+    return [metadata for _, metadata in results]
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--plugins", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    random.seed(11)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        discovery = PluginDiscovery(tmp_dir)
+        plugins = {}
+        for i in range(args.plugins):
+            meta = make_metadata(i)
+            plugins[meta.name] = meta
+        discovery.plugin_index = plugins
+
+        started = time.perf_counter()
+        discovery.search_index.rebuild(plugins)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        print(f"🔎 {args.plugins:,} plugins, index built in {build_ms:.0f} ms")
+        print(
+            f"{'query':>10} {'hits':>6} {'legacy_ms':>10} {'cold_p50':>9} "
+            f"{'cold_p95':>9} {'cached_us':>10}"
+        )
+        names = list(plugins)
+        for label, query, filters, limit in QUERIES:
+            started = time.perf_counter()
+            legacy_search(plugins, query, filters)
+            legacy_ms = (time.perf_counter() - started) * 1000
+
+            cold = []
+            for _ in range(args.repeat):
+                edited = plugins[random.choice(names)]
+                edited.rating = round(random.uniform(0, 5), 1)
+                discovery.search_index.add(edited.name, edited)
+                started = time.perf_counter()
+                results = discovery.search_plugins(query, filters, limit)
+                cold.append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                discovery.search_plugins(query, filters, limit)
+            cached_us = (time.perf_counter() - started) / args.repeat * 1e6
+
+            print(
+                f"{label:>10} {len(results):>6} {legacy_ms:>10.2f} "
+                f"{percentile(cold, 0.5):>9.3f} {percentile(cold, 0.95):>9.3f} "
+                f"{cached_us:>10.1f}"
+            )
+        discovery.close()
+
+
+if __name__ == "__main__":
+    main()
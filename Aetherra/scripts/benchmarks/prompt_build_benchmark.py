@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+🎭 Prompt Build Benchmark
+========================
+
+Times build_dynamic_prompt with the original per-call inputs (blocking
+psutil.cpu_percent(interval=0.1), process enumeration and a full JSON
+memory file parse per recall) against the cached inputs (background
+metrics sampler, in-memory memory store and prompt fragment cache).
+
+The memory file is a temporary copy filled with --memories entries, so the
+repository's lyrixa_memory.json is never touched.
+
+Usage:
+    python Aetherra/scripts/benchmarks/prompt_build_benchmark.py
+    python Aetherra/scripts/benchmarks/prompt_build_benchmark.py --builds 200
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+import psutil  # noqa: E402
+
+from Aetherra.core import prompt_engine  # noqa: E402
+
+
+def legacy_get_system_status():
+    """The original blocking get_system_status metric collection"""
+    memory_percent = psutil.virtual_memory().percent
+    cpu_percent = psutil.cpu_percent(interval=0.1)
+    process_count = len(psutil.pids())
+    return {
+        "plugin_count": min(max(process_count // 20, 1), 15),
+        "active_agents": ["system_monitor"] if cpu_percent > 20 else [],
+        "memory_usage": int(memory_percent),
+        "cpu_usage": int(cpu_percent),
+        "recent_errors": 0,
+    }
+
+
+def make_legacy_recall(path: Path):
+    """The original recall: parse the whole JSON file on every call"""
+
+    def recall(query_dict, limit=None):
+        with open(path, "r", encoding="utf-8") as f:
+            memories = json.load(f)
+        filtered = [m for m in memories if prompt_engine._matches(m, query_dict)]
+        filtered.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
+        return filtered[:limit] if limit else filtered
+
+    return recall
+
+
+def write_memories(path: Path, count: int):
+    now = datetime.now().timestamp()
+    types = ["user_interaction", "reflection", "note"]
+    memories = [
+        {
+            "type": "user_profile",
+            "user_id": "default_user",
+            "tone": "balanced",
+            "interests": ["technology"],
+            "timestamp": now - 86400,
+        }
+    ]
+    for i in range(count):
+        memories.append(
+            {
+                "type": random.choice(types),
+                "user_id": "default_user",
+                "user_message": f"message {i} about system performance",
+                "summary": f"summary {i}",
+                "content": f"reflection {i}",
+                "timestamp": now - random.random() * 14 * 86400,
+            }
+        )
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(memories, f)
+
+
+def time_builds(builds: int, before_each=None):
+    samples = []
+    for _ in range(builds):
+        if before_each:
+            before_each()
+        started = time.perf_counter()
+        prompt_engine.build_dynamic_prompt("default_user")
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return samples
+
+
+def report(name: str, samples):
+    mean = sum(samples) / len(samples)
+    p50 = samples[len(samples) // 2]
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(f"{name:>10} {len(samples):>8} {mean:>10.3f} {p50:>10.3f} {p95:>10.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--builds", type=int, default=100)
+    parser.add_argument("--legacy-builds", type=int, default=20)
+    parser.add_argument("--memories", type=int, default=1000)
+    args = parser.parse_args()
+    random.seed(42)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        memory_file = Path(tmp_dir) / "lyrixa_memory.json"
+        write_memories(memory_file, args.memories)
+
+        original = (
+            prompt_engine.get_system_status,
+            prompt_engine.recall,
+            prompt_engine.search_memory_one,
+            prompt_engine._memory_store,
+        )
+        prompt_engine._memory_store = prompt_engine.JsonMemoryStore(memory_file)
+
+        print(f"🎭 build_dynamic_prompt with {args.memories:,} memories")
+        print(
+            f"{'mode':>10} {'builds':>8} {'mean_ms':>10} {'p50_ms':>10} {'p95_ms':>10}"
+        )
+        try:
+            legacy_recall = make_legacy_recall(memory_file)
+            prompt_engine.get_system_status = legacy_get_system_status
+            prompt_engine.recall = legacy_recall
+            prompt_engine.search_memory_one = lambda q: next(
+                iter(legacy_recall(q, 1)), None
+            )
+            report(
+                "legacy",
+                time_builds(args.legacy_builds, prompt_engine._prompt_fragments.clear),
+            )
+        finally:
+            (
+                prompt_engine.get_system_status,
+                prompt_engine.recall,
+                prompt_engine.search_memory_one,
+            ) = original[:3]
+
+        prompt_engine._prompt_fragments.clear()
+        report("cold", time_builds(1))
+        report("cached", time_builds(args.builds))
+        prompt_engine._memory_store = original[3]
+        prompt_engine._system_sampler.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+⏰ Scheduler Benchmark
+=====================
+
+Compares AetherraScheduler's timer heap with the original 1 Hz polling
+loop (scan every task, then run the due ones one after another) with
+100,000 recurring tasks scheduled:
+
+- idle: no task due for an hour; CPU time the scheduler burns anyway
+- dispatch: a subset of tasks comes due within a few seconds, a few of
+  them slow; lateness of each run relative to its deadline
+
+Usage:
+    python Aetherra/scripts/benchmarks/scheduler_benchmark.py
+    python Aetherra/scripts/benchmarks/scheduler_benchmark.py --tasks 20000 --due 2000
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+# Add repository root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from Aetherra.aetherra_core.orchestration.scheduler import (  # noqa: E402
+    AetherraScheduler,
+    ScheduledTask,
+    TaskStatus,
+)
+
+HOUR = 3600.0
+
+
+class Probe:
+    """Task body recording how late each run started"""
+
+    def __init__(self, slow_delay: float):
+        self.slow_delay = slow_delay
+        self.lateness = []
+
+    async def run(self, deadline: float, slow: bool = False):
+        self.lateness.append(time.monotonic() - deadline)
+        if slow:
+            await asyncio.sleep(self.slow_delay)
+
+
+async def legacy_loop(tasks, stop: asyncio.Event):
+    """The original scheduler loop, reproduced for comparison"""
+    while not stop.is_set():
+        now = datetime.now()
+        ready = [
+            task
+            for task in tasks.values()
+            if task.status == TaskStatus.PENDING and task.next_run <= now
+        ]
+        ready.sort(key=lambda t: t.priority.value, reverse=True)
+        for task in ready:
+            task.status = TaskStatus.RUNNING
+            task.run_count += 1
+            await task.func(*task.args, **task.kwargs)
+            task.next_run = datetime.now() + timedelta(seconds=task.interval)
+            task.status = TaskStatus.PENDING
+        try:
+            await asyncio.wait_for(stop.wait(), 1)
+        except asyncio.TimeoutError:
+            pass
+
+
+def plan(args):
+    """
+    (offset, slow) for every task; the first --due tasks fire within the
+    window, which opens once every task has been scheduled
+    """
+    random.seed(5)
+    runs = []
+    for i in range(args.tasks):
+        if i < args.due:
+            runs.append((random.uniform(0, args.window), i < args.slow))
+        else:
+            runs.append((HOUR + random.uniform(0, HOUR), False))
+    return runs
+
+
+async def run_scheduler(args, runs, probe):
+    scheduler = AetherraScheduler(max_concurrency=args.concurrency)
+    await scheduler.start()
+    window_start = time.monotonic() + args.setup
+    for i, (offset, slow) in enumerate(runs):
+        deadline = window_start + offset
+        scheduler.schedule_task(
+            f"probe {i}",
+            probe.run,
+            (deadline, slow),
+            delay=deadline - time.monotonic(),
+            interval=HOUR,
+        )
+
+    await asyncio.sleep(window_start - time.monotonic())
+    cpu = time.process_time()
+    await asyncio.sleep(args.window + args.drain)
+    busy_cpu = time.process_time() - cpu
+
+    # Nothing is due for the next hour from here on
+    cpu = time.process_time()
+    await asyncio.sleep(args.idle)
+    idle_cpu = time.process_time() - cpu
+    await scheduler.stop()
+    return busy_cpu, idle_cpu
+
+
+async def run_legacy(args, runs, probe):
+    tasks = {}
+    window_start = time.monotonic() + args.setup
+    wall_start = datetime.now() + timedelta(seconds=args.setup)
+    for i, (offset, slow) in enumerate(runs):
+        task = ScheduledTask(
+            task_id=f"task_{i}",
+            name=f"probe {i}",
+            func=probe.run,
+            args=(window_start + offset, slow),
+            interval=HOUR,
+            next_run=wall_start + timedelta(seconds=offset),
+        )
+        tasks[task.task_id] = task
+
+    stop = asyncio.Event()
+    loop_task = asyncio.create_task(legacy_loop(tasks, stop))
+    await asyncio.sleep(window_start - time.monotonic())
+    cpu = time.process_time()
+    await asyncio.sleep(args.window + args.drain)
+    busy_cpu = time.process_time() - cpu
+
+    cpu = time.process_time()
+    await asyncio.sleep(args.idle)
+    idle_cpu = time.process_time() - cpu
+    stop.set()
+    await loop_task
+    return busy_cpu, idle_cpu
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--due", type=int, default=5_000)
+    parser.add_argument("--slow", type=int, default=20)
+    parser.add_argument("--slow-delay", type=float, default=0.1)
+    parser.add_argument("--window", type=float, default=3.0)
+    parser.add_argument("--drain", type=float, default=1.5)
+    parser.add_argument("--setup", type=float, default=3.0)
+    parser.add_argument("--idle", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    runs = plan(args)
+    rows = []
+    for name, runner in (("legacy 1 Hz", run_legacy), ("timer heap", run_scheduler)):
+        probe = Probe(args.slow_delay)
+        busy_cpu, idle_cpu = asyncio.run(runner(args, runs, probe))
+        rows.append((name, probe.lateness, busy_cpu, idle_cpu))
+
+    print(
+        f"⏰ {args.tasks:,} recurring tasks, {args.due:,} due within "
+        f"{args.window:.0f}s ({args.slow} take {args.slow_delay * 1000:.0f} ms)"
+    )
+    print(
+        f"{'scheduler':>12} {'runs':>6} {'p50_ms':>8} {'p99_ms':>8} {'max_ms':>8} "
+        f"{'busy_cpu_s':>10} {'idle_cpu_%':>10}"
+    )
+    for name, lateness, busy_cpu, idle_cpu in rows:
+        print(
+            f"{name:>12} {len(lateness):>6} "
+            f"{percentile(lateness, 0.5) * 1000:>8.1f} "
+            f"{percentile(lateness, 0.99) * 1000:>8.1f} "
+            f"{max(lateness) * 1000:>8.1f} {busy_cpu:>10.2f} "
+            f"{idle_cpu / args.idle * 100:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
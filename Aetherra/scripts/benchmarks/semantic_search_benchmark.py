@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+🔎 Semantic Search Benchmark
+===========================
+
+Compares the original pure-Python SemanticSearch path (per-entry cosine
+similarity over Python lists plus a full sort) with the NumPy VectorIndex
+(float32 matrix, matmul + argpartition top-k) at 10k/100k/1M entries.
+
+The legacy path is skipped above --legacy-max entries because it needs
+several GB of Python floats at 1M entries.
+
+Usage:
+    python Aetherra/scripts/benchmarks/semantic_search_benchmark.py
+    python Aetherra/scripts/benchmarks/semantic_search_benchmark.py --sizes 10000 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add repository root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from Aetherra.core.vector_index import VectorIndex, hash_embedding  # noqa: E402
+
+DIMENSIONS = 100
+QUERIES = 20
+VOCABULARY = [f"word{i}" for i in range(20_000)]
+
+
+def legacy_search(embeddings, query_embedding, top_k):
+    """The pre-VectorIndex SemanticSearch.search_similar algorithm"""
+
+    def cosine(a, b):
+        dot_product = sum(x * y for x, y in zip(a, b))
+        norm_a = sum(x * x for x in a) ** 0.5
+        norm_b = sum(x * x for x in b) ** 0.5
+        if norm_a == 0 or norm_b == 0:
+            return 0.0
+        return dot_product / (norm_a * norm_b)
+
+    similarities = [
+        (cosine(query_embedding, embedding), entry_id)
+        for entry_id, embedding in embeddings.items()
+    ]
+    similarities.sort(reverse=True)
+    return [entry_id for _, entry_id in similarities[:top_k]]
+
+
+def random_text(rng: random.Random) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(12))
+
+
+def run_size(size: int, legacy_max: int, top_k: int):
+    rng = random.Random(size)
+    texts = [random_text(rng) for _ in range(size)]
+    queries = [hash_embedding(random_text(rng), DIMENSIONS) for _ in range(QUERIES)]
+
+    index = VectorIndex(DIMENSIONS)
+    started = time.perf_counter()
+    for i, text in enumerate(texts):
+        index.add(f"entry_{i}", hash_embedding(text, DIMENSIONS))
+    build_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for query in queries:
+        index.search(query, top_k)
+    vector_ms = (time.perf_counter() - started) / QUERIES * 1000
+
+    legacy_ms = None
+    if size <= legacy_max:
+        embeddings = {
+            f"entry_{i}": hash_embedding(text, DIMENSIONS).tolist()
+            for i, text in enumerate(texts)
+        }
+        legacy_queries = [query.tolist() for query in queries[:3]]
+        started = time.perf_counter()
+        for query in legacy_queries:
+            legacy_search(embeddings, query, top_k)
+        legacy_ms = (time.perf_counter() - started) / len(legacy_queries) * 1000
+
+    legacy_text = f"{legacy_ms:>12.2f}" if legacy_ms is not None else f"{'skipped':>12}"
+    speedup = (
+        f"{legacy_ms / vector_ms:>9.0f}x" if legacy_ms is not None else f"{'-':>10}"
+    )
+    print(f"{size:>10,} {build_s:>10.2f} {legacy_text} {vector_ms:>12.3f} {speedup}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Semantic search benchmark")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--legacy-max", type=int, default=100_000)
+    parser.add_argument("--top-k", type=int, default=10)
+    args = parser.parse_args()
+
+    print("🔎 Semantic search: legacy pure-Python vs NumPy VectorIndex")
+    print(
+        f"{'entries':>10} {'build_s':>10} {'legacy_ms':>12} {'vector_ms':>12} "
+        f"{'speedup':>10}"
+    )
+    for size in args.sizes:
+        run_size(size, args.legacy_max, args.top_k)
+
+
+if __name__ == "__main__":
+    main()
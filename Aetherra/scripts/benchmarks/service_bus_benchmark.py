@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+📡 Service Bus Benchmark
+=======================
+
+Broadcast latency of AetherraServiceRegistry with 100 services, 5 of which
+take --slow-ms to handle each message.
+
+The original broadcast awaited every service's handler in turn, so each
+call took as long as all the slow handlers together. Over the message bus
+a broadcast returns once the message is in every mailbox. Fast services get
+it right away while the slow ones fall behind, shown as lag. With a small
+DROP_OLDEST mailbox the slow services shed old messages instead, which
+bounds their lag.
+
+Usage:
+    python Aetherra/scripts/benchmarks/service_bus_benchmark.py
+    python Aetherra/scripts/benchmarks/service_bus_benchmark.py --services 500 --slow 20
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+# Add repository root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from aetherra_service_registry import (  # noqa: E402
+    AetherraServiceRegistry,
+    OverflowPolicy,
+    ServiceStatus,
+)
+
+
+class Service:
+    def __init__(self, delay):
+        self.delay = delay
+        self.delivery = []
+
+    async def handle_message(self, message_type, data):
+        self.delivery.append(time.monotonic() - data["sent_at"])
+        await asyncio.sleep(self.delay)
+
+
+def percentile_ms(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] * 1000
+
+
+async def legacy_broadcast(services, message_type, data):
+    """The original broadcast_message: one handler after another"""
+    for service in services.values():
+        await service.handle_message(message_type, data)
+
+
+async def run(args, mode):
+    slow_delay = args.slow_ms / 1000
+    services = {
+        f"service_{i}": Service(slow_delay if i < args.slow else 0)
+        for i in range(args.services)
+    }
+    if mode == "bus drop_oldest(4)":
+        registry = AetherraServiceRegistry(4, OverflowPolicy.DROP_OLDEST)
+    else:
+        registry = AetherraServiceRegistry()
+    for name, service in services.items():
+        await registry.register_service(name, service)
+        await registry.update_service_status(name, ServiceStatus.HEALTHY)
+
+    calls = []
+    for _ in range(args.broadcasts):
+        data = {"sent_at": time.monotonic()}
+        if mode == "legacy sequential":
+            await legacy_broadcast(services, "tick", data)
+        else:
+            await registry.broadcast_message("tick", data)
+        calls.append(time.monotonic() - data["sent_at"])
+        await asyncio.sleep(args.interval_ms / 1000)
+
+    # Wait until every message was handled or dropped
+    def outstanding():
+        metrics = registry.get_bus_metrics()
+        return any(
+            len(service.delivery) + metrics.get(name, {}).get("dropped", 0)
+            < args.broadcasts
+            for name, service in services.items()
+        )
+
+    while outstanding():
+        await asyncio.sleep(0.001)
+    metrics = registry.get_bus_metrics()
+    await registry.bus.close(timeout=0)
+
+    slow = [s for s in services.values() if s.delay]
+    fast = [s for s in services.values() if not s.delay]
+    slow_lag = max(d for s in slow for d in s.delivery)
+    dropped = sum(m["dropped"] for m in metrics.values())
+    fast_delivery = [d for s in fast for d in s.delivery]
+    print(
+        f"{mode:<20} {percentile_ms(calls, 0.5):>10.2f} {percentile_ms(calls, 0.99):>10.2f}"
+        f" {percentile_ms(fast_delivery, 0.99):>13.2f} {slow_lag * 1000:>12.0f}"
+        f" {dropped:>8}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--services", type=int, default=100)
+    parser.add_argument("--slow", type=int, default=5)
+    parser.add_argument("--slow-ms", type=float, default=100.0)
+    parser.add_argument("--broadcasts", type=int, default=10)
+    parser.add_argument("--interval-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(
+        f"📡 {args.services} services ({args.slow} slow, {args.slow_ms:g} ms), "
+        f"{args.broadcasts} broadcasts {args.interval_ms:g} ms apart"
+    )
+    print(
+        f"{'mode':<20} {'call_p50':>10} {'call_p99':>10} {'fast_recv_p99':>13} "
+        f"{'slow_lag_ms':>12} {'dropped':>8}"
+    )
+    for mode in ["legacy sequential", "bus block(1000)", "bus drop_oldest(4)"]:
+        asyncio.run(run(args, mode))
+
+
+if __name__ == "__main__":
+    main()
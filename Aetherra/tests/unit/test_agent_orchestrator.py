@@ -0,0 +1,210 @@
+"""
+Tests for capability-indexed dispatch and the SQLite journal in AgentOrchestrator
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from Aetherra.aetherra_core.orchestration.agent_orchestrator import (
+    AgentOrchestrator,
+    AgentStatus,
+    Task,
+    TaskPriority,
+    TaskStatus,
+)
+
+
+class GatedOrchestrator(AgentOrchestrator):
+    """Agents finish a task only once its gate is opened"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.gates = {}
+        self.started = []
+
+    async def _run_agent(self, task, agent):
+        self.started.append((task.task_id, agent.agent_id))
+        gate = self.gates.setdefault(task.task_id, asyncio.Event())
+        await gate.wait()
+        return {"status": "completed", "task_id": task.task_id}
+
+
+def make_task(task_id, capabilities, priority=TaskPriority.NORMAL):
+    return Task(task_id, task_id, "", capabilities, {}, priority=priority)
+
+
+class TestAgentOrchestrator(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "orchestrator.db")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def run_orchestrator(self, scenario):
+        async def main():
+            orchestrator = GatedOrchestrator(self.db_path)
+            orchestrator.orchestration_active = True  # No background loop
+            try:
+                return await scenario(orchestrator)
+            finally:
+                for gate in orchestrator.gates.values():
+                    gate.set()
+                await orchestrator.stop_orchestration()
+                orchestrator.close()
+
+        return asyncio.run(main())
+
+    def test_submit_dispatches_to_best_matching_agent(self):
+        async def scenario(orchestrator):
+            await orchestrator.register_agent("writer", "Writer", ["text"])
+            await orchestrator.register_agent("analyst", "Analyst", ["text", "data"])
+            await orchestrator.submit_task(make_task("t1", ["text", "data"]))
+            await orchestrator.submit_task(make_task("t2", ["text"]))
+            await orchestrator.submit_task(make_task("t3", ["data"]))  # Queued
+            await asyncio.sleep(0)
+
+            self.assertEqual(
+                orchestrator.started, [("t1", "analyst"), ("t2", "writer")]
+            )
+            self.assertEqual(orchestrator.get_system_status()["queue_length"], 1)
+
+        self.run_orchestrator(scenario)
+
+    def test_freed_agent_takes_most_urgent_task_it_can_run(self):
+        async def scenario(orchestrator):
+            await orchestrator.register_agent("a1", "Agent", ["text", "data"])
+            await orchestrator.submit_task(make_task("busy", ["text"]))
+            await orchestrator.submit_task(make_task("low", ["text"], TaskPriority.LOW))
+            await orchestrator.submit_task(make_task("normal", ["data"]))
+            await orchestrator.submit_task(
+                make_task("high", ["text"], TaskPriority.HIGH)
+            )
+            await orchestrator.submit_task(make_task("other", ["web"]))
+            await orchestrator.cancel_task("normal")
+            await asyncio.sleep(0)
+
+            for task_id in ["busy", "high"]:
+                orchestrator.gates[task_id].set()
+                while orchestrator.tasks[task_id].status != TaskStatus.COMPLETED:
+                    await asyncio.sleep(0)
+                await asyncio.sleep(0)
+
+            self.assertEqual(
+                [task_id for task_id, _ in orchestrator.started],
+                ["busy", "high", "low"],
+            )
+            self.assertEqual(orchestrator.agents["a1"].status, AgentStatus.BUSY)
+            self.assertEqual(orchestrator.tasks["other"].status, TaskStatus.PENDING)
+
+        self.run_orchestrator(scenario)
+
+    def test_busy_agent_is_not_replaced(self):
+        async def scenario(orchestrator):
+            await orchestrator.register_agent("a1", "Agent", ["text"])
+            await orchestrator.submit_task(make_task("t1", ["text"]))
+            await asyncio.sleep(0)
+            first = orchestrator.agents["a1"]
+            self.assertFalse(await orchestrator.register_agent("a1", "New", ["text"]))
+            self.assertIs(orchestrator.agents["a1"], first)
+
+            # Timed out while running: replaced, and the late finish of its
+            # task leaves the replacement alone
+            first.current_task = None
+            orchestrator._set_agent_status(first, AgentStatus.OFFLINE)
+            self.assertTrue(await orchestrator.register_agent("a1", "New", ["text"]))
+            await orchestrator.submit_task(make_task("t2", ["text"]))
+            orchestrator.gates["t1"].set()
+            while orchestrator.tasks["t1"].status != TaskStatus.COMPLETED:
+                await asyncio.sleep(0)
+            await orchestrator.submit_task(make_task("t3", ["text"]))
+            await asyncio.sleep(0)
+
+            self.assertEqual(first.status, AgentStatus.OFFLINE)
+            self.assertEqual(orchestrator.agents["a1"].current_task, "t2")
+            self.assertEqual(orchestrator.started, [("t1", "a1"), ("t2", "a1")])
+
+        self.run_orchestrator(scenario)
+
+    def test_failed_journal_write_is_retried(self):
+        async def scenario(orchestrator):
+            await orchestrator.register_agent("a1", "Agent", ["text"])
+            orchestrator._save_state()
+            orchestrator._db.close()
+            await orchestrator.submit_task(make_task("t1", ["data"]))
+            with self.assertLogs(level="ERROR"):
+                orchestrator._save_state()
+            orchestrator._db = sqlite3.connect(self.db_path)
+
+        self.run_orchestrator(scenario)  # Shutdown writes the journal again
+
+        with sqlite3.connect(self.db_path) as db:
+            statuses = dict(db.execute("SELECT task_id, status FROM tasks"))
+        self.assertEqual(statuses, {"t1": "pending"})
+
+    def test_journal_restores_unfinished_tasks(self):
+        async def scenario(orchestrator):
+            await orchestrator.register_agent("a1", "Agent", ["text"])
+            await orchestrator.submit_task(make_task("running", ["text"]))
+            await orchestrator.submit_task(make_task("queued", ["text"]))
+            await orchestrator.submit_task(make_task("cancelled", ["text"]))
+            await orchestrator.cancel_task("cancelled")
+            await asyncio.sleep(0)
+
+        self.run_orchestrator(scenario)
+
+        with sqlite3.connect(self.db_path) as db:
+            statuses = dict(db.execute("SELECT task_id, status FROM tasks"))
+        self.assertEqual(statuses["cancelled"], "cancelled")
+
+        restored = AgentOrchestrator(self.db_path)
+        try:
+            self.assertEqual(sorted(restored.tasks), ["queued", "running"])
+            self.assertEqual(restored.get_system_status()["queue_length"], 2)
+            self.assertEqual(restored.agents["a1"].status, AgentStatus.OFFLINE)
+        finally:
+            restored.close()
+
+    def test_imports_legacy_json_state(self):
+        with open(self.db_path, "w") as f:
+            json.dump(
+                {
+                    "agents": [
+                        {
+                            "agent_id": "a1",
+                            "name": "Agent",
+                            "capabilities": ["text"],
+                            "last_seen": "2024-01-01T00:00:00",
+                        }
+                    ],
+                    "tasks": [
+                        {
+                            "task_id": "t1",
+                            "name": "Task",
+                            "description": "",
+                            "required_capabilities": ["text"],
+                            "input_data": {},
+                            "priority": "high",
+                            "status": "pending",
+                            "created_at": "2024-01-01T00:00:00",
+                        }
+                    ],
+                },
+                f,
+            )
+
+        orchestrator = AgentOrchestrator(self.db_path)
+        try:
+            self.assertIn("a1", orchestrator.agents)
+            self.assertEqual(orchestrator.tasks["t1"].priority, TaskPriority.HIGH)
+            self.assertTrue(os.path.exists(self.db_path + ".json"))
+        finally:
+            orchestrator.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
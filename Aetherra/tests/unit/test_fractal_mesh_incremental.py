@@ -0,0 +1,94 @@
+"""
+Tests for incremental clustering and episodic chaining in FractalMeshCore
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from Aetherra.aetherra_core.memory.fractal_mesh.base import (
+    FractalMeshCore,
+    MemoryFragment,
+    MemoryFragmentType,
+)
+
+
+def make_fragment(fragment_id, created_at, tags=("unit",), episodic=True):
+    return MemoryFragment(
+        fragment_id=fragment_id,
+        content={"text": fragment_id},
+        fragment_type=MemoryFragmentType.EPISODIC
+        if episodic
+        else MemoryFragmentType.SEMANTIC,
+        temporal_tags={},
+        symbolic_tags=set(tags),
+        associative_links=[],
+        confidence_score=0.5,
+        access_pattern={},
+        narrative_role=None,
+        created_at=created_at,
+        last_evolved=created_at,
+    )
+
+
+class TestFractalMeshIncremental(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.mesh = FractalMeshCore(os.path.join(self.tmp_dir.name, "mesh.db"))
+        self.start = datetime(2025, 1, 1, 12, 0, 0)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_chain_is_extended_in_place(self):
+        for i in range(3):
+            self.mesh.store_fragment(
+                make_fragment(f"f{i}", self.start + timedelta(hours=i))
+            )
+
+        self.assertEqual(len(self.mesh.episodic_chains), 1)
+        chain = next(iter(self.mesh.episodic_chains.values()))
+        self.assertEqual(chain.fragments, ["f0", "f1", "f2"])
+        self.assertEqual(chain.temporal_span, (self.start, self.start + timedelta(hours=2)))
+
+    def test_distant_fragments_stay_unchained(self):
+        self.mesh.store_fragment(make_fragment("a", self.start))
+        self.mesh.store_fragment(make_fragment("b", self.start + timedelta(days=3)))
+        self.assertEqual(self.mesh.episodic_chains, {})
+
+    def test_bridging_fragment_merges_chains(self):
+        self.mesh.store_fragment(make_fragment("a0", self.start))
+        self.mesh.store_fragment(make_fragment("a1", self.start + timedelta(hours=1)))
+        self.mesh.store_fragment(make_fragment("b0", self.start + timedelta(hours=40)))
+        self.mesh.store_fragment(make_fragment("b1", self.start + timedelta(hours=41)))
+        self.assertEqual(len(self.mesh.episodic_chains), 2)
+
+        self.mesh.store_fragment(make_fragment("mid", self.start + timedelta(hours=20)))
+
+        self.assertEqual(len(self.mesh.episodic_chains), 1)
+        chain = next(iter(self.mesh.episodic_chains.values()))
+        self.assertEqual(chain.fragments, ["a0", "a1", "mid", "b0", "b1"])
+
+    def test_restoring_fragment_is_idempotent(self):
+        fragment = make_fragment("f0", self.start)
+        self.mesh.store_fragment(make_fragment("f1", self.start + timedelta(hours=1)))
+        self.mesh.store_fragment(fragment)
+        self.mesh.store_fragment(fragment)
+
+        chain = next(iter(self.mesh.episodic_chains.values()))
+        self.assertEqual(chain.fragments, ["f0", "f1"])
+        self.assertEqual(len(self.mesh._episodic_ids), 2)
+
+    def test_concepts_join_existing_cluster(self):
+        self.mesh.store_fragment(make_fragment("s0", self.start, ("alpha", "beta"), False))
+        self.mesh.store_fragment(make_fragment("s1", self.start, ("beta",), False))
+
+        self.assertEqual(len(self.mesh.concept_clusters), 1)
+        cluster = next(iter(self.mesh.concept_clusters.values()))
+        self.assertEqual(cluster.member_fragments, {"s0", "s1"})
+        self.assertEqual(cluster.related_concepts, {"alpha", "beta"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests for lazy, on-demand hydration in the fractal mesh stack
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from Aetherra.aetherra_core.memory.fractal_mesh.base import (
+    FractalMeshCore,
+    MemoryFragment,
+    MemoryFragmentType,
+)
+from Aetherra.aetherra_core.memory.fractal_mesh.timelines import EpisodicTimeline
+
+
+def make_fragment(index, created_at):
+    return MemoryFragment(
+        fragment_id=f"f{index}",
+        content={"text": f"fragment {index}", "kind": "unit", "extra": "rich"},
+        fragment_type=MemoryFragmentType.EPISODIC,
+        temporal_tags={},
+        symbolic_tags={"shared", f"tag{index % 3}"},
+        associative_links=[],
+        confidence_score=0.9,
+        access_pattern={},
+        narrative_role="test",
+        created_at=created_at,
+        last_evolved=created_at,
+    )
+
+
+class TestFractalMeshLazyLoading(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.start = datetime(2025, 1, 1, 9, 0, 0)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_lazy_mesh_hydrates_on_demand(self):
+        db_path = os.path.join(self.tmp_dir.name, "mesh.db")
+        mesh = FractalMeshCore(db_path)
+        for i in range(20):
+            mesh.store_fragment(make_fragment(i, self.start + timedelta(minutes=i)))
+        mesh.close()
+
+        lazy_mesh = FractalMeshCore(db_path, lazy=True, cache_size=5)
+        stats = lazy_mesh.get_fragment_cache_stats()
+        self.assertEqual(stats["known_records"], 20)
+        self.assertEqual(stats["cached_records"], 0)
+        self.assertEqual(len(lazy_mesh.concept_index["shared"]), 20)
+        self.assertEqual(len(lazy_mesh._episodic_ids), 20)
+
+        self.assertEqual(lazy_mesh.fragments["f3"].content["text"], "fragment 3")
+        retrieved = lazy_mesh.retrieve_by_concept("tag1", limit=10)
+        self.assertEqual(len(retrieved), 7)
+
+        stats = lazy_mesh.get_fragment_cache_stats()
+        self.assertLessEqual(stats["cached_records"], 5)
+        self.assertGreater(stats["evictions"], 0)
+        self.assertEqual(len(list(lazy_mesh.fragments.values())), 20)
+        lazy_mesh.close()
+
+    def test_lazy_timeline_extends_persisted_chain(self):
+        db_path = os.path.join(self.tmp_dir.name, "timeline.db")
+        timeline = EpisodicTimeline(db_path)
+        chain_ids = timeline.process_new_fragment(make_fragment(0, self.start))
+        timeline.close()
+
+        lazy_timeline = EpisodicTimeline(db_path, lazy=True)
+        self.assertEqual(len(lazy_timeline.episodic_chains), 1)
+        later = make_fragment(1, self.start + timedelta(minutes=30))
+        self.assertEqual(lazy_timeline.process_new_fragment(later), chain_ids)
+        self.assertEqual(
+            lazy_timeline.episodic_chains[chain_ids[0]].fragments, ["f0", "f1"]
+        )
+        lazy_timeline.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
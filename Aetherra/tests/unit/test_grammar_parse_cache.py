@@ -0,0 +1,110 @@
+"""
+Tests for the shared Lark parser and the AST cache in aetherra_grammar
+"""
+
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from Aetherra.core import aetherra_grammar
+from Aetherra.core.aetherra_grammar import (
+    AetherraCodeSyntaxError,
+    AetherraParser,
+    ASTCache,
+    get_shared_parser,
+)
+
+SCRIPT = """goal: "improve system performance"
+agent: on
+x = "test"
+"""
+
+
+class TestGrammarParseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "asts.db")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_parsers_share_one_lark_instance(self):
+        first, second = AetherraParser(), AetherraParser()
+        self.assertIs(first.parser, get_shared_parser())
+        self.assertIs(second.parser, first.parser)
+
+    def test_identical_source_is_parsed_once(self):
+        cache = ASTCache()
+        parser = AetherraParser(ast_cache=cache)
+        first = parser.parse(SCRIPT)
+        first.children.clear()  # Callers may modify what they get back
+        second = parser.parse("  " + SCRIPT.replace("\n", "\n  "))
+        self.assertEqual(second, AetherraParser(ast_cache=ASTCache()).parse(SCRIPT))
+        self.assertEqual(second.children[0].type, "goal")
+        self.assertIsNot(second, first)
+        self.assertIs(parser.last_ast, second)
+
+        stats = cache.get_stats()
+        self.assertEqual((stats["misses"], stats["memory_hits"]), (1, 1))
+        self.assertEqual(stats["hit_ratio"], 0.5)
+
+    def test_syntax_errors_are_not_cached(self):
+        cache = ASTCache()
+        parser = AetherraParser(ast_cache=cache)
+        for _ in range(2):
+            with self.assertRaises(AetherraCodeSyntaxError):
+                parser.parse('goal: "unterminated')
+        self.assertEqual(cache.get_stats()["stores"], 0)
+
+    def test_persistent_tier_survives_restart_until_grammar_changes(self):
+        cache = ASTCache(self.db_path)
+        expected = AetherraParser(ast_cache=cache).parse(SCRIPT)
+        cache.close()
+
+        reopened = ASTCache(self.db_path)
+        self.assertEqual(AetherraParser(ast_cache=reopened).parse(SCRIPT), expected)
+        self.assertEqual(reopened.get_stats()["persistent_hits"], 1)
+        reopened.close()
+
+        upgraded = ASTCache(self.db_path, grammar_version="next")
+        self.assertEqual(upgraded.get_stats()["persistent_entries"], 0)
+        AetherraParser(ast_cache=upgraded).parse(SCRIPT)
+        self.assertEqual(upgraded.get_stats()["misses"], 1)
+        upgraded.close()
+
+    def test_persistent_tier_stores_json_and_never_unpickles(self):
+        cache = ASTCache(self.db_path)
+        expected = AetherraParser(ast_cache=cache).parse(SCRIPT)
+        key = ASTCache.make_key(AetherraParser()._preprocess_source(SCRIPT))
+        (stored,) = cache._conn.execute("SELECT ast FROM aether_ast_json").fetchone()
+        self.assertIn("__ast__", json.loads(stored))
+
+        # A pickle planted in the database file is treated as a miss
+        with cache._conn:
+            cache._conn.execute(
+                "UPDATE aether_ast_json SET ast = ?", (pickle.dumps(expected),)
+            )
+        cache.close()
+        reopened = ASTCache(self.db_path)
+        with mock.patch("pickle.loads") as loads:
+            self.assertIsNone(reopened.get(key))
+            self.assertEqual(AetherraParser(ast_cache=reopened).parse(SCRIPT), expected)
+        loads.assert_not_called()
+        reopened.close()
+
+    def test_grammar_tables_are_cached_in_the_application_directory(self):
+        cache_path = Path(self.tmp_dir.name) / "aetherra" / "cache" / "grammar.lark"
+        with mock.patch.object(aetherra_grammar, "LARK_CACHE_PATH", cache_path):
+            with mock.patch.object(aetherra_grammar, "_shared_parser", None):
+                parser = get_shared_parser()
+                self.assertIs(get_shared_parser(), parser)
+        self.assertTrue(cache_path.is_file())
+        self.assertEqual(cache_path.parent.stat().st_mode & 0o777, 0o700)
+
+
+if __name__ == "__main__":
+    unittest.main()
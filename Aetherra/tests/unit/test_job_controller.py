@@ -0,0 +1,165 @@
+"""
+Tests for the worker-pool JobController and the SQLite JobStore
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from Aetherra.api.job_controller import (
+    AetherScriptRunner,
+    JobController,
+    JobQueueFull,
+)
+from Aetherra.api.job_store import JobStatus, JobStore
+
+SCRIPT = """# sample job
+goal "ship the release"
+$count = 3
+$owner = $who
+"""
+
+
+class GatedRunner(AetherScriptRunner):
+    """Runner that holds every job until released, honouring cancellation"""
+
+    def __init__(self, script_dirs):
+        super().__init__(script_dirs)
+        self.release = threading.Event()
+        self.started = threading.Semaphore(0)
+
+    def execute_script(self, script_name, parameters=None, context=None, *hooks):
+        should_stop = hooks[0] if hooks else None
+        self.started.release()
+        while not self.release.is_set():
+            if should_stop and should_stop():
+                return {"stopped": True}
+            time.sleep(0.005)
+        return super().execute_script(script_name, parameters, context, *hooks)
+
+
+class JobTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.script_dir = os.path.join(self.tmp_dir.name, "scripts")
+        os.mkdir(self.script_dir)
+        with open(os.path.join(self.script_dir, "sample.aether"), "w") as f:
+            f.write(SCRIPT)
+        self.db_path = os.path.join(self.tmp_dir.name, "jobs.db")
+        self.store = JobStore(self.db_path)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp_dir.cleanup()
+
+    def make_controller(self, **kwargs):
+        controller = JobController(
+            store=self.store, script_dirs=[self.script_dir], **kwargs
+        )
+        self.addCleanup(controller.shutdown)
+        return controller
+
+    def wait_for(self, job_id, *statuses, timeout=10.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            status = self.store.get_status(job_id)
+            if status in statuses:
+                return status
+            time.sleep(0.01)
+        self.fail(f"job {job_id} stuck in {self.store.get_status(job_id)}")
+
+
+class TestJobStore(JobTestCase):
+    def test_state_is_shared_and_final_states_stick(self):
+        self.store.create_job("a", "sample", {"x": 1})
+        other = JobStore(self.db_path)
+        self.addCleanup(other.close)
+
+        self.assertEqual(other.start_job("a").parameters, {"x": 1})
+        self.assertTrue(other.cancel_job("a"))
+        self.assertFalse(
+            self.store.update_job_status("a", JobStatus.COMPLETED, output={"ok": 1})
+        )
+        job = self.store.get_job("a")
+        self.assertEqual(job.status, JobStatus.CANCELLED)
+        self.assertIsNone(job.output)
+        self.assertIsNotNone(job.completed_at)
+        self.assertEqual(self.store.get_stats()["status_breakdown"]["cancelled"], 1)
+
+    def test_cleanup_removes_oldest_finished_jobs(self):
+        for i in range(5):
+            self.store.create_job(f"job{i}", "sample")
+        for i in range(4):
+            self.store.update_job_status(f"job{i}", JobStatus.COMPLETED)
+        self.assertEqual(self.store.cleanup_old_jobs(max_jobs=2), 3)
+        remaining = [job.job_id for job in self.store.list_jobs()]
+        self.assertEqual(remaining, ["job4", "job3"])
+
+
+class TestJobController(JobTestCase):
+    def test_script_runs_through_runtime(self):
+        controller = self.make_controller()
+        job_id = controller.run_script("sample", {"who": "ada"})
+        self.wait_for(job_id, JobStatus.COMPLETED)
+
+        output = controller.get_job_status(job_id)["output"]
+        self.assertEqual(output["goals"], ["ship the release"])
+        self.assertEqual(output["variables"]["count"], 3)
+        self.assertEqual(output["variables"]["owner"], "ada")
+        self.assertEqual(output["lines_executed"], 4)
+
+        with self.assertRaises(FileNotFoundError):
+            controller.run_script("../jobs.db")
+
+    def test_admission_control_and_cancellation(self):
+        controller = self.make_controller(max_workers=1, max_queue=1)
+        runner = controller.script_runner = GatedRunner([self.script_dir])
+
+        running = controller.run_script("sample")
+        self.assertTrue(runner.started.acquire(timeout=5))
+        queued = controller.run_script("sample")
+        with self.assertRaises(JobQueueFull):
+            controller.run_script("sample")
+
+        # Cancelling the queued job frees its slot without it ever running
+        self.assertTrue(controller.cancel_job(queued))
+        self.assertFalse(controller.cancel_job(queued))
+        admitted = controller.run_script("sample")
+
+        self.assertTrue(controller.cancel_job(running))
+        self.assertTrue(runner.started.acquire(timeout=5))
+        runner.release.set()
+        self.wait_for(admitted, JobStatus.COMPLETED)
+
+        self.assertEqual(self.store.get_status(running), JobStatus.CANCELLED)
+        self.assertEqual(self.store.get_job(queued).started_at, None)
+
+    def test_cancellation_from_another_worker(self):
+        controller = self.make_controller(poll_interval=0.01)
+        runner = controller.script_runner = GatedRunner([self.script_dir])
+        job_id = controller.run_script("sample")
+        self.assertTrue(runner.started.acquire(timeout=5))
+
+        # Another API worker process only shares the database file
+        other = JobStore(self.db_path)
+        self.addCleanup(other.close)
+        self.assertTrue(other.cancel_job(job_id))
+
+        deadline = time.monotonic() + 5
+        while controller.running_jobs and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(controller.running_jobs, {})
+        self.assertEqual(self.store.get_status(job_id), JobStatus.CANCELLED)
+
+    def test_process_pool_mode(self):
+        controller = self.make_controller(mode="process", max_workers=1)
+        job_id = controller.run_script("sample", {"who": "grace"})
+        self.wait_for(job_id, JobStatus.COMPLETED)
+        output = self.store.get_job(job_id).output
+        self.assertEqual(output["variables"]["owner"], "grace")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+"""
+Tests for pushed job events and the indexed job listing in JobStore
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+
+from Aetherra.api.job_controller import JobController
+from Aetherra.api.job_store import JobStatus, JobStore
+from Aetherra.api.websocket.job_events import JobEventBroker
+
+
+class JobEventsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "jobs.db")
+        self.store = JobStore(self.db_path)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp_dir.cleanup()
+
+
+class TestIndexedListing(JobEventsTestCase):
+    def test_paging_with_cursor(self):
+        for i in range(5):
+            self.store.create_job(f"job{i}", "sample")
+        self.store.update_job_status("job1", JobStatus.COMPLETED)
+        self.store.update_job_status("job3", JobStatus.COMPLETED)
+
+        first = self.store.list_jobs(limit=2)
+        second = self.store.list_jobs(limit=2, before=first[-1].job_id)
+        self.assertEqual(
+            [j.job_id for j in first + second], [f"job{i}" for i in (4, 3, 2, 1)]
+        )
+
+        completed = self.store.list_jobs(JobStatus.COMPLETED, limit=1, before="job3")
+        self.assertEqual([j.job_id for j in completed], ["job1"])
+
+    def test_status_counts_follow_transitions(self):
+        for i in range(4):
+            self.store.create_job(f"job{i}", "sample")
+        self.store.start_job("job0")
+        self.store.update_job_status("job0", JobStatus.COMPLETED)
+        self.store.cancel_job("job1")
+        self.assertEqual(self.store.cleanup_old_jobs(max_jobs=3), 1)
+
+        stats = self.store.get_stats()
+        self.assertEqual(stats["total_jobs"], 3)
+        self.assertEqual(
+            stats["status_breakdown"],
+            {"pending": 2, "running": 0, "completed": 0, "failed": 0, "cancelled": 1},
+        )
+        self.assertEqual(self.store.get_active_jobs_count(), 2)
+
+
+class TestJobEventBroker(JobEventsTestCase):
+    def collect(self, broker, *args, count=None, start=None):
+        async def scenario():
+            events = []
+            subscription = broker.subscribe(*args)
+            if start:
+                first = asyncio.ensure_future(subscription.__anext__())
+                await asyncio.sleep(0.05)
+                start()
+                events.append(await asyncio.wait_for(first, 5))
+            async for event in subscription:
+                events.append(event)
+                if count and len(events) >= count:
+                    break
+            return events
+
+        return asyncio.run(asyncio.wait_for(scenario(), 10))
+
+    def test_job_lifecycle_is_pushed(self):
+        script_dir = os.path.join(self.tmp_dir.name, "scripts")
+        os.mkdir(script_dir)
+        with open(os.path.join(script_dir, "sample.aether"), "w") as f:
+            f.write('goal "push it"\n')
+        controller = JobController(store=self.store, script_dirs=[script_dir])
+        self.addCleanup(controller.shutdown)
+
+        broker = JobEventBroker(self.store, poll_interval=5)
+        events = self.collect(
+            broker, count=3, start=lambda: controller.run_script("sample")
+        )
+        self.assertEqual(
+            [e["status"] for e in events], ["pending", "running", "completed"]
+        )
+        self.assertEqual(len({e["job_id"] for e in events}), 1)
+
+        # Following a single job starts with a snapshot and ends when it is done
+        job_events = self.collect(broker, events[0]["job_id"])
+        self.assertEqual(
+            [(e["type"], e["status"]) for e in job_events], [("snapshot", "completed")]
+        )
+
+    def test_events_from_other_processes_and_resume(self):
+        self.store.create_job("a", "sample")
+        broker = JobEventBroker(self.store, poll_interval=0.01)
+
+        # A second store on the same file stands in for another API worker;
+        # its writes are only seen by polling the event log
+        other = JobStore(self.db_path)
+        self.addCleanup(other.close)
+
+        def work():
+            other.update_job_progress("a", {"step": 1})
+            other.cancel_job("a")
+
+        events = self.collect(broker, "a", start=work)
+        self.assertEqual(
+            [(e["type"], e["status"]) for e in events],
+            [("snapshot", "pending"), ("progress", "pending"), ("status", "cancelled")],
+        )
+        self.assertEqual(events[1]["progress"], {"step": 1})
+
+        # Resuming after the snapshot replays what followed it
+        replayed = self.collect(broker, None, events[0]["seq"], count=2)
+        self.assertEqual([e["seq"] for e in replayed], [e["seq"] for e in events[1:]])
+
+    def test_resuming_a_finished_job_ends_the_stream(self):
+        self.store.create_job("a", "sample")
+        self.store.start_job("a")
+        self.store.update_job_status("a", JobStatus.COMPLETED)
+        events = self.store.events_since(0, "a")
+        broker = JobEventBroker(self.store, poll_interval=5)
+
+        # A reconnecting EventSource sends the last id it saw
+        self.assertEqual(self.collect(broker, "a", events[-1]["seq"]), [])
+        self.assertEqual(
+            [e["status"] for e in self.collect(broker, "a", events[0]["seq"])],
+            ["running", "completed"],
+        )
+
+    def test_subscribers_share_one_tail_off_the_event_loop(self):
+        for job_id in ("a", "b"):
+            self.store.create_job(job_id, "sample")
+        broker = JobEventBroker(self.store, poll_interval=0.01)
+        readers = set()
+        events_since = self.store.events_since
+
+        def recording_events_since(*args):
+            readers.add(threading.current_thread())
+            return events_since(*args)
+
+        self.store.events_since = recording_events_since
+
+        async def scenario():
+            subscriptions = [broker.subscribe() for _ in range(3)]
+            subscriptions.append(broker.subscribe("b"))
+            firsts = [asyncio.ensure_future(s.__anext__()) for s in subscriptions]
+            await asyncio.sleep(0.05)
+            tails = [t for t in threading.enumerate() if t.name == "job-event-tail"]
+            self.store.cancel_job("a")
+            self.store.cancel_job("b")
+            received = [await asyncio.wait_for(first, 5) for first in firsts]
+            received.append(await asyncio.wait_for(subscriptions[0].__anext__(), 5))
+            for subscription in subscriptions:
+                await subscription.aclose()
+            return tails, received
+
+        tails, received = asyncio.run(asyncio.wait_for(scenario(), 10))
+        self.assertEqual(len(tails), 1)
+        self.assertEqual([e["job_id"] for e in received], ["a", "a", "a", "b", "b"])
+        self.assertNotIn(threading.main_thread(), readers)
+
+        # The tail stops once nobody is subscribed
+        tails[0].join(5)
+        self.assertFalse(tails[0].is_alive())
+        self.assertEqual(broker.get_stats()["subscribers"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+"""
+Tests for the event-driven task dispatcher in AetherraKernelLoop
+"""
+
+import asyncio
+import time
+import unittest
+
+from aetherra_kernel_loop import AetherraKernelLoop
+
+
+class RecordingSystem:
+    """Memory system, plugin manager and Lyrixa engine in one"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.active = {}
+        self.peak = {}
+
+    async def _handle(self, kind, data):
+        self.calls.append((kind, data))
+        self.active[kind] = self.active.get(kind, 0) + 1
+        self.peak[kind] = max(self.peak.get(kind, 0), self.active[kind])
+        await asyncio.sleep(self.delay)
+        self.active[kind] -= 1
+
+    async def process_query(self, data):
+        await self._handle("query", data)
+
+    async def invoke_plugin(self, data):
+        await self._handle("plugin", data)
+
+    async def process_thought(self, data):
+        await self._handle("thought", data)
+
+
+class BatchingSystem(RecordingSystem):
+    async def process_queries(self, batch):
+        await self._handle("batch", batch)
+
+
+class TestKernelDispatcher(unittest.TestCase):
+    def run_kernel(self, scenario, system, **config):
+        async def main():
+            kernel = AetherraKernelLoop(config)
+            kernel.inject_systems(system, system, system, None, None)
+            await scenario(kernel)  # Queue before the dispatcher starts
+            kernel.running = True
+            dispatcher = asyncio.create_task(kernel._dispatch_loop())
+            try:
+                started = time.monotonic()
+                while sum(kernel._queued_counts.values()) or kernel._runs:
+                    await asyncio.sleep(0.005)
+                return kernel, time.monotonic() - started
+            finally:
+                kernel.running = False
+                kernel._work_available.set()
+                await dispatcher
+
+        return asyncio.run(main())
+
+    def test_tasks_run_concurrently_within_type_limits(self):
+        system = RecordingSystem(delay=0.05)
+
+        async def scenario(kernel):
+            for i in range(40):
+                await kernel.add_task({"type": "memory_query", "data": i})
+                await kernel.add_task({"type": "plugin_invoke", "data": i})
+
+        kernel, elapsed = self.run_kernel(
+            scenario, system, concurrency_limits={"memory_query": 8, "plugin_invoke": 2}
+        )
+        self.assertEqual(system.peak, {"query": 8, "plugin": 2})
+        self.assertEqual(kernel.metrics["tasks_completed"], 80)
+        self.assertLess(elapsed, 2.0)  # Sequentially: 4 s
+
+    def test_priorities_share_dispatches_by_weight(self):
+        system = RecordingSystem()
+
+        async def scenario(kernel):
+            for priority in ["background", "normal", "high"]:
+                for i in range(20):
+                    await kernel.add_task(
+                        {"type": "lyrixa_thought", "data": priority}, priority
+                    )
+
+        self.run_kernel(scenario, system, max_concurrency=1)
+        first = [data for _, data in system.calls[:18]]
+        self.assertEqual(
+            (first.count("high"), first.count("normal"), first.count("background")),
+            (10, 6, 2),
+        )
+
+    def test_same_type_tasks_are_batched(self):
+        system = BatchingSystem(delay=0.01)
+
+        async def scenario(kernel):
+            for i in range(10):
+                await kernel.add_task({"type": "memory_query", "data": i})
+            await kernel.add_task({"type": "plugin_invoke", "data": "p"})
+
+        kernel, _ = self.run_kernel(scenario, system, max_batch_size=4)
+        batches = [data for kind, data in system.calls if kind == "batch"]
+        self.assertEqual(batches, [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]])
+        self.assertEqual(kernel.metrics["batches"], 3)
+
+        status = kernel.get_status()
+        self.assertEqual(status["queue_wait_ms"]["normal"]["count"], 11)
+        self.assertEqual(status["service_time_ms"]["normal"]["count"], 11)
+        self.assertGreaterEqual(status["service_time_ms"]["normal"]["max_ms"], 10)
+        self.assertEqual(status["queue_sizes"]["normal_priority"], 0)
+
+    def test_batches_are_filled_in_priority_order(self):
+        system = BatchingSystem()
+
+        async def scenario(kernel):
+            for priority in ["background", "high"]:
+                for i in range(4):
+                    await kernel.add_task(
+                        {"type": "memory_query", "data": f"{priority}_{i}"}, priority
+                    )
+
+        kernel, _ = self.run_kernel(scenario, system, max_batch_size=4)
+        batches = [data for kind, data in system.calls if kind == "batch"]
+        self.assertEqual(
+            batches,
+            [[f"high_{i}" for i in range(4)], [f"background_{i}" for i in range(4)]],
+        )
+        self.assertEqual(kernel._batchable, {})
+
+    def test_dispatched_tasks_leave_the_batch_queue(self):
+        system = RecordingSystem()
+
+        async def scenario(kernel):
+            for i in range(500):
+                await kernel.add_task({"type": "memory_query", "data": i})
+                await kernel.add_task({"type": "plugin_invoke", "data": i})
+
+        kernel, _ = self.run_kernel(scenario, system)
+        self.assertEqual(kernel.metrics["tasks_completed"], 1000)
+        self.assertEqual(kernel._batchable, {})
+
+    def test_single_query_handler_runs_batches_in_one_slot(self):
+        system = RecordingSystem(delay=0.01)
+
+        async def scenario(kernel):
+            for i in range(10):
+                await kernel.add_task({"type": "memory_query", "data": i})
+
+        kernel, _ = self.run_kernel(
+            scenario, system, concurrency_limits={"memory_query": 2}
+        )
+        # Spread over both free slots rather than one run of ten
+        self.assertEqual(kernel.metrics["batches"], 2)
+        self.assertEqual(system.peak, {"query": 2})
+        self.assertEqual(sorted(data for _, data in system.calls), list(range(10)))
+        self.assertEqual(kernel.metrics["tasks_completed"], 10)
+        self.assertEqual(kernel.get_status()["queue_sizes"]["normal_priority"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+"""
+Tests for the LLM response cache and its use in LyrixaConversationManager
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from Aetherra.aetherra_core.engine.conversation_manager import (
+    LyrixaConversationManager,
+)
+from Aetherra.core.llm_response_cache import LLMResponseCache
+from Aetherra.core.multi_llm_manager import (
+    FakeLLMProvider,
+    LLMConfig,
+    LLMProvider,
+    MultiLLMManager,
+)
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "cache.db")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_key_ignores_case_whitespace_and_volatile_context(self):
+        cache = LLMResponseCache()
+        params = {"temperature": 0, "max_tokens": 100}
+        first = cache.make_key(
+            "What is  the status?",
+            "m",
+            params,
+            context="Time 10:41 AM, 2025-01-02T10:41:07, session 3f2a9c1e7b6d4e5f",
+        )
+        second = cache.make_key(
+            "what is the status?",
+            "m",
+            params,
+            context="Time 11:02 AM, 2025-01-03T11:02:55, session 9e8d7c6b5a4f3e21",
+        )
+        self.assertEqual(first, second)
+
+        # Figures that can change the answer are part of the key
+        self.assertNotEqual(
+            cache.make_key("status?", "m", params, context="CPU 12.5%, 3 plugins"),
+            cache.make_key("status?", "m", params, context="CPU 80%, 3 plugins"),
+        )
+        self.assertNotEqual(
+            cache.make_key("status?", "m", params, context="3 plugins loaded"),
+            cache.make_key("status?", "m", params, context="4 plugins loaded"),
+        )
+
+        # The question itself is never masked
+        self.assertNotEqual(
+            cache.make_key("what is 2+2", "m", params),
+            cache.make_key("what is 3+3", "m", params),
+        )
+        self.assertNotEqual(first, cache.make_key("what is the status?", "other"))
+
+    def test_only_deterministic_calls_cached_by_default(self):
+        cache = LLMResponseCache()
+        self.assertTrue(cache.is_cacheable({"temperature": 0}))
+        self.assertFalse(cache.is_cacheable({"temperature": 0.7}))
+        sampled = LLMResponseCache(cache_sampled_responses=True)
+        self.assertTrue(sampled.is_cacheable({"temperature": 0.7}))
+
+    def test_ttl_and_lru_bounds(self):
+        cache = LLMResponseCache(max_entries=2)
+        cache.put("a", "A", "m")
+        cache.put("b", "B", "m")
+        cache.get("a")
+        cache.put("c", "C", "m")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a").response, "A")
+
+        cache.put("short", "S", "m", ttl_seconds=0.01)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("short"))
+        self.assertEqual(cache.get_stats()["expired"], 1)
+
+    def test_persistent_tier_survives_restart(self):
+        cache = LLMResponseCache(db_path=self.db_path)
+        cache.put("k", "persisted", "m", latency_ms=120.0, cost_usd=0.002)
+        cache.close()
+
+        reopened = LLMResponseCache(db_path=self.db_path)
+        entry = reopened.get("k")
+        self.assertEqual(entry.response, "persisted")
+        stats = reopened.get_stats()
+        self.assertEqual(stats["persistent_hits"], 1)
+        self.assertAlmostEqual(stats["latency_saved_ms"], 120.0)
+        self.assertAlmostEqual(stats["cost_saved_usd"], 0.002)
+        reopened.close()
+
+
+class TestConversationResponseCache(unittest.TestCase):
+    def test_repeated_question_served_from_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            llm_manager = MultiLLMManager()
+            provider = FakeLLMProvider()
+            llm_manager.register_provider(
+                LLMProvider.FAKE,
+                provider,
+                {
+                    "fake-echo": LLMConfig(
+                        provider=LLMProvider.FAKE,
+                        model_name="fake-echo",
+                        cost_per_1k_tokens=0.01,
+                    )
+                },
+            )
+            manager = LyrixaConversationManager(
+                tmp_dir, llm_manager=llm_manager, cache_sampled_responses=True
+            )
+            self.assertTrue(manager.llm_enabled)
+
+            async def ask_twice():
+                first = await manager.generate_response("How is the system doing?")
+                manager.reset_conversation()
+                second = await manager.generate_response("how is the  system doing?")
+                return first, second
+
+            first, second = asyncio.run(ask_twice())
+            llm_manager.close()
+
+            self.assertEqual(first, second)
+            self.assertEqual(len(provider.calls), 1)
+
+            cache_stats = manager.get_model_health()["response_cache"]
+            self.assertEqual(cache_stats["hits"], 1)
+            self.assertEqual(cache_stats["hit_ratio"], 0.5)
+            self.assertGreater(cache_stats["cost_saved_usd"], 0)
+            manager.response_cache.close()
+
+    def test_sampled_answers_not_cached_by_default(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            llm_manager = MultiLLMManager()
+            provider = FakeLLMProvider()
+            llm_manager.register_provider(
+                LLMProvider.FAKE,
+                provider,
+                {
+                    "fake-echo": LLMConfig(
+                        provider=LLMProvider.FAKE, model_name="fake-echo"
+                    )
+                },
+            )
+            manager = LyrixaConversationManager(tmp_dir, llm_manager=llm_manager)
+
+            async def ask_twice():
+                await manager.generate_response("How is the system doing?")
+                manager.reset_conversation()
+                await manager.generate_response("How is the system doing?")
+
+            asyncio.run(ask_twice())
+            llm_manager.close()
+
+            self.assertEqual(len(provider.calls), 2)
+            cache_stats = manager.get_model_health()["response_cache"]
+            self.assertEqual(cache_stats["skipped_uncacheable"], 2)
+            manager.response_cache.close()
+
+    def test_status_questions_cached_by_default(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            llm_manager = MultiLLMManager()
+            provider = FakeLLMProvider()
+            llm_manager.register_provider(
+                LLMProvider.FAKE,
+                provider,
+                {
+                    "fake-echo": LLMConfig(
+                        provider=LLMProvider.FAKE, model_name="fake-echo"
+                    )
+                },
+            )
+            manager = LyrixaConversationManager(tmp_dir, llm_manager=llm_manager)
+
+            async def ask_twice():
+                first = await manager.generate_response("/status")
+                manager.reset_conversation()
+                second = await manager.generate_response("  /STATUS ")
+                return first, second
+
+            first, second = asyncio.run(ask_twice())
+            llm_manager.close()
+
+            self.assertEqual(first, second)
+            self.assertEqual(len(provider.calls), 1)
+            cache_stats = manager.get_model_health()["response_cache"]
+            self.assertEqual(cache_stats["hits"], 1)
+            self.assertEqual(cache_stats["skipped_uncacheable"], 0)
+            manager.response_cache.close()
+
+    def test_only_explicit_status_and_help_turns_are_deterministic(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            llm_manager = MultiLLMManager()
+            manager = LyrixaConversationManager(tmp_dir, llm_manager=llm_manager)
+            for text in ["help", "Status?", "/help plugins", " /status "]:
+                self.assertIs(
+                    manager._generation_params_for(text), manager.deterministic_params
+                )
+            for text in [
+                "that was helpful",
+                "help me write a poem",
+                "What is your status?",
+                "/helpful",
+            ]:
+                self.assertIs(
+                    manager._generation_params_for(text), manager.generation_params
+                )
+            llm_manager.close()
+            manager.response_cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
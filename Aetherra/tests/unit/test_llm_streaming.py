@@ -0,0 +1,180 @@
+"""
+Tests for streamed LLM responses through MultiLLMManager and
+LyrixaConversationManager
+"""
+
+import asyncio
+import tempfile
+import threading
+import time
+import unittest
+
+from Aetherra.aetherra_core.engine.conversation_manager import (
+    LyrixaConversationManager,
+)
+from Aetherra.core.multi_llm_manager import (
+    FakeLLMProvider,
+    LLMConfig,
+    LLMProvider,
+    MultiLLMManager,
+)
+
+
+def make_manager(provider, supports_streaming=True):
+    manager = MultiLLMManager()
+    config = LLMConfig(
+        provider=LLMProvider.FAKE,
+        model_name="fake-stream",
+        supports_streaming=supports_streaming,
+    )
+    manager.register_provider(LLMProvider.FAKE, provider, {"fake-stream": config})
+    manager.set_model("fake-stream")
+    return manager
+
+
+class TestManagerStreaming(unittest.TestCase):
+    def setUp(self):
+        self.provider = FakeLLMProvider(
+            responses={"hi": "one two three four"}, latency=0.02, chunk_delay=0.01
+        )
+        self.manager = make_manager(self.provider)
+
+    def tearDown(self):
+        self.manager.close()
+
+    def collect(self, stream):
+        async def run():
+            return [chunk async for chunk in stream]
+
+        return asyncio.run(run())
+
+    def test_chunks_join_to_full_response(self):
+        chunks = self.collect(self.manager.stream_response("hi"))
+        self.assertEqual(chunks, ["one", " two", " three", " four"])
+
+        metrics = self.manager.get_provider_metrics()["fake"]
+        self.assertEqual(metrics["streams"], 1)
+        self.assertGreaterEqual(metrics["last_time_to_first_token_ms"], 15)
+        self.assertLess(
+            metrics["last_time_to_first_token_ms"], metrics["last_latency_ms"]
+        )
+
+    def test_non_streaming_config_yields_single_chunk(self):
+        manager = make_manager(self.provider, supports_streaming=False)
+        try:
+            chunks = self.collect(manager.stream_response("hi"))
+        finally:
+            manager.close()
+        self.assertEqual(chunks, ["one two three four"])
+
+    def test_closing_stream_cancels_provider(self):
+        async def read_one():
+            stream = self.manager.stream_response("hi")
+            first = await stream.__anext__()
+            await stream.aclose()
+            return first
+
+        self.assertEqual(asyncio.run(read_one()), "one")
+        self.assertEqual(self.provider.streams_closed, 1)
+        metrics = self.manager.get_provider_metrics()["fake"]
+        self.assertEqual(metrics["in_flight"], 0)
+
+    def test_iterate_sync_cancel(self):
+        self.provider.chunk_delay = 0.2
+        cancel = threading.Event()
+        received = []
+        started = time.perf_counter()
+        for chunk in self.manager.executor.iterate_sync(
+            self.manager.stream_response("hi"), cancel=cancel
+        ):
+            received.append(chunk)
+            cancel.set()
+        self.assertEqual(received, ["one"])
+        self.assertLess(time.perf_counter() - started, 0.5)
+
+        time.sleep(0.05)
+        self.assertEqual(self.provider.streams_closed, 1)
+
+    def test_blocking_iterator_applies_backpressure(self):
+        produced = []
+
+        def numbers():
+            for i in range(50):
+                produced.append(i)
+                yield i
+
+        async def slow_consumer():
+            seen = []
+            async for item in self.manager.executor.iterate_blocking(
+                numbers, max_buffer=4
+            ):
+                if not seen:
+                    await asyncio.sleep(0.05)
+                    ahead = len(produced)
+                seen.append(item)
+            return seen, ahead
+
+        seen, ahead = asyncio.run(slow_consumer())
+        self.assertEqual(seen, list(range(50)))
+        self.assertLessEqual(ahead, 6)
+
+
+class TestConversationStreaming(unittest.TestCase):
+    def test_stream_response_updates_history_and_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            provider = FakeLLMProvider(chunk_delay=0.001)
+            llm_manager = make_manager(provider)
+            manager = LyrixaConversationManager(
+                tmp_dir, llm_manager=llm_manager, cache_sampled_responses=True
+            )
+
+            async def stream():
+                return [c async for c in manager.stream_response("Tell me a story")]
+
+            chunks = asyncio.run(stream())
+            llm_manager.close()
+            manager.response_cache.close()
+
+            self.assertGreater(len(chunks), 1)
+            response = "".join(chunks)
+            self.assertIn("Tell me a story", response)
+            self.assertEqual(manager.conversation_history[-1]["content"], response)
+            self.assertEqual(manager.response_cache.get_stats()["stores"], 1)
+
+    def test_prefix_split_across_chunks_is_stripped(self):
+        cases = [
+            (["ASSIST", "ANT: hi", " there"], "hi there"),
+            ([" ASS", "IST", "ANT:", " ", "hi"], "hi"),
+            (["ASSISTANT", " is here"], "ASSISTANT is here"),
+            (["ASS"], "ASS"),
+        ]
+        for pieces, expected in cases:
+            with self.subTest(pieces=pieces), tempfile.TemporaryDirectory() as tmp_dir:
+                provider = ChunkedProvider(pieces)
+                llm_manager = make_manager(provider)
+                manager = LyrixaConversationManager(tmp_dir, llm_manager=llm_manager)
+
+                async def stream():
+                    return [c async for c in manager.stream_response("Say hi")]
+
+                chunks = asyncio.run(stream())
+                llm_manager.close()
+                manager.response_cache.close()
+
+                self.assertEqual("".join(chunks), expected)
+
+
+class ChunkedProvider(FakeLLMProvider):
+    """Streams a fixed list of chunks"""
+
+    def __init__(self, pieces):
+        super().__init__()
+        self.pieces = pieces
+
+    async def stream(self, config, prompt, **kwargs):
+        for piece in self.pieces:
+            yield piece
+
+
+if __name__ == "__main__":
+    unittest.main()
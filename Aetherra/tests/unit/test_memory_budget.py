@@ -0,0 +1,200 @@
+"""
+Tests for MemoryManager budget accounting and hot/compressed/disk tiering
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from datetime import timedelta
+
+from Aetherra.core.memory_manager import (
+    MemoryManager,
+    MemoryPriority,
+    MemoryTier,
+    MemoryType,
+)
+
+
+class TestMemoryBudgetTiering(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        # ~5 KB budget so a handful of 600-byte values overflows it
+        self.manager = MemoryManager(
+            db_path=os.path.join(self.tmp_dir.name, "memory.db"),
+            max_memory_mb=0.005,
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def fill(self, count=20):
+        async def scenario():
+            for i in range(count):
+                await self.manager.store(f"key_{i}", f"{i:04d}" + "x" * 600)
+
+        asyncio.run(scenario())
+
+    def test_resident_bytes_stay_within_budget(self):
+        self.fill()
+        self.assertLessEqual(
+            self.manager.budget.resident_bytes, self.manager.max_memory_bytes
+        )
+        stats = self.manager.get_memory_stats()
+        self.assertGreater(stats["demotions"]["compressed"], 0)
+        self.assertGreater(stats["demotions"]["disk"], 0)
+        self.assertGreater(stats["tiers"]["disk"]["entries"], 0)
+
+    def test_retrieve_promotes_spilled_and_compressed_entries(self):
+        self.fill()
+        spilled_key = "key_0"
+        self.assertIsNone(self.manager.index.find_by_key(spilled_key))
+
+        value = asyncio.run(self.manager.retrieve(spilled_key))
+        self.assertEqual(value, "0000" + "x" * 600)
+        entry = self.manager.entries[self.manager.index.find_by_key(spilled_key)]
+        self.assertEqual(entry.tier, MemoryTier.HOT)
+
+        compressed = [
+            e for e in self.manager.entries.values() if e.tier == MemoryTier.COMPRESSED
+        ]
+        self.assertTrue(compressed)
+        key = compressed[0].key
+        value = asyncio.run(self.manager.retrieve(key))
+        self.assertTrue(value.endswith("x" * 600))
+
+        stats = self.manager.get_memory_stats()
+        self.assertEqual(stats["tiers"]["disk"]["hits"], 1)
+        self.assertEqual(stats["tiers"]["compressed"]["hits"], 1)
+
+    def test_restoring_a_spilled_key_replaces_the_old_row(self):
+        self.fill()
+        asyncio.run(self.manager.store("key_0", "fresh"))
+        self.manager.entries.clear()
+        self.manager.index = type(self.manager.index)()
+        self.assertEqual(asyncio.run(self.manager.retrieve("key_0")), "fresh")
+
+    def test_demotion_updates_entry_and_index_sizes(self):
+        self.fill()
+        compressed = [
+            e for e in self.manager.entries.values() if e.tier == MemoryTier.COMPRESSED
+        ]
+        self.assertTrue(compressed)
+        for entry in compressed:
+            self.assertEqual(entry.size_bytes, len(entry.value))
+        self.assertEqual(
+            self.manager.index.total_size_bytes,
+            sum(e.size_bytes for e in self.manager.entries.values()),
+        )
+        self.assertEqual(
+            self.manager.index.total_size_bytes, self.manager.budget.resident_bytes
+        )
+
+        key = compressed[0].key
+        asyncio.run(self.manager.retrieve(key))
+        entry = self.manager.entries[self.manager.index.find_by_key(key)]
+        self.assertGreater(entry.size_bytes, 600)
+        self.assertEqual(
+            self.manager.index.total_size_bytes, self.manager.budget.resident_bytes
+        )
+
+    def test_critical_entries_are_never_spilled(self):
+        async def scenario():
+            await self.manager.store(
+                "pinned", "p" * 600, priority=MemoryPriority.CRITICAL
+            )
+            for i in range(20):
+                await self.manager.store(f"key_{i}", f"{i:04d}" + "x" * 600)
+
+        asyncio.run(scenario())
+        self.assertIsNotNone(self.manager.index.find_by_key("pinned"))
+        self.assertGreater(self.manager.budget.spilled_entries, 0)
+
+    def test_stats_use_index_byte_counters(self):
+        async def scenario():
+            await self.manager.store("fact", "f" * 100, memory_type=MemoryType.LONG_TERM)
+            for i in range(20):
+                await self.manager.store(f"key_{i}", f"{i:04d}" + "x" * 600)
+
+        asyncio.run(scenario())
+        stats = self.manager.get_memory_stats()
+        for memory_type in (MemoryType.WORKING, MemoryType.LONG_TERM):
+            expected = sum(
+                e.size_bytes
+                for e in self.manager.entries.values()
+                if e.memory_type == memory_type
+            )
+            self.assertEqual(
+                stats["type_breakdown"][memory_type.value]["size_mb"],
+                expected / 1024 / 1024,
+            )
+        self.assertEqual(
+            stats["total_size_mb"],
+            sum(e.size_bytes for e in self.manager.entries.values()) / 1024 / 1024,
+        )
+
+    def test_restoring_a_spilled_key_clears_its_spill_record(self):
+        async def scenario():
+            await self.manager.store("key_0", "0" * 600, enable_search=True)
+            for i in range(1, 20):
+                await self.manager.store(f"key_{i}", f"{i:04d}" + "x" * 600)
+
+        asyncio.run(scenario())
+        self.assertIsNone(self.manager.index.find_by_key("key_0"))
+        spilled = self.manager.budget.spilled_entries
+        old_ids = {
+            entry_id
+            for entry_id, _ in self.manager.semantic_search.search_with_scores(
+                "0" * 600
+            )
+        }
+        self.assertTrue(old_ids)
+
+        asyncio.run(self.manager.store("key_0", "fresh"))
+        self.assertEqual(self.manager.budget.spilled_entries, spilled - 1)
+        remaining = {
+            entry_id
+            for entry_id, _ in self.manager.semantic_search.search_with_scores(
+                "0" * 600
+            )
+        }
+        self.assertFalse(old_ids & remaining)
+
+    def test_delete_removes_spilled_entries(self):
+        self.fill()
+        self.assertIsNone(self.manager.index.find_by_key("key_0"))
+
+        self.assertTrue(asyncio.run(self.manager.delete("key_0")))
+        self.assertIsNone(asyncio.run(self.manager.retrieve("key_0")))
+        self.assertFalse(asyncio.run(self.manager.delete("key_0")))
+
+    def test_spilled_entries_expire(self):
+        async def scenario():
+            await self.manager.store("short", "s" * 600, ttl=timedelta(seconds=1))
+            await self.manager.store("long", "l" * 600, ttl=timedelta(hours=1))
+            for i in range(20):
+                await self.manager.store(f"key_{i}", f"{i:04d}" + "x" * 600)
+
+        asyncio.run(scenario())
+        self.assertIsNone(self.manager.index.find_by_key("short"))
+        time.sleep(1.1)
+
+        self.assertIsNone(asyncio.run(self.manager.retrieve("short")))
+        self.assertEqual(asyncio.run(self.manager.retrieve("long")), "l" * 600)
+
+    def test_cleanup_purges_expired_spilled_rows(self):
+        async def scenario():
+            await self.manager.store("short", "s" * 600, ttl=timedelta(seconds=1))
+            for i in range(20):
+                await self.manager.store(f"key_{i}", f"{i:04d}" + "x" * 600)
+            await asyncio.sleep(1.1)
+            await self.manager._perform_cleanup()
+
+        asyncio.run(scenario())
+        self.assertIsNone(self.manager._load_entry("key_name", "short"))
+        self.assertIsNotNone(self.manager._load_entry("key_name", "key_0"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Tests for the FTS5 recall path and tag join table in LyrixaMemorySystem
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+
+from Aetherra.aetherra_core.memory.memory_core import LyrixaMemorySystem, MemoryQuery
+
+
+class TestMemoryCoreSearch(unittest.TestCase):
+    def setUp(self):
+        self.memory = LyrixaMemorySystem()
+
+        async def seed():
+            await self.memory.store_memory(
+                {"text": "python asyncio tutorial"}, tags=["code", "python"]
+            )
+            await self.memory.store_memory(
+                {"text": "cooking pasta recipe"}, tags=["food"], importance=0.9
+            )
+            await self.memory.store_memory(
+                {"text": "python packaging notes"}, tags=["code"], importance=0.9
+            )
+
+        asyncio.run(seed())
+
+    def tearDown(self):
+        self.memory.close_connection()
+
+    def texts(self, memories):
+        return sorted(memory.content["text"] for memory in memories)
+
+    def test_recall_matches_word_prefixes(self):
+        memories = asyncio.run(self.memory.recall_memories("pyth", limit=5))
+        self.assertEqual(
+            self.texts(memories), ["python asyncio tutorial", "python packaging notes"]
+        )
+
+    def test_tag_filter_is_exact(self):
+        memories = asyncio.run(
+            self.memory.search_memories(MemoryQuery(text="python", tags=["code"]))
+        )
+        self.assertEqual(len(memories), 2)
+
+        memories = asyncio.run(self.memory.search_memories(MemoryQuery(tags=["cod"])))
+        self.assertEqual(memories, [])
+
+    def test_deleted_rows_leave_the_index(self):
+        conn = self.memory.ensure_connection()
+        conn.execute("DELETE FROM memories WHERE content LIKE '%pasta%'")
+        conn.commit()
+
+        self.assertEqual(asyncio.run(self.memory.recall_memories("pasta")), [])
+        tag_rows = conn.execute(
+            "SELECT COUNT(*) FROM memory_tags WHERE tag = 'food'"
+        ).fetchone()[0]
+        self.assertEqual(tag_rows, 0)
+
+
+class TestMemoryAccessBatching(unittest.TestCase):
+    def setUp(self):
+        self.memory = LyrixaMemorySystem(access_flush_interval=3600)
+        asyncio.run(self.memory.store_memory({"text": "batched access counts"}))
+
+    def tearDown(self):
+        self.memory.close_connection()
+
+    def access_count(self):
+        return (
+            self.memory.ensure_connection()
+            .execute("SELECT access_count FROM memories")
+            .fetchone()[0]
+        )
+
+    def test_access_counts_are_coalesced_until_flush(self):
+        for _ in range(3):
+            asyncio.run(self.memory.recall_memories("batched"))
+
+        stats = asyncio.run(self.memory.get_memory_stats())
+        self.assertEqual(stats["pending_access_updates"], 1)
+        self.assertEqual(self.access_count(), 0)
+
+        self.assertEqual(self.memory.flush_access_updates(), 1)
+        self.assertEqual(self.access_count(), 3)
+
+    def test_pending_access_counts_flush_without_another_recall(self):
+        self.memory.access_flush_interval = 0.1
+        self.memory.flush_access_updates()  # Start a fresh interval
+
+        async def scenario():
+            await self.memory.recall_memories("batched")
+            self.assertEqual(self.access_count(), 0)
+            await asyncio.sleep(0.3)
+
+        asyncio.run(scenario())
+        self.assertEqual(self.access_count(), 1)
+        self.assertEqual(self.memory.access_metrics["access_flushes"], 1)
+
+    def test_default_interval_flushes_every_recall(self):
+        self.memory.access_flush_interval = 0.0
+        asyncio.run(self.memory.recall_memories("batched"))
+        self.assertEqual(self.access_count(), 1)
+
+
+class TestMemoryCoreMigration(unittest.TestCase):
+    def test_existing_database_is_backfilled(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "legacy.db")
+            conn = sqlite3.connect(db_path)
+            conn.execute("""
+                CREATE TABLE memories (
+                    id TEXT PRIMARY KEY, content TEXT NOT NULL, context TEXT,
+                    tags TEXT, importance REAL NOT NULL, created_at TEXT NOT NULL,
+                    last_accessed TEXT NOT NULL, access_count INTEGER DEFAULT 0,
+                    memory_type TEXT NOT NULL
+                )
+            """)
+            now = datetime.now().isoformat()
+            conn.execute(
+                "INSERT INTO memories VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    "legacy",
+                    json.dumps({"text": "legacy memory about gardening"}),
+                    "{}",
+                    json.dumps(["garden"]),
+                    0.5,
+                    now,
+                    now,
+                    0,
+                    "learning",
+                ),
+            )
+            conn.commit()
+            conn.close()
+
+            memory = LyrixaMemorySystem(db_path)
+            try:
+                memories = asyncio.run(
+                    memory.search_memories(
+                        MemoryQuery(text="gardening", tags=["garden"])
+                    )
+                )
+                self.assertEqual([m.id for m in memories], ["legacy"])
+            finally:
+                memory.close_connection()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Tests for the O(1) recency index and index-driven eviction in MemoryManager
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from itertools import islice
+
+from Aetherra.core.memory_manager import (
+    MemoryEntry,
+    MemoryEvictionPolicy,
+    MemoryIndex,
+    MemoryManager,
+    MemoryPriority,
+    MemoryType,
+)
+
+
+def make_entry(entry_id, priority=MemoryPriority.NORMAL, size=10, access_count=1):
+    now = datetime.now()
+    return MemoryEntry(
+        entry_id=entry_id,
+        key=f"key_{entry_id}",
+        value=entry_id,
+        memory_type=MemoryType.WORKING,
+        priority=priority,
+        created_at=now,
+        accessed_at=now,
+        access_count=access_count,
+        ttl=None,
+        tags=[],
+        size_bytes=size,
+        compressed=False,
+    )
+
+
+def lru(index, count):
+    return list(islice(index.iter_lru(), count))
+
+
+class TestMemoryIndexLRU(unittest.TestCase):
+    def setUp(self):
+        self.index = MemoryIndex()
+        self.entries = {}
+        for entry_id in ["a", "b", "c"]:
+            entry = make_entry(entry_id)
+            self.entries[entry_id] = entry
+            self.index.add_entry(entry)
+
+    def test_touch_moves_entry_to_most_recent(self):
+        self.index.touch(self.entries["a"])
+        self.assertEqual(lru(self.index, 3), ["b", "c", "a"])
+
+    def test_lower_priority_is_evicted_first(self):
+        low = make_entry("low", priority=MemoryPriority.LOW)
+        self.entries["low"] = low
+        self.index.add_entry(low)
+        self.assertEqual(lru(self.index, 2), ["low", "a"])
+
+    def test_remove_updates_order_and_size(self):
+        self.index.remove_entry(self.entries["b"])
+        self.assertEqual(lru(self.index, 3), ["a", "c"])
+        self.assertEqual(self.index.total_size_bytes, 20)
+        self.assertEqual(self.index.type_size_bytes[MemoryType.WORKING], 20)
+
+    def test_lru_eviction_uses_index_order(self):
+        self.index.touch(self.entries["a"])
+        evict_ids = MemoryEvictionPolicy.lru_eviction(self.entries, 10, self.index)
+        self.assertEqual(evict_ids, ["b", "c"])
+
+    def test_priority_eviction_prefers_least_frequently_used(self):
+        self.entries["a"].access_count = 5
+        self.index.touch(self.entries["a"])
+        critical = make_entry("crit", priority=MemoryPriority.CRITICAL)
+        self.entries["crit"] = critical
+        self.index.add_entry(critical)
+
+        evict_ids = MemoryEvictionPolicy.priority_eviction(self.entries, 0, self.index)
+        self.assertEqual(evict_ids, ["b", "c", "a"])
+
+    def test_priority_eviction_leaves_the_index_intact(self):
+        self.entries["a"].access_count = 5
+        self.index.touch(self.entries["a"])  # Leaves one stale heap item
+        evict_ids = MemoryEvictionPolicy.priority_eviction(self.entries, 20, self.index)
+        self.assertEqual(evict_ids, ["b"])
+        # Popped candidates are pushed back, stale items met on the way dropped
+        self.assertEqual(len(self.index.lfu_heap), 3)
+
+        # Nothing was evicted, so the same candidate is offered again
+        evict_ids = MemoryEvictionPolicy.priority_eviction(self.entries, 0, self.index)
+        self.assertEqual(evict_ids, ["b", "c", "a"])
+
+
+class TestMemoryManagerRecency(unittest.TestCase):
+    def test_retrieve_updates_recency(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manager = MemoryManager(db_path=os.path.join(tmp_dir, "memory.db"))
+
+            async def scenario():
+                await manager.store("first", "one")
+                await manager.store("second", "two")
+                await manager.retrieve("first")
+
+            asyncio.run(scenario())
+
+            oldest_id = lru(manager.index, 1)[0]
+            self.assertEqual(manager.entries[oldest_id].key, "second")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Tests for the staged LyrixaMemoryEngine.remember pipeline
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+from Aetherra.aetherra_core.kernel.memory_kernel import (
+    LyrixaMemoryEngine,
+    MemorySystemConfig,
+)
+
+
+def make_config(tmp_dir, **overrides):
+    paths = {
+        f"{name}_db_path": os.path.join(tmp_dir, f"{name}.db")
+        for name in ["core", "fractal", "concepts", "timeline", "pulse", "reflector"]
+    }
+    return MemorySystemConfig(**paths, **overrides)
+
+
+class TestRememberPipeline(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.engine.close()
+        self.tmp_dir.cleanup()
+
+    def count_mesh_writes(self):
+        writes = []
+        store_fragment = self.engine.fractal_mesh.store_fragment
+
+        def counting_store(fragment):
+            writes.append(fragment.fragment_id)
+            return store_fragment(fragment)
+
+        self.engine.fractal_mesh.store_fragment = counting_store
+        return writes
+
+    def test_fragment_is_committed_once_with_links(self):
+        self.engine = LyrixaMemoryEngine(make_config(self.tmp_dir.name))
+        writes = self.count_mesh_writes()
+
+        result = asyncio.run(self.engine.remember("pipeline test", tags=["kernel"]))
+
+        self.assertTrue(result.success)
+        self.assertEqual(writes, [result.fragment_id])
+        fragment = self.engine.fractal_mesh.fragments[result.fragment_id]
+        self.assertTrue(fragment.associative_links)
+
+    def test_deferred_enrichment_runs_after_commit(self):
+        self.engine = LyrixaMemoryEngine(
+            make_config(
+                self.tmp_dir.name,
+                defer_enrichment=True,
+                auto_narrative_generation=False,
+                auto_pulse_monitoring=False,
+            )
+        )
+
+        async def scenario():
+            result = await self.engine.remember("deferred test", tags=["kernel"])
+            fragment = self.engine.fractal_mesh.fragments[result.fragment_id]
+            self.assertEqual(fragment.associative_links, [])
+            await self.engine.drain_enrichment()
+            return fragment
+
+        fragment = asyncio.run(scenario())
+        self.assertTrue(fragment.associative_links)
+        self.assertEqual(self.engine.operation_stats["deferred_enrichments"], 1)
+
+    def test_failed_deferred_enrichment_is_logged_and_counted(self):
+        self.engine = LyrixaMemoryEngine(
+            make_config(
+                self.tmp_dir.name,
+                defer_enrichment=True,
+                auto_narrative_generation=False,
+                auto_pulse_monitoring=False,
+            )
+        )
+
+        def fail(fragment):
+            raise RuntimeError("boom")
+
+        self.engine._enrich_fragment = fail
+
+        async def scenario():
+            await self.engine.remember("deferred failure", tags=["kernel"])
+            await self.engine.drain_enrichment()
+
+        with self.assertLogs(
+            "Aetherra.aetherra_core.kernel.memory_kernel", level="WARNING"
+        ) as logs:
+            asyncio.run(scenario())
+        self.assertIn("boom", logs.output[0])
+        self.assertEqual(self.engine.operation_stats["failed_enrichments"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
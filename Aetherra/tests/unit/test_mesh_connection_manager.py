@@ -0,0 +1,152 @@
+"""
+Tests for the shared write-behind SQLite connection manager of the fractal mesh
+"""
+
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from datetime import datetime
+
+from Aetherra.aetherra_core.memory.fractal_mesh.base import (
+    FractalMeshCore,
+    MemoryFragment,
+    MemoryFragmentType,
+)
+from Aetherra.aetherra_core.memory.fractal_mesh.connection_manager import (
+    MeshConnectionManager,
+    acquire_connection_manager,
+    release_connection_manager,
+)
+
+
+class TestMeshConnectionManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "mesh.db")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_writes_are_batched_and_flushed(self):
+        manager = MeshConnectionManager(
+            self.db_path, batch_size=1000, flush_interval=60
+        )
+        manager.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, value TEXT)")
+        for i in range(10):
+            manager.submit("INSERT INTO items VALUES (?, ?)", (i, str(i)))
+
+        self.assertEqual(manager.get_metrics()["pending_writes"], 10)
+        rows = manager.query("SELECT COUNT(*) FROM items")
+        self.assertEqual(rows[0][0], 10)
+
+        metrics = manager.get_metrics()
+        self.assertEqual(metrics["pending_writes"], 0)
+        self.assertEqual(metrics["flushes"], 1)
+        self.assertEqual(metrics["rows_flushed"], 10)
+        manager.close()
+
+    def test_background_flush_by_time(self):
+        manager = MeshConnectionManager(self.db_path, flush_interval=0.01)
+        manager.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+        manager.submit("INSERT INTO items VALUES (?)", (1,))
+
+        deadline = time.monotonic() + 2
+        while manager.get_metrics()["pending_writes"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(manager.get_metrics()["rows_flushed"], 1)
+        manager.close()
+
+    def test_failed_flush_keeps_writes_queued(self):
+        manager = MeshConnectionManager(
+            self.db_path, batch_size=1000, flush_interval=60
+        )
+        manager.submit("INSERT INTO items VALUES (?)", (1,))
+        manager.submit("INSERT INTO items VALUES (?)", (2,))
+        self.assertEqual(manager.flush(), 0)  # No such table yet
+        self.assertEqual(manager.get_metrics()["pending_writes"], 2)
+
+        manager.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+        self.assertEqual(manager.query("SELECT id FROM items"), [(1,), (2,)])
+        self.assertEqual(manager.get_metrics()["flush_errors"], 1)
+        manager.close()
+
+    def test_bad_row_does_not_block_the_queue(self):
+        manager = MeshConnectionManager(
+            self.db_path, batch_size=1000, flush_interval=60, max_attempts=2
+        )
+        manager.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+        manager.submit("INSERT INTO items VALUES (?)", (1,))
+        manager.submit("INSERT INTO items VALUES (?)", (1,))  # Duplicate key
+        manager.submit("INSERT INTO items VALUES (?)", (2,))
+
+        self.assertEqual(manager.query("SELECT id FROM items"), [(1,), (2,)])
+        self.assertEqual(manager.get_metrics()["pending_writes"], 1)
+
+        manager.submit("INSERT INTO items VALUES (?)", (3,))
+        self.assertEqual(manager.query("SELECT id FROM items"), [(1,), (2,), (3,)])
+
+        metrics = manager.get_metrics()
+        self.assertEqual(metrics["pending_writes"], 0)
+        self.assertEqual(metrics["dead_letters"], 1)
+        self.assertEqual(metrics["row_errors"], 2)
+        self.assertEqual(manager.dead_letters[0][1], (1,))
+        manager.close()
+
+    def test_close_dead_letters_rows_that_still_fail(self):
+        manager = MeshConnectionManager(
+            self.db_path, batch_size=1000, flush_interval=60, max_attempts=5
+        )
+        manager.submit("INSERT INTO items VALUES (?)", (1,))  # No such table
+        with self.assertLogs(
+            "Aetherra.aetherra_core.memory.fractal_mesh.connection_manager",
+            level="WARNING",
+        ):
+            manager.close()
+
+        metrics = manager.get_metrics()
+        self.assertEqual(metrics["pending_writes"], 0)
+        self.assertEqual(metrics["dead_letters"], 1)
+        self.assertEqual(manager.dead_letters[0][1], (1,))
+        self.assertEqual(manager.dead_letters[0][2], "connection closed")
+
+    def test_manager_is_shared_per_database(self):
+        first = acquire_connection_manager(self.db_path)
+        second = acquire_connection_manager(self.db_path)
+        self.assertIs(first, second)
+        release_connection_manager(self.db_path)
+        release_connection_manager(self.db_path)
+
+    def test_close_persists_pending_fragments(self):
+        mesh = FractalMeshCore(self.db_path)
+        now = datetime.now()
+        mesh.store_fragment(
+            MemoryFragment(
+                fragment_id="durable",
+                content={"text": "kept"},
+                fragment_type=MemoryFragmentType.SEMANTIC,
+                temporal_tags={},
+                symbolic_tags={"unit"},
+                associative_links=[],
+                confidence_score=1.0,
+                access_pattern={},
+                narrative_role=None,
+                created_at=now,
+                last_evolved=now,
+            )
+        )
+        mesh.close()
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            count = conn.execute(
+                "SELECT COUNT(*) FROM memory_fragments WHERE fragment_id = 'durable'"
+            ).fetchone()[0]
+        finally:
+            conn.close()
+        self.assertEqual(count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
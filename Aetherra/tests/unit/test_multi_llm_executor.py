@@ -0,0 +1,179 @@
+"""
+Tests for the non-blocking provider execution layer in MultiLLMManager
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import types
+import unittest
+from unittest import mock
+
+from Aetherra.core.multi_llm_manager import (
+    BaseLLMProvider,
+    LLMConfig,
+    LlamaCppProvider,
+    LLMProvider,
+    MultiLLMManager,
+)
+
+
+class BlockingProvider(BaseLLMProvider):
+    """Provider whose SDK call blocks the calling thread"""
+
+    def __init__(self, delay=0.05):
+        super().__init__()
+        self.delay = delay
+        self.threads = set()
+
+    def is_model_available(self, config):
+        return True
+
+    def _call(self, prompt):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return f"echo: {prompt}"
+
+    async def generate(self, config, prompt, **kwargs):
+        return await self.run_blocking(self._call, prompt)
+
+
+class TestProviderExecutor(unittest.TestCase):
+    def setUp(self):
+        self.manager = MultiLLMManager(
+            max_workers=4, provider_concurrency={LLMProvider.OLLAMA: 2}
+        )
+        self.provider = BlockingProvider()
+        config = LLMConfig(provider=LLMProvider.OLLAMA, model_name="blocking")
+        self.manager.register_provider(
+            LLMProvider.OLLAMA, self.provider, {"blocking": config}
+        )
+        self.assertTrue(self.manager.set_model("blocking"))
+
+    def tearDown(self):
+        self.manager.close()
+
+    def test_blocking_calls_do_not_stall_event_loop(self):
+        async def scenario():
+            ticks = 0
+
+            async def heartbeat():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.005)
+
+            beat = asyncio.ensure_future(heartbeat())
+            response = await self.manager.generate_response("hello")
+            beat.cancel()
+            return response, ticks
+
+        response, ticks = asyncio.run(scenario())
+        self.assertEqual(response, "echo: hello")
+        self.assertGreater(ticks, 3)
+        self.assertTrue(
+            all(n.startswith("llm-provider") for n in self.provider.threads)
+        )
+
+    def test_concurrency_limit_and_queue_metrics(self):
+        async def scenario():
+            return await asyncio.gather(
+                *(self.manager.generate_response(f"p{i}") for i in range(6))
+            )
+
+        responses = asyncio.run(scenario())
+        self.assertEqual(len(responses), 6)
+
+        metrics = self.manager.get_provider_metrics()["ollama"]
+        self.assertEqual(metrics["requests"], 6)
+        self.assertEqual(metrics["max_in_flight"], 2)
+        self.assertEqual(metrics["in_flight"], 0)
+        self.assertEqual(metrics["queued"], 0)
+        self.assertGreater(metrics["avg_queue_ms"], 10)
+        self.assertGreaterEqual(metrics["p50_latency_ms"], 40)
+
+    def test_sync_callers_reuse_one_loop(self):
+        loops = []
+
+        async def capture(config, prompt, **kwargs):
+            loops.append(asyncio.get_running_loop())
+            return prompt
+
+        self.provider.generate = capture
+        self.assertEqual(self.manager.generate_response_sync("a"), "a")
+        self.assertEqual(self.manager.generate_response_sync("b"), "b")
+        self.assertIs(loops[0], loops[1])
+
+    def test_errors_are_counted(self):
+        async def failing(config, prompt, **kwargs):
+            raise RuntimeError("boom")
+
+        self.provider.generate = failing
+        with self.assertRaises(RuntimeError):
+            self.manager.generate_response_sync("x")
+        self.assertEqual(self.manager.get_provider_metrics()["ollama"]["errors"], 1)
+
+
+class FakeLlama:
+    """Stands in for llama_cpp.Llama and records overlapping calls"""
+
+    loaded = []
+
+    def __init__(self, **kwargs):
+        FakeLlama.loaded.append(kwargs["model_path"])
+        self.active = 0
+        self.peak = 0
+
+    def _enter(self):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+
+    def __call__(self, prompt, stream=False, **kwargs):
+        if stream:
+            return self._stream(prompt)
+        self._enter()
+        self.active -= 1
+        return {"choices": [{"text": prompt}]}
+
+    def _stream(self, prompt):
+        self._enter()
+        try:
+            for word in prompt.split():
+                yield {"choices": [{"text": word}]}
+        finally:
+            self.active -= 1
+
+
+class TestLlamaCppProvider(unittest.TestCase):
+    def test_model_is_shared_and_never_used_concurrently(self):
+        fake_module = types.SimpleNamespace(Llama=FakeLlama)
+        with mock.patch.dict(sys.modules, {"llama_cpp": fake_module}):
+            providers = [LlamaCppProvider(), LlamaCppProvider()]
+        config = LLMConfig(
+            provider=LLMProvider.LLAMACPP,
+            model_name="fake",
+            model_path="/models/fake-shared.gguf",
+        )
+
+        def call(i):
+            provider = providers[i % 2]
+            if i % 3:
+                provider._complete(config, f"prompt {i}")
+            else:
+                list(provider._complete(config, f"stream {i}", stream=True))
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        model, _ = providers[0]._get_model(config)
+        self.assertEqual(FakeLlama.loaded.count(config.model_path), 1)
+        self.assertEqual(model.peak, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
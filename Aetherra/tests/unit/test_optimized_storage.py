@@ -0,0 +1,187 @@
+"""
+Tests for OptimizedMemoryStorage: schema, writer thread, codec and read path
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from Aetherra.aetherra_core.memory.fractal_mesh.base import (
+    MemoryFragment,
+    MemoryFragmentType,
+)
+from Aetherra.aetherra_core.memory.optimized_storage import (
+    FragmentCodec,
+    OptimizedMemoryStorage,
+)
+
+
+def make_fragment(fragment_id):
+    now = datetime.now()
+    return MemoryFragment(
+        fragment_id=fragment_id,
+        content={"text": f"memory {fragment_id}", "score": 0.5, "n": [1, None]},
+        fragment_type=MemoryFragmentType.EPISODIC,
+        temporal_tags={"hour": now.hour},
+        symbolic_tags={"alpha", "beta"},
+        associative_links=["other"],
+        confidence_score=0.7,
+        access_pattern={"access_count": 0},
+        narrative_role="event",
+        created_at=now,
+        last_evolved=now,
+    )
+
+
+class TestFragmentCodec(unittest.TestCase):
+    def test_round_trip(self):
+        value = {"a": [1, 2.5, "x", None, True], "b": {"nested": b"raw"}, "c": {1}}
+        self.assertEqual(FragmentCodec.decode(FragmentCodec.encode(value)), value)
+
+    def test_legacy_json_payloads_still_decode(self):
+        legacy = json.dumps({"content": {"text": "old"}}).encode("utf-8")
+        self.assertEqual(FragmentCodec.decode(legacy)["content"]["text"], "old")
+
+    def test_unknown_version_is_rejected(self):
+        data = bytearray(FragmentCodec.encode({}))
+        data[2] = 99
+        with self.assertRaises(ValueError):
+            FragmentCodec.decode(bytes(data))
+
+
+class TestOptimizedMemoryStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "optimized.db")
+        self.storage = OptimizedMemoryStorage(self.db_path, batch_size=10)
+
+    def tearDown(self):
+        self.storage.cleanup()
+        self.tmp_dir.cleanup()
+
+    def test_pending_fragments_are_readable_before_commit(self):
+        fragment = make_fragment("pending")
+        self.storage.store_fragment_fast(fragment)
+        self.assertIs(self.storage.retrieve_fragment("pending"), fragment)
+
+    def test_fragments_survive_reopen(self):
+        self.storage.store_fragments_batch(
+            [make_fragment(f"frag_{i}") for i in range(25)]
+        )
+        self.assertTrue(self.storage.flush(timeout=5))
+        metrics = self.storage.get_performance_metrics()
+        self.assertEqual(metrics["rows_written"], 25)
+        self.assertEqual(metrics["buffer_size"], 0)
+        self.storage.cleanup()
+
+        self.storage = OptimizedMemoryStorage(self.db_path)
+        restored = self.storage.retrieve_fragment("frag_3")
+        self.assertEqual(restored.content["text"], "memory frag_3")
+        self.assertEqual(restored.symbolic_tags, {"alpha", "beta"})
+        self.assertEqual(restored.associative_links, ["other"])
+        self.assertEqual(restored.fragment_type, MemoryFragmentType.EPISODIC)
+
+    def test_failed_batch_stays_pending_and_is_retried(self):
+        admin = sqlite3.connect(self.db_path)
+        admin.execute(
+            "ALTER TABLE memory_fragments_optimized RENAME TO fragments_offline"
+        )
+        admin.commit()
+        self.storage.max_attempts = 1000  # Not dead-lettered while offline
+        self.storage.store_fragment_fast(make_fragment("kept"))
+        self.assertFalse(self.storage.flush(timeout=5))
+        metrics = self.storage.get_performance_metrics()
+        self.assertGreaterEqual(metrics["write_errors"], 1)
+        self.assertEqual(metrics["buffer_size"], 1)
+        self.assertEqual(self.storage.retrieve_fragment("kept").fragment_id, "kept")
+
+        admin.execute(
+            "ALTER TABLE fragments_offline RENAME TO memory_fragments_optimized"
+        )
+        admin.commit()
+        self.assertTrue(self.storage.flush(timeout=5))
+        self.assertEqual(self.storage.get_performance_metrics()["buffer_size"], 0)
+        rows = admin.execute(
+            "SELECT fragment_id FROM memory_fragments_optimized"
+        ).fetchall()
+        admin.close()
+        self.assertEqual(rows, [("kept",)])
+
+    def test_writer_survives_unexpected_errors(self):
+        with mock.patch.object(
+            self.storage, "_extract_tag_data", side_effect=RuntimeError("boom")
+        ):
+            self.storage.store_fragment_fast(make_fragment("first"))
+            self.assertFalse(self.storage.flush(timeout=5))
+        self.assertTrue(self.storage.flush(timeout=5))  # Retried without the fault
+        metrics = self.storage.get_performance_metrics()
+        self.assertEqual((metrics["rows_written"], metrics["buffer_size"]), (1, 0))
+
+    def test_unencodable_fragment_is_dead_lettered(self):
+        bad = make_fragment("bad")
+        bad.content = {"handle": object()}
+        self.storage.store_fragments_batch([bad, make_fragment("good")])
+        self.assertFalse(self.storage.flush(timeout=5))
+
+        metrics = self.storage.get_performance_metrics()
+        self.assertEqual((metrics["rows_written"], metrics["buffer_size"]), (1, 0))
+        self.assertEqual((metrics["encode_errors"], metrics["dead_letters"]), (1, 1))
+        self.assertIs(self.storage.dead_letters[0][0], bad)
+        self.assertIsNone(self.storage.retrieve_fragment("bad"))
+        self.assertTrue(self.storage.flush(timeout=5))
+
+    def test_failing_fragment_is_dead_lettered_after_max_attempts(self):
+        # Long interval: the writer only retries when a flush asks it to
+        self.storage.cleanup()
+        self.storage = OptimizedMemoryStorage(
+            self.db_path, flush_interval_ms=60000, max_attempts=2
+        )
+        original = self.storage._extract_tag_data
+
+        def extract(fragment):
+            if fragment.fragment_id == "poison":
+                raise RuntimeError("boom")
+            return original(fragment)
+
+        with mock.patch.object(self.storage, "_extract_tag_data", side_effect=extract):
+            self.storage.store_fragments_batch(
+                [make_fragment("poison"), make_fragment("fine")]
+            )
+            self.assertFalse(self.storage.flush(timeout=5))
+            self.assertEqual(self.storage.get_performance_metrics()["rows_written"], 1)
+            self.assertFalse(self.storage.flush(timeout=5))
+            self.assertTrue(self.storage.flush(timeout=5))
+
+        metrics = self.storage.get_performance_metrics()
+        self.assertEqual((metrics["buffer_size"], metrics["dead_letters"]), (0, 1))
+        self.assertEqual(self.storage.dead_letters[0][0].fragment_id, "poison")
+
+    def test_cleanup_dead_letters_fragments_that_still_fail(self):
+        admin = sqlite3.connect(self.db_path)
+        admin.execute(
+            "ALTER TABLE memory_fragments_optimized RENAME TO fragments_offline"
+        )
+        admin.commit()
+        admin.close()
+        self.storage.max_attempts = 1000
+        self.storage.store_fragment_fast(make_fragment("lost"))
+        self.assertFalse(self.storage.flush(timeout=5))
+        self.storage.store_fragment_fast(make_fragment("late"))
+
+        self.storage.cleanup()
+        metrics = self.storage.get_performance_metrics()
+        self.assertEqual((metrics["buffer_size"], metrics["dead_letters"]), (0, 2))
+        self.assertEqual(
+            {fragment.fragment_id for fragment, _ in self.storage.dead_letters},
+            {"lost", "late"},
+        )
+        with self.assertRaises(RuntimeError):
+            self.storage.store_fragment_fast(make_fragment("after"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+"""
+Tests for the DAG strategy of PluginChainExecutor
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from typing import Any, Dict
+
+from Aetherra.plugins.core.plugin_chain_executor import (
+    ChainStrategy,
+    ExecutionStatus,
+    PluginChainExecutor,
+    PluginInterface,
+    PluginResult,
+)
+
+
+class RecordingPlugin(PluginInterface):
+    """Sleeps, records start order and concurrency, and tags its input"""
+
+    def __init__(self, plugin_id, delay, log, fail=False):
+        super().__init__(plugin_id)
+        self.delay = delay
+        self.log = log
+        self.fail = fail
+
+    async def execute(self, input_data: Any, context: Dict[str, Any]) -> PluginResult:
+        self.log["started"].append(self.plugin_id)
+        self.log["running"] += 1
+        self.log["max_running"] = max(self.log["max_running"], self.log["running"])
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.log["running"] -= 1
+        if self.fail:
+            raise RuntimeError(f"{self.plugin_id} failed")
+        return PluginResult(
+            plugin_id=self.plugin_id,
+            success=True,
+            output=(self.plugin_id, input_data),
+            execution_time=self.delay,
+        )
+
+
+class TestDagStrategy(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.executor = PluginChainExecutor(
+            db_path=os.path.join(self.tmp_dir.name, "chains.db"), max_concurrency=2
+        )
+        self.log = {"started": [], "running": 0, "max_running": 0}
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def register(self, plugin_id, delay=0.01, fail=False):
+        self.executor.register_plugin(
+            RecordingPlugin(plugin_id, delay, self.log, fail=fail)
+        )
+
+    def run_chain(self, plugins, dependencies):
+        return asyncio.run(
+            self.executor.execute_chain(
+                plugins=plugins,
+                strategy=ChainStrategy.DAG,
+                context={"initial_input": "x"},
+                dependencies=dependencies,
+            )
+        )
+
+    def test_outputs_flow_to_dependents(self):
+        for plugin_id in ["a", "b", "c", "merge"]:
+            self.register(plugin_id)
+        execution = self.run_chain(
+            ["a", "b", "c", "merge"],
+            {"b": ["a"], "c": ["a"], "merge": ["b", "c"]},
+        )
+
+        self.assertEqual(execution.status, ExecutionStatus.COMPLETED)
+        results = {r.plugin_id: r for r in execution.results}
+        self.assertEqual(results["b"].output, ("b", ("a", "x")))
+        self.assertEqual(
+            results["merge"].output,
+            ("merge", {"b": ("b", ("a", "x")), "c": ("c", ("a", "x"))}),
+        )
+        self.assertEqual(self.log["started"][0], "a")
+        self.assertEqual(self.log["started"][-1], "merge")
+
+    def test_concurrency_limits(self):
+        for i in range(6):
+            self.register(f"p{i}")
+        self.run_chain([f"p{i}" for i in range(6)], {})
+        self.assertEqual(self.log["max_running"], 2)
+
+        self.log["max_running"] = 0
+        self.executor.max_concurrency = 8
+        self.executor.plugin_concurrency = {"solo": 1}
+        self.register("solo")
+
+        async def concurrent_chains():
+            return await asyncio.gather(
+                *(
+                    self.executor.execute_chain(
+                        plugins=["solo"], strategy=ChainStrategy.DAG
+                    )
+                    for _ in range(3)
+                )
+            )
+
+        asyncio.run(concurrent_chains())
+        self.assertEqual(self.log["max_running"], 1)
+
+    def test_saturated_plugin_does_not_hold_global_slots(self):
+        self.executor.plugin_concurrency = {"solo": 1}
+        self.register("solo", delay=0.05)
+        self.register("other")
+
+        async def concurrent_chains():
+            return await asyncio.gather(
+                *(
+                    self.executor.execute_chain(
+                        plugins=[plugin_id], strategy=ChainStrategy.DAG
+                    )
+                    for plugin_id in ["solo", "solo", "solo", "other"]
+                )
+            )
+
+        asyncio.run(concurrent_chains())
+        # The queued solo runs wait on their own limit, not on a global slot
+        self.assertEqual(self.log["started"][:2], ["solo", "other"])
+
+    def test_blocked_plugin_does_not_take_chain_slots(self):
+        self.executor.plugin_concurrency = {"solo": 1}
+        self.register("solo")
+        self.register("x", delay=0.05)
+        self.register("y", delay=0.05)
+        for _ in range(3):
+            self.executor.optimizer.record_performance("solo", 1.0)
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            solo_limit = asyncio.Semaphore(1)
+            self.executor._limits[loop] = {
+                "": asyncio.Semaphore(self.executor.max_concurrency),
+                "solo": solo_limit,
+            }
+            await solo_limit.acquire()  # Held by another chain
+            chain = asyncio.create_task(
+                self.executor.execute_chain(
+                    plugins=["solo", "x", "y"], strategy=ChainStrategy.DAG
+                )
+            )
+            await asyncio.sleep(0.03)
+            started = list(self.log["started"])
+            solo_limit.release()
+            await chain
+            return started
+
+        started = asyncio.run(scenario())
+        # Both runnable plugins took the two chain slots while solo waited
+        self.assertEqual(started, ["x", "y"])
+        self.assertEqual(self.log["started"][-1], "solo")
+
+    def test_unknown_dependency_key_fails_chain(self):
+        self.register("a")
+        execution = self.run_chain(["a"], {"ghost": ["a"]})
+        self.assertEqual(execution.status, ExecutionStatus.FAILED)
+        self.assertEqual(self.log["started"], [])
+
+    def test_failure_skips_only_descendants(self):
+        self.register("a")
+        self.register("bad", fail=True)
+        self.register("after_bad")
+        self.register("independent")
+        execution = self.run_chain(
+            ["a", "bad", "after_bad", "independent"],
+            {"bad": ["a"], "after_bad": ["bad"], "independent": ["a"]},
+        )
+
+        results = {r.plugin_id: r for r in execution.results}
+        self.assertFalse(results["bad"].success)
+        self.assertFalse(results["after_bad"].success)
+        self.assertNotIn("after_bad", self.log["started"])
+        self.assertTrue(results["independent"].success)
+
+    def test_cycle_fails_chain(self):
+        self.register("a")
+        self.register("b")
+        execution = self.run_chain(["a", "b"], {"a": ["b"], "b": ["a"]})
+        self.assertEqual(execution.status, ExecutionStatus.FAILED)
+        self.assertEqual(self.log["started"], [])
+
+    def test_critical_path_scheduled_first(self):
+        self.executor.max_concurrency = 1
+        for plugin_id in ["quick", "slow", "after_slow"]:
+            self.register(plugin_id)
+        for _ in range(3):
+            self.executor.optimizer.record_performance("quick", 0.01)
+            self.executor.optimizer.record_performance("slow", 1.0)
+            self.executor.optimizer.record_performance("after_slow", 0.5)
+
+        ranks = self.executor.optimizer.critical_path_priorities(
+            ["quick", "slow", "after_slow"], {"after_slow": ["slow"]}
+        )
+        self.assertAlmostEqual(ranks["slow"], 1.5)
+
+        self.run_chain(["quick", "slow", "after_slow"], {"after_slow": ["slow"]})
+        self.assertEqual(self.log["started"][0], "slow")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Tests for incremental, SQLite-backed PluginDiscovery
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from Aetherra.plugins.core import plugin_discovery
+from Aetherra.plugins.core.plugin_discovery import PluginDiscovery
+
+PLUGIN_SOURCE = '''"""
+{doc}
+"""
+
+__category__ = "data"
+__tags__ = ["sample"]
+
+
+def execute(payload):
+    return payload
+'''
+
+
+class TestIncrementalDiscovery(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dir = self.tmp_dir.name
+        for i in range(3):
+            self.write(f"plugin_{i}", f"Plugin {i}")
+        self.discovery = PluginDiscovery(self.dir)
+
+    def tearDown(self):
+        self.discovery.close()
+        self.tmp_dir.cleanup()
+
+    def write(self, name, doc):
+        path = os.path.join(self.dir, f"{name}.py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(PLUGIN_SOURCE.format(doc=doc))
+        return path
+
+    def analyzed_names(self):
+        analyzed = []
+        original = plugin_discovery._analyze_plugin_task
+
+        def spy(task):
+            analyzed.append(task[0])
+            return original(task)
+
+        return analyzed, mock.patch.object(
+            plugin_discovery, "_analyze_plugin_task", side_effect=spy
+        )
+
+    def test_only_changed_files_are_analyzed(self):
+        index = self.discovery.discover_plugins()
+        self.assertEqual(sorted(index), ["plugin_0", "plugin_1", "plugin_2"])
+        self.assertEqual(index["plugin_0"].description, "Plugin 0")
+
+        analyzed, patch = self.analyzed_names()
+        with patch:
+            self.discovery.discover_plugins()
+            self.assertEqual(analyzed, [])
+
+            # Touch without changing content: hashed, not re-analyzed
+            now = time.time() + 5
+            os.utime(os.path.join(self.dir, "plugin_1.py"), (now, now))
+            self.discovery.discover_plugins()
+            self.assertEqual(analyzed, [])
+
+            time.sleep(0.01)
+            self.write("plugin_2", "Plugin two, edited")
+            os.remove(os.path.join(self.dir, "plugin_0.py"))
+            index = self.discovery.discover_plugins()
+
+        self.assertEqual(analyzed, ["plugin_2"])
+        self.assertNotIn("plugin_0", index)
+        self.assertEqual(index["plugin_2"].description, "Plugin two, edited")
+        self.assertEqual(self.discovery.discovery_history[-1]["removed"], 1)
+
+    def test_plugin_that_fails_analysis_leaves_the_index(self):
+        self.discovery.discover_plugins()
+        with open(os.path.join(self.dir, "plugin_1.py"), "wb") as f:
+            f.write(b"\xff\xfe not utf-8")  # Read fails while hashing succeeds
+        with mock.patch("builtins.print"):
+            index = self.discovery.discover_plugins()
+        self.assertEqual(sorted(index), ["plugin_0", "plugin_2"])
+        self.assertNotIn(
+            "plugin_1", [m.name for m in self.discovery.search_plugins("plugin")]
+        )
+        self.discovery.close()
+
+        reloaded = PluginDiscovery(self.dir)
+        self.assertNotIn("plugin_1", reloaded.plugin_index)
+        reloaded.close()
+
+    def test_index_persists_in_sqlite(self):
+        self.discovery.discover_plugins()
+        self.discovery.rate_plugin("plugin_1", 4.0)
+        self.discovery.close()
+
+        reloaded = PluginDiscovery(self.dir)
+        analyzed, patch = self.analyzed_names()
+        with patch:
+            index = reloaded.discover_plugins()
+        reloaded.close()
+
+        self.assertEqual(analyzed, [])
+        self.assertEqual(index["plugin_1"].rating, 4.0)
+        self.assertIn("data", reloaded.categories)
+
+    def test_push_mode_examines_only_given_paths(self):
+        self.discovery.discover_plugins()
+        new_path = self.write("plugin_new", "Brand new")
+        self.write("plugin_1", "Edited but not reported")
+
+        analyzed, patch = self.analyzed_names()
+        with patch:
+            index = self.discovery.apply_changes(
+                [new_path, os.path.join(self.dir, "not_a_plugin.txt")]
+            )
+        self.assertEqual(analyzed, ["plugin_new"])
+        self.assertIn("plugin_new", index)
+
+    def test_parallel_analysis_matches_serial(self):
+        self.discovery.parallel_threshold = 1
+        self.discovery.max_workers = 2
+        index = self.discovery.discover_plugins()
+        self.assertEqual(len(index), 3)
+        self.assertIn("sample", index["plugin_1"].tags)
+
+
+if __name__ == "__main__":
+    unittest.main()
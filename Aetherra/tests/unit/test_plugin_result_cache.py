@@ -0,0 +1,223 @@
+"""
+Tests for memoized deterministic plugin results and single-flight
+coalescing in PluginChainExecutor and PluginManager
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+from typing import Any, Dict
+
+import numpy as np
+
+from Aetherra.plugins.core.plugin_chain_executor import (
+    ChainStrategy,
+    PluginChainExecutor,
+    PluginInterface,
+    PluginResult,
+)
+from Aetherra.plugins.core.plugin_manager import PluginManager
+from Aetherra.plugins.core.plugin_result_cache import (
+    COALESCED,
+    UNCACHED,
+    PluginResultCache,
+)
+
+
+class UpperPlugin(PluginInterface):
+    """Deterministic plugin counting how often it really runs"""
+
+    def __init__(self, plugin_id="upper", delay=0.02, deterministic=True):
+        super().__init__(plugin_id)
+        self.delay = delay
+        self.deterministic = deterministic
+        self.runs = 0
+
+    async def execute(self, input_data: Any, context: Dict[str, Any]) -> PluginResult:
+        self.runs += 1
+        await asyncio.sleep(self.delay)
+        return PluginResult(
+            plugin_id=self.plugin_id,
+            success=True,
+            output=str(input_data).upper(),
+            execution_time=self.delay,
+        )
+
+
+class SyncPlugin:
+    """Module-style plugin with a blocking execute entry point"""
+
+    deterministic = True
+
+    def __init__(self):
+        self.runs = 0
+
+    def execute(self, value, scale=1):
+        self.runs += 1
+        time.sleep(0.05)
+        return {"value": value * scale}
+
+
+class TestPluginResultCache(unittest.TestCase):
+    def test_key_is_canonical_and_tracks_source(self):
+        cache = PluginResultCache()
+        first = cache.make_key("p", "h1", {"b": {2, 1}, "a": (1, 2)})
+        second = cache.make_key("p", "h1", {"a": [1, 2], "b": {1, 2}})
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, cache.make_key("p", "h2", {"a": [1, 2]}))
+        self.assertEqual(len(cache.source_hash(UpperPlugin())), 64)
+
+    def test_inputs_with_truncated_reprs_do_not_collide(self):
+        cache = PluginResultCache()
+        first, second = np.zeros(2000), np.zeros(2000)
+        second[1000] = 1.0
+        self.assertEqual(repr(first), repr(second))
+        self.assertEqual(cache.call("p", "", first, lambda: "first")[0], "first")
+        self.assertEqual(cache.call("p", "", second, lambda: "second")[0], "second")
+        self.assertEqual(cache.call("p", "", first.copy(), lambda: "again")[0], "first")
+
+        class Opaque:
+            pass
+
+        runs = []
+        for _ in range(2):
+            result, source = cache.call("p", "", Opaque(), lambda: runs.append(1))
+            self.assertEqual(source, UNCACHED)
+        self.assertEqual(len(runs), 2)
+        self.assertEqual(cache.get_stats("p")["uncacheable"], 2)
+
+    def test_cancelling_first_caller_leaves_shared_run_to_others(self):
+        cache = PluginResultCache()
+        runs = []
+
+        async def run():
+            runs.append(1)
+            await asyncio.sleep(0.02)
+            return "done"
+
+        async def scenario():
+            first = asyncio.ensure_future(cache.call_async("p", "", 1, run))
+            second = asyncio.ensure_future(cache.call_async("p", "", 1, run))
+            await asyncio.sleep(0)
+            first.cancel()
+            result = await second
+            self.assertTrue(first.cancelled())
+
+            # With every caller gone the run itself is cancelled
+            alone = asyncio.ensure_future(cache.call_async("p", "", 2, run))
+            await asyncio.sleep(0)
+            alone.cancel()
+            await asyncio.sleep(0.05)
+            return result
+
+        self.assertEqual(asyncio.run(scenario()), ("done", COALESCED))
+        self.assertEqual(len(runs), 2)
+        self.assertEqual(cache.get_stats("p")["hits"], 0)
+        self.assertEqual(len(cache._inflight), 0)
+
+    def test_ttl_and_lru_eviction(self):
+        cache = PluginResultCache(max_entries=2, ttl_seconds=60)
+        for value in ["a", "b", "c"]:
+            cache.call("p", "", value, lambda v=value: v.upper())
+        self.assertEqual(cache.get_stats("p")["evictions"], 1)
+        self.assertEqual(cache.call("p", "", "c", lambda: "unused"), ("C", "hit"))
+
+        cache.ttl_seconds = 0.01
+        cache.call("q", "", 1, lambda: "fresh")
+        time.sleep(0.02)
+        self.assertEqual(cache.call("q", "", 1, lambda: "again"), ("again", "miss"))
+
+    def test_failures_are_not_cached(self):
+        cache = PluginResultCache()
+        self.assertEqual(cache.call("p", "", 1, lambda: None), (None, "miss"))
+        self.assertEqual(cache.call("p", "", 1, lambda: 5), (5, "miss"))
+
+
+class TestChainExecutorMemoization(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.executor = PluginChainExecutor(
+            db_path=os.path.join(self.tmp_dir.name, "chains.db")
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def run_chains(self, count, plugins, strategy=ChainStrategy.PARALLEL):
+        async def scenario():
+            return await asyncio.gather(
+                *(
+                    self.executor.execute_chain(
+                        plugins=plugins,
+                        strategy=strategy,
+                        context={"initial_input": "hello"},
+                    )
+                    for _ in range(count)
+                )
+            )
+
+        return asyncio.run(scenario())
+
+    def test_concurrent_identical_calls_share_one_run(self):
+        plugin = UpperPlugin()
+        self.executor.register_plugin(plugin)
+
+        executions = self.run_chains(5, ["upper"])
+        self.assertEqual(plugin.runs, 1)
+        outputs = {e.results[0].output for e in executions}
+        self.assertEqual(outputs, {"HELLO"})
+
+        self.run_chains(1, ["upper"])
+        self.assertEqual(plugin.runs, 1)
+        stats = self.executor.get_plugin_cache_stats("upper")
+        self.assertEqual(
+            (stats["misses"], stats["coalesced"], stats["hits"]), (1, 4, 1)
+        )
+        # Cache hits do not skew the optimizer's timing history
+        self.assertEqual(
+            self.executor.get_plugin_performance("upper")["execution_count"], 1
+        )
+
+    def test_non_deterministic_plugins_always_run(self):
+        plugin = UpperPlugin(deterministic=False)
+        self.executor.register_plugin(plugin)
+        self.run_chains(3, ["upper"])
+        self.assertEqual(plugin.runs, 3)
+        self.assertEqual(self.executor.get_plugin_cache_stats("upper")["misses"], 0)
+
+
+class TestPluginManagerMemoization(unittest.TestCase):
+    def test_threads_share_execution_and_results(self):
+        manager = PluginManager(plugins_dir=tempfile.gettempdir())
+        plugin = SyncPlugin()
+        manager.plugins["scaler"] = plugin
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    manager.execute_plugin("scaler", 2, scale=3)
+                )
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [{"value": 6}] * 4)
+        self.assertEqual(plugin.runs, 1)
+        self.assertEqual(manager.execute_plugin("scaler", 2, scale=4), {"value": 8})
+        self.assertEqual(plugin.runs, 2)
+
+        stats = manager.get_plugin_info("scaler")["cache"]
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["coalesced"] + stats["hits"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
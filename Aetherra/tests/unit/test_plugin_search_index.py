@@ -0,0 +1,116 @@
+"""
+Tests for the inverted-index plugin search and its bounded result cache
+"""
+
+import tempfile
+import unittest
+
+from Aetherra.plugins.core.plugin_discovery import PluginDiscovery, PluginMetadata
+from Aetherra.plugins.core.plugin_search_index import PluginSearchIndex, tokenize
+
+
+def make_plugin(name, description="", category="data", tags=(), rating=0.0):
+    meta = PluginMetadata(name, f"/plugins/{name}.py")
+    meta.description = description
+    meta.category = category
+    meta.tags = list(tags)
+    meta.rating = rating
+    meta.compatibility_score = 50.0
+    return meta
+
+
+PLUGINS = [
+    make_plugin("json_parser", "Reads structured text", tags=["json"], rating=4.5),
+    make_plugin("csv_export", "Writes rows, json optional", "file", ["csv"], 3.0),
+    make_plugin("webScraper", "Fetches pages", "integration", ["web"], 3.5),
+    make_plugin("encryptor", "Encrypts files", "utility", ["security"], 2.0),
+]
+
+
+class TestPluginSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = PluginSearchIndex()
+        self.index.rebuild({meta.name: meta for meta in PLUGINS})
+
+    def names(self, *args, **kwargs):
+        return [name for name, _ in self.index.search(*args, **kwargs)]
+
+    def test_tokenize_splits_identifiers(self):
+        self.assertEqual(
+            tokenize("webScraper json_parser"), ["web", "scraper", "json", "parser"]
+        )
+
+    def test_name_match_outranks_description_match(self):
+        self.assertEqual(self.names("json"), ["json_parser", "csv_export"])
+        self.assertEqual(self.names("json", limit=1), ["json_parser"])
+        self.assertEqual(self.names("scraper"), ["webScraper"])
+
+    def test_prefix_matching_for_autocomplete(self):
+        self.assertEqual(self.names("encr"), ["encryptor"])
+        self.assertEqual(self.names("encr", prefix=False), [])
+
+    def test_facet_filters(self):
+        self.assertEqual(self.names("json", {"category": "file"}), ["csv_export"])
+        self.assertEqual(
+            self.names("", {"min_rating": 3.5}), ["json_parser", "webScraper"]
+        )
+        self.assertEqual(
+            self.names("", {"tags": ["csv", "web"]}), ["csv_export", "webScraper"]
+        )
+        self.assertEqual(self.index.get_facets()["rating"], {2: 1, 3: 2, 4: 1})
+
+    def test_incremental_add_and_remove(self):
+        generation = self.index.generation
+        self.index.add("json_lint", make_plugin("json_lint", "Checks json"))
+        self.index.remove("json_parser")
+        self.assertGreater(self.index.generation, generation)
+        self.assertEqual(self.names("json"), ["json_lint", "csv_export"])
+        self.assertEqual(self.names("parser"), [])
+        self.assertEqual(len(self.index), 4)
+
+
+class TestDiscoverySearchCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.discovery = PluginDiscovery(self.tmp_dir.name)
+        self.discovery.plugin_index = {meta.name: meta for meta in PLUGINS}
+        self.discovery.search_index.rebuild(self.discovery.plugin_index)
+
+    def tearDown(self):
+        self.discovery.close()
+        self.tmp_dir.cleanup()
+
+    def test_changes_invalidate_cached_results(self):
+        filters = {"min_rating": 4.0}
+        self.assertEqual(
+            [m.name for m in self.discovery.search_plugins("", filters)],
+            ["json_parser"],
+        )
+        self.discovery.rate_plugin("webScraper", 5.0)
+        self.assertEqual(
+            [m.name for m in self.discovery.search_plugins("", filters)],
+            ["json_parser", "webScraper"],
+        )
+
+    def test_cache_is_bounded(self):
+        self.discovery.search_cache_size = 3
+        for query in ["json", "csv", "web", "encr", "json"]:
+            self.discovery.search_plugins(query)
+        self.assertEqual(len(self.discovery.search_cache), 3)
+        self.assertEqual(
+            [key[1] for key in self.discovery.search_cache],
+            [("web",), ("encr",), ("json",)],
+        )
+
+    def test_queries_differing_in_word_breaks_are_cached_apart(self):
+        def names(query):
+            return [m.name for m in self.discovery.search_plugins(query)]
+
+        self.assertEqual(names("webScraper"), ["webScraper"])
+        self.assertEqual(names("webscraper"), [])
+        self.assertEqual(names(" web_scraper "), ["webScraper"])
+        self.assertEqual(len(self.discovery.search_cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Tests for the cached memory store, metrics sampler and prompt fragments in
+the prompt engine
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from Aetherra.core import prompt_engine
+from Aetherra.core.prompt_engine import (
+    JsonMemoryStore,
+    PromptFragmentCache,
+    SystemMetricsSampler,
+)
+
+
+class TestJsonMemoryStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "memory.json"
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump([{"type": "note", "timestamp": 1}], f)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_append_writes_log_and_replays_on_load(self):
+        store = JsonMemoryStore(self.path)
+        store.append({"type": "note", "timestamp": 3})
+        store.append({"type": "reflection", "timestamp": 2})
+
+        lines = self.store_log_lines(store)
+        self.assertEqual(len(lines), 2)
+        # Snapshot is untouched until compaction
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)), 1)
+
+        reloaded = JsonMemoryStore(self.path)
+        self.assertEqual(len(reloaded.all()), 3)
+        notes = reloaded.query({"type": "note"})
+        self.assertEqual([m["timestamp"] for m in notes], [3, 1])
+        self.assertEqual(len(reloaded.query({"type": "note"}, limit=1)), 1)
+
+    def test_compaction_folds_log_into_snapshot(self):
+        store = JsonMemoryStore(self.path, max_memories=3, compact_every=4)
+        for i in range(4):
+            store.append({"type": "note", "timestamp": 10 + i})
+
+        self.assertFalse(store.log_path.exists())
+        with open(self.path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+        self.assertEqual([m["timestamp"] for m in snapshot], [11, 12, 13])
+
+    def test_appends_at_capacity_do_not_rewrite_snapshot(self):
+        store = JsonMemoryStore(self.path, max_memories=1, compact_every=20)
+        compactions = []
+        original_compact = store.compact
+
+        def counting_compact():
+            compactions.append(len(store.all()))
+            original_compact()
+
+        store.compact = counting_compact
+        for i in range(50):
+            store.append({"type": "note", "timestamp": 10 + i})
+
+        # One compaction per compact_every appends, not one per append
+        self.assertEqual(compactions, [21, 21])
+        self.assertEqual(len(self.store_log_lines(store)), 10)
+
+    def test_query_returns_copies(self):
+        store = JsonMemoryStore(self.path)
+        store.query({"type": "note"})[0]["type"] = "changed"
+        store.all()[0]["timestamp"] = 99
+        self.assertEqual(store.all(), [{"type": "note", "timestamp": 1}])
+
+    def test_reads_do_not_reparse_file(self):
+        store = JsonMemoryStore(self.path)
+        store.all()
+        version = store.version
+        for _ in range(5):
+            store.query({"type": "note"})
+        self.assertEqual(store.version, version)
+
+        store.append({"type": "note", "timestamp": 5})
+        self.assertEqual(store.version, version + 1)
+
+    def store_log_lines(self, store):
+        with open(store.log_path, encoding="utf-8") as f:
+            return [line for line in f if line.strip()]
+
+
+class TestPromptFragmentCache(unittest.TestCase):
+    def test_rebuilds_only_when_inputs_change(self):
+        cache = PromptFragmentCache()
+        builds = []
+
+        def build():
+            builds.append(1)
+            return f"section {len(builds)}"
+
+        self.assertEqual(cache.get("s", (1,), build), "section 1")
+        self.assertEqual(cache.get("s", (1,), build), "section 1")
+        self.assertEqual(cache.get("s", (2,), build), "section 2")
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+
+
+class TestSystemMetricsSampler(unittest.TestCase):
+    def test_snapshot_is_cached_between_samples(self):
+        sampler = SystemMetricsSampler(interval=60)
+        try:
+            first = sampler.get_snapshot()
+            second = sampler.get_snapshot()
+            self.assertIs(first, second)
+            self.assertEqual(sampler.samples, 1)  # The second read did not sample
+            self.assertIn("cpu_percent", first)
+        finally:
+            sampler.stop()
+
+
+class TestBuildDynamicPrompt(unittest.TestCase):
+    def test_warm_build_served_from_fragments(self):
+        prompt_engine._prompt_fragments.clear()
+        first = prompt_engine.build_dynamic_prompt("default_user")
+        hits = prompt_engine._prompt_fragments.hits
+        second = prompt_engine.build_dynamic_prompt("default_user")
+
+        self.assertIn("Lyrixa", first)
+        self.assertEqual(first.splitlines()[1:5], second.splitlines()[1:5])
+        self.assertGreater(prompt_engine._prompt_fragments.hits, hits)
+
+
+if __name__ == "__main__":
+    unittest.main()
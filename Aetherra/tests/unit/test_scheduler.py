@@ -0,0 +1,147 @@
+"""
+Tests for the timer-heap AetherraScheduler
+"""
+
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+from Aetherra.aetherra_core.orchestration import scheduler as scheduler_module
+from Aetherra.aetherra_core.orchestration.scheduler import (
+    AetherraScheduler,
+    MisfirePolicy,
+    TaskPriority,
+    TaskStatus,
+)
+
+
+async def wait_until(predicate, timeout=5.0):
+    """Poll until predicate() holds; the deadline only bounds a hung test"""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not reached in time")
+        await asyncio.sleep(0.005)
+
+
+class ShiftedClock:
+    """Stands in for the scheduler's time module; ``offset`` moves its clock"""
+
+    def __init__(self):
+        self.offset = 0.0
+
+    def monotonic(self):
+        return time.monotonic() + self.offset
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+class TestTimerHeapScheduler(unittest.TestCase):
+    def run_with_scheduler(self, scenario, **kwargs):
+        async def main():
+            scheduler = AetherraScheduler(**kwargs)
+            await scheduler.start()
+            try:
+                return await scenario(scheduler)
+            finally:
+                await scheduler.stop()
+
+        return asyncio.run(main())
+
+    def test_wakes_for_new_deadlines_without_polling(self):
+        async def scenario(scheduler):
+            await asyncio.sleep(0.05)  # Loop is asleep with nothing scheduled
+            started = time.monotonic()
+            done = asyncio.Event()
+            scheduler.schedule_task("soon", done.set, delay=0.05)
+            # With nothing else scheduled the loop sleeps without a timeout,
+            # so this only completes if scheduling wakes it
+            await asyncio.wait_for(done.wait(), 5)
+            return time.monotonic() - started
+
+        elapsed = self.run_with_scheduler(scenario)
+        self.assertGreaterEqual(elapsed, 0.04)
+
+    def test_due_tasks_run_concurrently_up_to_the_limit(self):
+        order, active, peak = [], [0], [0]
+
+        async def job(name):
+            order.append(name)
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.1)
+            active[0] -= 1
+
+        async def scenario(scheduler):
+            for name in ["a", "b", "c"]:
+                scheduler.schedule_task(name, job, (name,), delay=0.02)
+            scheduler.schedule_task(
+                "urgent", job, ("urgent",), delay=0.02, priority=TaskPriority.HIGH
+            )
+            await wait_until(
+                lambda: scheduler.get_status()["task_counts"]["completed"] == 4
+            )
+
+        self.run_with_scheduler(scenario, max_concurrency=2)
+        self.assertEqual(peak[0], 2)  # Overlapping runs, never more than the limit
+        self.assertEqual(order[0], "urgent")
+
+    def test_cancel_removes_pending_run(self):
+        ran = []
+
+        async def scenario(scheduler):
+            task_id = scheduler.schedule_task(
+                "later", lambda: ran.append(1), delay=0.05
+            )
+            self.assertEqual(scheduler.get_status()["next_task"]["id"], task_id)
+            self.assertTrue(scheduler.cancel_task(task_id))
+            self.assertIsNone(scheduler.get_status()["next_task"])
+            await asyncio.sleep(0.1)
+
+        self.run_with_scheduler(scenario)
+        self.assertEqual(ran, [])
+
+    def test_misfire_policies(self):
+        runs = {policy: [] for policy in MisfirePolicy}
+        clock = ShiftedClock()
+
+        async def scenario(scheduler):
+            ids = {
+                policy: scheduler.schedule_task(
+                    policy.value,
+                    runs[policy].append,
+                    (policy,),
+                    delay=10,
+                    interval=10,
+                    max_runs=4,
+                    misfire_policy=policy,
+                )
+                for policy in MisfirePolicy
+            }
+            one_off = scheduler.schedule_task(
+                "one off", lambda: None, delay=10, misfire_policy=MisfirePolicy.SKIP
+            )
+
+            # Jump past the deadlines at 10, 20 and 30 s as if the loop had
+            # been blocked; the next slot (40 s) stays seconds away
+            clock.offset = 35
+            scheduler.schedule_task("wake", lambda: None)
+            await wait_until(
+                lambda: len(runs[MisfirePolicy.RUN_ALL]) == 3
+                and len(runs[MisfirePolicy.RUN_ONCE]) == 1
+                and scheduler.tasks[ids[MisfirePolicy.SKIP]].misfire_count == 1
+                and scheduler.get_task_status(one_off) == TaskStatus.CANCELLED
+            )
+            await asyncio.sleep(0.05)  # Nothing more is due before 40 s
+
+        with mock.patch.object(scheduler_module, "time", clock):
+            self.run_with_scheduler(scenario, misfire_grace_time=0.5)
+        self.assertEqual(len(runs[MisfirePolicy.RUN_ALL]), 3)  # Caught up
+        self.assertEqual(len(runs[MisfirePolicy.RUN_ONCE]), 1)  # Coalesced
+        self.assertEqual(runs[MisfirePolicy.SKIP], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
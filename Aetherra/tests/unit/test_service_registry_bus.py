@@ -0,0 +1,255 @@
+"""
+Tests for the message bus behind AetherraServiceRegistry
+"""
+
+import asyncio
+import unittest
+
+from aetherra_service_registry import (
+    AetherraServiceRegistry,
+    MessageBus,
+    OverflowPolicy,
+    ServiceStatus,
+)
+
+
+class RecordingService:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.received = []
+
+    async def handle_message(self, message_type, data):
+        await asyncio.sleep(self.delay)
+        self.received.append((message_type, data))
+        return {"echo": data}
+
+
+async def settle(times=5):
+    for _ in range(times):
+        await asyncio.sleep(0)
+
+
+class TestServiceRegistryBus(unittest.TestCase):
+    def run_registry(self, scenario, **kwargs):
+        async def main():
+            registry = AetherraServiceRegistry(**kwargs)
+            try:
+                return await scenario(registry)
+            finally:
+                await registry.bus.close(timeout=0)
+
+        return asyncio.run(main())
+
+    async def add_services(self, registry, services, **kwargs):
+        for name, service in services.items():
+            await registry.register_service(name, service, **kwargs.get(name, {}))
+            await registry.update_service_status(name, ServiceStatus.HEALTHY)
+
+    def test_broadcast_does_not_wait_for_slow_services(self):
+        fast, slow = RecordingService(), RecordingService(delay=1.0)
+
+        async def scenario(registry):
+            await self.add_services(registry, {"fast": fast, "slow": slow})
+            queued = await asyncio.wait_for(
+                registry.broadcast_message("ping", 1), timeout=0.1
+            )
+            await settle()
+            return queued
+
+        self.assertEqual(self.run_registry(scenario), 2)
+        self.assertEqual(fast.received, [("ping", 1)])
+        self.assertEqual(slow.received, [])
+
+    def test_services_receive_only_subscribed_topics(self):
+        memory, plugins, monitor = (RecordingService() for _ in range(3))
+
+        async def scenario(registry):
+            await self.add_services(
+                registry,
+                {"memory": memory, "plugins": plugins, "monitor": monitor},
+                memory={"topics": ["memory.stored"]},
+                plugins={"topics": ["plugin.*"]},
+                monitor={"topics": ["*"]},
+            )
+            self.assertEqual(await registry.publish("memory.stored", 1), 2)
+            self.assertEqual(await registry.publish("plugin.loaded.core", 2), 2)
+            self.assertEqual(
+                await registry.publish("plugin.loaded", 3, sender="monitor"), 1
+            )
+            registry.subscribe_service("memory", ["memory.*"])
+            await registry.publish("memory.recalled", 4)
+            await settle()
+
+        self.run_registry(scenario)
+        self.assertEqual(
+            memory.received, [("memory.stored", 1), ("memory.recalled", 4)]
+        )
+        self.assertEqual(
+            plugins.received, [("plugin.loaded.core", 2), ("plugin.loaded", 3)]
+        )
+        self.assertEqual(
+            [data for _, data in monitor.received], [1, 2, 4]
+        )  # Not its own message
+
+    def test_overflow_policies(self):
+        async def scenario():
+            bus = MessageBus()
+            gate = asyncio.Event()
+            handled = {policy: [] for policy in OverflowPolicy}
+
+            def make_handler(policy):
+                async def handler(message):
+                    await gate.wait()
+                    handled[policy].append(message.data)
+
+                return handler
+
+            for policy in OverflowPolicy:
+                bus.subscribe(policy.value, make_handler(policy), ["t"], 2, policy)
+
+            # The first message is taken by each worker, two more fill the mailbox
+            await bus.publish("t", 0)
+            await settle()
+            for i in (1, 2):
+                await bus.publish("t", i)
+            await asyncio.wait_for(
+                bus.send_to(["drop_new", "drop_oldest"], "t", 3), timeout=0.1
+            )
+            blocked = asyncio.create_task(bus.send_to(["block"], "t", 3))
+            await settle()
+            self.assertFalse(blocked.done())  # Backpressure
+
+            metrics = bus.get_lag_metrics()
+            self.assertEqual(metrics["drop_new"]["dropped"], 1)
+            self.assertEqual(metrics["drop_oldest"]["queued"], 2)
+            self.assertGreater(metrics["block"]["oldest_queued_ms"], 0)
+
+            gate.set()
+            self.assertEqual(await blocked, 1)
+            await bus.close(timeout=1)
+            return handled
+
+        handled = asyncio.run(scenario())
+        self.assertEqual(handled[OverflowPolicy.DROP_NEW], [0, 1, 2])
+        self.assertEqual(handled[OverflowPolicy.DROP_OLDEST], [0, 2, 3])
+        self.assertEqual(handled[OverflowPolicy.BLOCK], [0, 1, 2, 3])
+
+    def test_request_response_and_timeout(self):
+        quick, stalled = RecordingService(), RecordingService(delay=5.0)
+
+        async def scenario(registry):
+            await self.add_services(registry, {"quick": quick, "stalled": stalled})
+            reply = await registry.request("quick", "echo", "hi")
+            with self.assertRaises(asyncio.TimeoutError):
+                await registry.request("stalled", "echo", "hi", timeout=0.05)
+            self.assertTrue(await registry.send_message("quick", "note", 1))
+            return reply, registry.get_bus_metrics()
+
+        reply, metrics = self.run_registry(scenario)
+        self.assertEqual(reply, {"echo": "hi"})
+        self.assertEqual(metrics["quick"]["handled"], 2)
+        self.assertEqual(metrics["stalled"]["handled"], 0)
+        self.assertEqual(metrics["stalled"]["received"], 1)
+
+    def test_event_subscribers_run_concurrently(self):
+        seen = []
+
+        async def slow_handler(event):
+            await asyncio.sleep(1.0)
+
+        async def scenario(registry):
+            registry.subscribe_to_events("service.registered", slow_handler)
+            registry.subscribe_to_events("service.registered", seen.append)
+            await asyncio.wait_for(
+                registry.register_service("svc", RecordingService()), timeout=0.1
+            )
+            await settle()
+            registry.unsubscribe_from_events("service.registered", seen.append)
+            await registry.register_service("other", RecordingService())
+            await settle()
+
+        self.run_registry(scenario)
+        self.assertEqual(seen, [{"service_name": "svc", "metadata": None}])
+
+    def test_registry_events_skip_wildcard_services(self):
+        service = RecordingService()
+        seen = []
+
+        async def scenario(registry):
+            registry.subscribe_to_events("service.registered", seen.append)
+            registry.subscribe_to_events("service.registered", seen.append)
+            await self.add_services(registry, {"svc": service, "other": service})
+            await settle()
+            registry.unsubscribe_from_events("service.registered", seen.append)
+            await registry.register_service("late", RecordingService())
+            await settle()
+            return registry.bus.get_lag_metrics()
+
+        metrics = self.run_registry(scenario)
+        self.assertEqual(service.received, [])
+        self.assertEqual(
+            [event["service_name"] for event in seen], ["svc", "other"]
+        )  # Once each, and nothing after unsubscribing
+        self.assertFalse([name for name in metrics if name.startswith("event:")])
+
+    def test_services_without_topics_receive_everything(self):
+        service = RecordingService()
+
+        async def scenario(registry):
+            await self.add_services(registry, {"svc": service})
+            self.assertEqual(await registry.publish("anything.at.all", 1), 1)
+            await settle()
+
+        self.run_registry(scenario)
+        self.assertEqual(service.received, [("anything.at.all", 1)])
+
+    def test_request_cycles_do_not_deadlock(self):
+        class Relay:
+            def __init__(self, registry, peer):
+                self.registry, self.peer, self.hops = registry, peer, 0
+
+            async def handle_message(self, message_type, data):
+                self.hops += 1
+                if data > 0:
+                    await self.registry.send_message(self.peer, message_type, data - 1)
+                return data
+
+        async def scenario(registry):
+            a, b = Relay(registry, "b"), Relay(registry, "a")
+            me = Relay(registry, "me")
+            await self.add_services(registry, {"a": a, "b": b, "me": me})
+            sent = await asyncio.wait_for(
+                registry.send_message("a", "ping", 3), timeout=1
+            )
+            await asyncio.wait_for(registry.send_message("me", "ping", 2), timeout=1)
+            return sent, a.hops + b.hops, me.hops
+
+        self.assertEqual(self.run_registry(scenario), (True, 4, 3))
+
+    def test_blocked_publisher_is_released_by_unsubscribe(self):
+        async def scenario():
+            bus = MessageBus()
+            gate = asyncio.Event()
+            handled = []
+
+            async def handler(message):
+                await gate.wait()
+                handled.append(message.data)
+
+            bus.subscribe("svc", handler, ["t"], 1, OverflowPolicy.BLOCK)
+            await bus.publish("t", 1)
+            await settle()
+            await bus.publish("t", 2)
+            blocked = asyncio.create_task(bus.publish("t", 3))
+            await settle()
+            bus.unsubscribe("svc")
+            gate.set()
+            delivered = await blocked
+            await settle()
+            return delivered, handled
+
+        self.assertEqual(asyncio.run(scenario()), (0, []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Tests for the NumPy-backed VectorIndex used by MemoryManager semantic search
+"""
+
+import os
+import tempfile
+import unittest
+
+from Aetherra.core.vector_index import VectorIndex, hash_embedding
+
+
+class TestVectorIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = VectorIndex(dimensions=3, initial_capacity=2)
+        self.index.add("x", [1.0, 0.0, 0.0])
+        self.index.add("y", [0.0, 1.0, 0.0])
+        self.index.add("xy", [1.0, 1.0, 0.0])
+
+    def test_top_k_is_ranked_by_cosine_similarity(self):
+        results = self.index.search([1.0, 0.1, 0.0], top_k=2)
+        self.assertEqual([entry_id for entry_id, _ in results], ["x", "xy"])
+        self.assertGreater(results[0][1], results[1][1])
+
+    def test_removed_entries_are_not_returned(self):
+        self.index.remove("x")
+        results = self.index.search([1.0, 0.0, 0.0], top_k=3)
+        self.assertEqual([entry_id for entry_id, _ in results], ["xy", "y"])
+        self.assertEqual(len(self.index), 2)
+
+    def test_save_and_load_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "vectors")
+            self.index.save(path)
+            loaded = VectorIndex.load(path)
+
+            self.assertEqual(len(loaded), 3)
+            self.assertEqual(loaded.search([0.0, 1.0, 0.0], top_k=1)[0][0], "y")
+
+            loaded.add("z", [0.0, 0.0, 1.0])
+            self.assertEqual(loaded.search([0.0, 0.0, 1.0], top_k=1)[0][0], "z")
+
+    def test_hash_embedding_is_stable(self):
+        first = hash_embedding("memory systems remember things")
+        second = hash_embedding("memory systems remember things")
+        self.assertEqual(first.tolist(), second.tolist())
+        self.assertAlmostEqual(float(first.sum()), 1.0, places=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,16 +5,25 @@
 The core heartbeat and orchestration engine for the AI-native Operating System.
 
 This is the living brain of Aetherra - continuously processing, learning, and evolving.
+
+Tasks go into a single weighted-fair priority queue. A dispatcher blocks on it
+and runs tasks concurrently, within per-type concurrency limits, batching
+waiting same-type tasks into one worker slot (with one call when the
+handling system offers a batch method).
 """
 
 import asyncio
+import bisect
+import heapq
 import json
 import logging
+import math
 import time
 import traceback
+from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +31,82 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Share of dispatches each priority gets while several are waiting (the old
+# loop took up to 5 high, 3 normal and 1 background task per cycle)
+PRIORITY_WEIGHTS = {"high": 5, "normal": 3, "background": 1}
+
+# Concurrent runs allowed per task type; "default" covers other types
+DEFAULT_CONCURRENCY_LIMITS = {
+    "memory_query": 8,
+    "plugin_invoke": 4,
+    "lyrixa_thought": 2,
+    "default": 4,
+}
+
+# Task type -> (system attribute, method taking a list of task data, method
+# taking one). Waiting tasks of these types share a worker slot: handed over
+# together when the system has the batch method, otherwise run one after
+# another with the single-task method.
+BATCH_METHODS = {
+    "memory_query": ("memory_system", "process_queries", "process_query"),
+}
+
+
+class LatencyHistogram:
+    """📊 Fixed-bucket latency histogram in milliseconds."""
+
+    BOUNDS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds: float):
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.BOUNDS_MS, ms)] += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, fraction: float) -> float:
+        """Estimate a percentile, interpolating within its bucket."""
+        threshold = fraction * sum(self.counts)
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(self.BOUNDS_MS, self.counts):
+            if count and seen + count >= threshold:
+                estimate = lower + (bound - lower) * (threshold - seen) / count
+                return min(estimate, self.max_ms)
+            seen += count
+            lower = float(bound)
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        count = sum(self.counts)
+        labels = [f"<={bound}" for bound in self.BOUNDS_MS]
+        labels.append(f">{self.BOUNDS_MS[-1]}")
+        return {
+            "count": count,
+            "avg_ms": self.total_ms / count if count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max_ms,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class _QueuedTask:
+    """A task waiting in the kernel queue."""
+
+    __slots__ = ("task", "task_type", "priority", "enqueued_at", "taken")
+
+    def __init__(self, task: Dict[str, Any], priority: str):
+        self.task = task
+        self.task_type = task.get("type")
+        self.priority = priority
+        self.enqueued_at = time.monotonic()
+        self.taken = False  # Dispatched, possibly as part of another's batch
+
 
 class AetherraKernelLoop:
     """
@@ -56,12 +141,41 @@ class AetherraKernelLoop:
             "last_cycle_time": 0.0,
             "errors_count": 0,
             "night_cycles_count": 0,
+            "tasks_completed": 0,
+            "tasks_failed": 0,
+            "batches": 0,
         }
 
-        # Task queues
-        self.high_priority_queue = asyncio.Queue()
-        self.normal_priority_queue = asyncio.Queue()
-        self.background_queue = asyncio.Queue()
+        # Task dispatch limits
+        self.max_concurrency = self.config.get("max_concurrency", 16)
+        self.concurrency_limits = {
+            **DEFAULT_CONCURRENCY_LIMITS,
+            **self.config.get("concurrency_limits", {}),
+        }
+        self.max_batch_size = self.config.get("max_batch_size", 32)
+
+        # Task queue: a heap of (finish tag, seq, entry), see add_task.
+        # Entries of a type at its concurrency limit are parked per type until
+        # one of its runs finishes; taken entries are skipped lazily. Batchable
+        # types also keep their own heap so batches are filled in tag order.
+        self._queue: List[Tuple[float, int, _QueuedTask]] = []
+        self._parked: Dict[str, List[Tuple[float, int, _QueuedTask]]] = {}
+        self._batchable: Dict[str, List[Tuple[float, int, _QueuedTask]]] = {}
+        self._waiting_by_type: Dict[str, int] = defaultdict(int)
+        self._queued_counts = {priority: 0 for priority in PRIORITY_WEIGHTS}
+        self._last_finish = {priority: 0.0 for priority in PRIORITY_WEIGHTS}
+        self._virtual_time = 0.0
+        self._seq = 0
+        self._work_available = asyncio.Event()
+
+        # Runs in progress
+        self._active: Dict[str, int] = defaultdict(int)
+        self._active_total = 0
+        self._runs: Set[asyncio.Task] = set()
+
+        # Per-priority latency histograms
+        self._queue_wait = {p: LatencyHistogram() for p in PRIORITY_WEIGHTS}
+        self._service_time = {p: LatencyHistogram() for p in PRIORITY_WEIGHTS}
 
     def inject_systems(
         self, memory_system, plugin_manager, lyrixa_engine, scheduler, service_registry
@@ -82,6 +196,7 @@ class AetherraKernelLoop:
 
         # Start concurrent tasks
         tasks = [
+            asyncio.create_task(self._dispatch_loop()),
             asyncio.create_task(self._main_processing_loop()),
             asyncio.create_task(self._background_maintenance_loop()),
             asyncio.create_task(self._health_monitoring_loop()),
@@ -107,21 +222,31 @@ class AetherraKernelLoop:
                 logger.error(f"❌ Kernel heartbeat error: {e}")
                 await asyncio.sleep(60)
 
-    async def _main_processing_loop(self):
-        """🔄 Main processing cycle - handles events and orchestration."""
+    async def _dispatch_loop(self):
+        """⚡ Start queued tasks as soon as they arrive and a worker slot is free."""
         while self.running:
-            cycle_start = time.time()
-
             try:
-                # Process high priority tasks first
-                await self._process_task_queue(self.high_priority_queue, max_tasks=5)
+                self._work_available.clear()
+                while self._active_total < self.max_concurrency:
+                    entry = self._next_runnable()
+                    if entry is None:
+                        break
+                    self._start_run(entry)
 
-                # Process normal priority tasks
-                await self._process_task_queue(self.normal_priority_queue, max_tasks=3)
+                # Woken by add_task, a finished run or shutdown
+                await self._work_available.wait()
 
-                # Process background tasks
-                await self._process_task_queue(self.background_queue, max_tasks=1)
+            except Exception as e:
+                logger.error(f"❌ Task dispatch error: {e}")
+                self.metrics["errors_count"] += 1
+                await asyncio.sleep(1.0)
 
+    async def _main_processing_loop(self):
+        """🔄 Main processing cycle - night cycle checks and cycle metrics."""
+        while self.running:
+            cycle_start = time.time()
+
+            try:
                 # Check for night cycle
                 await self._check_night_cycle()
 
@@ -129,7 +254,7 @@ class AetherraKernelLoop:
                 cycle_time = time.time() - cycle_start
                 self._update_metrics(cycle_time)
 
-                # Adaptive sleep based on load
+                # One cycle per second; tasks are run by _dispatch_loop
                 sleep_time = max(0.1, 1.0 - cycle_time)
                 await asyncio.sleep(sleep_time)
 
@@ -246,18 +371,129 @@ class AetherraKernelLoop:
         except Exception as e:
             logger.error(f"❌ Night cycle error: {e}")
 
-    async def _process_task_queue(self, queue: asyncio.Queue, max_tasks: int = 5):
-        """📋 Process tasks from a priority queue."""
-        processed = 0
-        while not queue.empty() and processed < max_tasks:
-            try:
-                task = await asyncio.wait_for(queue.get(), timeout=0.1)
+    def _next_runnable(self) -> Optional[_QueuedTask]:
+        """📋 Pop the queued task with the smallest finish tag whose type has room."""
+        while self._queue:
+            item = heapq.heappop(self._queue)
+            entry = item[2]
+            if entry.taken:
+                continue
+            if self._active[entry.task_type] >= self._type_limit(entry.task_type):
+                heapq.heappush(self._parked.setdefault(entry.task_type, []), item)
+                continue
+            self._virtual_time = max(self._virtual_time, item[0])
+            return entry
+        return None
+
+    def _type_limit(self, task_type: Optional[str]) -> int:
+        return self.concurrency_limits.get(
+            task_type, self.concurrency_limits["default"]
+        )
+
+    def _batch_handler(self, task_type: Optional[str]) -> Optional[Callable]:
+        """The batch method of the system handling ``task_type``, if it has one."""
+        attribute, method, _ = BATCH_METHODS.get(task_type, (None, None, None))
+        if attribute is None:
+            return None
+        return getattr(getattr(self, attribute), method, None)
+
+    def _can_batch(self, task_type: Optional[str]) -> bool:
+        """Whether waiting tasks of ``task_type`` may share a worker slot."""
+        if self._batch_handler(task_type) is not None:
+            return True
+        attribute, _, single = BATCH_METHODS.get(task_type, (None, None, None))
+        return attribute is not None and hasattr(getattr(self, attribute), single)
+
+    def _batch_limit(self, task_type: Optional[str]) -> int:
+        """
+        How many tasks a run of ``task_type`` may take.
+
+        Without a batch method the tasks run one after another, so the
+        waiting ones are spread over the free worker slots instead of
+        filling one run.
+        """
+        if self._batch_handler(task_type) is not None:
+            return self.max_batch_size
+        free_slots = min(
+            self._type_limit(task_type) - self._active[task_type],
+            self.max_concurrency - self._active_total,
+        )
+        waiting = self._waiting_by_type[task_type]
+        return min(self.max_batch_size, math.ceil(waiting / max(free_slots, 1)))
+
+    def _start_run(self, entry: _QueuedTask):
+        """⚡ Start a run for a task plus any waiting same-type tasks it can batch."""
+        batch = [entry]
+        entry.taken = True
+        waiting = self._batchable.get(entry.task_type)
+        if waiting is not None:
+            limit = self._batch_limit(entry.task_type)
+            while waiting and len(batch) < limit:
+                other = heapq.heappop(waiting)[2]
+                if not other.taken:
+                    other.taken = True
+                    batch.append(other)
+            # Drop entries already dispatched through the main queue
+            while waiting and waiting[0][2].taken:
+                heapq.heappop(waiting)
+            if not waiting:
+                del self._batchable[entry.task_type]
+
+        started = time.monotonic()
+        for queued in batch:
+            self._queued_counts[queued.priority] -= 1
+            self._waiting_by_type[queued.task_type] -= 1
+            self._queue_wait[queued.priority].record(started - queued.enqueued_at)
+
+        self._active[entry.task_type] += 1
+        self._active_total += 1
+        run = asyncio.create_task(self._run(entry.task_type, batch, started))
+        self._runs.add(run)
+        run.add_done_callback(self._runs.discard)
+
+    async def _run(
+        self, task_type: Optional[str], batch: List[_QueuedTask], started: float
+    ):
+        """⚡ Execute one run and release its worker slot."""
+        try:
+            if len(batch) == 1:
+                await self._execute_task(batch[0].task)
+            else:
+                await self._execute_batch(task_type, [q.task for q in batch])
+        finally:
+            service_time = time.monotonic() - started
+            for queued in batch:
+                self._service_time[queued.priority].record(service_time)
+
+            self._active[task_type] -= 1
+            self._active_total -= 1
+
+            # Return the next parked task of this type to the queue
+            parked = self._parked.get(task_type)
+            while parked:
+                item = heapq.heappop(parked)
+                if not item[2].taken:
+                    heapq.heappush(self._queue, item)
+                    break
+            if parked is not None and not parked:
+                del self._parked[task_type]
+
+            self._work_available.set()
+
+    async def _execute_batch(self, task_type: str, tasks: List[Dict[str, Any]]):
+        """⚡ Execute same-type tasks in one batch call, or one after another."""
+        handler = self._batch_handler(task_type)
+        if handler is None:
+            for task in tasks:
                 await self._execute_task(task)
-                processed += 1
-            except asyncio.TimeoutError:
-                break
+        else:
+            try:
+                await handler([t.get("data", {}) for t in tasks])
+                self.metrics["tasks_completed"] += len(tasks)
             except Exception as e:
-                logger.error(f"❌ Task processing error: {e}")
+                logger.error(f"❌ Batch execution error ({task_type}): {e}")
+                self.metrics["tasks_failed"] += len(tasks)
+        self.metrics["batches"] += 1
 
     async def _execute_task(self, task: Dict[str, Any]):
         """⚡ Execute a single task."""
@@ -276,9 +512,11 @@ class AetherraKernelLoop:
                     await self.lyrixa_engine.process_thought(task_data)
             else:
                 logger.warning(f"[WARN] Unknown task type: {task_type}")
+            self.metrics["tasks_completed"] += 1
 
         except Exception as e:
             logger.error(f"❌ Task execution error: {e}")
+            self.metrics["tasks_failed"] += 1
 
     async def _gather_health_metrics(self) -> Dict[str, Any]:
         """🩺 Gather comprehensive system health metrics."""
@@ -368,18 +606,44 @@ class AetherraKernelLoop:
             )
 
     async def add_task(self, task: Dict[str, Any], priority: str = "normal"):
-        """📝 Add a task to the appropriate priority queue."""
-        if priority == "high":
-            await self.high_priority_queue.put(task)
-        elif priority == "background":
-            await self.background_queue.put(task)
-        else:
-            await self.normal_priority_queue.put(task)
+        """
+        📝 Add a task to the kernel queue.
+
+        Each task gets a finish tag ``max(virtual time, last tag of its
+        priority) + 1 / weight`` and the smallest tag is dispatched first, so
+        waiting priorities share dispatches in proportion to PRIORITY_WEIGHTS
+        and an idle priority does not build up credit.
+        """
+        if priority not in PRIORITY_WEIGHTS:
+            priority = "normal"
+
+        entry = _QueuedTask(task, priority)
+        tag = max(self._virtual_time, self._last_finish[priority])
+        tag += 1.0 / PRIORITY_WEIGHTS[priority]
+        self._last_finish[priority] = tag
+        self._seq += 1
+        item = (tag, self._seq, entry)
+        heapq.heappush(self._queue, item)
+        if self._can_batch(entry.task_type):
+            heapq.heappush(self._batchable.setdefault(entry.task_type, []), item)
+        self._queued_counts[priority] += 1
+        self._waiting_by_type[entry.task_type] += 1
+        self._work_available.set()
 
     async def shutdown(self):
         """🛑 Gracefully shutdown the kernel loop."""
         logger.info("🛑 Shutting down Aetherra OS Kernel Loop...")
         self.running = False
+        self._work_available.set()
+
+        # Give running tasks a moment to finish, then cancel the rest
+        runs = list(self._runs)
+        if runs:
+            _, pending = await asyncio.wait(
+                runs, timeout=self.config.get("shutdown_timeout", 5.0)
+            )
+            for run in pending:
+                run.cancel()
 
         # Save final metrics
         await self._save_metrics()
@@ -409,9 +673,21 @@ class AetherraKernelLoop:
             "cycle_count": self.cycle_count,
             "metrics": self.metrics.copy(),
             "queue_sizes": {
-                "high_priority": self.high_priority_queue.qsize(),
-                "normal_priority": self.normal_priority_queue.qsize(),
-                "background": self.background_queue.qsize(),
+                "high_priority": self._queued_counts["high"],
+                "normal_priority": self._queued_counts["normal"],
+                "background": self._queued_counts["background"],
+            },
+            "active_tasks": {
+                task_type: count for task_type, count in self._active.items() if count
+            },
+            "max_concurrency": self.max_concurrency,
+            "queue_wait_ms": {
+                priority: histogram.snapshot()
+                for priority, histogram in self._queue_wait.items()
+            },
+            "service_time_ms": {
+                priority: histogram.snapshot()
+                for priority, histogram in self._service_time.items()
             },
         }
 
@@ -6,18 +6,32 @@ Live service registration and inter-component communication system.
 
 Enables all Aetherra components to discover, communicate, and coordinate
 with each other in real-time.
+
+Messages and events travel over an in-process MessageBus: every subscriber has
+a bounded mailbox drained by its own task, so a slow service only delays its
+own messages.
 """
 
 import asyncio
+import contextvars
+import inspect
+import itertools
 import logging
+import time
 import weakref
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Subscribers whose handlers are waiting further up the current request chain
+_handling: contextvars.ContextVar[Tuple[str, ...]] = contextvars.ContextVar(
+    "aetherra_bus_handling", default=()
+)
+
 
 class ServiceStatus(Enum):
     """Service health status enumeration."""
@@ -29,6 +43,350 @@ class ServiceStatus(Enum):
     STOPPING = "stopping"
 
 
+class OverflowPolicy(Enum):
+    """What a full mailbox does with a new message."""
+
+    BLOCK = "block"  # The publisher waits for room (backpressure)
+    DROP_NEW = "drop_new"  # The new message is discarded
+    DROP_OLDEST = "drop_oldest"  # The oldest queued message is discarded
+
+
+class MessageDropped(Exception):
+    """Raised to a requester whose message was dropped before being handled"""
+
+
+@dataclass
+class BusMessage:
+    """A message travelling over the bus."""
+
+    topic: str
+    data: Any
+    sender: Optional[str] = None
+    published_at: float = field(default_factory=time.monotonic)
+    reply: Optional[asyncio.Future] = None  # Set for requests
+    chain: Tuple[str, ...] = ()  # Handlers the request was made from
+
+
+class Subscription:
+    """
+    [MAILBOX] One subscriber: topic patterns, a bounded mailbox and the task
+    feeding queued messages to its handler in order.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[BusMessage], Any],
+        topics: Iterable[str] = (),
+        maxsize: int = 1000,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ):
+        self.name = name
+        self.handler = handler
+        self.topics = set(topics)
+        self.maxsize = maxsize
+        self.policy = policy
+
+        self._messages: Deque[BusMessage] = deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._worker: Optional[asyncio.Task] = None
+        self.closed = False
+
+        # Counters and lag (seconds from publish to handling)
+        self.received = 0
+        self.handled = 0
+        self.failed = 0
+        self.dropped = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._total_lag = 0.0
+
+    async def deliver(self, message: BusMessage) -> bool:
+        """Queue a message, applying the overflow policy; False if dropped."""
+        if self.closed:
+            return False
+        while len(self._messages) >= self.maxsize:
+            # Requests always wait for room; their timeout bounds the wait
+            if message.reply is None and self.policy == OverflowPolicy.DROP_NEW:
+                self.dropped += 1
+                return False
+            if message.reply is None and self.policy == OverflowPolicy.DROP_OLDEST:
+                self._drop(self._messages.popleft())
+                break
+            self._not_full.clear()
+            await self._not_full.wait()
+            if self.closed:
+                return False
+
+        self._messages.append(message)
+        self.received += 1
+        self._not_empty.set()
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+        return True
+
+    def _drop(self, message: BusMessage):
+        self.dropped += 1
+        if message.reply is not None and not message.reply.done():
+            message.reply.set_exception(
+                MessageDropped(f"Mailbox of '{self.name}' overflowed")
+            )
+
+    async def _run(self):
+        """Feed queued messages to the handler, one at a time."""
+        while True:
+            while not self._messages:
+                self._not_empty.clear()
+                await self._not_empty.wait()
+            message = self._messages.popleft()
+            self._not_full.set()
+
+            lag = time.monotonic() - message.published_at
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            self._total_lag += lag
+
+            try:
+                result = await self.call(message)
+                self.handled += 1
+                if message.reply is not None and not message.reply.done():
+                    message.reply.set_result(result)
+            except Exception as e:
+                self.failed += 1
+                if message.reply is not None:
+                    if not message.reply.done():
+                        message.reply.set_exception(e)
+                else:
+                    logger.error(
+                        f"[ERROR] Handler of '{self.name}' failed on "
+                        f"'{message.topic}': {e}"
+                    )
+
+    async def call(self, message: BusMessage) -> Any:
+        """Run the handler on a message, outside the mailbox."""
+        token = _handling.set(message.chain + (self.name,))
+        try:
+            result = self.handler(message)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        finally:
+            _handling.reset(token)
+
+    @property
+    def idle(self) -> bool:
+        return not self._messages
+
+    def close(self):
+        """Stop the worker and fail requests still waiting in the mailbox."""
+        self.closed = True
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        while self._messages:
+            message = self._messages.popleft()
+            if message.reply is not None and not message.reply.done():
+                message.reply.set_exception(
+                    MessageDropped(f"'{self.name}' unsubscribed")
+                )
+        self._not_full.set()  # Release blocked publishers
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """[LAG] Mailbox depth, counters and delivery lag."""
+        oldest = self._messages[0].published_at if self._messages else None
+        handled = self.handled + self.failed
+        return {
+            "topics": sorted(self.topics),
+            "policy": self.policy.value,
+            "maxsize": self.maxsize,
+            "queued": len(self._messages),
+            "received": self.received,
+            "handled": self.handled,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "oldest_queued_ms": (
+                (time.monotonic() - oldest) * 1000 if oldest is not None else 0.0
+            ),
+            "last_lag_ms": self.last_lag * 1000,
+            "avg_lag_ms": self._total_lag / handled * 1000 if handled else 0.0,
+            "max_lag_ms": self.max_lag * 1000,
+        }
+
+
+class MessageBus:
+    """
+    [BUS] In-process publish/subscribe bus.
+
+    Subscribers register under a unique name with topic patterns: an exact
+    topic, a prefix ending in ``.*`` (``service.*`` matches
+    ``service.registered``) or ``*`` for everything. Publishing copies the
+    message into each matching mailbox and returns without waiting for the
+    handlers; it only waits when a full mailbox has the BLOCK policy.
+    """
+
+    def __init__(self):
+        self._subscriptions: Dict[str, Subscription] = {}
+        self._exact: Dict[str, Set[str]] = {}
+        self._prefixes: Dict[str, Set[str]] = {}  # "service." / "" -> names
+
+    def subscribe(
+        self,
+        name: str,
+        handler: Callable[[BusMessage], Any],
+        topics: Iterable[str] = (),
+        maxsize: int = 1000,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> Subscription:
+        """[SUBSCRIBE] Add (or replace) a subscriber."""
+        previous = self._subscriptions.get(name)
+        if previous is not None:
+            self._index(previous, add=False)
+        subscription = Subscription(name, handler, topics, maxsize, policy)
+        if previous is not None:
+            # Carry over messages queued for the replaced subscription
+            pending, previous._messages = previous._messages, deque()
+            previous.close()
+            subscription._messages = pending
+            if pending:
+                subscription._not_empty.set()
+                subscription._worker = asyncio.create_task(subscription._run())
+        self._subscriptions[name] = subscription
+        self._index(subscription, add=True)
+        return subscription
+
+    def unsubscribe(self, name: str) -> bool:
+        """[UNSUBSCRIBE] Remove a subscriber, discarding its queued messages."""
+        subscription = self._subscriptions.pop(name, None)
+        if subscription is None:
+            return False
+        self._index(subscription, add=False)
+        subscription.close()
+        return True
+
+    def set_topics(self, name: str, topics: Iterable[str]):
+        """Replace the topic patterns of a subscriber."""
+        subscription = self._subscriptions[name]
+        self._index(subscription, add=False)
+        subscription.topics = set(topics)
+        self._index(subscription, add=True)
+
+    def has_subscriber(self, name: str) -> bool:
+        return name in self._subscriptions
+
+    def _index(self, subscription: Subscription, add: bool):
+        for pattern in subscription.topics:
+            if pattern == "*" or pattern.endswith(".*"):
+                index, key = self._prefixes, pattern[:-1]
+            else:
+                index, key = self._exact, pattern
+            if add:
+                index.setdefault(key, set()).add(subscription.name)
+            else:
+                names = index.get(key)
+                if names is not None:
+                    names.discard(subscription.name)
+                    if not names:
+                        del index[key]
+
+    def subscribers_for(self, topic: str) -> Set[str]:
+        """Names of the subscribers whose patterns match ``topic``."""
+        names = set(self._exact.get(topic, ()))
+        names.update(self._prefixes.get("", ()))
+        for i, char in enumerate(topic):
+            if char == ".":
+                names.update(self._prefixes.get(topic[: i + 1], ()))
+        return names
+
+    async def publish(self, topic: str, data: Any, sender: Optional[str] = None):
+        """[PUBLISH] Deliver to every matching subscriber; returns how many queued it."""
+        return await self.send_to(self.subscribers_for(topic), topic, data, sender)
+
+    async def send_to(
+        self,
+        names: Iterable[str],
+        topic: str,
+        data: Any,
+        sender: Optional[str] = None,
+    ) -> int:
+        """[FANOUT] Deliver to the named subscribers regardless of their topics."""
+        subscriptions = [
+            self._subscriptions[name]
+            for name in names
+            if name in self._subscriptions and name != sender
+        ]
+        message = BusMessage(topic, data, sender)
+        blocked = []
+        delivered = 0
+        for subscription in subscriptions:
+            if len(subscription._messages) < subscription.maxsize:
+                # Room in the mailbox: deliver() completes without suspending
+                delivered += await subscription.deliver(message)
+            else:
+                blocked.append(subscription.deliver(message))
+        if blocked:
+            delivered += sum(await asyncio.gather(*blocked))
+        return delivered
+
+    async def request(
+        self,
+        name: str,
+        topic: str,
+        data: Any,
+        timeout: Optional[float] = 5.0,
+        sender: Optional[str] = None,
+    ) -> Any:
+        """
+        [REQUEST] Send to one subscriber and wait for its handler's result.
+
+        Raises KeyError for an unknown subscriber, asyncio.TimeoutError when
+        no reply arrives in time and re-raises the handler's exception.
+
+        A request to a subscriber whose handler is already waiting up the
+        chain (A -> B -> A, or A -> A) calls the handler directly, as its
+        mailbox worker could never get to it.
+        """
+        subscription = self._subscriptions.get(name)
+        if subscription is None:
+            raise KeyError(f"No subscriber named '{name}'")
+
+        chain = _handling.get()
+        if name in chain:
+            message = BusMessage(topic, data, sender, chain=chain)
+            return await asyncio.wait_for(subscription.call(message), timeout)
+
+        reply = asyncio.get_running_loop().create_future()
+        message = BusMessage(topic, data, sender, reply=reply, chain=chain)
+
+        async def exchange():
+            await subscription.deliver(message)
+            return await reply
+
+        try:
+            return await asyncio.wait_for(exchange(), timeout)
+        finally:
+            if not reply.done():
+                reply.cancel()  # The handler's result is no longer wanted
+
+    def get_lag_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """[LAG] Per-subscriber mailbox and lag metrics."""
+        return {
+            name: subscription.get_metrics()
+            for name, subscription in self._subscriptions.items()
+        }
+
+    async def close(self, timeout: float = 5.0):
+        """[STOP] Give mailboxes ``timeout`` seconds to drain, then stop workers."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and not all(
+            s.idle for s in self._subscriptions.values()
+        ):
+            await asyncio.sleep(0.01)
+        for name in list(self._subscriptions):
+            self.unsubscribe(name)
+
+
 @dataclass
 class ServiceInfo:
     """Information about a registered service."""
@@ -48,14 +406,29 @@ class AetherraServiceRegistry:
 
     Manages service discovery, health monitoring, and inter-service communication
     for all Aetherra components.
+
+    Services with a ``handle_message`` or ``on_message`` method get a bus
+    mailbox of ``mailbox_size`` messages with ``overflow_policy``; event
+    handlers get one per event type.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        mailbox_size: int = 1000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ):
         self._services: Dict[str, ServiceInfo] = {}
         self._event_handlers: Dict[str, List[Callable]] = {}
         self._running = False
         self._heartbeat_task = None
 
+        self.bus = MessageBus()
+        self.mailbox_size = mailbox_size
+        self.overflow_policy = overflow_policy
+        # (event type, handler) -> bus subscriber name
+        self._event_subscribers: Dict[Tuple[str, Callable], str] = {}
+        self._event_ids = itertools.count()
+
     async def start(self):
         """[START] Start the service registry."""
         logger.info("[REGISTRY] Starting Aetherra Service Registry...")
@@ -77,6 +450,7 @@ class AetherraServiceRegistry:
 
         # Notify all services of shutdown
         await self._broadcast_event("system.shutdown", {})
+        await self.bus.close()
 
         logger.info("[OK] Service Registry stopped")
 
@@ -86,6 +460,7 @@ class AetherraServiceRegistry:
         instance: Any,
         metadata: Optional[Dict[str, Any]] = None,
         dependencies: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
     ) -> bool:
         """
         [REGISTER] Register a service with the registry.
@@ -95,6 +470,8 @@ class AetherraServiceRegistry:
             instance: Service instance
             metadata: Service metadata (version, description, etc.)
             dependencies: List of service names this service depends on
+            topics: Topic patterns the service receives published messages
+                for; all topics ("*") by default
 
         Returns:
             True if registration successful
@@ -112,6 +489,20 @@ class AetherraServiceRegistry:
 
             self._services[name] = service_info
 
+            handler = getattr(instance, "handle_message", None) or getattr(
+                instance, "on_message", None
+            )
+            if handler is not None:
+                self.bus.subscribe(
+                    name,
+                    lambda message: handler(message.topic, message.data),
+                    topics if topics is not None else ["*"],
+                    self.mailbox_size,
+                    self.overflow_policy,
+                )
+            else:
+                self.bus.unsubscribe(name)
+
             logger.info(f"[OK] Service '{name}' registered successfully")
 
             # Broadcast registration event
@@ -151,6 +542,7 @@ class AetherraServiceRegistry:
 
             # Remove from registry
             del self._services[name]
+            self.bus.unsubscribe(name)
 
             logger.info(f"[OK] Service '{name}' unregistered successfully")
 
@@ -258,15 +650,23 @@ class AetherraServiceRegistry:
         logger.debug(f"[HEARTBEAT] Heartbeat updated for service '{name}'")
 
     async def send_message(
-        self, target_service: str, message_type: str, data: Any
+        self,
+        target_service: str,
+        message_type: str,
+        data: Any,
+        timeout: Optional[float] = None,
     ) -> bool:
         """
         [SEND] Send a message to a specific service.
 
+        The message goes through the service's mailbox, after anything
+        already queued for it.
+
         Args:
             target_service: Target service name
             message_type: Type of message
             data: Message data
+            timeout: Optional seconds to wait for the service to handle it
 
         Returns:
             True if message was delivered
@@ -280,41 +680,75 @@ class AetherraServiceRegistry:
                 return False
 
             # Check if service has message handler
-            if hasattr(service, "handle_message"):
-                await service.handle_message(message_type, data)
-                return True
-            elif hasattr(service, "on_message"):
-                await service.on_message(message_type, data)
-                return True
-            else:
+            if not self.bus.has_subscriber(target_service):
                 logger.warning(f"[WARN] Service '{target_service}' has no message handler")
                 return False
 
+            await self.bus.request(target_service, message_type, data, timeout)
+            return True
+
         except Exception as e:
             logger.error(f"[ERROR] Failed to send message to '{target_service}': {e}")
             return False
 
     async def broadcast_message(
         self, message_type: str, data: Any, exclude: Optional[List[str]] = None
-    ):
+    ) -> int:
         """
         [BROADCAST] Broadcast a message to all services.
 
+        Returns once the message is in every mailbox, without waiting for
+        the services to handle it.
+
         Args:
             message_type: Type of message
             data: Message data
             exclude: Optional list of service names to exclude
+
+        Returns:
+            Number of services the message was queued for
         """
         exclude = exclude or []
+        targets = [
+            service_name
+            for service_name, service_info in self._services.items()
+            if service_name not in exclude
+            and service_info.status == ServiceStatus.HEALTHY
+        ]
+        return await self.bus.send_to(targets, message_type, data)
+
+    async def publish(self, topic: str, data: Any, sender: Optional[str] = None) -> int:
+        """
+        [PUBLISH] Send a message to the services subscribed to ``topic``.
 
-        for service_name, service_info in self._services.items():
-            if service_name in exclude or service_info.status != ServiceStatus.HEALTHY:
-                continue
+        Returns:
+            Number of subscribers the message was queued for
+        """
+        return await self.bus.publish(topic, data, sender)
 
-            try:
-                await self.send_message(service_name, message_type, data)
-            except Exception as e:
-                logger.error(f"[ERROR] Failed to broadcast to '{service_name}': {e}")
+    async def request(
+        self,
+        target_service: str,
+        message_type: str,
+        data: Any,
+        timeout: Optional[float] = 5.0,
+    ) -> Any:
+        """
+        [REQUEST] Send a message to a service and return its handler's reply.
+
+        Raises:
+            KeyError: if the service has no message handler
+            asyncio.TimeoutError: if no reply arrives within ``timeout``
+        """
+        return await self.bus.request(target_service, message_type, data, timeout)
+
+    def subscribe_service(self, name: str, topics: List[str]):
+        """[SUBSCRIBE] Set the topic patterns a registered service receives."""
+        self.bus.set_topics(name, topics)
+
+    def get_bus_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """[LAG] Mailbox depth, drops and delivery lag per subscriber."""
+        return self.bus.get_lag_metrics()
 
     def subscribe_to_events(self, event_type: str, handler: Callable):
         """
@@ -324,10 +758,25 @@ class AetherraServiceRegistry:
             event_type: Event type to subscribe to
             handler: Event handler function
         """
+        if (event_type, handler) in self._event_subscribers:
+            logger.debug(f"[SUBSCRIBE] Already subscribed to event '{event_type}'")
+            return
+
         if event_type not in self._event_handlers:
             self._event_handlers[event_type] = []
 
         self._event_handlers[event_type].append(handler)
+        name = f"event:{event_type}:{next(self._event_ids)}"
+        self._event_subscribers[(event_type, handler)] = name
+        # No topics: registry events are sent to event subscribers only, so
+        # services listening on "*" never see them
+        self.bus.subscribe(
+            name,
+            lambda message: handler(message.data),
+            [],
+            self.mailbox_size,
+            self.overflow_policy,
+        )
         logger.debug(f"[SUBSCRIBE] Subscribed to event '{event_type}'")
 
     def unsubscribe_from_events(self, event_type: str, handler: Callable):
@@ -341,23 +790,24 @@ class AetherraServiceRegistry:
         if event_type in self._event_handlers:
             try:
                 self._event_handlers[event_type].remove(handler)
+                name = self._event_subscribers.pop((event_type, handler), None)
+                if name is not None:
+                    self.bus.unsubscribe(name)
                 logger.debug(f"[UNSUBSCRIBE] Unsubscribed from event '{event_type}'")
             except ValueError:
                 logger.warning(f"[WARN] Handler not found for event '{event_type}'")
 
     async def _broadcast_event(self, event_type: str, event_data: Dict[str, Any]):
-        """[BROADCAST] Broadcast an event to all subscribers."""
+        """[BROADCAST] Broadcast an event to all subscribers, without waiting for them."""
         if event_type not in self._event_handlers:
             return
 
-        for handler in self._event_handlers[event_type]:
-            try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(event_data)
-                else:
-                    handler(event_data)
-            except Exception as e:
-                logger.error(f"[ERROR] Event handler error for '{event_type}': {e}")
+        names = [
+            name
+            for (subscribed_type, _), name in self._event_subscribers.items()
+            if subscribed_type == event_type
+        ]
+        await self.bus.send_to(names, event_type, event_data)
 
     async def _heartbeat_monitor(self):
         """[MONITOR] Monitor service heartbeats and health."""